@@ -0,0 +1,49 @@
+"""sources feed validators — GET conditionnel du sync RSS.
+
+Le sync re-téléchargeait et re-parsait chaque flux à chaque cycle, même
+inchangé. On persiste les validateurs HTTP (`ETag`, `Last-Modified`) et le
+SHA-256 du dernier corps traité pour court-circuiter un 304 ou un corps
+identique avant le parsing, plus deux compteurs (taux de flux inchangés par
+source).
+
+Additive (colonnes nullables ou à défaut serveur) → sûre en expand-contract sur
+la DB partagée staging/prod : l'ancien code ignore les colonnes.
+
+Revision ID: fc01_source_feed_validators
+Revises: ca01_coverage_analyses
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "fc01_source_feed_validators"
+down_revision: str | None = "ca01_coverage_analyses"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.add_column("sources", sa.Column("feed_etag", sa.Text(), nullable=True))
+    op.add_column("sources", sa.Column("feed_last_modified", sa.Text(), nullable=True))
+    op.add_column(
+        "sources", sa.Column("feed_body_hash", sa.String(length=64), nullable=True)
+    )
+    op.add_column(
+        "sources",
+        sa.Column("feed_fetch_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "sources",
+        sa.Column(
+            "feed_unchanged_count", sa.Integer(), nullable=False, server_default="0"
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("sources", "feed_unchanged_count")
+    op.drop_column("sources", "feed_fetch_count")
+    op.drop_column("sources", "feed_body_hash")
+    op.drop_column("sources", "feed_last_modified")
+    op.drop_column("sources", "feed_etag")
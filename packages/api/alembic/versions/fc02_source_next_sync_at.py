@@ -0,0 +1,42 @@
+"""sources next_sync_at — planification adaptative du sync RSS.
+
+Chaque source reçoit sa prochaine échéance de sync (cadence de parution,
+abonnés, échecs consécutifs) au lieu d'un intervalle fixe commun. L'index sur
+`next_sync_at` sert de file de priorité au worker.
+
+Additive (colonne nullable + compteur à défaut serveur, index) → sûre en
+expand-contract sur la DB partagée staging/prod : NULL = due, l'ancien code
+ignore les colonnes.
+
+Revision ID: fc02_source_next_sync_at
+Revises: fc01_source_feed_validators
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "fc02_source_next_sync_at"
+down_revision: str | None = "fc01_source_feed_validators"
+branch_labels: str | None = None
+depends_on: str | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "sources",
+        sa.Column("next_sync_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "sources",
+        sa.Column(
+            "sync_failure_count", sa.Integer(), nullable=False, server_default="0"
+        ),
+    )
+    op.create_index("ix_sources_next_sync_at", "sources", ["next_sync_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sources_next_sync_at", table_name="sources")
+    op.drop_column("sources", "sync_failure_count")
+    op.drop_column("sources", "next_sync_at")
@@ -100,6 +100,29 @@ class Settings(BaseSettings):
     # RSS Sync
     rss_sync_interval_minutes: int = 30
     rss_sync_enabled: bool = True
+    # Planification adaptative (`sync_scheduler`) : un `next_sync_at` par
+    # source, file vidée toutes les `rss_sync_tick_seconds`. False → rafale
+    # fixe toutes les `rss_sync_interval_minutes` (ancien régime).
+    rss_sync_adaptive: bool = True
+    rss_sync_tick_seconds: int = 60
+    rss_sync_batch_size: int = 25
+    rss_sync_concurrency: int = 5
+    rss_sync_min_interval_minutes: int = 10
+    rss_sync_max_interval_minutes: int = 360
+    # HEAD article du paywall (`ArticleHeadFetcher`) : fetchs simultanés au
+    # total, connexions par hôte et écart minimal entre deux départs vers un
+    # même hôte.
+    rss_sync_head_concurrency: int = 16
+    rss_sync_head_per_host: int = 2
+    rss_sync_head_host_interval_ms: int = 250
+    # CPU d'ingestion (feedparser, extraction, paywall) : processus dédiés
+    # (`FeedIngestPool`, 0 → executor de threads) et tâches soumises à la fois.
+    rss_sync_parse_workers: int = 1
+    rss_sync_parse_queue: int = 8
+    # Gros flux (`feed_stream`) : au-delà du seuil, lecture incrémentale
+    # arrêtée au plafond d'entrées / d'octets.
+    rss_sync_stream_threshold_bytes: int = 1024 * 1024
+    rss_sync_feed_max_bytes: int = 8 * 1024 * 1024
 
     # RSS Retention
     rss_retention_days: int = 20
@@ -177,6 +200,16 @@ class Settings(BaseSettings):
         0  # plafond d'attente du + vieux pending (0 = immédiat)
     )
     classification_worker_interval_s: int = 10  # intervalle entre 2 vérifications
+    # Voies LLM concurrentes du pipeline (dequeue → N voies → écriture groupée).
+    # Le débit Mistral réel reste borné par les limiteurs partagés
+    # (`mistral_small_*`, `mistral_large_*`) ; 1 = un seul lot en vol.
+    classification_worker_lanes: int = 3
+    # Classification fusionnée : un seul appel Mistral par lot pour topics,
+    # serene, is_ad, entités et good_news, fallback par champ sur les appels
+    # séparés. Off par défaut — activer après comparaison
+    # (scripts/compare_classification_modes.py).
+    classification_fused_enabled: bool = False
+    classification_fused_model: str = "mistral-small-latest"
 
     # Garde-fou anti-angle-mort (bug-classification-worker-stopped) : le job
     # scheduler `classification_queue_health_check` alerte Sentry si le plus
@@ -241,6 +274,10 @@ class Settings(BaseSettings):
     mistral_rate_limit_enabled: bool = True  # kill-switch throttle large
     mistral_large_rpm: int = 60  # requêtes large/minute (token-bucket)
     mistral_large_concurrency: int = 4  # appels large simultanés (semaphore)
+    # Pendant `small` (classification topics/entités) : plafond commun aux
+    # voies du ClassificationWorker, quel que soit `classification_worker_lanes`.
+    mistral_small_rpm: int = 120  # requêtes small/minute (token-bucket)
+    mistral_small_concurrency: int = 4  # appels small simultanés (semaphore)
 
     # GitHub (app update feature)
     github_token: str = ""
@@ -446,6 +446,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     else:
         logger.info("lifespan_ml_worker_skipped", reason="ML_ENABLED=false")
 
+    # Index du cache disque du proxy d'images : scan du répertoire (jusqu'à
+    # 512 Mo de fichiers) en thread, hors du chemin de la première requête.
+    from app.services.image_proxy_cache import IMAGE_PROXY_CACHE
+
+    asyncio.create_task(IMAGE_PROXY_CACHE.warm())
+
     logger.info("lifespan_startup_complete")
     yield
     # Shutdown
@@ -453,6 +459,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
         await ml_worker.stop()
         logger.info("lifespan_ml_worker_stopped")
     stop_scheduler()
+    from app.services.feed_ingest_pool import FEED_INGEST_POOL
+
+    FEED_INGEST_POOL.shutdown()
+    from app.services.outbound_http import OUTBOUND_HTTP
+
+    await OUTBOUND_HTTP.aclose()
     try:
         from app.services.posthog_client import get_posthog_client
 
@@ -767,7 +779,16 @@ async def feed_cache_metrics(
     d'utilisateurs actifs. Sans le secret (staging), il reste ouvert —
     fail-open assumé, à l'inverse de `require_admin_token`.
     """
+    from app.services.cache_refresh import BACKGROUND_REFRESHER
+    from app.services.candidate_pool_cache import CANDIDATE_POOL_CACHE
+    from app.services.carousel_aggregates import CAROUSEL_AGGREGATES
     from app.services.feed_cache import FEED_CACHE
+    from app.services.feed_cursor import FEED_CURSORS
+    from app.services.feed_detection_cache import FEED_DETECTION_CACHE
+    from app.services.feed_ingest_pool import FEED_INGEST_POOL
+    from app.services.image_proxy_cache import IMAGE_PROXY_CACHE
+    from app.services.outbound_http import OUTBOUND_HTTP
+    from app.services.user_context_cache import USER_CONTEXT_CACHE
 
     # Relu à chaque requête (comme `require_admin_token`) plutôt que depuis le
     # `settings` de module : le secret peut être posé sans redéployer.
@@ -778,6 +799,24 @@ async def feed_cache_metrics(
         raise HTTPException(status_code=404, detail="Not Found")
 
     metrics: dict[str, Any] = FEED_CACHE.stats()
+    # Snapshot des entrées du scoring, partagé par les sections du cold open.
+    metrics["user_context"] = USER_CONTEXT_CACHE.stats()
+    # Pool de candidats partagé : `hits` = sections servies sans requête.
+    metrics["candidate_pool"] = CANDIDATE_POOL_CACHE.stats()
+    # Recomputes stale-while-revalidate : `skipped_busy` = plafond atteint.
+    metrics["background_refresh"] = BACKGROUND_REFRESHER.stats()
+    # Pages 2+ servies depuis le classement de la page 1 (`hits`).
+    metrics["feed_cursors"] = FEED_CURSORS.stats()
+    # Carrousels Phase B lus depuis les agrégats (`fresh`, `community_hits`).
+    metrics["carousel_aggregates"] = CAROUSEL_AGGREGATES.stats()
+    # CPU d'ingestion RSS hors event loop (`waiting` = file pleine).
+    metrics["feed_ingest_pool"] = FEED_INGEST_POOL.stats()
+    # Pools HTTP sortants par usage (latence/erreurs par hôte, cache DNS).
+    metrics["outbound_http"] = OUTBOUND_HTTP.stats()
+    # Cache disque du proxy d'images Web (`coalesced` = fetchs partagés).
+    metrics["image_proxy_cache"] = IMAGE_PROXY_CACHE.stats()
+    # Détections de flux partagées recherche / ajout (`negative_hits` inclus).
+    metrics["feed_detection"] = FEED_DETECTION_CACHE.stats()
     logger.info("feed_cache_metrics_probed", **metrics)
     return metrics
 
@@ -800,6 +839,9 @@ async def classification_health(
       pending (un âge qui grimpe alors que `worker_running=true` = loop coincée) ;
     - `last_completed_at` / `last_completed_age_s` : dernier `processed_at` écrit
       (avance = le pipeline tourne réellement).
+    - `pipeline` : voies LLM occupées, profondeur des files dequeue → voies →
+      écriture et latences p50/p95 par étage (une file d'écriture pleine = DB
+      lente ; des voies toutes occupées = plafond Mistral atteint).
 
     Renvoie **503** quand `ML_ENABLED=true` mais que le worker ne tourne pas
     (état actionnable, alertable via le simple code HTTP). Un service où le
@@ -815,7 +857,8 @@ async def classification_health(
     from app.services.classification_queue_service import ClassificationQueueService
     from app.workers.classification_worker import get_worker
 
-    worker_running = get_worker().running
+    worker = get_worker()
+    worker_running = worker.running
     ml_enabled = settings.ml_enabled
 
     pending, oldest_pending_age_s = await ClassificationQueueService(
@@ -855,6 +898,7 @@ async def classification_health(
             last_completed_at.isoformat() if last_completed_at is not None else None
         ),
         "last_completed_age_s": last_completed_age_s,
+        "pipeline": worker.pipeline_stats(),
         "environment": settings.environment,
         "probe": "classification",
     }
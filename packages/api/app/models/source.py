@@ -11,6 +11,7 @@ from sqlalchemy import (
     Float,
     ForeignKey,
     Index,
+    Integer,
     String,
     Text,
     UniqueConstraint,
@@ -64,6 +65,27 @@ class Source(Base):
     last_synced_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+    # GET conditionnel du sync RSS : validateurs HTTP renvoyés par le serveur
+    # et SHA-256 du dernier corps traité (NULL = jamais vu / pas de validateur).
+    feed_etag: Mapped[str | None] = mapped_column(Text, nullable=True)
+    feed_last_modified: Mapped[str | None] = mapped_column(Text, nullable=True)
+    feed_body_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    # Taux de flux inchangés = feed_unchanged_count / feed_fetch_count
+    # (304 ou corps identique).
+    feed_fetch_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0"
+    )
+    feed_unchanged_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0"
+    )
+    # Planification adaptative du sync (`sync_scheduler`) : prochaine échéance
+    # (NULL = due tout de suite) et échecs consécutifs (backoff).
+    next_sync_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, index=True
+    )
+    sync_failure_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0"
+    )
     # Biais et fiabilité (Story 7.1)
     bias_stance: Mapped[BiasStance] = mapped_column(
         Enum(
@@ -248,9 +248,10 @@ async def unhide_content(
     await service.unset_hide_status(user_id=user_uuid, content_id=content_id)
 
     await db.commit()
-    # `unset_hide_status` ne touche pas aux poids (le malus n'est appliqué
-    # qu'au hide).
-    FEED_CACHE.invalidate_content(user_uuid, content_id)
+    # Pas de poids touchés, mais l'article réintègre le pool de candidats
+    # partagé de l'utilisateur (`CANDIDATE_POOL_CACHE`), que seule la purge
+    # complète fait tomber — comme au hide.
+    FEED_CACHE.invalidate(user_uuid)
     return {"status": "ok", "is_hidden": False}
 
 
@@ -1,14 +1,14 @@
-import json
+import gzip
 import re
 import time
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
 import structlog
-from fastapi import APIRouter, Depends, Query, Response
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db, get_feed_db
+from app.database import feed_async_session_maker, get_db, get_feed_db
 from app.dependencies import get_current_user_id
 from app.models.content import UserContentStatus
 from app.models.enums import ContentType, FeedFilterMode
@@ -33,6 +33,7 @@ from app.schemas.feed import (
     TrendingTopicResponse,
 )
 from app.services.feed_cache import FEED_CACHE
+from app.services.feed_serialization import serialize_feed_response
 from app.services.recommendation.french_stopwords import FRENCH_STOP_WORDS
 from app.services.recommendation_service import RecommendationService
 from app.utils.db_retry import retry_db_op
@@ -188,8 +189,28 @@ def _personalized_variant(
     return f"p|t={theme}|tp={topic}|s={source_id}|sr={int(serein)}|l={limit}"
 
 
+def _cached_payload_response(body: bytes, request: Request) -> Response:
+    """Response for a payload in its `FEED_CACHE` stored form.
+
+    Compressed cache (`FEED_CACHE_GZIP`): the gzip bytes go out as-is with
+    `Content-Encoding: gzip` — the global `GZipMiddleware` skips responses
+    that already set an encoding, so nothing is compressed twice. A client
+    that does not accept gzip gets the decompressed JSON (rare: Dio always
+    sends `Accept-Encoding: gzip`)."""
+    if not FEED_CACHE.compressed:
+        return Response(content=body, media_type="application/json")
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+    return Response(content=gzip.decompress(body), media_type="application/json")
+
+
 @router.get("/", response_model=FeedResponse)
 async def get_personalized_feed(
+    request: Request,
     limit: int = Query(20, ge=1, le=50),
     offset: int = Query(0, ge=0),
     content_type: ContentType | None = Query(None, alias="type"),
@@ -234,6 +255,13 @@ async def get_personalized_feed(
             "sources separately."
         ),
     ),
+    cursor: str | None = Query(
+        None,
+        description=(
+            "`pagination.next_cursor` of the first page. With offset > 0, the "
+            "page is sliced from that first-page ranking instead of re-ranking."
+        ),
+    ),
     db: AsyncSession = Depends(get_feed_db),
     current_user_id: str = Depends(get_current_user_id),
 ):
@@ -254,11 +282,16 @@ async def get_personalized_feed(
     60s), avec le même pattern single-flight. Coupe le recompute du pipeline
     piliers sur les ~10 appels parallèles du cold-open.
 
-    Chaque requête émet un log `feed_request` (hit/miss/bypass + durée) —
+    Chaque requête émet un log `feed_request` (hit/stale/miss/bypass + durée) —
     `feed_total` n'était émis que par `_compute_feed`, donc jamais sur un
     hit : le hit rate était invisible. `items` n'est renseigné que sur
     miss/bypass, où la réponse est déjà désérialisée ; le compter sur un hit
     imposerait un `json.loads` du payload sur le chemin rapide.
+
+    Le payload mis en cache est sérialisé en une passe par
+    `serialize_feed_response` (fragments JSON par article, partagés entre
+    utilisateurs) ; avec `FEED_CACHE_GZIP`, il est stocké et servi déjà
+    compressé — un hit ne fait ni sérialisation ni compression.
     """
     user_uuid = UUID(current_user_id)
     started_at = time.perf_counter()
@@ -328,26 +361,12 @@ async def get_personalized_feed(
         )
 
     if cache_eligible:
-        # Fast path: cached and fresh → no DB work, no Pydantic.
-        cached = FEED_CACHE.get(user_uuid, cache_variant)
-        if cached is not None:
-            _emit("hit")
-            return Response(content=cached, media_type="application/json")
 
-        # Single-flight: serialize concurrent first-misses for the same
-        # (user, variant). 2nd+ waiters re-check after acquiring the lock and
-        # pick up the payload populated by the 1st.
-        async with FEED_CACHE.lock(user_uuid, cache_variant):
-            cached = FEED_CACHE.get(user_uuid, cache_variant)
-            if cached is not None:
-                _emit("hit")
-                return Response(content=cached, media_type="application/json")
-            # Capturée juste AVANT le compute (1,5-5 s) : une invalidation
-            # arrivant dans cette fenêtre change la génération et le `put`
-            # est droppé, au lieu de ressusciter le payload évincé.
-            generation = FEED_CACHE.generation(user_uuid)
+        async def _compute_payload(
+            session: AsyncSession, *, rotate_cursor: bool = True
+        ) -> tuple[bytes, int]:
             response = await _compute_feed(
-                db=db,
+                db=session,
                 user_uuid=user_uuid,
                 limit=limit,
                 offset=offset,
@@ -364,11 +383,49 @@ async def get_personalized_feed(
                 include_unfollowed=include_unfollowed,
                 personalized=personalized,
                 followed_only=followed_only,
+                cursor=cursor,
+                rotate_cursor=rotate_cursor,
+            )
+            return serialize_feed_response(response), len(response.items)
+
+        async def _refresh_payload() -> bytes:
+            # Le refresh tourne après la réponse : la session de la requête est
+            # fermée, d'où une session feed dédiée (même AUTOCOMMIT que
+            # `get_feed_db`). Le curseur servi avec la page stale reste valide :
+            # pas de rotation hors recompute au premier plan.
+            async with feed_async_session_maker() as session:
+                payload, _ = await _compute_payload(session, rotate_cursor=False)
+            return payload
+
+        # Fast path: cached → no DB work, no Pydantic. Stale (SWR mode, past
+        # the soft TTL) → served as-is, recomputed in the background.
+        cached, is_stale = FEED_CACHE.get_or_stale(user_uuid, cache_variant)
+        if cached is not None:
+            if is_stale:
+                FEED_CACHE.refresh_in_background(
+                    user_uuid, cache_variant, _refresh_payload
+                )
+            _emit("stale" if is_stale else "hit")
+            return _cached_payload_response(cached, request)
+
+        # Single-flight: serialize concurrent first-misses for the same
+        # (user, variant). 2nd+ waiters re-check after acquiring the lock and
+        # pick up the payload populated by the 1st.
+        async with FEED_CACHE.lock(user_uuid, cache_variant):
+            cached = FEED_CACHE.get(user_uuid, cache_variant)
+            if cached is not None:
+                _emit("hit")
+                return _cached_payload_response(cached, request)
+            # Capturée juste AVANT le compute (1,5-5 s) : une invalidation
+            # arrivant dans cette fenêtre change la génération et le `put`
+            # est droppé, au lieu de ressusciter le payload évincé.
+            generation = FEED_CACHE.generation(user_uuid)
+            payload, items = await _compute_payload(db)
+            stored = FEED_CACHE.put(
+                user_uuid, payload, cache_variant, generation=generation
             )
-            payload = json.dumps(response.model_dump(mode="json")).encode("utf-8")
-            FEED_CACHE.put(user_uuid, payload, cache_variant, generation=generation)
-            _emit("miss", len(response.items))
-            return Response(content=payload, media_type="application/json")
+            _emit("miss", items)
+            return _cached_payload_response(stored, request)
 
     response = await _compute_feed(
         db=db,
@@ -388,9 +445,14 @@ async def get_personalized_feed(
         include_unfollowed=include_unfollowed,
         personalized=personalized,
         followed_only=followed_only,
+        cursor=cursor,
     )
     _emit("bypass", len(response.items))
-    return response
+    # Même sérialisation une passe que le chemin caché, au lieu de la
+    # revalidation `response_model` + `jsonable_encoder` de FastAPI.
+    return Response(
+        content=serialize_feed_response(response), media_type="application/json"
+    )
 
 
 async def _compute_feed(
@@ -412,10 +474,16 @@ async def _compute_feed(
     include_unfollowed: bool = False,
     personalized: bool = False,
     followed_only: bool = False,
+    cursor: str | None = None,
+    rotate_cursor: bool = True,
 ) -> FeedResponse:
     """Run the full recommendation pipeline. Identical to the pre-Round-5
-    body of `get_personalized_feed`, extracted for cache-miss reuse."""
+    body of `get_personalized_feed`, extracted for cache-miss reuse.
+
+    ``rotate_cursor=False`` keeps the view's live cursor (background
+    refresh) instead of issuing a new one."""
     service = RecommendationService(db)
+    service.rotate_cursor = rotate_cursor
 
     # serein=True overrides mode to use the serein filter (same as INSPIRATION)
     if serein and not mode:
@@ -442,6 +510,7 @@ async def _compute_feed(
         include_unfollowed=include_unfollowed,
         personalized=personalized,
         followed_only=followed_only,
+        cursor=cursor,
     )
 
     # Epic 11: Build clusters from custom topics (reuse from service, no duplicate query)
@@ -518,6 +587,7 @@ async def _compute_feed(
             per_page=limit,
             total=0,  # Total unknown without additional query
             has_next=has_next,
+            next_cursor=service.next_cursor,
         ),
         clusters=clusters_data,
         source_overflow=overflow_data,
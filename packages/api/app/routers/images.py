@@ -13,26 +13,44 @@ que si `kIsWeb`.
 
 from urllib.parse import urlparse
 
-import httpx
 import structlog
 from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import Response
+from fastapi.responses import StreamingResponse
+
+from app.services.image_proxy_cache import (
+    IMAGE_PROXY_CACHE,
+    THUMBNAIL_WIDTHS,
+    ImageProxyError,
+)
 
 router = APIRouter()
 logger = structlog.get_logger()
 
-_TIMEOUT_S = 5.0
-_MAX_BYTES = 5 * 1024 * 1024  # 5 MB
 _CACHE_HEADERS = {
     "Cache-Control": "public, max-age=604800, immutable",
     "Access-Control-Allow-Origin": "*",
 }
 
 
+def _thumbnail_width(requested: int | None) -> int | None:
+    """Plus petite largeur servie couvrant `requested` ; None = original."""
+    if requested is None:
+        return None
+    return next((w for w in THUMBNAIL_WIDTHS if w >= requested), None)
+
+
 @router.get("/proxy")
-async def proxy_image(url: str = Query(..., min_length=8, max_length=2048)) -> Response:
+async def proxy_image(
+    url: str = Query(..., min_length=8, max_length=2048),
+    w: int | None = Query(None, ge=1, le=4096),
+) -> StreamingResponse:
     """Fetch an external image and re-serve it with CORS + cache headers.
 
+    `w` asks for a thumbnail: rounded up to one of `THUMBNAIL_WIDTHS`
+    (beyond the largest, the original is served). Images are kept in a local
+    disk cache (`image_proxy_cache`): after the first request they are
+    streamed from disk, and concurrent misses share one upstream fetch.
+
     Returns 404 on any upstream failure so the Flutter `errorBuilder`
     collapses the thumbnail cleanly (same UX as a real broken image).
     """
@@ -41,31 +59,16 @@ async def proxy_image(url: str = Query(..., min_length=8, max_length=2048)) -> R
         raise HTTPException(status_code=400, detail="invalid_url")
 
     try:
-        async with httpx.AsyncClient(
-            timeout=_TIMEOUT_S,
-            follow_redirects=True,
-            max_redirects=3,
-        ) as client:
-            resp = await client.get(url)
-    except (httpx.HTTPError, httpx.InvalidURL):
-        raise HTTPException(status_code=404, detail="upstream_unreachable") from None
-
-    if resp.status_code != 200:
-        raise HTTPException(status_code=404, detail="upstream_status")
-
-    content_type = resp.headers.get("content-type", "").split(";")[0].strip().lower()
-    if not content_type.startswith("image/"):
-        raise HTTPException(status_code=415, detail="not_an_image")
-
-    body = resp.content
-    if len(body) > _MAX_BYTES:
-        raise HTTPException(status_code=413, detail="image_too_large")
+        image = await IMAGE_PROXY_CACHE.get(url, _thumbnail_width(w))
+    except ImageProxyError as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.detail) from None
 
-    return Response(
-        content=body,
-        media_type=content_type,
+    return StreamingResponse(
+        image.chunks(),
+        media_type=image.content_type,
         headers={
             **_CACHE_HEADERS,
+            "Content-Length": str(image.size),
             # Opt-out explicite du GZipMiddleware global (`app/main.py`) :
             # JPEG/PNG/WebP sont déjà compressés, les regzipper coûte du CPU sur
             # l'unique worker uvicorn pour ~0 octet gagné. Starlette saute la
@@ -142,6 +142,33 @@ def _check_search_endpoint_rate(user_id: str) -> bool:
     return True
 
 
+async def _load_sources(user_id: str) -> SourceCatalogResponse:
+    """Charge le catalogue de ``user_id`` dans une session courte dédiée.
+
+    Partagé par le chemin foreground de :func:`get_sources` et par le
+    refresh en arrière-plan du mode stale-while-revalidate de SOURCES_CACHE.
+    """
+    try:
+        async with safe_async_session() as db:
+            service = SourceService(db)
+            return await retry_db_op(
+                lambda: service.get_all_sources(user_id),
+                session=db,
+                op_name="sources.get_all",
+            )
+    except (SQLAlchemyError, DBAPIError) as e:
+        logger.error(
+            "sources_endpoint_db_error",
+            user_id=user_id,
+            exc_type=type(e).__name__,
+            error=str(e)[:300],
+        )
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="sources_unavailable",
+        )
+
+
 @router.get("", response_model=SourceCatalogResponse)
 async def get_sources(
     user_id: str = Depends(get_current_user_id),
@@ -160,11 +187,19 @@ async def get_sources(
     d'avoir le lock — si un request concurrent tenait le lock plus de 10 s
     (ex. retry mobile), Postgres tuait la transaction idle et le request
     retombait en 503 après 3 retries exhaustés.
+
+    Mode stale-while-revalidate (``SOURCES_CACHE_STALE_SECONDS``) : une entrée
+    expirée mais encore dans la fenêtre stale est servie tout de suite et
+    recalculée en arrière-plan.
     """
     user_uuid = UUID(user_id)
 
-    cached = SOURCES_CACHE.get(user_uuid)
+    cached, is_stale = SOURCES_CACHE.get_or_stale(user_uuid)
     if cached is not None:
+        if is_stale:
+            SOURCES_CACHE.refresh_in_background(
+                user_uuid, lambda: _load_sources(user_id)
+            )
         return cached
 
     async with SOURCES_CACHE.lock(user_uuid):
@@ -172,30 +207,14 @@ async def get_sources(
         if cached is not None:
             return cached
 
-        # Session ouverte ICI — après le lock, juste avant les queries.
-        # Le timer idle_in_transaction_session_timeout ne démarre qu'à ce
-        # moment, éliminant le risque de timeout pendant l'attente de lock.
-        try:
-            async with safe_async_session() as db:
-                service = SourceService(db)
-                sources = await retry_db_op(
-                    lambda: service.get_all_sources(user_id),
-                    session=db,
-                    op_name="sources.get_all",
-                )
-        except (SQLAlchemyError, DBAPIError) as e:
-            logger.error(
-                "sources_endpoint_db_error",
-                user_id=user_id,
-                exc_type=type(e).__name__,
-                error=str(e)[:300],
-            )
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="sources_unavailable",
-            )
-
-        SOURCES_CACHE.put(user_uuid, sources)
+        # Session ouverte dans `_load_sources` — après le lock, juste avant
+        # les queries. Le timer idle_in_transaction_session_timeout ne démarre
+        # qu'à ce moment, éliminant le risque de timeout pendant l'attente de
+        # lock. Génération capturée avant : une invalidation pendant le
+        # compute droppe le `put`.
+        generation = SOURCES_CACHE.generation(user_uuid)
+        sources = await _load_sources(user_id)
+        SOURCES_CACHE.put(user_uuid, sources, generation=generation)
         return sources
 
 
@@ -14,6 +14,11 @@ class PaginationMeta(BaseModel):
     per_page: int
     total: int
     has_next: bool
+    # Jeton opaque du classement de la page 1 : à renvoyer (`cursor=`) avec
+    # les pages suivantes pour qu'elles soient servies sans re-classement.
+    # Additif (défaut None) : un client qui l'ignore garde la pagination
+    # par offset historique.
+    next_cursor: str | None = None
 
 
 class FeedItemResponse(ContentResponse):
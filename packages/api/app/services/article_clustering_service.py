@@ -4,7 +4,6 @@ Provides entity-based clustering for hot news detection (T4)
 and read-article-based perspective finding (T5).
 """
 
-import json
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
@@ -15,6 +14,7 @@ from sqlalchemy.orm import selectinload
 
 from app.models.content import Content, UserContentStatus
 from app.models.enums import ContentStatus
+from app.services.recommendation.helpers.entities import iter_entities
 
 logger = structlog.get_logger(__name__)
 
@@ -29,17 +29,11 @@ def parse_entities(article: Content) -> list[dict]:
         return []
     seen: set[str] = set()
     result: list[dict] = []
-    for raw in article.entities:
-        try:
-            obj = json.loads(raw)
-            name = obj.get("name", "").strip()
-            etype = obj.get("type", "")
-            key = name.lower()
-            if name and key not in seen:
-                seen.add(key)
-                result.append({"name": name, "type": etype, "key": key})
-        except (ValueError, TypeError):
+    for ref in iter_entities(article.entities):
+        if not ref.is_json or not ref.key or ref.key in seen:
             continue
+        seen.add(ref.key)
+        result.append({"name": ref.name.strip(), "type": ref.type, "key": ref.key})
     return result
 
 
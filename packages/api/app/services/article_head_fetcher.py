@@ -0,0 +1,135 @@
+"""Fetch partiel des pages article pour la détection paywall du sync RSS.
+
+Chaque nouvelle entrée d'un flux demande le début de sa page (JSON-LD,
+meta `og:article:content_tier`, cf. `paywall_detector.detect_paywall_from_html`).
+Ces fetchs étaient attendus un à un dans la boucle d'entrées : 50 nouveaux
+articles coûtaient jusqu'à 50 × 5 s, quelle que soit la capacité du média.
+
+`ArticleHeadFetcher` est partagé par toutes les sources d'un même passage de
+sync (les copies `copy.copy` de `SyncService` gardent la même instance) :
+
+- **plafond global** (`rss_sync_head_concurrency`) de fetchs simultanés ;
+- **par hôte** : au plus `rss_sync_head_per_host` connexions, et un départ
+  de requête toutes les `rss_sync_head_host_interval_ms` — la politesse vis-à-vis
+  d'un média dont on crawle 50 articles d'un coup ;
+- **lecture en flux** : requête `Range`, puis abandon de la connexion dès que
+  `</head>` est arrivé et que `detect_paywall_from_html` tient un signal
+  d'accès (JSON-LD `isAccessibleForFree`, `og:article:content_tier`,
+  `isPremium`) ; sans signal, on lit jusqu'au plafond — un JSON-LD tardif ou
+  dans le body peut encore le porter.
+
+Fail-soft : toute erreur donne `None` (→ scoring RSS de repli).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from urllib.parse import urlsplit
+
+import httpx
+import structlog
+
+from app.services.paywall_detector import detect_paywall_from_html
+
+logger = structlog.get_logger()
+
+#: Lecture maximale (caractères), comme l'ancien `response.text[:50000]`.
+HEAD_MAX_CHARS = 50_000
+HEAD_TIMEOUT_SECONDS = 5.0
+
+_HEAD_END = re.compile(r"</head\s*>", re.IGNORECASE)
+
+
+def head_is_complete(text: str) -> bool:
+    """Assez lu pour `detect_paywall_from_html` : `</head>` et un signal
+    d'accès déjà trouvé."""
+    return bool(_HEAD_END.search(text)) and detect_paywall_from_html(text) is not None
+
+
+class _HostSlot:
+    """Connexions et cadence d'un hôte."""
+
+    def __init__(self, connections: int) -> None:
+        self.connections = asyncio.Semaphore(connections)
+        self.next_start = 0.0
+
+
+class ArticleHeadFetcher:
+    """Début de page article, sous plafonds global et par hôte."""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        *,
+        concurrency: int,
+        per_host: int,
+        host_interval_seconds: float,
+    ) -> None:
+        self._client = client
+        self._global = asyncio.Semaphore(max(1, concurrency))
+        self._per_host = max(1, per_host)
+        self._host_interval = max(0.0, host_interval_seconds)
+        self._hosts: dict[str, _HostSlot] = {}
+        self._stats = {
+            "requests": 0,
+            "early_aborts": 0,
+            "chars": 0,
+            "errors": 0,
+            "throttled": 0,
+        }
+
+    async def _wait_turn(self, slot: _HostSlot) -> None:
+        # Réserve le prochain créneau de l'hôte avant de dormir : les
+        # requêtes concurrentes s'échelonnent au lieu de partir ensemble.
+        now = time.monotonic()
+        start = max(now, slot.next_start)
+        slot.next_start = start + self._host_interval
+        if start > now:
+            self._stats["throttled"] += 1
+            await asyncio.sleep(start - now)
+
+    async def fetch(self, url: str) -> str | None:
+        """Premiers caractères utiles de la page, ou None sur erreur."""
+        if not url:
+            return None
+        host = urlsplit(url).hostname or ""
+        slot = self._hosts.get(host)
+        if slot is None:
+            slot = self._hosts[host] = _HostSlot(self._per_host)
+        async with slot.connections:
+            await self._wait_turn(slot)
+            async with self._global:
+                self._stats["requests"] += 1
+                try:
+                    return await self._read_head(url)
+                except Exception:
+                    self._stats["errors"] += 1
+                    return None
+
+    async def _read_head(self, url: str) -> str | None:
+        async with self._client.stream(
+            "GET",
+            url,
+            headers={"Range": f"bytes=0-{HEAD_MAX_CHARS}"},
+            timeout=HEAD_TIMEOUT_SECONDS,
+        ) as response:
+            # Accept both 200 (full) and 206 (partial) responses
+            if response.status_code not in (200, 206):
+                return None
+            text = ""
+            async for chunk in response.aiter_text():
+                text += chunk
+                if len(text) >= HEAD_MAX_CHARS:
+                    break
+                if head_is_complete(text):
+                    # Sortie du `async with` : connexion fermée, reste ignoré.
+                    self._stats["early_aborts"] += 1
+                    break
+        text = text[:HEAD_MAX_CHARS]
+        self._stats["chars"] += len(text)
+        return text
+
+    def stats(self) -> dict[str, int]:
+        return {**self._stats, "hosts": len(self._hosts)}
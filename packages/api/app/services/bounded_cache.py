@@ -0,0 +1,234 @@
+"""Bounded-memory building blocks for the in-process caches.
+
+The per-user caches (`FEED_CACHE`, `SOURCES_CACHE`, `USER_CONTEXT_CACHE`, …)
+started as plain dicts that only shrink by TTL *on overwrite*: an entry read
+once and never again stays resident forever, and so do its `asyncio.Lock`
+and its generation counter. The 50-65 MB budget of `feed_cache.py` assumed
+100 DAU; past that the pod's RSS grows with every user ever seen since boot.
+
+Three primitives, adopted by each cache instead of its raw dicts:
+
+- :class:`BoundedLRU` — entries under a **byte budget**, evicted least
+  recently used first (size-aware: one large payload can evict several small
+  ones). Publishes `bytes`, `entries` and `evictions`.
+- :class:`LockRegistry` — per-key single-flight locks, with **reclamation of
+  idle locks** (not held, no waiter) once the registry grows past a
+  threshold. Dropping a lock someone holds or waits on would let a later
+  request create a fresh one and break single-flight; an idle lock carries
+  no state, so a fresh one is equivalent.
+- :class:`GenerationCounters` — per-key invalidation counters, capped. An
+  evicted key falls back to a **floor** (the max value ever evicted), so its
+  generation never goes backwards: a `put()` whose capture predates an
+  evicted invalidation still mismatches and is dropped. The worst case is a
+  spurious drop (a missed fill), never a resurrected payload.
+
+All of them assume a single asyncio event loop (no cross-thread access),
+like the caches using them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Surcoût fixe compté par entrée (clé, nœud d'OrderedDict, dataclass) : sans
+# lui, des milliers de petites entrées passeraient sous le budget.
+ENTRY_OVERHEAD_BYTES = 256
+
+
+def max_bytes_from_env(name: str, default: int) -> int:
+    """Read a byte budget from env. `0` disables the bound (unbounded)."""
+    raw = os.environ.get(name, str(default))
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning("bounded_cache_invalid_budget %s=%s, defaulting", name, raw)
+        return default
+
+
+class BoundedLRU[K: Hashable, V]:
+    """`OrderedDict` LRU under a byte budget.
+
+    `sizeof(value)` is called once per `put` (keep it O(1) or proportional to
+    work already done); `on_evict(key, value)` runs for budget evictions only —
+    not for explicit `pop`, whose caller already knows."""
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int,
+        sizeof: Callable[[V], int],
+        on_evict: Callable[[K, V], None] | None = None,
+    ) -> None:
+        self._max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._on_evict = on_evict
+        self._data: OrderedDict[K, tuple[V, int]] = OrderedDict()
+        self._bytes = 0
+        self._evictions = 0
+
+    @property
+    def bytes(self) -> int:
+        return self._bytes
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(list(self._data))
+
+    def get(self, key: K) -> V | None:
+        """Value for `key`, marked most recently used."""
+        found = self._data.get(key)
+        if found is None:
+            return None
+        self._data.move_to_end(key)
+        return found[0]
+
+    def peek(self, key: K) -> V | None:
+        """Value for `key` without touching the LRU order."""
+        found = self._data.get(key)
+        return found[0] if found is not None else None
+
+    def put(self, key: K, value: V) -> None:
+        size = self._sizeof(value) + ENTRY_OVERHEAD_BYTES
+        previous = self._data.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous[1]
+        self._data[key] = (value, size)
+        self._bytes += size
+        self._evict_over_budget(keep=key)
+
+    def pop(self, key: K) -> V | None:
+        found = self._data.pop(key, None)
+        if found is None:
+            return None
+        self._bytes -= found[1]
+        return found[0]
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._bytes = 0
+
+    def _evict_over_budget(self, *, keep: K) -> None:
+        if not self._max_bytes:
+            return
+        while self._bytes > self._max_bytes and len(self._data) > 1:
+            key, (value, size) = next(iter(self._data.items()))
+            if key == keep:
+                # L'entrée qu'on vient d'écrire est plus grosse que le budget
+                # restant : on la garde (seule), le reste est déjà parti.
+                break
+            del self._data[key]
+            self._bytes -= size
+            self._evictions += 1
+            if self._on_evict is not None:
+                self._on_evict(key, value)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._data),
+            "bytes": self._bytes,
+            "max_bytes": self._max_bytes,
+            "evictions": self._evictions,
+        }
+
+
+def lock_is_idle(lock: object) -> bool:
+    """True when nobody holds `lock` nor waits on it.
+
+    `asyncio.Lock` exposes no public waiter count; `_waiters` is the deque it
+    has kept since 3.4 (None until the first contention). A waiter just woken
+    by `release()` is still in it until it runs — so it is never reclaimed
+    mid hand-off. Locks of another type can define `is_idle()`."""
+    is_idle = getattr(lock, "is_idle", None)
+    if is_idle is not None:
+        return bool(is_idle())
+    if isinstance(lock, asyncio.Lock):
+        return not lock.locked() and not lock._waiters
+    return False
+
+
+class LockRegistry[K: Hashable, L]:
+    """Per-key locks created on demand, idle ones reclaimed past a threshold.
+
+    Reclamation runs on creation only, when the registry has doubled since the
+    last sweep (amortized O(1)), and never drops a lock in use — the lock
+    identity a caller holds stays the one later callers get."""
+
+    def __init__(self, factory: Callable[[K], L], *, sweep_above: int = 1024) -> None:
+        self._factory = factory
+        self._min_sweep = sweep_above
+        self._sweep_at = sweep_above
+        self._locks: dict[K, L] = {}
+        self._reclaimed = 0
+
+    def get(self, key: K) -> L:
+        lock = self._locks.get(key)
+        if lock is None:
+            if len(self._locks) >= self._sweep_at:
+                self.reclaim()
+                self._sweep_at = max(self._min_sweep, 2 * len(self._locks))
+            lock = self._factory(key)
+            self._locks[key] = lock
+        return lock
+
+    def reclaim(self) -> int:
+        """Drop every idle lock. Returns how many were dropped."""
+        idle = [key for key, lock in self._locks.items() if lock_is_idle(lock)]
+        for key in idle:
+            del self._locks[key]
+        self._reclaimed += len(idle)
+        return len(idle)
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+    def clear(self) -> None:
+        self._locks.clear()
+        self._sweep_at = self._min_sweep
+
+    def stats(self) -> dict[str, int]:
+        return {"locks": len(self._locks), "locks_reclaimed": self._reclaimed}
+
+
+class GenerationCounters[K: Hashable]:
+    """Per-key monotonic counters, at most `max_keys` resident.
+
+    Cf. module docstring for why evicting a counter is safe (the floor)."""
+
+    def __init__(self, *, max_keys: int = 50_000) -> None:
+        self._max_keys = max_keys
+        self._values: OrderedDict[K, int] = OrderedDict()
+        self._floor = 0
+
+    def get(self, key: K) -> int:
+        return self._values.get(key, self._floor)
+
+    def bump(self, key: K) -> int:
+        value = self.get(key) + 1
+        self._values[key] = value
+        self._values.move_to_end(key)
+        while len(self._values) > self._max_keys:
+            _, evicted = self._values.popitem(last=False)
+            self._floor = max(self._floor, evicted)
+        return value
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def clear(self) -> None:
+        self._values.clear()
+        self._floor = 0
@@ -0,0 +1,106 @@
+"""Background recomputes for the stale-while-revalidate caches.
+
+Shared by :mod:`app.services.feed_cache` and :mod:`app.services.sources_cache`
+when their soft-TTL mode is on (``*_STALE_SECONDS > 0``): once an entry passes
+its soft TTL, the request is served the stale payload immediately and the
+recompute runs here, off the request path.
+
+Bounds
+------
+- **One refresh per key** — a second stale hit on a key already refreshing
+  schedules nothing.
+- **Global concurrency cap** (``CACHE_REFRESH_MAX_CONCURRENCY``, default 2)
+  shared by every cache: each refresh holds a DB connection for the length
+  of a full compute (1.5-5 s for the feed), so an unbounded fan-out on a
+  popular TTL boundary would starve the pool the foreground requests need.
+  A refresh that finds the cap full is **dropped**, not queued — the entry
+  stays stale, and the next stale hit (or the hard TTL) retries.
+- Failures are logged and swallowed: the stale payload keeps being served
+  until the hard TTL, then the foreground path recomputes as before.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from collections.abc import Awaitable, Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+def _max_concurrency_from_env() -> int:
+    raw = os.environ.get("CACHE_REFRESH_MAX_CONCURRENCY", "2")
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        logger.warning("cache_refresh_invalid_concurrency raw=%s, defaulting to 2", raw)
+        return 2
+
+
+class BackgroundRefresher:
+    """Run at most `max_concurrency` refreshes at once, one per key."""
+
+    def __init__(self, max_concurrency: int | None = None) -> None:
+        self._max = (
+            max_concurrency
+            if max_concurrency is not None
+            else _max_concurrency_from_env()
+        )
+        self._inflight: dict[Hashable, asyncio.Task[None]] = {}
+        self._scheduled = 0
+        self._skipped_busy = 0
+        self._failures = 0
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max
+
+    def schedule(self, key: Hashable, refresh: Callable[[], Awaitable[None]]) -> bool:
+        """Start `refresh()` in the background for `key`. Returns False when
+        the key is already refreshing or the global cap is reached."""
+        if key in self._inflight:
+            return False
+        if len(self._inflight) >= self._max:
+            self._skipped_busy += 1
+            return False
+        task = asyncio.create_task(self._run(key, refresh))
+        # La référence dans `_inflight` empêche le GC de la task en vol.
+        self._inflight[key] = task
+        self._scheduled += 1
+        return True
+
+    async def _run(self, key: Hashable, refresh: Callable[[], Awaitable[None]]) -> None:
+        try:
+            await refresh()
+        except Exception:
+            self._failures += 1
+            logger.warning("cache_refresh_failed key=%s", key, exc_info=True)
+        finally:
+            self._inflight.pop(key, None)
+
+    async def drain(self) -> None:
+        """Wait for the in-flight refreshes (tests, graceful shutdown)."""
+        while self._inflight:
+            await asyncio.gather(*self._inflight.values(), return_exceptions=True)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "inflight": len(self._inflight),
+            "scheduled": self._scheduled,
+            "skipped_busy": self._skipped_busy,
+            "failures": self._failures,
+            "max_concurrency": self._max,
+        }
+
+    def clear(self) -> None:
+        """Test helper. Forgets in-flight tasks without cancelling them — they
+        belong to the event loop of the test that scheduled them."""
+        self._inflight.clear()
+        self._scheduled = 0
+        self._skipped_busy = 0
+        self._failures = 0
+
+
+BACKGROUND_REFRESHER = BackgroundRefresher()
+"""Module-level singleton — the cap is global across the caches using it."""
@@ -0,0 +1,287 @@
+"""Per-user candidate-pool snapshot shared by the Tournée section requests.
+
+Cousin of :mod:`app.services.feed_cache` and
+:mod:`app.services.user_context_cache` — caches the *candidate rows* the
+personalized sections are cut from.
+
+Background
+----------
+The ~10 ``personalized=true`` theme/topic section calls fired at cold open
+each ran their own ``SELECT Content … JOIN source … NOT EXISTS
+(user_content_status)`` over the same followed sources and the same 24→72 h
+window, each holding a pool connection. Their rows overlap almost entirely:
+only the theme/topic predicate differs.
+
+Design
+------
+- **One wide query** per user: followed sources, 72 h (the widest tier of
+  ``THEMATIC_WINDOW_TIERS_HOURS``), every filter the sections share (hidden
+  exclusion, digest exclusion, mutes, paywall, language) — but *not* the
+  theme/topic predicate. Sections then filter the snapshot in memory with
+  :func:`filter_section_pool`, which mirrors the SQL predicates and ordering.
+- The rows are loaded on a short session and **detached** (``html_content``
+  deferred — no feed surface reads it). The snapshot rows are never handed
+  out: each section request gets its own copies (:func:`detached_copy`),
+  so the request-scoped fields it writes (``recommendation_reason`` from its
+  own scoring context, ``is_saved``, ``status``, ``is_followed_source``…)
+  never leak into a concurrent section serving the same article.
+- **Exactness over reuse**: a snapshot that hit its row cap is flagged
+  ``complete=False`` and callers fall back to the per-section SQL path —
+  the in-memory cut of a truncated pool would differ from the SQL one.
+- The key is the full signature of the shared filters; any change (new
+  digest, mute, follow…) is a miss. Writes also drop the snapshot through
+  ``FEED_CACHE.invalidate`` (listener registered at import time), and
+  those of other workers through ``FEED_CACHE.sync_invalidations``. TTL via
+  ``CANDIDATE_POOL_CACHE_TTL_SECONDS`` (default 30 s, ``0`` disables).
+- Snapshots are the heaviest per-user entries (up to ``SNAPSHOT_MAX_ROWS``
+  ORM rows): they sit in a ``BoundedLRU`` under
+  ``CANDIDATE_POOL_CACHE_MAX_BYTES`` (default 64 MiB, ``0`` = unbounded).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.models.content import Content
+from app.services.bounded_cache import (
+    BoundedLRU,
+    GenerationCounters,
+    LockRegistry,
+    max_bytes_from_env,
+)
+from app.services.feed_cache import FEED_CACHE
+
+logger = logging.getLogger(__name__)
+
+# Plafond de lignes du snapshot. Au-delà, le pool est tronqué → repli SQL.
+SNAPSHOT_MAX_ROWS = 2000
+
+# Estimation par ligne détachée (Content sans html_content + état
+# SQLAlchemy + description) pour le budget mémoire.
+_ROW_BYTES = 4096
+
+
+def _ttl_from_env() -> float:
+    """Read TTL from env. ``CANDIDATE_POOL_CACHE_TTL_SECONDS=0`` disables the cache."""
+    raw = os.environ.get("CANDIDATE_POOL_CACHE_TTL_SECONDS", "30")
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        logger.warning(
+            "candidate_pool_cache_invalid_ttl raw=%s, defaulting to 30s", raw
+        )
+        return 30.0
+
+
+def _max_bytes_from_env() -> int:
+    """``CANDIDATE_POOL_CACHE_MAX_BYTES`` — ``0`` disables the bound."""
+    return max_bytes_from_env("CANDIDATE_POOL_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+
+
+@dataclass(frozen=True)
+class CandidatePoolSnapshot:
+    """Detached candidate rows, ``published_at DESC``, plus fetch metadata."""
+
+    signature: Hashable
+    rows: tuple[Content, ...]
+    fetched_at: datetime.datetime
+    complete: bool
+
+
+def detached_copy(row: Content) -> Content:
+    """Request-owned copy of a snapshot row, detached like the original.
+
+    Loaded columns and eager relationships (``source``, shared read-only) are
+    copied; unloaded ones (``html_content``) stay unloaded.
+    """
+    clone = inspect(type(row)).class_manager.new_instance()
+    clone.__dict__.update(
+        {k: v for k, v in row.__dict__.items() if k != "_sa_instance_state"}
+    )
+    make_transient_to_detached(clone)
+    return clone
+
+
+def filter_section_pool(
+    rows: Sequence[Content],
+    *,
+    since: datetime.datetime,
+    theme: str | None,
+    topic: str | None,
+    user_subtopics: set[str] | None,
+    limit: int,
+) -> list[Content]:
+    """In-memory twin of one section's SQL cut of the pool.
+
+    Mirrors ``apply_theme_focus_filter`` (content theme, or primary source
+    theme for unclassified rows), ``apply_topic_filter`` (``topic =
+    ANY(topics)``) and the two-phase ordering: ``topics && user_subtopics
+    DESC`` — where Postgres sorts NULL (``topics IS NULL``) *first* — then
+    ``published_at DESC``.
+    """
+    selected = []
+    for c in rows:
+        if c.published_at < since:
+            continue
+        if theme is not None and not (
+            c.theme == theme
+            or (c.theme is None and c.source is not None and c.source.theme == theme)
+        ):
+            continue
+        if topic is not None and topic not in (c.topics or ()):
+            continue
+        selected.append(c)
+
+    if user_subtopics:
+        subtopics = set(user_subtopics)
+
+        def _overlap_rank(c: Content) -> int:
+            if c.topics is None:
+                return 2
+            return 1 if subtopics.intersection(c.topics) else 0
+
+        # `rows` est déjà en published_at DESC : le tri stable ne réordonne
+        # que par rang d'overlap.
+        selected.sort(key=_overlap_rank, reverse=True)
+    return selected[:limit]
+
+
+@dataclass
+class _Entry:
+    expires_at: float
+    payload: CandidatePoolSnapshot
+
+
+def _entry_bytes(entry: _Entry) -> int:
+    return len(entry.payload.rows) * _ROW_BYTES
+
+
+class CandidatePoolCache:
+    """Per-user TTL cache of :class:`CandidatePoolSnapshot`, single-flight.
+
+    See ``feed_cache.FeedPageCache`` for the rationale on locks and TTL.
+    """
+
+    def __init__(
+        self, ttl_seconds: float | None = None, max_bytes: int | None = None
+    ) -> None:
+        self._ttl = ttl_seconds if ttl_seconds is not None else _ttl_from_env()
+        self._entries: BoundedLRU[UUID, _Entry] = BoundedLRU(
+            max_bytes=max_bytes if max_bytes is not None else _max_bytes_from_env(),
+            sizeof=_entry_bytes,
+        )
+        self._locks: LockRegistry[UUID, asyncio.Lock] = LockRegistry(
+            lambda _: asyncio.Lock()
+        )
+        self._generations: GenerationCounters[UUID] = GenerationCounters()
+        self._hits = 0
+        self._misses = 0
+        self._builds = 0
+        self._incomplete = 0
+        self._invalidations = 0
+
+    @property
+    def ttl_seconds(self) -> float:
+        return self._ttl
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    def lock(self, user_id: UUID) -> asyncio.Lock:
+        return self._locks.get(user_id)
+
+    def _fresh(
+        self, user_id: UUID, signature: Hashable
+    ) -> CandidatePoolSnapshot | None:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        if entry.expires_at < time.monotonic():
+            self._entries.pop(user_id)
+            return None
+        if entry.payload.signature != signature:
+            return None
+        return entry.payload
+
+    async def get_or_build(
+        self,
+        user_id: UUID,
+        signature: Hashable,
+        build: Callable[[], Awaitable[CandidatePoolSnapshot]],
+    ) -> CandidatePoolSnapshot:
+        """Return the snapshot matching ``signature``, building it at most once
+        for concurrent callers."""
+        FEED_CACHE.sync_invalidations(user_id)
+        hit = self._fresh(user_id, signature) if self.enabled else None
+        if hit is not None:
+            self._hits += 1
+            return hit
+        async with self.lock(user_id):
+            hit = self._fresh(user_id, signature) if self.enabled else None
+            if hit is not None:
+                # Construit par un autre waiter pendant l'attente du lock :
+                # c'est précisément la réutilisation qu'on mesure.
+                self._hits += 1
+                return hit
+            self._misses += 1
+            generation = self._generations.get(user_id)
+            snapshot = await build()
+            self._builds += 1
+            if not snapshot.complete:
+                self._incomplete += 1
+            if self.enabled and generation == self._generations.get(user_id):
+                self._entries.put(
+                    user_id,
+                    _Entry(expires_at=time.monotonic() + self._ttl, payload=snapshot),
+                )
+            return snapshot
+
+    def invalidate(self, user_id: UUID) -> None:
+        self._generations.bump(user_id)
+        if self._entries.pop(user_id) is not None:
+            self._invalidations += 1
+
+    def stats(self) -> dict[str, int | float]:
+        """``hits`` = section requests served from a shared snapshot;
+        ``reuse_per_build`` = sections served per wide query."""
+        total = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "builds": self._builds,
+            "incomplete": self._incomplete,
+            "invalidations": self._invalidations,
+            "size": len(self._entries),
+            "hit_rate": (self._hits / total) if total else 0.0,
+            "reuse_per_build": (total / self._builds) if self._builds else 0.0,
+            "ttl_seconds": self._ttl,
+            **{k: v for k, v in self._entries.stats().items() if k != "entries"},
+            **self._locks.stats(),
+        }
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._locks.clear()
+        self._generations.clear()
+        self._hits = 0
+        self._misses = 0
+        self._builds = 0
+        self._incomplete = 0
+        self._invalidations = 0
+
+
+CANDIDATE_POOL_CACHE = CandidatePoolCache()
+"""Module-level singleton — import as ``from app.services.candidate_pool_cache import CANDIDATE_POOL_CACHE``."""
+
+FEED_CACHE.add_invalidate_listener(CANDIDATE_POOL_CACHE.invalidate)
@@ -0,0 +1,273 @@
+"""Process-wide aggregates behind the Phase B carousels.
+
+One snapshot per process, shared by every request, refreshed by the workers
+rather than by readers.
+
+Background
+----------
+Phase B of ``_build_carousels`` (shared with l'Essentiel through
+:mod:`app.services.recommendation.carousel_catalog`) ran a dozen sequential
+SELECTs per request. The heaviest do not depend on the user at all: the
+community ranking (``GROUP BY`` over every like of the last 7 days), the
+per-source probes of ``new_source`` (up to 8 round-trips, most of them for
+sources with nothing to show) and the ``LATERAL`` volume probe of
+``quiet_sources`` (one per followed source).
+
+Design
+------
+- :meth:`CarouselAggregates.refresh` rebuilds the snapshot in two queries:
+  per-source volume over :data:`VOLUME_WINDOWS_DAYS` (one ``count(*)
+  FILTER`` per window) and the top :data:`COMMUNITY_TOP_N` of the community
+  ranking, unfiltered. Run after every ``sync_all_sources`` and after every
+  classification batch, throttled by
+  ``CAROUSEL_AGGREGATES_MIN_INTERVAL_SECONDS`` (default 60 s) — the
+  classification loop ticks every few seconds.
+- Readers apply their per-user exclusions on the snapshot. They get
+  ``None`` — and keep their SQL — when the snapshot is older than
+  ``CAROUSEL_AGGREGATES_MAX_AGE_SECONDS`` (default 1800 s, ``0`` disables
+  the layer), or when the exclusions exhaust a truncated top list.
+- Volumes are counted without exclusion: an upper bound of what a user's
+  probe would find, only used to *skip* probes that cannot succeed. The
+  Tournée reads the 3-day window the same way: summed over the followed
+  sources, it tells whether the shared candidate pool would exceed
+  ``SNAPSHOT_MAX_ROWS`` before paying its wide query.
+- Fail-soft: a refresh error is logged and keeps the previous snapshot
+  (until it ages out).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import logging
+import os
+import time
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from sqlalchemy import func, select
+
+from app.database import safe_async_session
+from app.models.content import Content
+from app.services.community_recommendation_service import (
+    CommunityRecommendationService,
+)
+
+logger = logging.getLogger(__name__)
+
+# Fenêtres lues : borne du pool partagé de la Tournée (3 j, dernier palier de
+# `THEMATIC_WINDOW_TIERS_HOURS`), `new_source` (7 j), `quiet_sources` (30 j).
+VOLUME_WINDOWS_DAYS: tuple[int, ...] = (3, 7, 30)
+# Profondeur du classement communautaire gardée en mémoire : assez pour
+# absorber les exclusions (consommés + triés) d'un utilisateur actif.
+COMMUNITY_TOP_N = 50
+
+
+def _seconds_from_env(name: str, default: float) -> float:
+    raw = os.environ.get(name, str(default))
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        logger.warning(
+            "carousel_aggregates_invalid_env %s=%s, defaulting to %ss",
+            name,
+            raw,
+            default,
+        )
+        return default
+
+
+def _max_age_from_env() -> float:
+    """``CAROUSEL_AGGREGATES_MAX_AGE_SECONDS=0`` disables the layer."""
+    return _seconds_from_env("CAROUSEL_AGGREGATES_MAX_AGE_SECONDS", 1800.0)
+
+
+def _min_interval_from_env() -> float:
+    return _seconds_from_env("CAROUSEL_AGGREGATES_MIN_INTERVAL_SECONDS", 60.0)
+
+
+@dataclass(frozen=True)
+class CommunityPick:
+    """One row of the community ranking (``top_scores`` shape)."""
+
+    id: UUID
+    score: float
+    sunflower_count: int
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    built_at: float
+    volumes: dict[int, dict[UUID, int]] = field(default_factory=dict)
+    community_top: tuple[CommunityPick, ...] = ()
+
+
+class CarouselAggregates:
+    """Per-source volumes and community top-N, refreshed out of band."""
+
+    def __init__(
+        self,
+        max_age_seconds: float | None = None,
+        min_interval_seconds: float | None = None,
+    ) -> None:
+        self._max_age = (
+            max_age_seconds if max_age_seconds is not None else _max_age_from_env()
+        )
+        self._min_interval = (
+            min_interval_seconds
+            if min_interval_seconds is not None
+            else _min_interval_from_env()
+        )
+        self._snapshot: _Snapshot | None = None
+        self._refresh_lock = asyncio.Lock()
+        self._refreshes = 0
+        self._throttled = 0
+        self._errors = 0
+        self._volume_hits = 0
+        self._community_hits = 0
+        self._community_fallbacks = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_age > 0
+
+    def _fresh(self) -> _Snapshot | None:
+        snapshot = self._snapshot
+        if (
+            not self.enabled
+            or snapshot is None
+            or time.monotonic() - snapshot.built_at > self._max_age
+        ):
+            return None
+        return snapshot
+
+    # ─── Refresh ─────────────────────────────────────────────────────────
+
+    async def refresh(self, *, force: bool = False) -> bool:
+        """Rebuild the snapshot unless it is younger than the min interval.
+        Returns True when it was rebuilt; fail-soft."""
+        if not self.enabled:
+            return False
+        async with self._refresh_lock:
+            snapshot = self._snapshot
+            if (
+                not force
+                and snapshot is not None
+                and time.monotonic() - snapshot.built_at < self._min_interval
+            ):
+                self._throttled += 1
+                return False
+            now = datetime.datetime.now(datetime.UTC)
+            since = {
+                days: now - datetime.timedelta(days=days)
+                for days in VOLUME_WINDOWS_DAYS
+            }
+            volume_stmt = (
+                select(
+                    Content.source_id,
+                    *(
+                        func.count()
+                        .filter(Content.published_at >= since[days])
+                        .label(f"d{days}")
+                        for days in VOLUME_WINDOWS_DAYS
+                    ),
+                )
+                .where(Content.published_at >= since[max(VOLUME_WINDOWS_DAYS)])
+                .group_by(Content.source_id)
+            )
+            try:
+                async with safe_async_session(
+                    statement_timeout_ms=15_000, idle_in_tx_timeout_ms=5_000
+                ) as s:
+                    volume_rows = (await s.execute(volume_stmt)).all()
+                    community_rows = await CommunityRecommendationService(s).top_scores(
+                        limit=COMMUNITY_TOP_N
+                    )
+            except Exception as exc:
+                self._errors += 1
+                logger.warning("carousel_aggregates_refresh_failed error=%s", exc)
+                return False
+            volumes: dict[int, dict[UUID, int]] = {d: {} for d in VOLUME_WINDOWS_DAYS}
+            for row in volume_rows:
+                for days in VOLUME_WINDOWS_DAYS:
+                    count = getattr(row, f"d{days}")
+                    if count:
+                        volumes[days][row.source_id] = int(count)
+            self._snapshot = _Snapshot(
+                built_at=time.monotonic(),
+                volumes=volumes,
+                community_top=tuple(
+                    CommunityPick(r.id, float(r.score), int(r.sunflower_count))
+                    for r in community_rows
+                ),
+            )
+            self._refreshes += 1
+            logger.info(
+                "carousel_aggregates_refreshed sources=%d community=%d",
+                len(volume_rows),
+                len(community_rows),
+            )
+            return True
+
+    # ─── Reads ───────────────────────────────────────────────────────────
+
+    def source_volumes(self, window_days: int) -> Mapping[UUID, int] | None:
+        """``source_id`` → articles published in the last ``window_days`` (one
+        of :data:`VOLUME_WINDOWS_DAYS`; absent = 0), or None when not fresh."""
+        snapshot = self._fresh()
+        if snapshot is None:
+            return None
+        self._volume_hits += 1
+        return snapshot.volumes[window_days]
+
+    def community_top(
+        self, limit: int, exclude_ids: Iterable[UUID] | None = None
+    ) -> list[CommunityPick] | None:
+        """Best ``limit`` community picks outside ``exclude_ids``, or None
+        when the snapshot cannot answer (→ ``top_scores`` SQL)."""
+        snapshot = self._fresh()
+        if snapshot is None:
+            return None
+        excluded = set(exclude_ids or ())
+        picks = [p for p in snapshot.community_top if p.id not in excluded][:limit]
+        if len(picks) < limit and len(snapshot.community_top) >= COMMUNITY_TOP_N:
+            # Le top tronqué ne suffit plus : le rang N+1 peut être éligible.
+            self._community_fallbacks += 1
+            return None
+        self._community_hits += 1
+        return picks
+
+    def stats(self) -> dict[str, int | float | bool | None]:
+        snapshot = self._snapshot
+        return {
+            "enabled": self.enabled,
+            "fresh": self._fresh() is not None,
+            "sources": len(snapshot.volumes[max(VOLUME_WINDOWS_DAYS)])
+            if snapshot
+            else 0,
+            "community": len(snapshot.community_top) if snapshot else 0,
+            "refreshes": self._refreshes,
+            "throttled": self._throttled,
+            "errors": self._errors,
+            "volume_hits": self._volume_hits,
+            "community_hits": self._community_hits,
+            "community_fallbacks": self._community_fallbacks,
+            "seconds_since_refresh": (
+                round(time.monotonic() - snapshot.built_at, 1) if snapshot else None
+            ),
+            "max_age_seconds": self._max_age,
+        }
+
+    def clear(self) -> None:
+        self._snapshot = None
+        self._refreshes = 0
+        self._throttled = 0
+        self._errors = 0
+        self._volume_hits = 0
+        self._community_hits = 0
+        self._community_fallbacks = 0
+
+
+CAROUSEL_AGGREGATES = CarouselAggregates()
+"""Module-level singleton — import as ``from app.services.carousel_aggregates import CAROUSEL_AGGREGATES``."""
@@ -47,6 +47,35 @@ class ClassificationQueueService:
 
         return True
 
+    async def enqueue_many(self, priorities: dict[UUID, int]) -> None:
+        """Ajoute un lot de contenus (`content_id` → priorité) à la file, en
+        un seul INSERT ; les contenus déjà en file sont ignorés.
+
+        Ne commit pas : l'appelant (`SyncService._save_contents`) insère les
+        contenus dans la même transaction.
+        """
+        if not priorities:
+            return
+        now = datetime.utcnow()
+        query = (
+            insert(ClassificationQueue)
+            .values(
+                [
+                    {
+                        "content_id": content_id,
+                        "status": "pending",
+                        "priority": priority,
+                        "retry_count": 0,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                    for content_id, priority in priorities.items()
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=["content_id"])
+        )
+        await self.session.execute(query)
+
     async def dequeue_batch(self, batch_size: int = 10) -> list[ClassificationQueue]:
         """Récupère le prochain lot d'articles en attente (opération atomique).
 
@@ -110,6 +139,8 @@ class ClassificationQueueService:
         is_serene: bool | None = None,
         is_good_news: bool | None = None,
         is_ad: bool | None = None,
+        *,
+        commit: bool = True,
     ) -> None:
         """Marque un élément comme complété avec topics, entités, sérénité, good news et is_ad.
 
@@ -121,6 +152,8 @@ class ClassificationQueueService:
             is_good_news: True si véritable bonne nouvelle (espoir, progrès tangible),
                 False sinon, None si inconnu. Indépendant d'is_serene.
             is_ad: True si publicité / native ad, False sinon, None si inconnu.
+            commit: False pour laisser l'appelant committer un lot d'écritures
+                d'un coup (étage d'écriture du ClassificationWorker).
         """
         import structlog
 
@@ -186,11 +219,16 @@ class ClassificationQueueService:
                             content_id=str(content.id),
                         )
 
-            await self.session.commit()
+            if commit:
+                await self.session.commit()
 
-    async def mark_failed(self, queue_id: UUID, error: str) -> bool:
+    async def mark_failed(
+        self, queue_id: UUID, error: str, *, commit: bool = True
+    ) -> bool:
         """Marque un élément comme échoué avec logique de retry.
 
+        `commit=False` laisse l'appelant committer (écriture groupée).
+
         Returns:
             True si l'élément sera retenté, False si échec permanent.
         """
@@ -204,11 +242,13 @@ class ClassificationQueueService:
 
         if item.retry_count >= 3:
             item.status = "failed"
-            await self.session.commit()
+            if commit:
+                await self.session.commit()
             return False  # Échec permanent
         else:
             item.status = "pending"  # Réessayer
-            await self.session.commit()
+            if commit:
+                await self.session.commit()
             return True  # Sera retenté
 
     async def reset_stale_processing(self, stale_minutes: int = 10) -> int:
@@ -32,15 +32,15 @@ class CommunityRecommendationService:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def get_top_recommendations(
+    async def top_scores(
         self,
         limit: int = MAX_CAROUSEL_ITEMS,
         exclude_ids: set | None = None,
-    ) -> list[dict]:
-        """Feed carousel: best articles over 7 days, scored by decay.
+    ) -> list:
+        """Ranked `(id, score, sunflower_count)` rows over 7 days, score DESC.
 
-        Returns articles sorted by weighted score (descending).
-        Each dict contains: content (Content), sunflower_count (int), score (float).
+        The aggregate behind `get_top_recommendations`, without hydration —
+        also snapshotted per process by `carousel_aggregates`.
         """
         now = datetime.datetime.now(datetime.UTC)
         window_start = now - datetime.timedelta(days=COMMUNITY_WINDOW_DAYS)
@@ -52,28 +52,49 @@ class CommunityRecommendationService:
 
         exclusion = Content.id.notin_(exclude_ids) if exclude_ids else True
 
-        rows = (
-            await self.session.execute(
-                select(
-                    Content.id,
-                    func.sum(decay_weight).label("score"),
-                    func.count(UserContentStatus.id).label("sunflower_count"),
-                )
-                .join(
-                    UserContentStatus,
-                    UserContentStatus.content_id == Content.id,
-                )
-                .where(
-                    UserContentStatus.is_liked.is_(True),
-                    UserContentStatus.liked_at >= window_start,
-                    exclusion,
+        return list(
+            (
+                await self.session.execute(
+                    select(
+                        Content.id,
+                        func.sum(decay_weight).label("score"),
+                        func.count(UserContentStatus.id).label("sunflower_count"),
+                    )
+                    .join(
+                        UserContentStatus,
+                        UserContentStatus.content_id == Content.id,
+                    )
+                    .where(
+                        UserContentStatus.is_liked.is_(True),
+                        UserContentStatus.liked_at >= window_start,
+                        exclusion,
+                    )
+                    .group_by(Content.id)
+                    .having(func.count(UserContentStatus.id) >= 1)
+                    .order_by(func.sum(decay_weight).desc())
+                    .limit(limit)
                 )
-                .group_by(Content.id)
-                .having(func.count(UserContentStatus.id) >= 1)
-                .order_by(func.sum(decay_weight).desc())
-                .limit(limit)
-            )
-        ).all()
+            ).all()
+        )
+
+    async def get_top_recommendations(
+        self,
+        limit: int = MAX_CAROUSEL_ITEMS,
+        exclude_ids: set | None = None,
+        ranked: list | None = None,
+    ) -> list[dict]:
+        """Feed carousel: best articles over 7 days, scored by decay.
+
+        Returns articles sorted by weighted score (descending).
+        Each dict contains: content (Content), sunflower_count (int), score (float).
+        `ranked` — rows already ranked and filtered (`top_scores` shape), e.g.
+        from the `carousel_aggregates` snapshot: only the hydration runs.
+        """
+        rows = (
+            ranked
+            if ranked is not None
+            else await self.top_scores(limit=limit, exclude_ids=exclude_ids)
+        )
 
         if not rows:
             return []
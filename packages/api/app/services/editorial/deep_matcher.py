@@ -16,7 +16,6 @@ No time limit on deep articles (can be months old).
 from __future__ import annotations
 
 import asyncio
-import json
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime, timedelta
 
@@ -31,6 +30,7 @@ from app.services.briefing.importance_detector import ImportanceDetector
 from app.services.editorial.config import EditorialConfig
 from app.services.editorial.llm_client import EditorialLLMClient
 from app.services.editorial.schemas import MatchedDeepArticle, SelectedTopic
+from app.services.recommendation.helpers.entities import decode_entity
 
 logger = structlog.get_logger()
 
@@ -346,12 +346,11 @@ class DeepMatcher:
         for raw in content.entities or []:
             if not raw:
                 continue
-            name: str | None
-            try:
-                parsed = json.loads(raw)
-                name = parsed.get("name") if isinstance(parsed, dict) else None
-            except (json.JSONDecodeError, TypeError):
-                name = raw.split(":")[0] if ":" in raw else raw
+            ref = decode_entity(raw)
+            if ref is None:
+                continue
+            # Forme legacy "name:type" quand l'entité est stockée en clair.
+            name = ref.name if ref.is_json else raw.split(":")[0]
             if name:
                 names.add(name.lower().strip())
         return names
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+from contextlib import AbstractAsyncContextManager, nullcontext
 
 import httpx
 import structlog
@@ -43,21 +44,51 @@ def _get_large_limiter() -> _MistralRateLimiter:
     return _large_limiter
 
 
+# Pendant `small` : les voies concurrentes du ClassificationWorker (topics,
+# entités, retries individuels) partagent ce plafond, quel que soit leur nombre.
+_small_limiter: _MistralRateLimiter | None = None
+
+
+def _get_small_limiter() -> _MistralRateLimiter:
+    global _small_limiter
+    if _small_limiter is None:
+        settings = get_settings()
+        _small_limiter = _MistralRateLimiter(
+            rpm=settings.mistral_small_rpm,
+            concurrency=settings.mistral_small_concurrency,
+        )
+    return _small_limiter
+
+
 def _reset_large_limiter() -> None:
-    """Réinitialise le singleton (hook de test : bucket plein à chaque cas)."""
-    global _large_limiter
+    """Réinitialise les singletons (hook de test : bucket plein à chaque cas)."""
+    global _large_limiter, _small_limiter
     _large_limiter = None
+    _small_limiter = None
+
+
+def mistral_slot(model: str | None) -> AbstractAsyncContextManager[None]:
+    """Slot du limiteur partagé de `model` (`large` ou `small`), hors client.
+
+    Pour les services ML qui postent via leur propre client httpx
+    (`ClassificationService`, `GoodNewsClassifier`) : même throttle que
+    `_do_post`, no-op quand `mistral_rate_limit_enabled` est coupé.
+    """
+    if not get_settings().mistral_rate_limit_enabled:
+        return nullcontext()
+    if _is_large_model(model):
+        return _get_large_limiter().slot()
+    return _get_small_limiter().slot()
 
 
 def _is_large_model(model: str | None) -> bool:
     """True pour les modèles Mistral `large` (`mistral-large-*`).
 
-    Le throttle ne cible que les appels `large` passant par `EditorialLLMClient`
-    (curation + deep + perspective) : c'est la source dominante et *mesurée* des
-    429 (cf. docstring du module rate_limiter). `good_news_classifier` appelle
-    aussi un modèle `large`, mais via son propre client et en un seul appel
-    batché par lot (burst négligeable) — hors scope de ce throttle pour LR-1
-    PR 1 ; il pourra rejoindre un limiteur partagé en LR-3/PR 4.
+    Le throttle `large` borne les appels passant par `EditorialLLMClient`
+    (curation + deep + perspective), source dominante et *mesurée* des 429
+    (cf. docstring du module rate_limiter), et la passe good-news du
+    ClassificationWorker (via `mistral_slot`) depuis que ses voies tournent en
+    parallèle.
     """
     return bool(model and "large" in model.lower())
 
@@ -49,6 +49,10 @@ Design
   scrolled articles. Writes that *do* adjust weights (like, save, hide,
   feedback, note upsert, the CONSUMED transition) keep the full purge: a
   scoped one would leave a stale **ranking** everywhere else.
+  "Mentions" is resolved through a reverse index `content_id → keys` built
+  at `put()` from the UUIDs of the payload, so an eviction costs the number
+  of affected entries — not a byte search over every cached payload (the
+  former ~13 µs per entry, which capped how many variants we could cache).
 - **Generations** — `put()` from a compute that started before an
   invalidation is dropped instead of resurrecting the evicted payload.
   `_compute_feed` takes 1.5-5 s under the single-flight lock; an
@@ -61,27 +65,85 @@ Design
   /keyword) + `serein == False` + `saved_only == False` + not personalized.
 - **Hit telemetry** — hit/miss counters logged every 60 s on stderr so
   we can validate the hit rate without external infra.
+- **Stale-while-revalidate (opt-in)** — `FEED_CACHE_STALE_SECONDS > 0`
+  keeps an entry past its TTL (the *soft* TTL) for that many more seconds
+  (*hard* TTL). In that window `get_or_stale()` returns the stale payload
+  and the caller schedules a background recompute on `BACKGROUND_REFRESHER`
+  (`cache_refresh.py`, one refresh per key, global concurrency cap) instead
+  of paying `_compute_feed` on the request path. Invalidations drop stale
+  entries like fresh ones, and the refresh `put()` carries a generation —
+  it cannot resurrect an invalidated payload. `get()` keeps returning fresh
+  entries only.
+- **Pluggable storage** — entries, generations and single-flight leases
+  live behind `FeedCacheBackend`. `FEED_CACHE_BACKEND=memory` (default)
+  keeps the historical per-process dicts. `FEED_CACHE_BACKEND=shared`
+  (`feed_cache_shared.py`) stores them in a SQLite file on tmpfs shared by
+  every uvicorn worker of the pod: one compute per key across N workers
+  (lease-based locks) and invalidations visible to all workers (shared
+  generation counters) — the guarantees above, at worker scale. The
+  invalidate listeners (per-process caches of ranking inputs) only run in
+  the worker that served the write; the others catch up through
+  `sync_invalidations(user_id)`, which those caches call before every read.
+- **Pre-compressed entries (opt-in)** — `FEED_CACHE_GZIP=true` stores the
+  gzip bytes instead of the JSON: `put()` compresses once (level 6, like
+  the global `GZipMiddleware`) and returns the stored form, and the router
+  serves it with `Content-Encoding: gzip` — a hit then does no
+  serialization *and* no compression. The content index is built from the
+  JSON before compression, so scoped evictions are unchanged. ~5x smaller
+  entries under the same `FEED_CACHE_MAX_BYTES`.
 
 Memory budget
 -------------
 Default payload ~150 KB; personalized section payloads ~50 KB × ~10 sections.
 ~50-65 MB worst case at 100 DAU ceiling. Safe on a 1 GB Railway pod.
+
+Past that ceiling the memory backend no longer grows with the user count:
+payloads sit in a `BoundedLRU` capped at `FEED_CACHE_MAX_BYTES` (default
+64 MiB, least recently used evicted first), idle single-flight locks are
+reclaimed and per-user generation counters are capped
+(`bounded_cache.py`). `bytes` / `evictions` in `stats()` show the
+pressure — a steadily climbing `evictions` means the budget, not the TTL,
+decides the hit rate.
 """
 
 from __future__ import annotations
 
 import asyncio
+import gzip
 import logging
 import os
+import re
 import time
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
+from typing import Protocol
 from uuid import UUID
 
+from app.services.bounded_cache import (
+    BoundedLRU,
+    GenerationCounters,
+    LockRegistry,
+    lock_is_idle,
+    max_bytes_from_env,
+)
+from app.services.cache_refresh import BACKGROUND_REFRESHER
+
 logger = logging.getLogger(__name__)
 
 # Cache key = (user_id, variant). `variant is None` ⇒ default page-1 view.
 _CacheKey = tuple[UUID, str | None]
 
+# Canonical `str(UUID)` form, as serialized by Pydantic in the payloads.
+_UUID_RE = re.compile(rb"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+
+
+def _payload_ids(payload: bytes) -> frozenset[str]:
+    """Every UUID mentioned in `payload` — the keys of the content reverse
+    index. A superset of the item ids (source ids, cluster ids…) on purpose:
+    the index must answer exactly what `str(content_id) in payload` did, so
+    an id nested in a carousel or a cluster still evicts its entry."""
+    return frozenset(m.decode() for m in _UUID_RE.findall(payload))
+
 
 def _ttl_from_env() -> float:
     """Read default-view TTL from env. Returns `0.0` (cache disabled) on parse
@@ -108,24 +170,321 @@ def _personalized_ttl_from_env() -> float:
         return 60.0
 
 
+def _stale_seconds_from_env() -> float:
+    """Read the stale-while-revalidate window (beyond the TTL). `0` (default)
+    keeps the historical hard-TTL behavior."""
+    raw = os.environ.get("FEED_CACHE_STALE_SECONDS", "0")
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        logger.warning("feed_cache_invalid_stale raw=%s, defaulting to 0s", raw)
+        return 0.0
+
+
+def _max_bytes_from_env() -> int:
+    """Payload byte budget of the memory backend (LRU beyond it). `0` = no
+    bound. Default = the budget of *Memory budget* in the module docstring."""
+    return max_bytes_from_env("FEED_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+
+
+# ~16 k utilisateurs suivis par process (surcoût fixe par entrée seul).
+_SEEN_INPUTS_MAX_BYTES = 4 * 1024 * 1024
+
+
+def _gzip_from_env() -> bool:
+    """`FEED_CACHE_GZIP=true` stores gzip-compressed payloads (default off)."""
+    raw = os.environ.get("FEED_CACHE_GZIP", "false").strip().lower()
+    return raw in {"1", "true", "yes", "on"}
+
+
+def _lease_seconds_from_env() -> float:
+    """Read the single-flight lease duration (shared backend only). Bounds how
+    long a crashed worker can hold a key before another one recomputes it."""
+    raw = os.environ.get("FEED_CACHE_LEASE_SECONDS", "15")
+    try:
+        return max(1.0, float(raw))
+    except ValueError:
+        logger.warning("feed_cache_invalid_lease raw=%s, defaulting to 15s", raw)
+        return 15.0
+
+
 @dataclass
 class _Entry:
     expires_at: float
     payload: bytes
+    # Fin de la fraîcheur (soft TTL) ; `expires_at` est le hard TTL.
+    fresh_until: float = 0.0
+
+
+class FeedCacheBackend(Protocol):
+    """Storage behind `FeedPageCache`: entries, generations, leases.
+
+    Every method is synchronous and must stay sub-millisecond — they run on
+    the event loop, on the request fast path. `shared` tells the cache
+    whether other processes see the same state (⇒ single-flight needs a
+    lease, not just the local `asyncio.Lock`)."""
+
+    name: str
+    shared: bool
+
+    def get(self, key: _CacheKey) -> tuple[bytes, bool] | None:
+        """`(payload, is_stale)` until the hard TTL, else `None`."""
+        ...
+
+    def set(
+        self,
+        key: _CacheKey,
+        payload: bytes,
+        ttl: float,
+        content_ids: frozenset[str],
+        stale_seconds: float = 0.0,
+    ) -> None:
+        """Store `payload` fresh for `ttl`, then stale for `stale_seconds`,
+        and index it under each of `content_ids`."""
+        ...
+
+    def generation(self, user_id: UUID) -> tuple[int, int]: ...
+
+    def input_generation(self, user_id: UUID) -> int:
+        """Counter of the full invalidations of `user_id` (`purge` with
+        `content_id=None`), for `FeedPageCache.sync_invalidations`. Negative
+        when unknown."""
+        ...
+
+    def purge(self, *, user_id: UUID | None, content_id: str | None) -> int:
+        """Drop matching entries, bump the matching generation (per-user when
+        `user_id` is set, global otherwise). Returns the number dropped.
+
+        Must cost O(affected entries) — resolved through the reverse indexes,
+        never by scanning every payload."""
+        ...
+
+    def try_lease(self, key: _CacheKey, ttl: float) -> str | None:
+        """Take the cross-process compute lease for `key`; token or `None`."""
+        ...
+
+    def release_lease(self, key: _CacheKey, token: str) -> None: ...
+
+    def size(self) -> int: ...
+
+    def memory_stats(self) -> dict[str, int]:
+        """`bytes` / `max_bytes` / `evictions` — published on the health
+        endpoint to watch the cache's share of the pod's RSS."""
+        ...
+
+    def clear(self) -> None: ...
+
+
+class MemoryFeedCacheBackend:
+    """Per-process storage — the historical backend, default. Entries live
+    in a `BoundedLRU` under `FEED_CACHE_MAX_BYTES`."""
+
+    name = "memory"
+    shared = False
+
+    def __init__(self, max_bytes: int | None = None) -> None:
+        self._entries: BoundedLRU[_CacheKey, _Entry] = BoundedLRU(
+            max_bytes=max_bytes if max_bytes is not None else _max_bytes_from_env(),
+            sizeof=lambda entry: len(entry.payload),
+            on_evict=lambda key, _entry: self._unindex(key),
+        )
+        # Index inverses, maintenus à chaque `set`/suppression : content_id →
+        # clés dont le payload le mentionne, user_id → clés de l'utilisateur.
+        # `_entry_ids` garde les ids indexés par clé pour désindexer.
+        self._by_content: dict[str, set[_CacheKey]] = {}
+        self._by_user: dict[UUID, set[_CacheKey]] = {}
+        self._entry_ids: dict[_CacheKey, frozenset[str]] = {}
+        # Monotonic invalidation counters. Per-user + one global (bumped by
+        # `invalidate_content_global`, whose blast radius is every user —
+        # including users with no entry yet, hence not expressible per-user).
+        # A global-only counter would let any user's write drop every *other*
+        # user's in-flight `put()`, which the per-scroll SEEN write would fire
+        # constantly — exactly the cache defeat this change removes.
+        # Bornés : cf. `GenerationCounters` pour pourquoi évincer est sûr.
+        self._generations: GenerationCounters[UUID] = GenerationCounters()
+        self._global_generation = 0
+
+    def get(self, key: _CacheKey) -> tuple[bytes, bool] | None:
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is None:
+            return None
+        if entry.expires_at < now:
+            # Libérée dès la lecture plutôt qu'à la prochaine écriture.
+            self._entries.pop(key)
+            self._unindex(key)
+            return None
+        return entry.payload, entry.fresh_until < now
+
+    def set(
+        self,
+        key: _CacheKey,
+        payload: bytes,
+        ttl: float,
+        content_ids: frozenset[str],
+        stale_seconds: float = 0.0,
+    ) -> None:
+        self._unindex(key)
+        now = time.monotonic()
+        self._entries.put(
+            key,
+            _Entry(
+                expires_at=now + ttl + stale_seconds,
+                payload=payload,
+                fresh_until=now + ttl,
+            ),
+        )
+        self._entry_ids[key] = content_ids
+        self._by_user.setdefault(key[0], set()).add(key)
+        for content_id in content_ids:
+            self._by_content.setdefault(content_id, set()).add(key)
+
+    def _unindex(self, key: _CacheKey) -> None:
+        for content_id in self._entry_ids.pop(key, ()):
+            keys = self._by_content.get(content_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_content[content_id]
+        user_keys = self._by_user.get(key[0])
+        if user_keys is not None:
+            user_keys.discard(key)
+            if not user_keys:
+                del self._by_user[key[0]]
+
+    def generation(self, user_id: UUID) -> tuple[int, int]:
+        return (self._generations.get(user_id), self._global_generation)
+
+    def input_generation(self, user_id: UUID) -> int:
+        # Jamais lu : un seul process, les listeners voient chaque invalidation.
+        return 0
+
+    def purge(self, *, user_id: UUID | None, content_id: str | None) -> int:
+        if content_id is not None:
+            keys = [
+                key
+                for key in self._by_content.get(content_id, ())
+                if user_id is None or key[0] == user_id
+            ]
+        elif user_id is not None:
+            keys = list(self._by_user.get(user_id, ()))
+        else:
+            keys = list(self._entries)
+        for key in keys:
+            self._entries.pop(key)
+            self._unindex(key)
+        if user_id is None:
+            self._global_generation += 1
+        else:
+            self._generations.bump(user_id)
+        return len(keys)
+
+    def try_lease(self, key: _CacheKey, ttl: float) -> str | None:
+        # Un seul process : le `asyncio.Lock` local suffit au single-flight.
+        return "local"
+
+    def release_lease(self, key: _CacheKey, token: str) -> None:
+        return None
+
+    def size(self) -> int:
+        return len(self._entries)
+
+    def memory_stats(self) -> dict[str, int]:
+        stats = self._entries.stats()
+        del stats["entries"]
+        return stats
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_content.clear()
+        self._by_user.clear()
+        self._entry_ids.clear()
+        self._generations.clear()
+        self._global_generation = 0
+
+
+def _backend_from_env() -> FeedCacheBackend:
+    """Build the backend named by `FEED_CACHE_BACKEND` (`memory` | `shared`).
+    Unknown values fall back to `memory` — a typo must never take the feed
+    down."""
+    raw = os.environ.get("FEED_CACHE_BACKEND", "memory").strip().lower()
+    if raw == "shared":
+        from app.services.feed_cache_shared import SharedFeedCacheBackend
+
+        return SharedFeedCacheBackend()
+    if raw != "memory":
+        logger.warning("feed_cache_invalid_backend raw=%s, defaulting to memory", raw)
+    return MemoryFeedCacheBackend()
+
+
+class _LeaseLock:
+    """Single-flight across processes: the local `asyncio.Lock` first (so the
+    coroutines of one worker don't poll the backend), then the backend lease.
+
+    The lease expires on its own after `lease_seconds`: a worker killed
+    mid-compute delays the others by at most that, never forever."""
+
+    _POLL_SECONDS = 0.05
+
+    def __init__(
+        self, backend: FeedCacheBackend, key: _CacheKey, lease_seconds: float
+    ) -> None:
+        self._backend = backend
+        self._key = key
+        self._lease_seconds = lease_seconds
+        self._local = asyncio.Lock()
+        self._token: str | None = None
+
+    def locked(self) -> bool:
+        return self._local.locked()
+
+    def is_idle(self) -> bool:
+        """Reclaimable by `LockRegistry`: nobody holds nor awaits it."""
+        return lock_is_idle(self._local)
+
+    async def __aenter__(self) -> _LeaseLock:
+        await self._local.acquire()
+        try:
+            deadline = time.monotonic() + self._lease_seconds
+            token = self._backend.try_lease(self._key, self._lease_seconds)
+            while token is None and time.monotonic() < deadline:
+                await asyncio.sleep(self._POLL_SECONDS)
+                token = self._backend.try_lease(self._key, self._lease_seconds)
+        except BaseException:
+            # Annulé pendant l'attente : `__aexit__` ne tournera pas, et
+            # `LockRegistry` ne récupère jamais un verrou tenu.
+            self._local.release()
+            raise
+        # Pas de lease au bout du délai ⇒ on calcule quand même (fail-open) :
+        # un doublon de compute vaut mieux qu'une requête bloquée.
+        self._token = token
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        try:
+            if self._token is not None:
+                self._backend.release_lease(self._key, self._token)
+        finally:
+            self._token = None
+            self._local.release()
 
 
 class FeedPageCache:
     """Per-user, per-variant TTL cache with single-flight semantics.
 
     Thread-safety note: every method assumes it runs on the same asyncio
-    event loop. The `_locks` dict is mutated only inside `lock()` which is
-    called from coroutines — no cross-thread access.
+    event loop. The `_locks` registry is mutated only inside `lock()` which
+    is called from coroutines — no cross-thread access.
     """
 
     def __init__(
         self,
         ttl_seconds: float | None = None,
         personalized_ttl_seconds: float | None = None,
+        backend: FeedCacheBackend | None = None,
+        lease_seconds: float | None = None,
+        stale_seconds: float | None = None,
+        compress: bool | None = None,
     ) -> None:
         self._ttl = ttl_seconds if ttl_seconds is not None else _ttl_from_env()
         self._personalized_ttl = (
@@ -133,26 +492,47 @@ class FeedPageCache:
             if personalized_ttl_seconds is not None
             else _personalized_ttl_from_env()
         )
-        self._entries: dict[_CacheKey, _Entry] = {}
-        self._locks: dict[_CacheKey, asyncio.Lock] = {}
-        # Monotonic invalidation counters. Per-user + one global (bumped by
-        # `invalidate_content_global`, whose blast radius is every user —
-        # including users with no entry yet, hence not expressible per-user).
-        # A global-only counter would let any user's write drop every *other*
-        # user's in-flight `put()`, which the per-scroll SEEN write would fire
-        # constantly — exactly the cache defeat this change removes.
-        self._generations: dict[UUID, int] = {}
-        self._global_generation = 0
+        self._backend = backend if backend is not None else _backend_from_env()
+        self._lease_seconds = (
+            lease_seconds if lease_seconds is not None else _lease_seconds_from_env()
+        )
+        self._stale = (
+            stale_seconds if stale_seconds is not None else _stale_seconds_from_env()
+        )
+        self._compress = compress if compress is not None else _gzip_from_env()
+        self._locks: LockRegistry[_CacheKey, asyncio.Lock | _LeaseLock] = LockRegistry(
+            self._new_lock
+        )
         self._hits = 0
         self._misses = 0
+        self._stale_hits = 0
         self._invalidations = 0
         self._started_at = time.monotonic()
         self._last_flush_at = time.monotonic()
+        # Caches dérivés de l'état utilisateur (ex. `USER_CONTEXT_CACHE`) qui
+        # doivent tomber sur les mêmes écritures que le feed — cf.
+        # `add_invalidate_listener`.
+        self._invalidate_listeners: list[Callable[[UUID], None]] = []
+        # Backend partagé : dernière `input_generation` vue par utilisateur
+        # dans ce process. Une clé évincée est traitée comme invalidée.
+        self._seen_inputs: BoundedLRU[UUID, int] = BoundedLRU(
+            max_bytes=_SEEN_INPUTS_MAX_BYTES, sizeof=lambda _generation: 0
+        )
 
     @property
     def ttl_seconds(self) -> float:
         return self._ttl
 
+    @property
+    def backend(self) -> FeedCacheBackend:
+        return self._backend
+
+    @property
+    def compressed(self) -> bool:
+        """True when entries are stored gzip-compressed (`FEED_CACHE_GZIP`):
+        `get()` then returns gzip bytes."""
+        return self._compress
+
     @property
     def personalized_ttl_seconds(self) -> float:
         return self._personalized_ttl
@@ -175,8 +555,12 @@ class FeedPageCache:
         personalized TTL otherwise."""
         return self._ttl if variant is None else self._personalized_ttl
 
-    def lock(self, user_id: UUID, variant: str | None = None) -> asyncio.Lock:
-        """Return (or lazily create) the asyncio.Lock for `(user_id, variant)`.
+    def lock(
+        self, user_id: UUID, variant: str | None = None
+    ) -> asyncio.Lock | _LeaseLock:
+        """Return (or lazily create) the lock for `(user_id, variant)`: a plain
+        `asyncio.Lock` on a per-process backend, a `_LeaseLock` (local lock +
+        backend lease) on a shared one.
 
         Public so callers can do the canonical pattern:
             async with FEED_CACHE.lock(user_id, variant):
@@ -186,33 +570,76 @@ class FeedPageCache:
                 FEED_CACHE.put(user_id, payload, variant)
                 return payload
         """
-        key = (user_id, variant)
-        lock = self._locks.get(key)
-        if lock is None:
-            lock = asyncio.Lock()
-            self._locks[key] = lock
-        return lock
+        return self._locks.get((user_id, variant))
+
+    def _new_lock(self, key: _CacheKey) -> asyncio.Lock | _LeaseLock:
+        if self._backend.shared:
+            return _LeaseLock(self._backend, key, self._lease_seconds)
+        return asyncio.Lock()
 
     def get(self, user_id: UUID, variant: str | None = None) -> bytes | None:
         """Return cached payload for `(user_id, variant)` if fresh, else `None`.
         Updates hit/miss counters."""
-        if not self.enabled:
+        payload, is_stale = self._lookup(user_id, variant)
+        if is_stale:
             return None
-        entry = self._entries.get((user_id, variant))
+        return payload
+
+    def get_or_stale(
+        self, user_id: UUID, variant: str | None = None
+    ) -> tuple[bytes | None, bool]:
+        """Like `get()`, but past the soft TTL (stale-while-revalidate mode)
+        returns `(stale_payload, True)` — serve it and `refresh_in_background`.
+        Without `FEED_CACHE_STALE_SECONDS` it never returns a stale entry."""
+        return self._lookup(user_id, variant)
+
+    def _lookup(self, user_id: UUID, variant: str | None) -> tuple[bytes | None, bool]:
+        """Read `(payload, is_stale)`, updating hit/miss/stale counters. A
+        stale entry is counted once, as a stale hit."""
+        if not self.enabled:
+            return None, False
+        found = self._backend.get((user_id, variant))
         now = time.monotonic()
-        if entry is None or entry.expires_at < now:
+        if found is None:
             self._misses += 1
             self._maybe_flush_telemetry(now)
-            return None
-        self._hits += 1
+            return None, False
+        payload, is_stale = found
+        if is_stale:
+            self._stale_hits += 1
+        else:
+            self._hits += 1
         self._maybe_flush_telemetry(now)
-        return entry.payload
+        return payload, is_stale
+
+    def refresh_in_background(
+        self,
+        user_id: UUID,
+        variant: str | None,
+        compute: Callable[[], Awaitable[bytes]],
+    ) -> bool:
+        """Schedule `compute()` on `BACKGROUND_REFRESHER` to replace a stale
+        entry. Same single-flight lock and generation guard as the
+        foreground path: a refresh racing an invalidation is dropped, and a
+        foreground compute that already refreshed the key wins. Returns False
+        when nothing was scheduled (already refreshing, cap reached)."""
+
+        async def _refresh() -> None:
+            async with self.lock(user_id, variant):
+                found = self._backend.get((user_id, variant))
+                if found is not None and not found[1]:
+                    return
+                generation = self.generation(user_id)
+                payload = await compute()
+                self.put(user_id, payload, variant, generation=generation)
+
+        return BACKGROUND_REFRESHER.schedule(("feed", user_id, variant), _refresh)
 
     def generation(self, user_id: UUID) -> tuple[int, int]:
         """Current invalidation generation for `user_id`, as `(per_user,
         global)`. Capture it **before** a long compute and hand it to
         `put()`. Cf. *Generations* in the module docstring."""
-        return (self._generations.get(user_id, 0), self._global_generation)
+        return self._backend.generation(user_id)
 
     def put(
         self,
@@ -221,35 +648,74 @@ class FeedPageCache:
         variant: str | None = None,
         *,
         generation: tuple[int, int] | None = None,
-    ) -> None:
-        """Store `payload` for `(user_id, variant)` with the variant's TTL.
+    ) -> bytes:
+        """Store `payload` (the JSON) for `(user_id, variant)` with the
+        variant's TTL, and return its stored form — gzip bytes when
+        `compressed` — so a cache miss answers with exactly what a hit will.
 
         No-op when the relevant TTL class is disabled, or when `generation`
         is stale — the entry was invalidated while the caller was computing
         this payload. Only test seeding omits `generation`; every production
         caller passes one."""
+        stored = (
+            gzip.compress(payload, compresslevel=6, mtime=0)
+            if self._compress
+            else payload
+        )
         ttl = self._ttl_for(variant)
         if ttl <= 0:
-            return
+            return stored
         if generation is not None and generation != self.generation(user_id):
-            return
-        self._entries[(user_id, variant)] = _Entry(
-            expires_at=time.monotonic() + ttl,
-            payload=payload,
+            return stored
+        self._backend.set(
+            (user_id, variant), stored, ttl, _payload_ids(payload), self._stale
         )
+        return stored
 
     def invalidate(self, user_id: UUID) -> None:
         """Drop **all** cached variants for `user_id` (default + personalized).
 
-        Called by every write endpoint that can change the *ranking*."""
+        Called by every write endpoint that can change the *ranking*. Also
+        notifies the listeners registered via `add_invalidate_listener`."""
         self._purge(user_id=user_id)
+        for listener in self._invalidate_listeners:
+            listener(user_id)
+
+    def add_invalidate_listener(self, listener: Callable[[UUID], None]) -> None:
+        """Register `listener(user_id)`, called on every `invalidate(user_id)`.
+
+        Lets a cache of *ranking inputs* reuse the ~50 write sites that
+        already call `FEED_CACHE.invalidate` instead of duplicating them.
+        Content-scoped invalidations are deliberately not forwarded: they
+        never touch the ranking inputs."""
+        if listener not in self._invalidate_listeners:
+            self._invalidate_listeners.append(listener)
+
+    def sync_invalidations(self, user_id: UUID) -> None:
+        """Run the invalidate listeners for `user_id` if another worker
+        invalidated it since this process last looked. No-op on a
+        per-process backend.
+
+        `invalidate()` only notifies the listeners of the worker serving the
+        write. The ranking-input caches call this before every read, so no
+        worker builds — and stores in the shared backend — a page from inputs
+        another worker already invalidated. A user not seen yet (or evicted)
+        counts as invalidated: dropping its inputs is always safe."""
+        if not self._backend.shared:
+            return
+        current = self._backend.input_generation(user_id)
+        if current >= 0 and self._seen_inputs.get(user_id) == current:
+            return
+        self._seen_inputs.put(user_id, current)
+        for listener in self._invalidate_listeners:
+            listener(user_id)
 
     def invalidate_content(self, user_id: UUID, content_id: UUID) -> None:
         """Drop only the variants of `user_id` whose payload mentions
         `content_id` — for writes that change one article's display state
         without touching the ranking. Cf. *Content-scoped eviction* in the
         module docstring."""
-        self._purge(user_id=user_id, needle=str(content_id).encode())
+        self._purge(user_id=user_id, content_id=str(content_id))
 
     def invalidate_content_global(self, content_id: UUID) -> None:
         """Drop the variants of **every** user whose payload mentions
@@ -259,14 +725,13 @@ class FeedPageCache:
         `Content.is_serene=False` for everyone, so purging only the reporter
         would keep serving the article to the other users' serein sections.
 
-        Unlike `invalidate_content`, the scan is not narrowed to one user, so
-        it costs ~13 µs per cached entry across the whole cache (~16 ms at
-        100 DAU). Acceptable because the trigger is a rare user report; if
-        that ever changes, narrow it to serein variants."""
-        self._purge(needle=str(content_id).encode())
+        Resolved through the content reverse index like `invalidate_content`:
+        the cost is the number of entries mentioning the article, not the
+        size of the cache."""
+        self._purge(content_id=str(content_id))
 
     def _purge(
-        self, *, user_id: UUID | None = None, needle: bytes | None = None
+        self, *, user_id: UUID | None = None, content_id: str | None = None
     ) -> None:
         """Drop the entries matching both optional narrowings and bump the
         matching generation. One call == one counted invalidation, and only
@@ -275,37 +740,32 @@ class FeedPageCache:
         `_locks` is deliberately left untouched: dropping a `Lock` that
         in-flight waiters hold would let a later request create a fresh one
         and break single-flight — the thundering herd this cache exists to
-        prevent. Pinned by `test_invalidate_keeps_locks_alive`."""
-        keys = [
-            key
-            for key, entry in self._entries.items()
-            if (user_id is None or key[0] == user_id)
-            and (needle is None or needle in entry.payload)
-        ]
-        for key in keys:
-            del self._entries[key]
-        # Bumped even when nothing was purged: the entry being invalidated may
-        # be mid-compute (cache miss ⇒ no entry to scan), and that `put()` is
-        # exactly what must be dropped.
-        if user_id is None:
-            self._global_generation += 1
-        else:
-            self._generations[user_id] = self._generations.get(user_id, 0) + 1
-        if keys:
+        prevent. Pinned by `test_invalidate_keeps_locks_alive`. Only the
+        registry reclaims locks, and only idle ones."""
+        # The backend bumps the generation even when nothing was purged: the
+        # entry being invalidated may be mid-compute (cache miss ⇒ no entry to
+        # scan), and that `put()` is exactly what must be dropped.
+        if self._backend.purge(user_id=user_id, content_id=content_id):
             self._invalidations += 1
 
-    def stats(self) -> dict[str, int | float]:
+    def stats(self) -> dict[str, int | float | str]:
         """Snapshot for tests / health endpoint. `uptime_seconds` is the time
         base for reading the cumulative counters as a delta."""
         total = self._hits + self._misses
         return {
             "hits": self._hits,
             "misses": self._misses,
+            "stale_hits": self._stale_hits,
             "invalidations": self._invalidations,
-            "size": len(self._entries),
+            "size": self._backend.size(),
+            **self._backend.memory_stats(),
+            **self._locks.stats(),
             "hit_rate": (self._hits / total) if total else 0.0,
+            "backend": self._backend.name,
+            "gzip": self._compress,
             "ttl_seconds": self._ttl,
             "personalized_ttl_seconds": self._personalized_ttl,
+            "stale_seconds": self._stale,
             "uptime_seconds": round(time.monotonic() - self._started_at, 1),
         }
 
@@ -313,6 +773,7 @@ class FeedPageCache:
         """Test helper."""
         self._hits = 0
         self._misses = 0
+        self._stale_hits = 0
         self._invalidations = 0
         self._started_at = time.monotonic()
         self._last_flush_at = time.monotonic()
@@ -324,10 +785,9 @@ class FeedPageCache:
         counter left high by one test would silently drop the `put()` of the
         next one (heisenbug on test order). Safe here only because no
         compute is in flight between tests."""
-        self._entries.clear()
+        self._backend.clear()
         self._locks.clear()
-        self._generations.clear()
-        self._global_generation = 0
+        self._seen_inputs.clear()
 
     def _maybe_flush_telemetry(self, now: float) -> None:
         if now - self._last_flush_at < 60.0:
@@ -0,0 +1,444 @@
+"""Cross-worker storage for `FeedPageCache` (`FEED_CACHE_BACKEND=shared`).
+
+Why this exists
+---------------
+The default backend is a per-process dict: lost on every deploy, and with N
+uvicorn workers each worker recomputes every key (N× cold-cache cost) and an
+invalidation only reaches the worker that served the write — the other
+workers keep serving the evicted payload until TTL, breaking the
+*inconsistent-after-write is not acceptable* rule of `feed_cache.py`.
+
+Design
+------
+- **SQLite file on tmpfs** (`/dev/shm` by default, `FEED_CACHE_SHARED_PATH`
+  to override), WAL + `synchronous=OFF`: every worker of the pod opens the
+  same file, each op is a local page read/write, no network hop and no extra
+  dependency. The backend interface is synchronous because it runs on the
+  request fast path — a network client (Redis) would need the whole cache
+  API to become async, for no gain at single-pod scale.
+- **Never waits on a lock**: the connection has no busy timeout, so a write
+  that finds another worker's transaction open fails at once with
+  ``SQLITE_BUSY`` instead of stalling the event loop. Reads never contend
+  (WAL). A busy ``set`` or ``try_lease`` is dropped like any other error
+  (see *Fail-soft*).
+- **Entries** keyed by `(user_id, variant)`, with wall-clock `fresh_until`
+  (soft TTL) and `expires_at` (hard TTL) — `time.monotonic` is not
+  comparable across processes. Expired rows are
+  swept every `_SWEEP_EVERY` writes; the same sweep enforces the
+  `FEED_CACHE_MAX_BYTES` budget (tmpfs pages count against the pod's
+  memory), dropping the entries closest to expiry first.
+- **Content reverse index** (`entry_contents`): one row per `(content_id,
+  key)`, written in the same transaction as the entry, so content-scoped
+  purges delete exactly the affected keys — no scan of the payloads.
+- **Generations** are rows of a counter table (`user_id` or `*` = global),
+  bumped in the same transaction as the purge, so a worker capturing a
+  generation always sees the one matching the entries it reads. A full
+  per-user purge also bumps `inputs|<user_id>`, which the other workers
+  compare to drop their own ranking-input caches (`sync_invalidations`).
+- **Leases** implement cross-worker single-flight: `INSERT` of a row with a
+  random token and an expiry; a crashed holder frees the key on expiry.
+  Release only deletes our own token (an expired lease taken over by another
+  worker is not ours to drop).
+- **Fail-soft**: any `sqlite3.Error` is logged and degrades to "no cache"
+  (miss, no-op write, lease granted). Generation reads fail to `(-1, -1)`,
+  which never matches a real capture — the `put()` is dropped rather than
+  risking a stale payload.
+- **Purges and lease releases must land**: when busy, they are queued and
+  replayed before the next op and on a short timer. Until the queue drains
+  this worker reads misses and `(-1, -1)` generations, so it neither serves
+  nor stores what the pending purge is about to drop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sqlite3
+import tempfile
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import TypeVar
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+_CacheKey = tuple[UUID, str | None]
+
+_GLOBAL_SCOPE = "*"
+_INPUTS_SCOPE = "inputs|{}"
+# Variant `None` (vue par défaut) ⇒ chaîne vide : les variants perso sont
+# toujours préfixés `p|`, aucune collision possible.
+_DEFAULT_VARIANT = ""
+_SWEEP_EVERY = 256
+# Délai de rejeu des purges refusées (`SQLITE_BUSY`) : une transaction d'un
+# autre worker dure quelques dizaines de µs.
+_RETRY_SECONDS = 0.005
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS entries (
+        user_id TEXT NOT NULL,
+        variant TEXT NOT NULL,
+        fresh_until REAL NOT NULL,
+        expires_at REAL NOT NULL,
+        payload BLOB NOT NULL,
+        PRIMARY KEY (user_id, variant)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS entry_contents (
+        content_id TEXT NOT NULL,
+        user_id TEXT NOT NULL,
+        variant TEXT NOT NULL,
+        PRIMARY KEY (content_id, user_id, variant)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS entry_contents_by_key
+        ON entry_contents (user_id, variant)
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS generations (
+        scope TEXT PRIMARY KEY,
+        value INTEGER NOT NULL
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS leases (
+        key TEXT PRIMARY KEY,
+        token TEXT NOT NULL,
+        expires_at REAL NOT NULL
+    ) WITHOUT ROWID
+    """,
+)
+
+
+def _path_from_env() -> str:
+    """Shared file path. `/dev/shm` keeps it in RAM (and off the container's
+    writable layer); falls back to the temp dir where it does not exist."""
+    raw = os.environ.get("FEED_CACHE_SHARED_PATH")
+    if raw:
+        return raw
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(base, "facteur-feed-cache.sqlite3")
+
+
+def _lease_key(key: _CacheKey) -> str:
+    return f"{key[0]}|{key[1] if key[1] is not None else _DEFAULT_VARIANT}"
+
+
+@contextmanager
+def _transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """`BEGIN IMMEDIATE` … `COMMIT` (write lock taken up front: no upgrade
+    deadlock between two workers that both read first)."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+class SharedFeedCacheBackend:
+    """`FeedCacheBackend` shared by every process opening the same file."""
+
+    name = "shared"
+    shared = True
+
+    def __init__(self, path: str | None = None, max_bytes: int | None = None) -> None:
+        from app.services.feed_cache import _max_bytes_from_env
+
+        self._path = path or _path_from_env()
+        self._max_bytes = max_bytes if max_bytes is not None else _max_bytes_from_env()
+        self._evictions = 0
+        self._conn: sqlite3.Connection | None = None
+        self._writes = 0
+        self._errors = 0
+        self._pending: list[tuple[str, Callable[[sqlite3.Connection], object]]] = []
+        self._retry_scheduled = False
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def _connection(self) -> sqlite3.Connection:
+        # Ouverture paresseuse : le singleton est construit à l'import, avant
+        # le fork des workers uvicorn — chaque process ouvre sa connexion.
+        # `timeout=0` : jamais d'attente sur le verrou d'écriture, cf. module.
+        if self._conn is None:
+            conn = sqlite3.connect(
+                self._path, timeout=0, isolation_level=None, check_same_thread=False
+            )
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=OFF")
+                for ddl in _SCHEMA:
+                    conn.execute(ddl)
+            except BaseException:
+                conn.close()
+                raise
+            self._conn = conn
+        return self._conn
+
+    def _run(self, op: str, fn: Callable[[sqlite3.Connection], _T], default: _T) -> _T:
+        try:
+            conn = self._connection()
+            self._drain(conn)
+            return fn(conn)
+        except sqlite3.Error:
+            self._errors += 1
+            logger.warning("feed_cache_shared_error op=%s", op, exc_info=True)
+            return default
+
+    def _must_land(
+        self, op: str, fn: Callable[[sqlite3.Connection], _T], default: _T
+    ) -> _T:
+        """Like `_run`, but a failed `fn` is queued and replayed instead of
+        dropped — for writes whose loss would leave other workers stale."""
+        try:
+            conn = self._connection()
+            self._drain(conn)
+            return fn(conn)
+        except sqlite3.Error as exc:
+            self._errors += 1
+            logger.info("feed_cache_shared_deferred op=%s error=%s", op, exc)
+            self._pending.append((op, fn))
+            self._schedule_retry()
+            return default
+
+    def _drain(self, conn: sqlite3.Connection) -> None:
+        """Replay the queued writes in order; raises (and keeps the rest
+        queued) at the first one still refused."""
+        while self._pending:
+            self._pending[0][1](conn)
+            self._pending.pop(0)
+
+    def _schedule_retry(self) -> None:
+        if self._retry_scheduled:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # hors event loop : rejoué par l'op suivante
+        self._retry_scheduled = True
+        loop.call_later(_RETRY_SECONDS, self._retry)
+
+    def _retry(self) -> None:
+        self._retry_scheduled = False
+        try:
+            self._drain(self._connection())
+        except sqlite3.Error:
+            self._schedule_retry()
+
+    @property
+    def pending(self) -> int:
+        """Purges / lease releases refused as busy and not replayed yet."""
+        return len(self._pending)
+
+    def get(self, key: _CacheKey) -> tuple[bytes, bool] | None:
+        def _get(conn: sqlite3.Connection) -> tuple[bytes, bool] | None:
+            now = time.time()
+            row = conn.execute(
+                "SELECT payload, fresh_until FROM entries "
+                "WHERE user_id = ? AND variant = ? AND expires_at >= ?",
+                (str(key[0]), key[1] or _DEFAULT_VARIANT, now),
+            ).fetchone()
+            return (bytes(row[0]), row[1] < now) if row is not None else None
+
+        found = self._run("get", _get, None)
+        # Purge en attente : l'entrée lue est peut-être celle qu'elle retire.
+        return None if self._pending else found
+
+    def set(
+        self,
+        key: _CacheKey,
+        payload: bytes,
+        ttl: float,
+        content_ids: frozenset[str],
+        stale_seconds: float = 0.0,
+    ) -> None:
+        user, variant = str(key[0]), key[1] or _DEFAULT_VARIANT
+
+        def _set(conn: sqlite3.Connection) -> None:
+            now = time.time()
+            with _transaction(conn):
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries "
+                    "(user_id, variant, fresh_until, expires_at, payload) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (user, variant, now + ttl, now + ttl + stale_seconds, payload),
+                )
+                conn.execute(
+                    "DELETE FROM entry_contents WHERE user_id = ? AND variant = ?",
+                    (user, variant),
+                )
+                conn.executemany(
+                    "INSERT INTO entry_contents (content_id, user_id, variant) "
+                    "VALUES (?, ?, ?)",
+                    [(content_id, user, variant) for content_id in content_ids],
+                )
+                self._writes += 1
+                if self._writes % _SWEEP_EVERY == 0:
+                    conn.execute("DELETE FROM entries WHERE expires_at < ?", (now,))
+                    self._enforce_budget(conn)
+                    conn.execute(
+                        "DELETE FROM entry_contents WHERE NOT EXISTS ("
+                        "SELECT 1 FROM entries e WHERE e.user_id = "
+                        "entry_contents.user_id AND e.variant = entry_contents.variant)"
+                    )
+                    conn.execute("DELETE FROM leases WHERE expires_at < ?", (now,))
+
+        self._run("set", _set, None)
+
+    def _enforce_budget(self, conn: sqlite3.Connection) -> None:
+        if not self._max_bytes:
+            return
+        kept, overflow = 0, []
+        for user, variant, size in conn.execute(
+            "SELECT user_id, variant, length(payload) FROM entries "
+            "ORDER BY expires_at DESC"
+        ):
+            kept += size
+            if kept > self._max_bytes:
+                overflow.append((user, variant))
+        conn.executemany(
+            "DELETE FROM entries WHERE user_id = ? AND variant = ?", overflow
+        )
+        self._evictions += len(overflow)
+
+    def generation(self, user_id: UUID) -> tuple[int, int]:
+        def _generation(conn: sqlite3.Connection) -> tuple[int, int]:
+            values = dict(
+                conn.execute(
+                    "SELECT scope, value FROM generations WHERE scope IN (?, ?)",
+                    (str(user_id), _GLOBAL_SCOPE),
+                ).fetchall()
+            )
+            return (values.get(str(user_id), 0), values.get(_GLOBAL_SCOPE, 0))
+
+        generation = self._run("generation", _generation, (-1, -1))
+        return (-1, -1) if self._pending else generation
+
+    def input_generation(self, user_id: UUID) -> int:
+        def _input_generation(conn: sqlite3.Connection) -> int:
+            row = conn.execute(
+                "SELECT value FROM generations WHERE scope = ?",
+                (_INPUTS_SCOPE.format(user_id),),
+            ).fetchone()
+            return row[0] if row is not None else 0
+
+        generation = self._run("input_generation", _input_generation, -1)
+        return -1 if self._pending else generation
+
+    def purge(self, *, user_id: UUID | None, content_id: str | None) -> int:
+        def _purge(conn: sqlite3.Connection) -> int:
+            with _transaction(conn):
+                if content_id is not None:
+                    sql = (
+                        "SELECT user_id, variant FROM entry_contents "
+                        "WHERE content_id = ?"
+                    )
+                    params: tuple[str, ...] = (content_id,)
+                    if user_id is not None:
+                        sql += " AND user_id = ?"
+                        params += (str(user_id),)
+                    keys = conn.execute(sql, params).fetchall()
+                elif user_id is not None:
+                    keys = conn.execute(
+                        "SELECT user_id, variant FROM entries WHERE user_id = ?",
+                        (str(user_id),),
+                    ).fetchall()
+                else:
+                    keys = conn.execute(
+                        "SELECT user_id, variant FROM entries"
+                    ).fetchall()
+                purged = 0
+                for key in keys:
+                    purged += conn.execute(
+                        "DELETE FROM entries WHERE user_id = ? AND variant = ?", key
+                    ).rowcount
+                conn.executemany(
+                    "DELETE FROM entry_contents WHERE user_id = ? AND variant = ?",
+                    keys,
+                )
+                scopes = [str(user_id) if user_id is not None else _GLOBAL_SCOPE]
+                if user_id is not None and content_id is None:
+                    scopes.append(_INPUTS_SCOPE.format(user_id))
+                conn.executemany(
+                    "INSERT INTO generations (scope, value) VALUES (?, 1) "
+                    "ON CONFLICT (scope) DO UPDATE SET value = value + 1",
+                    [(scope,) for scope in scopes],
+                )
+            return purged
+
+        return self._must_land("purge", _purge, 0)
+
+    def try_lease(self, key: _CacheKey, ttl: float) -> str | None:
+        token = uuid.uuid4().hex
+
+        def _try(conn: sqlite3.Connection) -> str | None:
+            now = time.time()
+            lease = _lease_key(key)
+            with _transaction(conn):
+                conn.execute(
+                    "DELETE FROM leases WHERE key = ? AND expires_at < ?", (lease, now)
+                )
+                taken = conn.execute(
+                    "INSERT OR IGNORE INTO leases (key, token, expires_at) "
+                    "VALUES (?, ?, ?)",
+                    (lease, token, now + ttl),
+                ).rowcount
+            return token if taken else None
+
+        return self._run("try_lease", _try, token)
+
+    def release_lease(self, key: _CacheKey, token: str) -> None:
+        self._must_land(
+            "release_lease",
+            lambda conn: conn.execute(
+                "DELETE FROM leases WHERE key = ? AND token = ?",
+                (_lease_key(key), token),
+            ),
+            None,
+        )
+
+    def size(self) -> int:
+        return self._run(
+            "size",
+            lambda conn: conn.execute(
+                "SELECT count(*) FROM entries WHERE expires_at >= ?", (time.time(),)
+            ).fetchone()[0],
+            0,
+        )
+
+    def memory_stats(self) -> dict[str, int]:
+        size = self._run(
+            "memory_stats",
+            lambda conn: conn.execute(
+                "SELECT coalesce(sum(length(payload)), 0) FROM entries"
+            ).fetchone()[0],
+            0,
+        )
+        return {
+            "bytes": size,
+            "max_bytes": self._max_bytes,
+            "evictions": self._evictions,
+        }
+
+    def clear(self) -> None:
+        def _clear(conn: sqlite3.Connection) -> None:
+            for table in ("entries", "entry_contents", "generations", "leases"):
+                conn.execute(f"DELETE FROM {table}")
+
+        self._run("clear", _clear, None)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,233 @@
+"""Ranked-id cursors: page 2+ of ``/api/feed/`` without re-ranking.
+
+Cousin of :mod:`app.services.feed_cache` — caches the *ordering* of a feed
+view rather than a page of it.
+
+Background
+----------
+Infinite scroll (``offset > 0``) re-ran the whole pipeline — candidates
+(500 rows), scoring, source decay, randomization, stratification — to slice
+one page out of it. Seconds per page, and the slice was taken from a
+*different* ranking each time: the Gumbel noise is drawn per request and
+the candidate set moves as articles get impressed, so pages overlapped or
+skipped articles.
+
+Design
+------
+- The first page of a slice-paginated view stores its full ordered id list
+  under ``(user_id, signature)`` — signature = every query parameter but
+  the offset — and returns an opaque ``token`` (``PaginationMeta
+  .next_cursor``). Later pages send it back: the ids of the page are
+  hydrated by primary key and re-checked against the user's exclusion set
+  (hidden since page 1, …), nothing is re-ranked.
+- Only views whose pages *are* slices of one ranking get a cursor: the
+  scored modes and the explicit-filter chronological views. The default
+  chronological view re-runs diversification and regroupement over a window
+  that depends on the offset — its pages are not slices, it keeps the full
+  recompute.
+- The cursor keeps what the page hydration needs: followed sources and, for
+  scored views, the ``ScoringContext`` the ranking used (recommendation
+  reasons of later pages are built against the same context), plus the
+  ``CompiledUserContext`` version for telemetry.
+- **Invalidation**: ``FEED_CACHE.invalidate(user_id)`` — every
+  ranking-relevant write — bumps the user's generation (listener registered
+  at import time, other workers' writes via
+  ``FEED_CACHE.sync_invalidations``); older cursors stop resolving and the
+  next page falls back to the full pipeline. TTL ``FEED_CURSOR_TTL_SECONDS`` (default 900 s,
+  ``0`` disables cursors). A cursor unknown to this worker (other process,
+  evicted, expired) is the same fallback — never an error.
+- A stale-while-revalidate background refresh of page 1 does not rotate the
+  cursor: the stale page already served carries the current token, the
+  refreshed payload keeps it (``issue(..., rotate=False)``). Only foreground
+  recomputes issue a new ordering.
+- Memory: ``BoundedLRU`` under ``FEED_CURSOR_MAX_BYTES`` (default 32 MiB).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import secrets
+import time
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from app.services.bounded_cache import (
+    BoundedLRU,
+    GenerationCounters,
+    max_bytes_from_env,
+)
+from app.services.feed_cache import FEED_CACHE
+
+logger = logging.getLogger(__name__)
+
+# Estimations pour le budget : un UUID dans un tuple, une entrée
+# d'`impression_data` du contexte de scoring.
+_ID_BYTES = 72
+_CONTEXT_ITEM_BYTES = 160
+
+
+def _ttl_from_env() -> float:
+    """Read TTL from env. ``FEED_CURSOR_TTL_SECONDS=0`` disables cursors."""
+    raw = os.environ.get("FEED_CURSOR_TTL_SECONDS", "900")
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        logger.warning("feed_cursor_invalid_ttl raw=%s, defaulting to 900s", raw)
+        return 900.0
+
+
+def _max_bytes_from_env() -> int:
+    """``FEED_CURSOR_MAX_BYTES`` — ``0`` disables the bound."""
+    return max_bytes_from_env("FEED_CURSOR_MAX_BYTES", 32 * 1024 * 1024)
+
+
+@dataclass(frozen=True)
+class FeedCursor:
+    """One ranked view, as page 1 computed it."""
+
+    token: str
+    content_ids: tuple[UUID, ...]
+    context_version: int | None
+    followed_source_ids: frozenset[UUID]
+    # Prédicat d'exclusion de `_get_candidates` : relâché (masqués seuls)
+    # pour les vues filtrées.
+    explicit_filter: bool
+    # `ScoringContext` du classement (vues scorées), None sinon.
+    scoring_context: Any | None = None
+    personalized_theme_mode: bool = False
+
+
+@dataclass
+class _Entry:
+    expires_at: float
+    generation: int
+    cursor: FeedCursor
+
+
+def _entry_bytes(entry: _Entry) -> int:
+    context = entry.cursor.scoring_context
+    impressions = len(getattr(context, "impression_data", None) or ())
+    return len(entry.cursor.content_ids) * _ID_BYTES + impressions * _CONTEXT_ITEM_BYTES
+
+
+class FeedCursorStore:
+    """``(user_id, signature)`` → latest :class:`FeedCursor` of that view."""
+
+    def __init__(
+        self, ttl_seconds: float | None = None, max_bytes: int | None = None
+    ) -> None:
+        self._ttl = ttl_seconds if ttl_seconds is not None else _ttl_from_env()
+        self._entries: BoundedLRU[tuple[UUID, Hashable], _Entry] = BoundedLRU(
+            max_bytes=max_bytes if max_bytes is not None else _max_bytes_from_env(),
+            sizeof=_entry_bytes,
+        )
+        self._generations: GenerationCounters[UUID] = GenerationCounters()
+        self._issued = 0
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    def issue(
+        self,
+        user_id: UUID,
+        signature: Hashable,
+        content_ids: Sequence[UUID],
+        *,
+        context_version: int | None,
+        followed_source_ids: frozenset[UUID] | set[UUID],
+        explicit_filter: bool,
+        scoring_context: Any | None = None,
+        personalized_theme_mode: bool = False,
+        rotate: bool = True,
+    ) -> str | None:
+        """Store the ordering of a first page; returns its token (None when
+        cursors are disabled). Replaces the previous cursor of the view.
+
+        ``rotate=False`` (stale-while-revalidate background refresh): a still
+        valid cursor of the view is kept and its token returned — the stale
+        page just served carries it, the client's next page must resolve."""
+        if not self.enabled:
+            return None
+        key = (user_id, signature)
+        if not rotate:
+            current = self._entries.get(key)
+            now = time.monotonic()
+            if (
+                current is not None
+                and current.generation == self._generations.get(user_id)
+                and current.expires_at >= now
+            ):
+                current.expires_at = now + self._ttl
+                return current.cursor.token
+        cursor = FeedCursor(
+            token=secrets.token_urlsafe(12),
+            content_ids=tuple(content_ids),
+            context_version=context_version,
+            followed_source_ids=frozenset(followed_source_ids),
+            explicit_filter=explicit_filter,
+            scoring_context=scoring_context,
+            personalized_theme_mode=personalized_theme_mode,
+        )
+        self._entries.put(
+            key,
+            _Entry(
+                expires_at=time.monotonic() + self._ttl,
+                generation=self._generations.get(user_id),
+                cursor=cursor,
+            ),
+        )
+        self._issued += 1
+        return cursor.token
+
+    def resolve(
+        self, token: str, user_id: UUID, signature: Hashable
+    ) -> FeedCursor | None:
+        """The cursor behind ``token`` if it is still valid for this user and
+        exactly this view, else None (→ full pipeline)."""
+        FEED_CACHE.sync_invalidations(user_id)
+        entry = self._entries.get((user_id, signature)) if self.enabled else None
+        if (
+            entry is None
+            or entry.cursor.token != token
+            or entry.generation != self._generations.get(user_id)
+            or entry.expires_at < time.monotonic()
+        ):
+            self._misses += 1
+            return None
+        self._hits += 1
+        return entry.cursor
+
+    def invalidate(self, user_id: UUID) -> None:
+        # O(1) : les entrées de l'ancienne génération ne résolvent plus et
+        # sortent par TTL / LRU.
+        self._generations.bump(user_id)
+
+    def stats(self) -> dict[str, int | float]:
+        total = self._hits + self._misses
+        return {
+            "issued": self._issued,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": (self._hits / total) if total else 0.0,
+            "ttl_seconds": self._ttl,
+            **self._entries.stats(),
+        }
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._generations.clear()
+        self._issued = 0
+        self._hits = 0
+        self._misses = 0
+
+
+FEED_CURSORS = FeedCursorStore()
+"""Module-level singleton — import as ``from app.services.feed_cursor import FEED_CURSORS``."""
+
+FEED_CACHE.add_invalidate_listener(FEED_CURSORS.invalidate)
@@ -0,0 +1,221 @@
+"""In-process cache of ``RSSParser.detect`` outcomes, keyed per site URL.
+
+Background
+----------
+A feed detection costs up to ~20 outbound requests (landing page, link
+candidates, suffix probes, WordPress rungs, index pages). The same sites
+come back constantly: smart source search resolves the host root of every
+Brave / Google News candidate, then the user adds one of them through
+``SourceService``, and the rescue job retries the same failing hosts.
+
+Design
+------
+- **Key** — lowercase host + path without trailing slash (+ query), so a
+  host root is keyed ``lemonde.fr`` like the ``host_feed_resolutions``
+  table of smart source search, and path-level URLs (YouTube channels,
+  ``radiofrance.fr/franceculture``) stay distinct.
+- **Positive entries** hold the ``DetectedFeed`` (callers get a copy) for
+  ``FEED_DETECT_CACHE_TTL_SECONDS`` (default 6 h, ``0`` disables the cache).
+- **Negative entries** hold the ``FeedNotFoundError`` message (no feed, or
+  anti-bot block), replayed for ``FEED_DETECT_CACHE_NEGATIVE_TTL_SECONDS``
+  (default 15 min — short, a blocked site may recover). Fetch failures
+  (``FeedFetchError``: timeouts, connection and HTTP errors), other
+  ``ValueError`` and unexpected errors are never cached.
+- **Single-flight** per key: concurrent detections of one site wait on
+  one run (search fans out candidates that often share a host).
+- **Shared tiers** — ``SmartSourceSearchService._cached_detect_feed`` reads
+  this cache before its ``host_feed_resolutions`` table, and fills it
+  through ``detect()``; the table stays the durable tier of the search.
+- **Bounded memory** — ``BoundedLRU`` under ``FEED_DETECT_CACHE_MAX_BYTES``
+  (default 4 MiB, ``0`` = unbounded).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+from app.services.bounded_cache import BoundedLRU, LockRegistry, max_bytes_from_env
+
+if TYPE_CHECKING:
+    from app.services.rss_parser import DetectedFeed
+
+logger = logging.getLogger(__name__)
+
+
+def _seconds_from_env(name: str, default: float) -> float:
+    raw = os.environ.get(name, str(default))
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        logger.warning("feed_detection_cache_invalid_ttl %s=%s, defaulting", name, raw)
+        return default
+
+
+def _max_bytes_from_env() -> int:
+    """``FEED_DETECT_CACHE_MAX_BYTES`` — ``0`` disables the bound."""
+    return max_bytes_from_env("FEED_DETECT_CACHE_MAX_BYTES", 4 * 1024 * 1024)
+
+
+def detection_key(url: str) -> str | None:
+    """``host[/path][?query]`` for *url*, or None when it has no host."""
+    try:
+        parsed = urlparse(url)
+    except ValueError:
+        return None
+    host = (parsed.netloc or "").lower()
+    if not host:
+        return None
+    key = host + parsed.path.rstrip("/")
+    return f"{key}?{parsed.query}" if parsed.query else key
+
+
+@dataclass
+class _Entry:
+    expires_at: float
+    feed: DetectedFeed | None
+    error: str | None = None
+
+
+# Un DetectedFeed : URL, titre, description tronquée à 200 et 3 entrées.
+_FEED_BYTES = 2048
+_ERROR_BYTES = 512
+
+
+def _entry_bytes(entry: _Entry) -> int:
+    return _FEED_BYTES if entry.feed is not None else _ERROR_BYTES
+
+
+class FeedDetectionCache:
+    """TTL cache (positive + negative) of feed detections, single-flight."""
+
+    def __init__(
+        self,
+        ttl_seconds: float | None = None,
+        negative_ttl_seconds: float | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        self._ttl = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else _seconds_from_env("FEED_DETECT_CACHE_TTL_SECONDS", 6 * 3600.0)
+        )
+        self._negative_ttl = (
+            negative_ttl_seconds
+            if negative_ttl_seconds is not None
+            else _seconds_from_env("FEED_DETECT_CACHE_NEGATIVE_TTL_SECONDS", 900.0)
+        )
+        self._entries: BoundedLRU[str, _Entry] = BoundedLRU(
+            max_bytes=max_bytes if max_bytes is not None else _max_bytes_from_env(),
+            sizeof=_entry_bytes,
+        )
+        self._locks: LockRegistry[str, asyncio.Lock] = LockRegistry(
+            lambda _: asyncio.Lock()
+        )
+        self._hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+        self._detections = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    def _fresh(self, key: str) -> _Entry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at < time.monotonic():
+            self._entries.pop(key)
+            return None
+        return entry
+
+    def lookup(self, url: str) -> tuple[bool, DetectedFeed | None]:
+        """``(found, feed)`` — ``(True, None)`` is a cached "no feed".
+
+        A miss is not counted here: the caller's ``detect()`` counts it."""
+        key = detection_key(url) if self.enabled else None
+        entry = self._fresh(key) if key else None
+        if entry is None:
+            return False, None
+        if entry.feed is None:
+            self._negative_hits += 1
+            return True, None
+        self._hits += 1
+        return True, entry.feed.model_copy(deep=True)
+
+    def put(self, url: str, feed: DetectedFeed) -> None:
+        key = detection_key(url) if self.enabled else None
+        if key:
+            self._entries.put(
+                key,
+                _Entry(expires_at=time.monotonic() + self._ttl, feed=feed),
+            )
+
+    def put_negative(self, url: str, error: str) -> None:
+        key = detection_key(url) if self.enabled and self._negative_ttl else None
+        if key:
+            self._entries.put(
+                key,
+                _Entry(
+                    expires_at=time.monotonic() + self._negative_ttl,
+                    feed=None,
+                    error=error,
+                ),
+            )
+
+    async def get_or_detect(
+        self, url: str, detect: Callable[[], Awaitable[DetectedFeed]]
+    ) -> DetectedFeed:
+        """Cached outcome for *url*, or run ``detect()`` once for all waiters.
+
+        A cached negative is replayed as the original ``FeedNotFoundError``."""
+        from app.services.rss_parser import FeedNotFoundError
+
+        key = detection_key(url) if self.enabled else None
+        if not key:
+            self._detections += 1
+            return await detect()
+        async with self._locks.get(key):
+            entry = self._fresh(key)
+            if entry is not None:
+                if entry.feed is None:
+                    self._negative_hits += 1
+                    raise FeedNotFoundError(entry.error)
+                self._hits += 1
+                return entry.feed.model_copy(deep=True)
+            self._misses += 1
+            self._detections += 1
+            try:
+                feed = await detect()
+            except FeedNotFoundError as exc:
+                self.put_negative(url, str(exc))
+                raise
+            self.put(url, feed)
+            return feed.model_copy(deep=True)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._hits = self._negative_hits = self._misses = self._detections = 0
+
+    def stats(self) -> dict[str, int | float | bool]:
+        return {
+            "enabled": self.enabled,
+            "ttl_seconds": self._ttl,
+            "negative_ttl_seconds": self._negative_ttl,
+            "hits": self._hits,
+            "negative_hits": self._negative_hits,
+            "misses": self._misses,
+            "detections": self._detections,
+            **self._entries.stats(),
+        }
+
+
+FEED_DETECTION_CACHE = FeedDetectionCache()
+"""Module-level singleton — import as ``from app.services.feed_detection_cache import FEED_DETECTION_CACHE``."""
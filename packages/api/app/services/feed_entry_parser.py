@@ -0,0 +1,353 @@
+"""Extraction des entrées de flux RSS — fonctions pures, hors boucle.
+
+Tout ce que le sync fait en CPU sur un flux (feedparser, extraction des
+champs et du thumbnail, `compute_content_quality`, `detect_paywall`) vit ici
+sous forme de fonctions module-level : elles prennent et rendent des données
+simples (str, dicts, dataclasses) et peuvent donc tourner dans un processus
+de `FEED_INGEST_POOL` (cf. `feed_ingest_pool`). `SyncService` garde ses
+anciennes méthodes (`_parse_entry`, `_optimize_thumbnail_url`, …) comme
+façades.
+"""
+
+import datetime
+import html
+import re
+from dataclasses import dataclass
+from uuid import UUID
+
+import feedparser
+import structlog
+
+from app.models.enums import ContentType, SourceType
+from app.services.content_quality import compute_content_quality
+from app.services.paywall_detector import detect_paywall
+
+logger = structlog.get_logger()
+
+
+@dataclass(frozen=True)
+class EntrySource:
+    """Ce que l'extraction lit d'une `Source` (picklable, sans session)."""
+
+    id: UUID
+    name: str
+    type: SourceType
+
+    @classmethod
+    def of(cls, source) -> "EntrySource":
+        return cls(id=source.id, name=source.name, type=source.type)
+
+
+@dataclass(frozen=True)
+class ParsedFeed:
+    """Résultat de `analyze_feed`."""
+
+    entries: list[dict]
+    # Nombre d'entrées du flux (avant la limite et les entrées invalides).
+    total: int
+    bozo_error: str | None = None
+
+
+def analyze_feed(text: str, source: EntrySource, limit: int) -> ParsedFeed:
+    """feedparser + `parse_entry` sur les `limit` premières entrées."""
+    feed = feedparser.parse(text)
+    entries = []
+    for entry in feed.entries[:limit]:
+        content_data = parse_entry(entry, source)
+        if content_data:
+            entries.append(content_data)
+    return ParsedFeed(
+        entries=entries,
+        total=len(feed.entries),
+        bozo_error=str(feed.bozo_exception) if feed.bozo else None,
+    )
+
+
+def detect_paywalls(checks: list[dict]) -> list[bool]:
+    """`detect_paywall(**check)` pour chaque entrée, dans l'ordre."""
+    return [detect_paywall(**check) for check in checks]
+
+
+def parse_entry(entry, source: EntrySource) -> dict | None:
+    """Extrait les données pertinentes selon le type de source."""
+    try:
+        # Common fields
+        title = entry.get("title", "No Title")
+        link = entry.get("link", "")
+        guid = entry.get("id", link)  # Fallback to link if no ID
+
+        if not link:
+            return None
+
+        # Date handling
+        published_at = datetime.datetime.utcnow()
+        if hasattr(entry, "published_parsed") and entry.published_parsed:
+            published_at = datetime.datetime(*entry.published_parsed[:6])
+        elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
+            published_at = datetime.datetime(*entry.updated_parsed[:6])
+
+        # Base content data
+        content_data = {
+            "source_id": source.id,
+            "source_name": source.name,
+            "title": title,
+            "url": link,
+            "guid": guid,
+            "published_at": published_at,
+            "content_type": ContentType.ARTICLE,  # Default
+            "description": None,
+            "thumbnail_url": None,
+            "duration_seconds": None,
+            "html_content": None,  # Story 5.2: In-App Reading
+            "audio_url": None,  # Story 5.2: In-App Reading
+        }
+
+        # Type specific parsing
+        if source.type == SourceType.YOUTUBE:
+            content_data["content_type"] = ContentType.YOUTUBE
+
+            # YouTube specific details
+            if "media_group" in entry:
+                group = entry.media_group
+                if "media_thumbnail" in group:
+                    # Taken the largest thumbnail usually usually the first one or we can verify
+                    thumbnails = group.media_thumbnail
+                    if isinstance(thumbnails, list) and thumbnails:
+                        content_data["thumbnail_url"] = thumbnails[0]["url"]
+                if "media_description" in group:
+                    content_data["description"] = html.unescape(group.media_description)
+
+            if not content_data["description"] and "summary" in entry:
+                content_data["description"] = html.unescape(entry.summary)
+
+            # HD Thumbnail: extract video ID and use maxresdefault
+            video_id = extract_youtube_video_id(link)
+            if video_id:
+                content_data["thumbnail_url"] = (
+                    f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
+                )
+            elif content_data["thumbnail_url"]:
+                content_data["thumbnail_url"] = optimize_thumbnail_url(
+                    content_data["thumbnail_url"]
+                )
+
+            # Description -> html_content for in-app reading
+            if content_data["description"]:
+                desc = content_data["description"]
+                html_lines = html.escape(desc).replace("\n", "<br>")
+                content_data["html_content"] = f"<p>{html_lines}</p>"
+                content_data["content_quality"] = (
+                    "full" if len(desc) > 500 else "partial"
+                )
+
+        elif source.type == SourceType.PODCAST:
+            content_data["content_type"] = ContentType.PODCAST
+
+            # Podcast duration
+            if "itunes_duration" in entry:
+                duration_str = entry.itunes_duration
+                content_data["duration_seconds"] = parse_duration(duration_str)
+
+            # Story 5.2: Extract audio URL from enclosure
+            if "enclosures" in entry:
+                for enclosure in entry.enclosures:
+                    if enclosure.get("type", "").startswith("audio"):
+                        content_data["audio_url"] = enclosure.get(
+                            "href"
+                        ) or enclosure.get("url")
+                        break
+
+            # Thumbnail extraction
+            if "image" in entry and "href" in entry.image:
+                content_data["thumbnail_url"] = entry.image.href
+            elif "itunes_image" in entry and "href" in entry.itunes_image:
+                content_data["thumbnail_url"] = entry.itunes_image.href
+
+            description = entry.get("summary", "")
+            content_data["description"] = (
+                html.unescape(description) if description else ""
+            )
+
+            if content_data["thumbnail_url"]:
+                content_data["thumbnail_url"] = optimize_thumbnail_url(
+                    content_data["thumbnail_url"]
+                )
+
+        else:  # ARTICLE
+            content_data["content_type"] = ContentType.ARTICLE
+            # Try to find an image in standard enclosures
+            if "media_content" in entry:
+                for media in entry.media_content:
+                    if media.get("medium") == "image" and "url" in media:
+                        content_data["thumbnail_url"] = media["url"]
+                        break
+
+            # Fallback to enclosures
+            if not content_data["thumbnail_url"] and "enclosures" in entry:
+                for enclosure in entry.enclosures:
+                    if enclosure.get("type", "").startswith("image/"):
+                        content_data["thumbnail_url"] = enclosure.get("href")
+                        break
+
+            description = entry.get("summary", "")
+            content_data["description"] = (
+                html.unescape(description) if description else ""
+            )
+
+            # Fallback: Try to find image in description/content using regex
+            if not content_data["thumbnail_url"]:
+                html_content = ""
+                if "content" in entry:
+                    # Atom/RSS content usually in list of dicts
+                    for c in entry.content:
+                        html_content += c.get("value", "")
+
+                if not html_content:
+                    html_content = content_data["description"] or ""
+
+                # Unescape HTML (fixes Socialter and others)
+                html_content = html.unescape(html_content)
+
+                # Broad regex for img src
+                # Loop through all matches to find a valid one
+                img_matches = re.finditer(
+                    r'<img[^>]+src=["\'](http[^"\']+)["\']', html_content
+                )
+                for match in img_matches:
+                    url = match.group(1)
+                    if is_valid_thumbnail(url):
+                        content_data["thumbnail_url"] = url
+                        break
+
+            if content_data["thumbnail_url"]:
+                content_data["thumbnail_url"] = optimize_thumbnail_url(
+                    content_data["thumbnail_url"]
+                )
+
+            # Story 5.2: Extract content:encoded for in-app reading
+            if "content" in entry:
+                for c in entry.content:
+                    content_type = c.get("type", "")
+                    if content_type in ("text/html", "html") or "html" in content_type:
+                        content_data["html_content"] = c.get("value")
+                        break
+                # Fallback to first content if no HTML found
+                if not content_data["html_content"] and entry.content:
+                    content_data["html_content"] = entry.content[0].get("value")
+
+        quality_source = content_data.get("html_content") or content_data.get(
+            "description"
+        )
+        content_data["content_quality"] = content_data.get(
+            "content_quality"
+        ) or compute_content_quality(quality_source)
+        return content_data
+
+    except Exception as e:
+        logger.warning(
+            "Error parsing entry",
+            entry_title=entry.get("title", "Unknown"),
+            error=str(e),
+        )
+        return None
+
+
+def extract_youtube_video_id(url: str) -> str | None:
+    """Extract video ID from a YouTube URL.
+
+    Supports patterns like:
+    - https://www.youtube.com/watch?v=VIDEO_ID
+    - https://img.youtube.com/vi/VIDEO_ID/...
+    - https://youtu.be/VIDEO_ID
+    """
+    if not url:
+        return None
+    # watch?v=VIDEO_ID
+    match = re.search(r"[?&]v=([\w-]+)", url)
+    if match:
+        return match.group(1)
+    # /vi/VIDEO_ID or /embed/VIDEO_ID
+    match = re.search(r"/(?:vi|embed)/([\w-]+)", url)
+    if match:
+        return match.group(1)
+    # youtu.be/VIDEO_ID
+    match = re.search(r"youtu\.be/([\w-]+)", url)
+    if match:
+        return match.group(1)
+    return None
+
+
+def optimize_thumbnail_url(url: str) -> str:
+    """Tente d'obtenir une version haute résolution de l'image."""
+    if not url:
+        return url
+
+    # 1. Courrier International: /644/ -> /original/ or /1200/
+    if "focus.courrierinternational.com" in url:
+        # Pattern: .../644/0/60/0/...
+        url = url.replace("/644/", "/1200/")
+
+    # 2. WordPress resizing: thumb-150x150.jpg -> thumb.jpg
+    # Pattern match for -WxH before extension
+    wordpress_pattern = re.compile(r"-\d+x\d+(\.[a-z]{3,4})$", re.IGNORECASE)
+    url = wordpress_pattern.sub(r"\1", url)
+
+    return url
+
+
+def is_valid_thumbnail(url: str) -> bool:
+    """Vérifie si une URL d'image est pertinente comme thumbnail."""
+    if not url:
+        return False
+
+    url_lower = url.lower()
+
+    # 1. Exclure les emojis Wordpress et autres trackers connus
+    if "s.w.org/images/core/emoji" in url_lower:
+        return False
+    if "doubleclick.net" in url_lower:
+        return False
+    if "googlesyndication" in url_lower:
+        return False
+
+    # 2. Exclure par mots-clés dans le nom de fichier
+    # On essaie de ne pas être trop agressif sur le domaine, mais sur le path
+    bad_keywords = [
+        "logo",
+        "icon",
+        "button",
+        "pixel",
+        "tracker",
+        "avatar",
+        "smiley",
+        "emoji",
+        "facebook",
+        "twitter",
+        "linkedin",
+        "share",
+        "counter",
+        "count.gif",
+        "ad.",
+        "doubleclick",
+    ]
+
+    # Check if any bad keyword is in the URL filename part roughly
+    # Clean query params?
+    base_url = url_lower.split("?")[0]
+    return not any(keyword in base_url for keyword in bad_keywords)
+
+
+def parse_duration(duration_str: str) -> int | None:
+    """Convertit une durée itunes (HH:MM:SS ou MM:SS ou secondes) en entier."""
+    try:
+        if ":" in duration_str:
+            parts = duration_str.split(":")
+            if len(parts) == 3:
+                return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
+            elif len(parts) == 2:
+                return int(parts[0]) * 60 + int(parts[1])
+        else:
+            return int(duration_str)
+    except (ValueError, IndexError):
+        return None
+    return None
@@ -0,0 +1,157 @@
+"""Pool de processus pour le CPU d'ingestion RSS.
+
+`feedparser.parse` partait dans l'executor de threads par défaut (toujours
+sous le GIL) et `_parse_entry`, `compute_content_quality` et
+`detect_paywall` (parcours JSON-LD, regex sur 50 Ko de HTML) tournaient
+directement sur la boucle : pendant une rafale de sync, ce CPU s'ajoutait à
+la latence de `/api/feed` sur le même pod.
+
+`FeedIngestPool.run(fn, *args)` exécute une fonction pure de
+`feed_entry_parser` dans un `ProcessPoolExecutor` dédié :
+
+- `rss_sync_parse_workers` processus (contexte `spawn` : pas de `fork` d'un
+  processus qui porte déjà des threads et un event loop), démarrés au premier
+  appel ; `0` garde l'ancien régime (executor de threads) ;
+- **file bornée** : au plus `rss_sync_parse_queue` tâches soumises à la fois,
+  les suivantes attendent côté asyncio (backpressure, pas d'accumulation de
+  flux en mémoire dans la file du pool) ;
+- un pool cassé (`BrokenProcessPool`, worker tué) est recréé au prochain
+  appel. Les appels en cours échouent (la source compte en échec pour ce
+  cycle) : jamais rejoués dans le processus de l'API, que l'entrée qui a tué
+  le worker tuerait aussi.
+
+Métriques (`stats()`) exposées dans `/api/health/feed-cache`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, TypeVar
+
+import structlog
+
+from app.config import get_settings
+
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+
+
+class FeedIngestPool:
+    """Étage CPU du sync RSS, hors de l'event loop."""
+
+    def __init__(self, workers: int | None = None, queue_size: int | None = None):
+        self._workers = workers
+        self._queue_size = queue_size
+        self._executor: ProcessPoolExecutor | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._broken = 0
+        self._in_flight = 0
+        self._waiting = 0
+        self._peak_waiting = 0
+        self._wait_seconds = 0.0
+        self._run_seconds = 0.0
+
+    @property
+    def workers(self) -> int:
+        if self._workers is None:
+            self._workers = max(0, get_settings().rss_sync_parse_workers)
+        return self._workers
+
+    def _queue_slots(self) -> asyncio.Semaphore:
+        if self._slots is None:
+            size = self._queue_size
+            if size is None:
+                size = get_settings().rss_sync_parse_queue
+            self._slots = asyncio.Semaphore(max(1, size))
+        return self._slots
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info("feed_ingest_pool_started", workers=self.workers)
+        return self._executor
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """`fn(*args)` dans le pool ; `fn` et ses arguments doivent être
+        picklables (fonctions module-level, données simples)."""
+        loop = asyncio.get_running_loop()
+        slots = self._queue_slots()
+        queued_at = time.monotonic()
+        self._waiting += 1
+        self._peak_waiting = max(self._peak_waiting, self._waiting)
+        async with slots:
+            self._waiting -= 1
+            started_at = time.monotonic()
+            self._wait_seconds += started_at - queued_at
+            self._submitted += 1
+            self._in_flight += 1
+            try:
+                if self.workers == 0:
+                    result = await loop.run_in_executor(None, fn, *args)
+                else:
+                    executor = self._pool()
+                    try:
+                        result = await loop.run_in_executor(executor, fn, *args)
+                    except BrokenProcessPool:
+                        logger.warning("feed_ingest_pool_broken", fn=fn.__name__)
+                        self._discard_pool(executor)
+                        raise
+            except Exception:
+                self._failed += 1
+                raise
+            finally:
+                self._in_flight -= 1
+                self._run_seconds += time.monotonic() - started_at
+            self._completed += 1
+            return result
+
+    def _discard_pool(self, broken: ProcessPoolExecutor | None = None) -> None:
+        """Drop the current executor — only if it is still `broken` when given.
+
+        Every call in flight on a dead pool gets its own `BrokenProcessPool`;
+        the late ones must not shut down the pool an earlier one already
+        replaced. Compare and swap run with no `await` in between, hence
+        atomically on the event loop."""
+        if broken is not None:
+            if self._executor is not broken:
+                return
+            self._broken += 1
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        self._discard_pool()
+        self._slots = None
+
+    def stats(self) -> dict[str, int | float | bool]:
+        done = self._completed + self._failed
+        return {
+            "workers": self.workers,
+            "started": self._executor is not None,
+            "submitted": self._submitted,
+            "completed": self._completed,
+            "failed": self._failed,
+            "broken": self._broken,
+            "in_flight": self._in_flight,
+            "waiting": self._waiting,
+            "peak_waiting": self._peak_waiting,
+            "avg_wait_ms": round(self._wait_seconds / done * 1000, 2) if done else 0.0,
+            "avg_run_ms": round(self._run_seconds / done * 1000, 2) if done else 0.0,
+        }
+
+
+FEED_INGEST_POOL = FeedIngestPool()
+"""Module-level singleton — import as ``from app.services.feed_ingest_pool import FEED_INGEST_POOL``."""
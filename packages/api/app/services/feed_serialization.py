@@ -0,0 +1,153 @@
+"""Single-pass serialization of ``FeedResponse`` with per-article fragments.
+
+Background
+----------
+A feed cache miss serialized the page twice on the event loop:
+``response.model_dump(mode="json")`` (Python dicts, plus the Python
+``field_serializer`` of ``topics``/``entities`` per item) then
+``json.dumps(...)`` over ~150 KB. The same articles come back on every miss —
+the other sections of the same user, the other users following the same
+sources — and their JSON never changes between two syncs.
+
+Design
+------
+- The page is assembled from bytes: each item is the splice of a **shared
+  fragment** (the article's own fields, identical for every user) and a
+  **per-request fragment** (user state, recommendation reason, source), both
+  produced by pydantic-core's JSON serializer in one pass — no intermediate
+  dicts, no ``json.dumps``.
+- Shared fragments are cached per ``content_id`` in a ``BoundedLRU``
+  (``FEED_FRAGMENT_CACHE_MAX_BYTES``, default 8 MiB, ``0`` = unbounded).
+  ``Content`` carries no ``updated_at``: the fragment is versioned by the
+  **values** it was built from, compared on read — a re-classified article
+  (new topics/entities) or an edited title simply misses. Never a stale
+  fragment, whatever path wrote the row.
+- :data:`SHARED_ITEM_FIELDS` is an allow-list: a new ``ContentResponse``
+  field is per-request (never shared across users) until added here.
+
+The JSON is equivalent to ``json.dumps(response.model_dump(mode="json"))``
+(key order inside an item and whitespace differ, values do not), and UUIDs
+still appear verbatim — the ``FEED_CACHE`` content index relies on it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from uuid import UUID
+
+from app.schemas.feed import CarouselInfo, FeedItemResponse, FeedResponse
+from app.services.bounded_cache import BoundedLRU, max_bytes_from_env
+
+# Champs propres à l'article (colonnes de `Content`) : identiques pour tous
+# les utilisateurs. Tout le reste (statut, reco, source…) est resérialisé.
+SHARED_ITEM_FIELDS: frozenset[str] = frozenset(
+    {
+        "id",
+        "title",
+        "url",
+        "thumbnail_url",
+        "content_type",
+        "duration_seconds",
+        "published_at",
+        "description",
+        "topics",
+        "entities",
+        "is_paid",
+        "content_quality",
+        "language",
+    }
+)
+_SHARED_ORDER = tuple(
+    f for f in FeedItemResponse.model_fields if f in SHARED_ITEM_FIELDS
+)
+_PER_REQUEST_FIELDS = frozenset(FeedItemResponse.model_fields) - SHARED_ITEM_FIELDS
+
+
+def _max_bytes_from_env() -> int:
+    """``FEED_FRAGMENT_CACHE_MAX_BYTES`` — ``0`` disables the bound."""
+    return max_bytes_from_env("FEED_FRAGMENT_CACHE_MAX_BYTES", 8 * 1024 * 1024)
+
+
+def _fingerprint(item: FeedItemResponse) -> tuple:
+    """Values the shared fragment is built from. Lists are frozen to tuples
+    so the comparison is by value."""
+    return tuple(
+        tuple(value) if isinstance(value, list) else value
+        for value in (getattr(item, f) for f in _SHARED_ORDER)
+    )
+
+
+def _splice(head: bytes, tail: bytes) -> bytes:
+    """``{a…}`` + ``{b…}`` → ``{a…,b…}`` (both non-empty objects)."""
+    return b"".join((head[:-1], b",", tail[1:]))
+
+
+class ArticleFragmentCache:
+    """``content_id`` → JSON of the item's shared fields, value-versioned."""
+
+    def __init__(self, max_bytes: int | None = None) -> None:
+        self._fragments: BoundedLRU[UUID, tuple[tuple, bytes]] = BoundedLRU(
+            max_bytes=max_bytes if max_bytes is not None else _max_bytes_from_env(),
+            sizeof=lambda entry: 2 * len(entry[1]),
+        )
+        self._hits = 0
+        self._misses = 0
+
+    def shared_fragment(self, item: FeedItemResponse) -> bytes:
+        fingerprint = _fingerprint(item)
+        cached = self._fragments.get(item.id)
+        if cached is not None and cached[0] == fingerprint:
+            self._hits += 1
+            return cached[1]
+        self._misses += 1
+        fragment = type(item).__pydantic_serializer__.to_json(
+            item, include=SHARED_ITEM_FIELDS
+        )
+        self._fragments.put(item.id, (fingerprint, fragment))
+        return fragment
+
+    def item_json(self, item: FeedItemResponse) -> bytes:
+        tail = type(item).__pydantic_serializer__.to_json(
+            item, include=_PER_REQUEST_FIELDS
+        )
+        return _splice(self.shared_fragment(item), tail)
+
+    def items_json(self, items: Iterable[FeedItemResponse]) -> bytes:
+        return b"".join((b"[", b",".join(map(self.item_json, items)), b"]"))
+
+    def stats(self) -> dict[str, int | float]:
+        total = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": (self._hits / total) if total else 0.0,
+            **self._fragments.stats(),
+        }
+
+    def clear(self) -> None:
+        self._fragments.clear()
+        self._hits = 0
+        self._misses = 0
+
+
+ARTICLE_FRAGMENTS = ArticleFragmentCache()
+"""Module-level singleton — shared by every feed request of the process."""
+
+
+def _carousel_json(carousel: CarouselInfo) -> bytes:
+    rest = type(carousel).__pydantic_serializer__.to_json(carousel, exclude={"items"})
+    items = ARTICLE_FRAGMENTS.items_json(carousel.items)
+    return _splice(b'{"items":' + items + b"}", rest)
+
+
+def serialize_feed_response(response: FeedResponse) -> bytes:
+    """UTF-8 JSON of ``response``, items spliced from cached fragments."""
+    rest = type(response).__pydantic_serializer__.to_json(
+        response, exclude={"items", "carousels"}
+    )
+    items = ARTICLE_FRAGMENTS.items_json(response.items)
+    carousels = b"".join(
+        (b"[", b",".join(_carousel_json(c) for c in response.carousels), b"]")
+    )
+    head = b"".join((b'{"items":', items, b',"carousels":', carousels, b"}"))
+    return _splice(head, rest)
@@ -0,0 +1,139 @@
+"""Lecture incrémentale des gros flux RSS/Atom (lxml, parser « pull »).
+
+Certains flux pèsent plusieurs Mo (podcasts avec show notes complètes,
+WordPress avec `content:encoded` intégral) alors que le sync n'en lit que
+les `MAX_FEED_ENTRIES` premières entrées. Lire tout le corps en `str` puis
+laisser feedparser construire l'arbre complet coûtait mémoire et CPU pour
+rien.
+
+`FeedTruncator` reçoit les octets au fil du flux HTTP (`XMLPullParser`),
+détache chaque entrée (`<item>` / `<entry>`) dès qu'elle est complète et
+s'arrête :
+
+- au plafond d'entrées ;
+- au plafond d'octets lus (`rss_sync_feed_max_bytes`) ;
+- quand l'appelant constate que les dernières entrées sont toutes déjà
+  connues (`stop()`).
+
+`document()` re-sérialise l'en-tête du flux (channel / feed) suivi des seules
+entrées retenues : feedparser le parse ensuite comme n'importe quel flux —
+même normalisation, même sanitization qu'un flux complet, sur une fraction
+du volume. Le texte produit est déterministe pour un même préfixe de flux :
+son hash sert au court-circuit « corps inchangé » du sync.
+"""
+
+from __future__ import annotations
+
+from lxml import etree
+
+_ENTRY_TAGS = frozenset({"item", "entry"})
+
+
+def _localname(element) -> str:
+    tag = element.tag
+    if not isinstance(tag, str):
+        return ""
+    return tag.rsplit("}", 1)[-1]
+
+
+def entry_guid(entry) -> str | None:
+    """Identifiant de l'entrée tel que feedparser le lit (`id`, sinon le lien)."""
+    link = None
+    for child in entry:
+        name = _localname(child)
+        if name in ("guid", "id") and child.text and child.text.strip():
+            return child.text.strip()
+        if name == "link" and link is None:
+            if child.get("href") and child.get("rel", "alternate") == "alternate":
+                link = child.get("href").strip()
+            elif child.text and child.text.strip():
+                link = child.text.strip()
+    return link
+
+
+class FeedTruncator:
+    """Préfixe d'un flux XML, entrée par entrée."""
+
+    def __init__(self, *, max_entries: int, max_bytes: int) -> None:
+        self._parser = etree.XMLPullParser(
+            events=("start", "end"),
+            recover=True,
+            resolve_entities=False,
+            no_network=True,
+            huge_tree=True,
+        )
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._root = None
+        self._container = None
+        self._entries: list = []
+        self._unprobed: list[str] = []
+        self.bytes_read = 0
+        self.stop_reason: str | None = None
+
+    @property
+    def entry_count(self) -> int:
+        return len(self._entries)
+
+    @property
+    def unprobed_count(self) -> int:
+        return len(self._unprobed)
+
+    def feed(self, chunk: bytes) -> bool:
+        """Pousse un morceau du corps ; True quand il faut arrêter de lire."""
+        if self.stop_reason is not None:
+            return True
+        self.bytes_read += len(chunk)
+        try:
+            self._parser.feed(chunk)
+            events = list(self._parser.read_events())
+        except etree.XMLSyntaxError:
+            self.stop_reason = "error"
+            return True
+        for event, element in events:
+            if event == "start":
+                if self._root is None:
+                    self._root = element
+                continue
+            if _localname(element) not in _ENTRY_TAGS:
+                continue
+            parent = element.getparent()
+            if parent is None or (
+                parent is not self._root and parent.getparent() is not self._root
+            ):
+                continue  # `<item>` imbriqué (media:group, …) : pas une entrée
+            # Détachée de l'arbre en construction : seules les entrées
+            # retenues restent en mémoire.
+            parent.remove(element)
+            self._container = parent
+            self._entries.append(element)
+            guid = entry_guid(element)
+            if guid:
+                self._unprobed.append(guid)
+            if len(self._entries) >= self._max_entries:
+                self.stop_reason = "entries"
+                return True
+        if self.bytes_read >= self._max_bytes:
+            self.stop_reason = "bytes"
+            return True
+        return False
+
+    def take_unprobed_guids(self) -> list[str]:
+        """guids des entrées arrivées depuis le dernier appel."""
+        guids, self._unprobed = self._unprobed, []
+        return guids
+
+    def stop(self, reason: str) -> None:
+        self.stop_reason = reason
+
+    def document(self) -> str | None:
+        """En-tête du flux + entrées retenues, ou None sans entrée complète."""
+        if self._root is None or self._container is None or not self._entries:
+            return None
+        container = self._container
+        # Entrée en cours de construction à l'arrêt : incomplète, écartée.
+        for child in list(container):
+            if _localname(child) in _ENTRY_TAGS:
+                container.remove(child)
+        container.extend(self._entries)
+        return etree.tostring(self._root, encoding="unicode")
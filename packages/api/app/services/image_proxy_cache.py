@@ -0,0 +1,466 @@
+"""Disk cache behind the Web image proxy (`GET /api/images/proxy`).
+
+Background
+----------
+The proxy fetched the upstream image on every request and buffered up to
+5 MB in memory before answering. A burst of Web clients opening the same
+feed hit each thumbnail origin N times, all through the single uvicorn
+worker; only the CDN in front of us could absorb repeats.
+
+Design
+------
+- **Content-addressed files**: ``sha256(url | width)`` names the entry,
+  stored as ``<dir>/<hh>/<key>.<subtype>`` (the extension carries the
+  ``image/<subtype>`` content type). Written to a temp file then
+  ``os.replace``-d: readers never see a partial image, and every worker of
+  the pod can share the directory.
+- **Size-bounded LRU**: an in-process index (rebuilt from the directory by
+  mtime, at startup via :meth:`ImageProxyCache.warm`) tracks recency; a hit
+  ``utime``-s the file so the order survives restarts. Past
+  ``IMAGE_PROXY_CACHE_MAX_BYTES`` the least recently used entries are
+  unlinked. ``0`` disables the disk layer (each request spools its own
+  download to an anonymous temp file).
+- **Off the event loop**: the directory scan, and the per-request ``open`` /
+  ``utime``, renames, links and unlinks run in worker threads
+  (``asyncio.to_thread``); the index itself is only touched from the loop.
+- **Coalescing**: concurrent misses on the same key share one upstream
+  fetch (``_inflight``); the followers serve the file it committed.
+- **Streaming**: upstream bytes go to disk chunk by chunk (size checked on
+  the fly against :data:`MAX_BYTES`), and responses stream from an open
+  file descriptor — an entry evicted after ``open()`` stays readable.
+- **Thumbnail widths**: ``width`` in :data:`THUMBNAIL_WIDTHS` serves a
+  downscaled JPEG/PNG/WebP variant, cached under its own key and derived
+  from the cached original. Needs Pillow; without it (or for GIF/SVG, an
+  image already narrow enough, one past :data:`MAX_PIXELS`, or one Pillow
+  cannot decode) the original is served. The pixel cap is checked on the
+  header, before decoding: a 5 MB file can declare a decompression bomb.
+- **Fail-soft**: disk errors are logged and degrade to an uncached fetch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import io
+import logging
+import os
+import re
+import tempfile
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass
+from typing import IO
+
+import httpx
+
+from app.services.outbound_http import OUTBOUND_HTTP
+
+logger = logging.getLogger(__name__)
+
+MAX_BYTES = 5 * 1024 * 1024  # 5 MB
+THUMBNAIL_WIDTHS: tuple[int, ...] = (160, 320, 480, 640)
+# Au-delà, pas de décodage (~100 Mo en RGBA) : l'original est servi tel quel.
+MAX_PIXELS = 24_000_000
+CHUNK_BYTES = 64 * 1024
+_STALE_TMP_SECONDS = 600
+
+_SUBTYPE = re.compile(r"^[a-z0-9.+-]{1,32}$")
+# Formats ré-encodés à la réduction ; les autres (GIF animé, SVG) passent tels
+# quels.
+_RESIZABLE = {"jpeg": "JPEG", "jpg": "JPEG", "png": "PNG", "webp": "WEBP"}
+
+
+class ImageProxyError(Exception):
+    """Upstream answer the proxy refuses to serve (mapped to an HTTP status)."""
+
+    def __init__(self, status_code: int, detail: str) -> None:
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def _dir_from_env() -> str:
+    raw = os.environ.get("IMAGE_PROXY_CACHE_DIR")
+    if raw:
+        return raw
+    return os.path.join(tempfile.gettempdir(), "facteur-image-cache")
+
+
+def _max_bytes_from_env() -> int:
+    """``IMAGE_PROXY_CACHE_MAX_BYTES=0`` disables the disk cache."""
+    raw = os.environ.get("IMAGE_PROXY_CACHE_MAX_BYTES", str(512 * 1024 * 1024))
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning(
+            "image_proxy_cache_invalid_env IMAGE_PROXY_CACHE_MAX_BYTES=%s", raw
+        )
+        return 512 * 1024 * 1024
+
+
+def cache_key(url: str, width: int | None) -> str:
+    return hashlib.sha256(f"{url}|{width or ''}".encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class _Entry:
+    path: str
+    size: int
+    content_type: str
+
+
+@dataclass
+class ServedImage:
+    """An open image ready to stream; :meth:`chunks` closes the file."""
+
+    file: IO[bytes]
+    size: int
+    content_type: str
+    cached: bool
+
+    def chunks(self) -> Iterator[bytes]:
+        try:
+            while chunk := self.file.read(CHUNK_BYTES):
+                yield chunk
+        finally:
+            self.file.close()
+
+
+def _open_touch(path: str) -> IO[bytes]:
+    """Open a cached file and bump its mtime (LRU order across restarts)."""
+    file = open(path, "rb")  # noqa: SIM115 — fermé par `ServedImage.chunks()`
+    with contextlib.suppress(OSError):
+        os.utime(path)
+    return file
+
+
+def _place(tmp_path: str, path: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    os.replace(tmp_path, path)
+
+
+def _relink(original_path: str, tmp_path: str) -> None:
+    os.unlink(tmp_path)
+    os.link(original_path, tmp_path)
+
+
+def _unlink_all(paths: list[str]) -> None:
+    for path in paths:
+        with contextlib.suppress(OSError):
+            os.unlink(path)
+
+
+def _subtype(content_type: str) -> str:
+    subtype = content_type.split("/", 1)[1] if "/" in content_type else ""
+    return subtype if _SUBTYPE.match(subtype) else "bin"
+
+
+def _resize(source: IO[bytes], content_type: str, width: int) -> bytes | None:
+    """Downscaled image bytes, or None when the original should be served."""
+    fmt = _RESIZABLE.get(_subtype(content_type))
+    if fmt is None:
+        return None
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    try:
+        # `Image.open` ne lit que l'en-tête : la taille est connue avant tout
+        # décodage.
+        with Image.open(source) as image:
+            if image.width <= width or image.width * image.height > MAX_PIXELS:
+                return None
+            height = max(1, round(image.height * width / image.width))
+            resized = image.resize((width, height), Image.Resampling.LANCZOS)
+            if fmt == "JPEG" and resized.mode not in ("RGB", "L"):
+                resized = resized.convert("RGB")
+            out = io.BytesIO()
+            resized.save(out, format=fmt, quality=82, optimize=True)
+            return out.getvalue()
+    except (Image.DecompressionBombError, OSError, SyntaxError, ValueError) as exc:
+        # Image amont tronquée ou mensongère : l'original reste servable.
+        logger.info("image_proxy_resize_failed error=%s", exc)
+        return None
+
+
+class ImageProxyCache:
+    """Upstream fetch + disk LRU + in-flight coalescing for proxied images."""
+
+    def __init__(self, directory: str | None = None, max_bytes: int | None = None):
+        self._dir = directory if directory is not None else _dir_from_env()
+        self._max_bytes = max_bytes if max_bytes is not None else _max_bytes_from_env()
+        self._index: OrderedDict[str, _Entry] | None = None
+        self._index_lock = asyncio.Lock()
+        self._total = 0
+        self._inflight: dict[str, asyncio.Task[_Entry]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._downloads = 0
+        self._resized = 0
+        self._evictions = 0
+        self._errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_bytes > 0
+
+    # ─── Index ───────────────────────────────────────────────────────────
+
+    async def warm(self) -> None:
+        """Build the index from disk (lifespan startup); no-op once built."""
+        if self.enabled:
+            await self._ensure_index()
+
+    async def _ensure_index(self) -> OrderedDict[str, _Entry]:
+        if self._index is None:
+            async with self._index_lock:
+                if self._index is None:
+                    found = await asyncio.to_thread(self._scan)
+                    self._index = OrderedDict(found)
+                    self._total = sum(entry.size for entry in self._index.values())
+                    await self._evict()
+        return self._index
+
+    def _scan(self) -> list[tuple[str, _Entry]]:
+        """Walk the directory (worker thread): entries oldest first."""
+        found: list[tuple[float, str, _Entry]] = []
+        try:
+            for root, _dirs, files in os.walk(self._dir):
+                for name in files:
+                    path = os.path.join(root, name)
+                    stat = os.stat(path)
+                    if name.endswith(".tmp"):
+                        # Écriture interrompue (crash, deploy) — pas celle,
+                        # en cours, d'un autre worker.
+                        if stat.st_mtime < time.time() - _STALE_TMP_SECONDS:
+                            os.unlink(path)
+                        continue
+                    key, _, subtype = name.partition(".")
+                    if len(key) != 64 or not subtype:
+                        continue
+                    found.append(
+                        (
+                            stat.st_mtime,
+                            key,
+                            _Entry(path, stat.st_size, f"image/{subtype}"),
+                        )
+                    )
+        except OSError as exc:
+            self._errors += 1
+            logger.warning("image_proxy_cache_scan_failed error=%s", exc)
+        found.sort(key=lambda item: item[0])
+        return [(key, entry) for _mtime, key, entry in found]
+
+    async def _evict(self) -> None:
+        index = self._index
+        assert index is not None
+        doomed: list[str] = []
+        while self._total > self._max_bytes and index:
+            _key, entry = index.popitem(last=False)
+            self._total -= entry.size
+            self._evictions += 1
+            doomed.append(entry.path)
+        if doomed:
+            await asyncio.to_thread(_unlink_all, doomed)
+
+    def _forget(self, key: str, entry: _Entry | None = None) -> None:
+        """Drop ``key`` from the index (only if it still maps to ``entry``)."""
+        index = self._index
+        assert index is not None
+        if entry is not None and index.get(key) is not entry:
+            return
+        dropped = index.pop(key, None)
+        if dropped is not None:
+            self._total -= dropped.size
+
+    async def _open(self, key: str) -> tuple[_Entry, IO[bytes]] | None:
+        index = await self._ensure_index()
+        entry = index.get(key)
+        if entry is None:
+            return None
+        try:
+            file = await asyncio.to_thread(_open_touch, entry.path)
+        except OSError:
+            # Évincé par un autre worker qui partage le répertoire.
+            self._forget(key, entry)
+            return None
+        if index.get(key) is entry:
+            index.move_to_end(key)
+        return entry, file
+
+    async def _commit(
+        self, key: str, tmp_path: str, size: int, content_type: str
+    ) -> _Entry:
+        index = await self._ensure_index()
+        path = os.path.join(self._dir, key[:2], f"{key}.{_subtype(content_type)}")
+        await asyncio.to_thread(_place, tmp_path, path)
+        self._forget(key)
+        entry = index[key] = _Entry(path, size, content_type)
+        self._total += size
+        await self._evict()
+        return entry
+
+    def _tmp_file(self) -> tuple[IO[bytes], str]:
+        os.makedirs(self._dir, exist_ok=True)
+        fd, path = tempfile.mkstemp(dir=self._dir, suffix=".tmp")
+        return os.fdopen(fd, "wb"), path
+
+    # ─── Upstream ────────────────────────────────────────────────────────
+
+    async def _download(self, url: str, sink: IO[bytes]) -> tuple[int, str]:
+        """Stream ``url`` into ``sink``; returns ``(size, content_type)``."""
+        self._downloads += 1
+        try:
+            async with OUTBOUND_HTTP.client("images").stream("GET", url) as resp:
+                if resp.status_code != 200:
+                    raise ImageProxyError(404, "upstream_status")
+                content_type = (
+                    resp.headers.get("content-type", "").split(";")[0].strip().lower()
+                )
+                if not content_type.startswith("image/"):
+                    raise ImageProxyError(415, "not_an_image")
+                declared = resp.headers.get("content-length")
+                if declared and declared.isdigit() and int(declared) > MAX_BYTES:
+                    raise ImageProxyError(413, "image_too_large")
+                size = 0
+                async for chunk in resp.aiter_bytes(CHUNK_BYTES):
+                    size += len(chunk)
+                    if size > MAX_BYTES:
+                        raise ImageProxyError(413, "image_too_large")
+                    sink.write(chunk)
+        except (httpx.HTTPError, httpx.InvalidURL):
+            raise ImageProxyError(404, "upstream_unreachable") from None
+        return size, content_type
+
+    async def _fetch_original(self, url: str, key: str) -> _Entry:
+        sink, tmp_path = await asyncio.to_thread(self._tmp_file)
+        try:
+            with sink:
+                size, content_type = await self._download(url, sink)
+            return await self._commit(key, tmp_path, size, content_type)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+
+    async def _original(self, url: str) -> tuple[_Entry, IO[bytes]]:
+        key = cache_key(url, None)
+        opened = await self._open(key)
+        if opened is None:
+            await self._coalesce(key, lambda: self._fetch_original(url, key))
+            opened = await self._open(key)
+            if opened is None:
+                raise FileNotFoundError(key)
+        return opened
+
+    async def _build_variant(self, url: str, width: int, key: str) -> _Entry:
+        original, source = await self._original(url)
+        with source:
+            data = await asyncio.to_thread(
+                _resize, source, original.content_type, width
+            )
+        sink, tmp_path = await asyncio.to_thread(self._tmp_file)
+        if data is None:
+            # Pas de réduction possible : la variante est un lien dur vers
+            # l'original (même inode, évictions indépendantes).
+            sink.close()
+            await asyncio.to_thread(_relink, original.path, tmp_path)
+            return await self._commit(
+                key, tmp_path, original.size, original.content_type
+            )
+        with sink:
+            await asyncio.to_thread(sink.write, data)
+        self._resized += 1
+        return await self._commit(key, tmp_path, len(data), original.content_type)
+
+    async def _coalesce(
+        self, key: str, build: Callable[[], Awaitable[_Entry]]
+    ) -> _Entry:
+        """One ``build()`` per key at a time. It runs in its own task: a
+        client hanging up does not cancel the fetch the others wait on."""
+        task = self._inflight.get(key)
+        if task is not None:
+            self._coalesced += 1
+        else:
+            task = asyncio.create_task(build())
+            self._inflight[key] = task
+
+            def _done(done: asyncio.Task[_Entry]) -> None:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+                if not done.cancelled():
+                    done.exception()  # retrieved, even with no waiter left
+
+            task.add_done_callback(_done)
+        return await asyncio.shield(task)
+
+    # ─── Public API ──────────────────────────────────────────────────────
+
+    async def get(self, url: str, width: int | None = None) -> ServedImage:
+        """Open image for ``url`` (downscaled to ``width`` when given).
+
+        Raises :class:`ImageProxyError` for upstream failures.
+        """
+        if not self.enabled:
+            return await self._uncached(url)
+        key = cache_key(url, width)
+        try:
+            opened = await self._open(key)
+            if opened is not None:
+                self._hits += 1
+                entry, file = opened
+                return ServedImage(file, entry.size, entry.content_type, cached=True)
+            self._misses += 1
+            if width is None:
+                entry = await self._coalesce(
+                    key, lambda: self._fetch_original(url, key)
+                )
+            else:
+                entry = await self._coalesce(
+                    key, lambda: self._build_variant(url, width, key)
+                )
+            opened = await self._open(key)
+            if opened is None:
+                # Évincé entre le commit et l'ouverture (cache minuscule).
+                return await self._uncached(url)
+            opened_entry, file = opened
+            return ServedImage(
+                file, opened_entry.size, entry.content_type, cached=False
+            )
+        except OSError as exc:
+            self._errors += 1
+            logger.warning("image_proxy_cache_disk_error error=%s", exc)
+            return await self._uncached(url)
+
+    async def _uncached(self, url: str) -> ServedImage:
+        sink = tempfile.TemporaryFile()  # noqa: SIM115 — fermé par `chunks()`
+        try:
+            size, content_type = await self._download(url, sink)
+        except BaseException:
+            sink.close()
+            raise
+        sink.seek(0)
+        return ServedImage(sink, size, content_type, cached=False)
+
+    def stats(self) -> dict[str, int | bool]:
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._index) if self._index is not None else 0,
+            "bytes": self._total,
+            "max_bytes": self._max_bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "coalesced": self._coalesced,
+            "downloads": self._downloads,
+            "resized": self._resized,
+            "evictions": self._evictions,
+            "errors": self._errors,
+            "in_flight": len(self._inflight),
+        }
+
+
+IMAGE_PROXY_CACHE = ImageProxyCache()
+"""Module-level singleton — import as ``from app.services.image_proxy_cache import IMAGE_PROXY_CACHE``."""
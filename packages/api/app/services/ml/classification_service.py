@@ -17,6 +17,7 @@ import httpx
 import structlog
 
 from app.config import get_settings
+from app.services.editorial.llm_client import mistral_slot
 from app.services.observability.usage_recorder import track_api_call
 
 log = structlog.get_logger()
@@ -405,7 +406,8 @@ class ClassificationService:
         ) as _call:
             for attempt in range(max_retries):
                 try:
-                    response = await client.post(MISTRAL_API_URL, json=payload)
+                    async with mistral_slot(payload.get("model")):
+                        response = await client.post(MISTRAL_API_URL, json=payload)
                     response.raise_for_status()
                     data = response.json()
 
@@ -0,0 +1,207 @@
+"""Classification fusionnée : un seul appel Mistral par lot pour tous les champs.
+
+Le worker fait aujourd'hui jusqu'à 3 allers-retours par lot — topics + serene
++ is_ad (`classify_batch_async`), entités (`extract_entities_batch_async`),
+good-news (`GoodNewsClassifier`) — et chacun renvoie le texte des articles et
+son propre prompt système. Ce mode pose les cinq champs dans un seul prompt
+structuré : taxonomie et règles de la passe 1, règles good-news de la passe 2.
+
+La réponse passe un validateur strict, **champ par champ** : un champ absent
+ou invalide vaut None pour cet article, et le worker le redemande à l'appel
+séparé d'aujourd'hui (cf. `ClassificationWorker._classify_fused`). Une réponse
+illisible retombe donc intégralement sur le mode séparé.
+
+Derrière `CLASSIFICATION_FUSED_ENABLED` (off par défaut) ; à comparer au mode
+séparé avec `scripts/compare_classification_modes.py` avant activation.
+"""
+
+from __future__ import annotations
+
+import json
+
+import structlog
+
+from app.config import get_settings
+from app.services.ml.classification_service import (
+    CLASSIFICATION_SYSTEM_PROMPT,
+    VALID_TOPIC_SLUGS,
+    ClassificationService,
+    _clean_text,
+    _coerce_bool,
+    _validate_entities,
+    get_classification_service,
+)
+from app.services.ml.good_news_classifier import _SYSTEM_PROMPT as _GOOD_NEWS_PROMPT
+
+log = structlog.get_logger()
+
+# Clé de cache de prompt Mistral (LR-1 PR 2) — bumper `-vN` si le prompt change.
+FUSED_CACHE_KEY = "facteur-fused-v1"
+
+FUSED_FIELDS = ("topics", "serene", "is_ad", "entities", "good_news")
+
+# Règles good-news de la passe 2 (de « RÈGLE D'OR » aux anti-patterns), un
+# niveau de titre plus bas pour tenir sous la section du prompt fusionné.
+_GOOD_NEWS_RULES = (
+    _GOOD_NEWS_PROMPT.split("## RÈGLE D'OR", 1)[1]
+    .split("## FORMAT", 1)[0]
+    .replace("## ", "### ")
+    .strip()
+)
+
+FUSED_SYSTEM_PROMPT = (
+    CLASSIFICATION_SYSTEM_PROMPT.split("## FORMAT", 1)[0]
+    + "## BONNE NOUVELLE (good_news)\n"
+    "Pour chaque article serene = true, détermine si c'est une vraie bonne "
+    "nouvelle. Si serene = false, good_news = false.\n\n"
+    "### RÈGLE D'OR\n"
+    f"{_GOOD_NEWS_RULES}\n\n"
+    "## FORMAT\n"
+    "Réponds en JSON array. Chaque élément :\n"
+    '{"topics": ["slug1", "slug2"], "serene": true/false, '
+    '"entities": [{"name": "Nom Complet", "type": "PERSON"}], '
+    '"is_ad": true/false, "good_news": true/false}\n'
+    "Pas de texte avant ou après."
+)
+
+
+def _build_user_prompt(items: list[dict]) -> str:
+    """Prompt utilisateur du lot (description tronquée comme la passe 2)."""
+    parts = []
+    for i, item in enumerate(items):
+        title = _clean_text(item.get("title", ""))
+        desc = _clean_text(item.get("description", "") or "")
+        if len(desc) > 240:
+            desc = desc[:240] + "..."
+        source_name = item.get("source_name", "")
+
+        header = f"[{i + 1}]"
+        if source_name:
+            header += f" [Source: {source_name}]"
+
+        text = f"{title}. {desc}".strip() if desc else title
+        parts.append(f"{header}\n{text}")
+
+    articles_text = "\n\n".join(parts)
+    return (
+        f"Classifie chacun de ces {len(items)} articles.\n"
+        f"Réponds en JSON array de exactement {len(items)} éléments.\n"
+        'Exemple pour 1 article: [{"topics": ["health", "science"], '
+        '"serene": true, "entities": [{"name": "Institut Pasteur", '
+        '"type": "ORG"}], "is_ad": false, "good_news": true}]\n\n'
+        f"{articles_text}"
+    )
+
+
+def _invalid() -> dict:
+    return dict.fromkeys(FUSED_FIELDS)
+
+
+def _validate_item(item: object, top_k: int) -> dict:
+    """Champs valides d'un élément ; None = absent ou invalide (→ fallback).
+
+    Strict : des topics sans slug connu, un booléen en chaîne ou des entités
+    hors liste comptent comme absents. Une liste d'entités vide est valide.
+    """
+    out = _invalid()
+    if not isinstance(item, dict):
+        return out
+    raw_topics = item.get("topics")
+    if isinstance(raw_topics, list):
+        topics = [
+            s.strip().lower()
+            for s in raw_topics
+            if isinstance(s, str) and s.strip().lower() in VALID_TOPIC_SLUGS
+        ]
+        out["topics"] = topics[:top_k] or None
+    if isinstance(item.get("entities"), list):
+        out["entities"] = _validate_entities(item["entities"])
+    for key in ("serene", "is_ad", "good_news"):
+        out[key] = _coerce_bool(item.get(key))
+    return out
+
+
+def parse_fused_response(raw: str, expected_count: int, top_k: int = 3) -> list[dict]:
+    """Parse la réponse fusionnée en `expected_count` dicts de `FUSED_FIELDS`."""
+    try:
+        parsed = json.loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        log.warning("fused_classification.parse_failed", raw=raw[:200])
+        return [_invalid() for _ in range(expected_count)]
+
+    if not isinstance(parsed, list):
+        log.warning("fused_classification.unexpected_shape", raw=raw[:200])
+        return [_invalid() for _ in range(expected_count)]
+
+    if len(parsed) != expected_count:
+        log.warning(
+            "fused_classification.count_mismatch",
+            expected=expected_count,
+            got=len(parsed),
+        )
+    results = [_validate_item(item, top_k) for item in parsed[:expected_count]]
+    while len(results) < expected_count:
+        results.append(_invalid())
+    return results
+
+
+class FusedClassifier:
+    """Appel fusionné topics + serene + is_ad + entités + good_news.
+
+    Passe par le client et la politique de retry de `ClassificationService`
+    (call site `classification_fused`) ; le modèle vient de
+    `CLASSIFICATION_FUSED_MODEL`.
+    """
+
+    def __init__(
+        self,
+        service: ClassificationService | None = None,
+        model: str | None = None,
+    ) -> None:
+        self._service = service or get_classification_service()
+        self._model = model or get_settings().classification_fused_model
+
+    def is_ready(self) -> bool:
+        return self._service.is_ready()
+
+    async def classify_batch_async(
+        self, items: list[dict], top_k: int = 3
+    ) -> list[dict]:
+        """Un dict de `FUSED_FIELDS` par article, None = champ à redemander."""
+        if not items:
+            return []
+        if not self.is_ready():
+            return [_invalid() for _ in items]
+
+        data = await self._service._call_mistral(
+            {
+                "model": self._model,
+                "messages": [
+                    {"role": "system", "content": FUSED_SYSTEM_PROMPT},
+                    {"role": "user", "content": _build_user_prompt(items)},
+                ],
+                "temperature": 0.0,
+                "max_tokens": 230 * len(items),
+                "response_format": {"type": "json_object"},
+                "prompt_cache_key": FUSED_CACHE_KEY,
+            },
+            call_site="classification_fused",
+        )
+        try:
+            raw = (data["choices"][0]["message"]["content"] or "").strip()
+        except (KeyError, IndexError, TypeError):
+            log.warning("fused_classification.empty_response", count=len(items))
+            return [_invalid() for _ in items]
+
+        return parse_fused_response(raw, len(items), top_k)
+
+
+_singleton: FusedClassifier | None = None
+
+
+def get_fused_classifier() -> FusedClassifier:
+    """Retourne l'instance singleton du classifieur fusionné."""
+    global _singleton
+    if _singleton is None:
+        _singleton = FusedClassifier()
+    return _singleton
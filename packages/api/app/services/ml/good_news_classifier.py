@@ -22,6 +22,7 @@ import httpx
 import structlog
 
 from app.config import get_settings
+from app.services.editorial.llm_client import mistral_slot
 from app.services.ml.classification_service import _clean_text
 from app.services.observability.usage_recorder import track_api_call
 
@@ -162,7 +163,8 @@ class GoodNewsClassifier:
         ) as _call:
             for attempt in range(max_retries):
                 try:
-                    response = await client.post(MISTRAL_API_URL, json=payload)
+                    async with mistral_slot(payload.get("model")):
+                        response = await client.post(MISTRAL_API_URL, json=payload)
                     response.raise_for_status()
                     data = response.json()
                     usage = data.get("usage") or {}
@@ -33,6 +33,7 @@ CALL_SITES: frozenset[str] = frozenset(
     {
         "classification_pass1",  # mistral-small taxonomie (classification_service)
         "classification_entities",  # mistral-small extraction entités (LR-1 PR 2)
+        "classification_fused",  # appel unique tous champs (fused_classification)
         "good_news_pass2",  # mistral-large (good_news_classifier)
         "editorial",  # editorial llm_client (curation/pipeline/deep/perspective)
         "veille_suggester",  # mistral-medium (source/angle suggesters)
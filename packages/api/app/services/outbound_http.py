@@ -0,0 +1,507 @@
+"""Couche HTTP sortante partagée : un pool de connexions par usage.
+
+`SyncService`, `RSSParser`, `PerspectiveService`, les providers de recherche
+et le proxy d'images créaient chacun leur `httpx.AsyncClient`, avec leurs
+propres timeouts et sans keep-alive commun — le proxy d'images en ouvrait un
+par requête, donc une poignée de main TCP + TLS par vignette.
+
+`OUTBOUND_HTTP` tient un transport poolé par **usage** (`PURPOSES`) :
+
+- **HTTP/2** quand `h2` est installé (multiplexage sur une connexion par
+  hôte), HTTP/1.1 keep-alive sinon ;
+- **plafond par hôte** (`Purpose.per_host`) en plus du plafond global du
+  pool : un média lent ne monopolise pas les connexions des autres ;
+- **cache DNS** (`DNS_TTL_SECONDS`) devant le backend réseau de httpcore :
+  une rafale de sync ne relance pas `getaddrinfo` à chaque connexion ;
+- **budgets de timeout** uniformes : connexion `CONNECT_TIMEOUT_SECONDS`,
+  attente d'une connexion libre `POOL_TIMEOUT_SECONDS`, lecture selon
+  l'usage ;
+- **métriques par hôte** (latence jusqu'aux en-têtes, erreurs = exception
+  ou 5xx), exposées dans `/api/health/feed-cache`.
+
+Deux façons de s'en servir :
+
+- `client(purpose)` : le client partagé de l'usage, à ne jamais fermer ;
+- `session(purpose, **overrides)` : un client dédié (cookies, en-têtes
+  propres) posé sur le même transport ; le fermer ne ferme pas le pool.
+
+`fetch_with_impersonation` (curl-cffi, empreinte TLS Chrome) garde sa propre
+pile : elle ne peut pas partager un pool httpx.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import ipaddress
+import socket
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import certifi
+import httpcore
+import httpx
+import structlog
+
+logger = structlog.get_logger()
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+CONNECT_TIMEOUT_SECONDS = 3.0
+POOL_TIMEOUT_SECONDS = 5.0
+#: `getaddrinfo` ne donne pas le TTL DNS : durée de vie fixe, courte.
+DNS_TTL_SECONDS = 120.0
+_DNS_CACHE_MAX = 1024
+#: Adresses essayées par connexion (IPv6 puis IPv4, ou plusieurs A).
+_CONNECT_ATTEMPTS = 2
+#: Hôtes suivis individuellement dans les métriques ; au-delà → `other`.
+_MAX_TRACKED_HOSTS = 256
+_TOP_HOSTS = 10
+
+_CHROME_120_UA = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+_CHROME_131_UA = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+)
+
+
+def timeout_budget(read_timeout: float) -> httpx.Timeout:
+    """Timeouts httpx d'un budget de lecture : connexion et attente du pool
+    plafonnées uniformément."""
+    return httpx.Timeout(
+        read_timeout,
+        connect=min(CONNECT_TIMEOUT_SECONDS, read_timeout),
+        pool=POOL_TIMEOUT_SECONDS,
+    )
+
+
+@dataclass(frozen=True)
+class Purpose:
+    """Budget et plafonds d'un usage sortant."""
+
+    name: str
+    read_timeout: float
+    max_connections: int
+    per_host: int
+    follow_redirects: bool = True
+    max_redirects: int = 20
+    headers: Mapping[str, str] = field(default_factory=dict)
+
+    @property
+    def timeout(self) -> httpx.Timeout:
+        return timeout_budget(self.read_timeout)
+
+
+PURPOSES: dict[str, Purpose] = {
+    # Flux RSS + début des pages article (paywall) du sync.
+    "feeds": Purpose(
+        "feeds",
+        read_timeout=30.0,
+        max_connections=64,
+        per_host=6,
+        headers={"User-Agent": _CHROME_120_UA},
+    ),
+    # Détection de flux à l'ajout d'une source (redirections validées à la
+    # main par `RSSParser._safe_get`, cf. SSRF).
+    "detect": Purpose(
+        "detect",
+        read_timeout=7.0,
+        max_connections=32,
+        per_host=4,
+        follow_redirects=False,
+        headers={
+            "User-Agent": _CHROME_131_UA,
+            "Accept-Language": "en-US,en;q=0.9",
+        },
+    ),
+    # Google News RSS (perspectives, recherche de sources).
+    "news": Purpose(
+        "news",
+        read_timeout=10.0,
+        max_connections=16,
+        per_host=8,
+        headers={"User-Agent": _CHROME_120_UA},
+    ),
+    # APIs de recherche (Brave, Reddit) : réponses courtes, budget serré.
+    "search": Purpose("search", read_timeout=2.0, max_connections=16, per_host=4),
+    # Proxy d'images Web : beaucoup de petites requêtes vers quelques CDN.
+    "images": Purpose(
+        "images",
+        read_timeout=5.0,
+        max_connections=64,
+        per_host=8,
+        max_redirects=3,
+    ),
+}
+
+
+class CachingResolver(httpcore.AsyncNetworkBackend):
+    """Backend httpcore qui résout via un cache DNS avant de se connecter.
+
+    La poignée de main TLS garde le nom d'hôte d'origine (SNI, certificat) :
+    seul le `connect_tcp` reçoit l'adresse IP.
+    """
+
+    def __init__(
+        self,
+        backend: httpcore.AsyncNetworkBackend,
+        ttl_seconds: float = DNS_TTL_SECONDS,
+    ) -> None:
+        self._backend = backend
+        self._ttl = ttl_seconds
+        self._cache: dict[tuple[str, int], tuple[float, list[str]]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    async def _resolve(self, host: str, port: int, timeout: float | None) -> list[str]:
+        try:
+            ipaddress.ip_address(host)
+            return [host]
+        except ValueError:
+            pass
+        key = (host, port)
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] > now:
+            self.hits += 1
+            return cached[1]
+        self.misses += 1
+        loop = asyncio.get_running_loop()
+        try:
+            infos = await asyncio.wait_for(
+                loop.getaddrinfo(host, port, type=socket.SOCK_STREAM), timeout
+            )
+        except (OSError, TimeoutError) as exc:
+            self.errors += 1
+            raise httpcore.ConnectError(f"dns: {host}: {exc}") from exc
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        if not addresses:
+            self.errors += 1
+            raise httpcore.ConnectError(f"dns: {host}: no address")
+        if len(self._cache) >= _DNS_CACHE_MAX:
+            self._cache = {k: v for k, v in self._cache.items() if v[0] > now}
+            while len(self._cache) >= _DNS_CACHE_MAX:
+                self._cache.pop(next(iter(self._cache)))
+        self._cache[key] = (now + self._ttl, addresses)
+        return addresses
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Any = None,
+    ) -> httpcore.AsyncNetworkStream:
+        addresses = await self._resolve(host, port, timeout)
+        error: Exception | None = None
+        for address in addresses[:_CONNECT_ATTEMPTS]:
+            try:
+                return await self._backend.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as exc:
+                error = exc
+        # Adresses peut-être périmées : la prochaine connexion re-résout.
+        self._cache.pop((host, port), None)
+        assert error is not None
+        raise error
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: Any = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "entries": len(self._cache),
+        }
+
+
+class _HostGate:
+    """Connexions simultanées vers un hôte."""
+
+    __slots__ = ("slots", "users")
+
+    def __init__(self, limit: int) -> None:
+        self.slots = asyncio.Semaphore(limit)
+        self.users = 0
+
+
+class _HostStats:
+    __slots__ = ("requests", "errors", "total_seconds", "max_seconds")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def as_dict(self) -> dict[str, int | float]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "avg_ms": round(self.total_seconds / self.requests * 1000, 1)
+            if self.requests
+            else 0.0,
+            "max_ms": round(self.max_seconds * 1000, 1),
+        }
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Corps de réponse qui libère la place de l'hôte à sa fermeture."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release: Callable[[], None] | None = release
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            release, self._release = self._release, None
+            if release is not None:
+                release()
+
+
+class PooledTransport(httpx.AsyncBaseTransport):
+    """Transport partagé d'un usage : plafond par hôte et métriques.
+
+    `aclose()` est sans effet (les clients posés dessus se ferment sans
+    fermer le pool) ; seul `close_pool()` ferme les connexions.
+    """
+
+    def __init__(
+        self,
+        inner: httpx.AsyncBaseTransport,
+        *,
+        per_host: int,
+        resolver: CachingResolver | None = None,
+    ) -> None:
+        self._inner = inner
+        self._per_host = max(1, per_host)
+        self._resolver = resolver
+        self._gates: dict[str, _HostGate] = {}
+        self._hosts: dict[str, _HostStats] = {}
+        self._requests = 0
+        self._errors = 0
+        self._in_flight = 0
+        self._host_waits = 0
+
+    async def _enter(self, host: str) -> _HostGate:
+        gate = self._gates.get(host)
+        if gate is None:
+            gate = self._gates[host] = _HostGate(self._per_host)
+        gate.users += 1
+        if gate.slots.locked():
+            self._host_waits += 1
+        try:
+            await gate.slots.acquire()
+        except BaseException:
+            self._leave(host, gate, acquired=False)
+            raise
+        return gate
+
+    def _leave(self, host: str, gate: _HostGate, *, acquired: bool = True) -> None:
+        if acquired:
+            gate.slots.release()
+            self._in_flight -= 1
+        gate.users -= 1
+        if gate.users == 0 and self._gates.get(host) is gate:
+            del self._gates[host]
+
+    def _record(self, host: str, seconds: float, *, error: bool) -> None:
+        self._requests += 1
+        self._errors += error
+        stats = self._hosts.get(host)
+        if stats is None:
+            if len(self._hosts) >= _MAX_TRACKED_HOSTS:
+                host = "other"
+                stats = self._hosts.get(host)
+            if stats is None:
+                stats = self._hosts[host] = _HostStats()
+        stats.requests += 1
+        stats.errors += error
+        stats.total_seconds += seconds
+        stats.max_seconds = max(stats.max_seconds, seconds)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        gate = await self._enter(host)
+        self._in_flight += 1
+        started = time.monotonic()
+        try:
+            response = await self._inner.handle_async_request(request)
+        except BaseException:
+            self._record(host, time.monotonic() - started, error=True)
+            self._leave(host, gate)
+            raise
+        self._record(
+            host, time.monotonic() - started, error=response.status_code >= 500
+        )
+        if response.is_closed:
+            # Corps déjà en mémoire (transport de test, réponse vide).
+            self._leave(host, gate)
+        else:
+            # La place de l'hôte reste prise jusqu'à la fermeture du corps.
+            response.stream = _ReleasingStream(
+                response.stream, lambda: self._leave(host, gate)
+            )
+        return response
+
+    async def aclose(self) -> None:
+        return None
+
+    async def close_pool(self) -> None:
+        await self._inner.aclose()
+
+    def stats(self) -> dict[str, Any]:
+        top = sorted(self._hosts.items(), key=lambda kv: kv[1].requests, reverse=True)
+        return {
+            "requests": self._requests,
+            "errors": self._errors,
+            "in_flight": self._in_flight,
+            "host_waits": self._host_waits,
+            "dns": self._resolver.stats() if self._resolver is not None else None,
+            "hosts": {host: s.as_dict() for host, s in top[:_TOP_HOSTS]},
+        }
+
+
+def network_transport(purpose: Purpose, *, http2: bool) -> PooledTransport:
+    """Transport réseau réel d'un usage (HTTP/2, keep-alive, cache DNS)."""
+    inner = httpx.AsyncHTTPTransport(
+        verify=certifi.where(),
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=purpose.max_connections,
+            max_keepalive_connections=purpose.max_connections,
+            keepalive_expiry=30.0,
+        ),
+    )
+    resolver = None
+    # httpx 0.26 n'expose pas `network_backend` : on enveloppe celui du pool
+    # httpcore sous-jacent.
+    pool = getattr(inner, "_pool", None)
+    backend = getattr(pool, "_network_backend", None)
+    if backend is not None:
+        resolver = CachingResolver(backend)
+        pool._network_backend = resolver
+    return PooledTransport(inner, per_host=purpose.per_host, resolver=resolver)
+
+
+class OutboundHTTP:
+    """Registre des transports et clients partagés, un par usage."""
+
+    def __init__(
+        self,
+        purposes: Mapping[str, Purpose] | None = None,
+        *,
+        http2: bool | None = None,
+        transport_factory: Callable[[Purpose], PooledTransport] | None = None,
+    ) -> None:
+        self._purposes = dict(purposes if purposes is not None else PURPOSES)
+        self._http2 = HTTP2_AVAILABLE if http2 is None else http2
+        self._factory = transport_factory or (
+            lambda purpose: network_transport(purpose, http2=self._http2)
+        )
+        self._transports: dict[str, PooledTransport] = {}
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _bind_loop(self) -> None:
+        # Les connexions poolées appartiennent à la boucle qui les a ouvertes :
+        # une autre boucle (script `asyncio.run`, tests) repart de pools neufs.
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._loop is not loop:
+            if self._loop is not None:
+                self._transports = {}
+                self._clients = {}
+            self._loop = loop
+
+    def transport(self, purpose: str) -> PooledTransport:
+        self._bind_loop()
+        transport = self._transports.get(purpose)
+        if transport is None:
+            transport = self._transports[purpose] = self._factory(
+                self._purposes[purpose]
+            )
+            logger.info(
+                "outbound_http_pool_started", purpose=purpose, http2=self._http2
+            )
+        return transport
+
+    def _client_kwargs(self, purpose: str) -> dict[str, Any]:
+        spec = self._purposes[purpose]
+        return {
+            "transport": self.transport(purpose),
+            "timeout": spec.timeout,
+            "follow_redirects": spec.follow_redirects,
+            "max_redirects": spec.max_redirects,
+            "headers": dict(spec.headers),
+        }
+
+    def client(self, purpose: str) -> httpx.AsyncClient:
+        """Client partagé de l'usage — ne pas le fermer."""
+        self._bind_loop()
+        client = self._clients.get(purpose)
+        if client is None:
+            client = self._clients[purpose] = httpx.AsyncClient(
+                **self._client_kwargs(purpose)
+            )
+        return client
+
+    def session(
+        self, purpose: str, *, headers: Mapping[str, str] | None = None, **overrides
+    ) -> httpx.AsyncClient:
+        """Client dédié (cookies, en-têtes propres) sur le transport partagé."""
+        kwargs = self._client_kwargs(purpose)
+        kwargs["headers"].update(headers or {})
+        kwargs.update(overrides)
+        return httpx.AsyncClient(**kwargs)
+
+    async def aclose(self) -> None:
+        self._loop = None
+        clients, self._clients = self._clients, {}
+        transports, self._transports = self._transports, {}
+        for client in clients.values():
+            await client.aclose()
+        for transport in transports.values():
+            await transport.close_pool()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "http2": self._http2,
+            **{name: t.stats() for name, t in self._transports.items()},
+        }
+
+
+OUTBOUND_HTTP = OutboundHTTP()
+"""Module-level singleton — import as ``from app.services.outbound_http import OUTBOUND_HTTP``."""
@@ -2,7 +2,6 @@
 
 import asyncio
 import html
-import json
 import os
 import re
 import xml.etree.ElementTree as ET
@@ -12,13 +11,14 @@ from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from urllib.parse import quote, urlparse
 
-import certifi
 import httpx
 import structlog
 from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import selectinload
 
+from app.services.outbound_http import OUTBOUND_HTTP, timeout_budget
+from app.services.recommendation.helpers.entities import iter_entities
 from app.services.search.providers.denylist import is_listicle_host
 from app.services.text_similarity import jaccard_similarity, normalize_title
 
@@ -259,16 +259,13 @@ def _parse_entity_names(
     if not entities:
         return []
     names: list[str] = []
-    for raw in entities:
-        try:
-            obj = json.loads(raw)
-        except (json.JSONDecodeError, TypeError):
+    for ref in iter_entities(entities):
+        if not ref.is_json:
             continue
-        if types and obj.get("type") not in types:
+        if types and ref.type not in types:
             continue
-        name = obj.get("name")
-        if name:
-            names.append(name)
+        if ref.name:
+            names.append(ref.name)
     return names
 
 
@@ -897,32 +894,29 @@ class PerspectiveService:
         )
 
         try:
-            headers = {"User-Agent": USER_AGENT}
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                verify=certifi.where(),
-                headers=headers,
-                follow_redirects=True,
-            ) as client:
-                response = await client.get(url)
-
-                if response.status_code != 200:
-                    logger.warning(
-                        "perspectives_search_http_error",
-                        status_code=response.status_code,
-                        keywords=keywords,
-                    )
-                    return []
+            response = await OUTBOUND_HTTP.client("news").get(
+                url,
+                headers={"User-Agent": USER_AGENT},
+                timeout=timeout_budget(self.timeout),
+            )
 
-                perspectives = await self._parse_rss(
-                    response.content, exclude_url, exclude_title, exclude_domain
-                )
-                logger.info(
-                    "perspectives_search_success",
+            if response.status_code != 200:
+                logger.warning(
+                    "perspectives_search_http_error",
+                    status_code=response.status_code,
                     keywords=keywords,
-                    count=len(perspectives),
                 )
-                return perspectives
+                return []
+
+            perspectives = await self._parse_rss(
+                response.content, exclude_url, exclude_title, exclude_domain
+            )
+            logger.info(
+                "perspectives_search_success",
+                keywords=keywords,
+                count=len(perspectives),
+            )
+            return perspectives
 
         except httpx.TimeoutException as e:
             logger.error(
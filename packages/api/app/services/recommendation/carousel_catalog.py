@@ -36,6 +36,7 @@ from app.models.source import Source, UserSource
 
 # Sérialisation vers le schéma API partagé (même mapping que routers/feed.py).
 from app.schemas.feed import CarouselInfo, CarouselItemBadge
+from app.services.carousel_aggregates import CAROUSEL_AGGREGATES
 from app.services.community_recommendation_service import (
     CommunityRecommendationService,
 )
@@ -208,35 +209,64 @@ async def build_new_source(ctx: CarouselBuildContext) -> CarouselContent | None:
 
     MAX_NEW_SOURCE_PROBES = 8
     now = datetime.datetime.now(datetime.UTC)
-    candidates: list[tuple] = []
-    excluded_ids = ctx.discovery_excluded_ids
+    # Volume 7 j par source (agrégats process) : borne haute de ce que la sonde
+    # trouverait, une source sous le seuil n'est pas sondée.
+    volumes = CAROUSEL_AGGREGATES.source_volumes(7)
+    probes: list[tuple] = []
     for src_row in new_src_rows[:MAX_NEW_SOURCE_PROBES]:
-        exclusions = []
-        if excluded_ids:
-            exclusions.append(Content.id.notin_(excluded_ids))
-        items = list(
-            (
-                await session.scalars(
-                    select(Content)
-                    .options(selectinload(Content.source))
-                    .where(
-                        Content.source_id == src_row.source_id,
-                        Content.published_at > seven_days_ago,
-                        *exclusions,
-                    )
-                    .order_by(Content.published_at.desc())
-                    .limit(MAX_CAROUSEL_ITEMS)
-                )
-            ).all()
-        )
-        if len(items) < MIN_NEW_SOURCE_ITEMS:
-            continue
         # Cooldown post-add 6 h — laisse les articles remonter dans le main feed
         # avant de pousser un carrousel « Récemment ajouté ».
         source_age_seconds = (now - src_row.added_at).total_seconds()
         if source_age_seconds < 6 * 3600:
             continue
-        candidates.append((src_row, items, source_age_seconds))
+        if volumes is not None and volumes.get(src_row.source_id, 0) < (
+            MIN_NEW_SOURCE_ITEMS
+        ):
+            continue
+        probes.append((src_row, source_age_seconds))
+
+    candidates: list[tuple] = []
+    if probes:
+        # Une seule requête pour toutes les sondes : les MAX_CAROUSEL_ITEMS
+        # derniers articles de chaque source (row_number par source).
+        excluded_ids = ctx.discovery_excluded_ids
+        exclusions = []
+        if excluded_ids:
+            exclusions.append(Content.id.notin_(excluded_ids))
+        ranked = (
+            select(
+                Content.id,
+                func.row_number()
+                .over(
+                    partition_by=Content.source_id,
+                    order_by=Content.published_at.desc(),
+                )
+                .label("rank"),
+            )
+            .where(
+                Content.source_id.in_([p[0].source_id for p in probes]),
+                Content.published_at > seven_days_ago,
+                *exclusions,
+            )
+            .subquery()
+        )
+        rows = (
+            await session.scalars(
+                select(Content)
+                .options(selectinload(Content.source))
+                .join(ranked, ranked.c.id == Content.id)
+                .where(ranked.c.rank <= MAX_CAROUSEL_ITEMS)
+                .order_by(Content.published_at.desc())
+            )
+        ).all()
+        items_by_source: dict[UUID, list[Content]] = {}
+        for item in rows:
+            items_by_source.setdefault(item.source_id, []).append(item)
+        for src_row, source_age_seconds in probes:
+            items = items_by_source.get(src_row.source_id, [])
+            if len(items) < MIN_NEW_SOURCE_ITEMS:
+                continue
+            candidates.append((src_row, items, source_age_seconds))
 
     if not candidates:
         return None
@@ -273,32 +303,49 @@ async def build_quiet_sources(ctx: CarouselBuildContext) -> CarouselContent | No
 
     quiet_articles: list[Content] = []
     try:
-        probe = (
-            select(Content.id)
-            .where(
-                Content.source_id == UserSource.source_id,
-                Content.published_at >= window_start,
-            )
-            .limit(QUIET_SOURCE_MAX_RECENT)
-            .lateral()
-        )
-        quiet_ids_stmt = (
-            select(UserSource.source_id)
-            .select_from(UserSource)
-            .join(Source, Source.id == UserSource.source_id)
-            .join(probe, literal(True))
-            .where(
-                UserSource.user_id == ctx.user_id,
-                UserSource.state.in_(FOLLOWED_SOURCE_STATES),
-                Source.is_active.is_(True),
-            )
-            .group_by(UserSource.source_id)
-            .having(func.count() < QUIET_SOURCE_MAX_RECENT)
+        followed_active = (
+            UserSource.user_id == ctx.user_id,
+            UserSource.state.in_(FOLLOWED_SOURCE_STATES),
+            Source.is_active.is_(True),
         )
+        volumes = CAROUSEL_AGGREGATES.source_volumes(QUIET_SOURCE_WINDOW_DAYS)
         async with ctx.session_maker(
             statement_timeout_ms=8_000, idle_in_tx_timeout_ms=5_000
         ) as quiet_s:
-            quiet_source_ids = list((await quiet_s.scalars(quiet_ids_stmt)).all())
+            if volumes is not None:
+                # Volumes 30 j pré-agrégés : plus de sonde LATERAL par source.
+                followed_ids = (
+                    await quiet_s.scalars(
+                        select(UserSource.source_id)
+                        .join(Source, Source.id == UserSource.source_id)
+                        .where(*followed_active)
+                    )
+                ).all()
+                quiet_source_ids = [
+                    sid
+                    for sid in followed_ids
+                    if 0 < volumes.get(sid, 0) < QUIET_SOURCE_MAX_RECENT
+                ]
+            else:
+                probe = (
+                    select(Content.id)
+                    .where(
+                        Content.source_id == UserSource.source_id,
+                        Content.published_at >= window_start,
+                    )
+                    .limit(QUIET_SOURCE_MAX_RECENT)
+                    .lateral()
+                )
+                quiet_ids_stmt = (
+                    select(UserSource.source_id)
+                    .select_from(UserSource)
+                    .join(Source, Source.id == UserSource.source_id)
+                    .join(probe, literal(True))
+                    .where(*followed_active)
+                    .group_by(UserSource.source_id)
+                    .having(func.count() < QUIET_SOURCE_MAX_RECENT)
+                )
+                quiet_source_ids = list((await quiet_s.scalars(quiet_ids_stmt)).all())
             if quiet_source_ids:
                 conds = [
                     Content.source_id.in_(quiet_source_ids),
@@ -358,6 +405,8 @@ async def build_community(ctx: CarouselBuildContext) -> CarouselContent | None:
     recs = await service.get_top_recommendations(
         limit=MAX_CAROUSEL_ITEMS,
         exclude_ids=excluded_ids or None,
+        # Classement pré-agrégé (None → requête d'agrégat habituelle).
+        ranked=CAROUSEL_AGGREGATES.community_top(MAX_CAROUSEL_ITEMS, excluded_ids),
     )
     if len(recs) < MIN_CAROUSEL_ITEMS:
         return None
@@ -5,10 +5,65 @@
 clair en repli). Plusieurs surfaces en ont besoin (mute, affinité, scoring) ;
 cette primitive centralise le parse + la normalisation pour éviter la
 divergence (cf. PR2 « affinité entités »).
+
+Décodage unique : la classif écrit déjà une forme normalisée (nom + type
+validés), et les mêmes chaînes reviennent à chaque requête. `decode_entity`
+mémoïse donc le décodage **par chaîne brute** pour tout le process : le
+travail par requête devient des intersections d'ensembles de clés canoniques
+(`entity_keys`) au lieu de `json.loads` répétés. Les clés décodées sont
+partagées par toutes les requêtes (hash de chaîne mis en cache), et la
+mémoire reste bornée par le `lru_cache` de `decode_entity`.
 """
 
 import json
 from collections.abc import Iterator
+from functools import lru_cache
+from typing import NamedTuple
+
+
+class EntityRef(NamedTuple):
+    """Entité décodée, partagée (immuable) entre toutes les requêtes."""
+
+    name: str  # nom tel que stocké (casse live), "" si absent
+    type: str  # label NER, "" si absent ou entité en clair
+    key: str  # `name.strip().lower()` — clé canonique stockage == matching
+    is_json: bool  # False = entité stockée en clair (forme legacy)
+
+
+@lru_cache(maxsize=65_536)
+def decode_entity(raw: str) -> EntityRef | None:
+    """Décode une entrée de `Content.entities` (mémoïsé par chaîne brute).
+
+    - objet JSON → `EntityRef(is_json=True)` (nom/type vides si absents) ;
+    - chaîne non-JSON → entité en clair, `is_json=False`, `name=raw` ;
+    - JSON valide mais pas un objet → `None`.
+    """
+    try:
+        parsed = json.loads(raw)
+    except (ValueError, TypeError):
+        return EntityRef(raw, "", raw.strip().lower(), False)
+    if not isinstance(parsed, dict):
+        return None
+    name = parsed.get("name")
+    name = name if isinstance(name, str) else ""
+    etype = parsed.get("type")
+    etype = etype if isinstance(etype, str) else ""
+    return EntityRef(name, etype, name.strip().lower(), True)
+
+
+def iter_entities(entities: list[str] | None) -> Iterator[EntityRef]:
+    """Yield les entités décodées (non dédupliquées, entrées illisibles omises)."""
+    for raw in entities or ():
+        if not isinstance(raw, str):
+            continue
+        ref = decode_entity(raw)
+        if ref is not None:
+            yield ref
+
+
+def entity_keys(entities: list[str] | None) -> frozenset[str]:
+    """Clés canoniques (noms non vides) des entités d'un article."""
+    return frozenset(ref.key for ref in iter_entities(entities) if ref.key)
 
 
 def iter_entity_names(entities: list[str] | None) -> Iterator[tuple[str, str]]:
@@ -20,18 +75,8 @@ def iter_entity_names(entities: list[str] | None) -> Iterator[tuple[str, str]]:
     Distinct par `key`. Les éléments illisibles ou sans nom sont ignorés.
     """
     seen: set[str] = set()
-    for raw in entities or ():
-        name = ""
-        try:
-            parsed = json.loads(raw)
-            if isinstance(parsed, dict):
-                name = parsed.get("name", "") or ""
-        except (ValueError, TypeError):
-            # Entité stockée en clair (pas de JSON) — tolérée comme nom.
-            name = raw if isinstance(raw, str) else ""
-        display = name.strip()
-        key = display.lower()
-        if not key or key in seen:
+    for ref in iter_entities(entities):
+        if not ref.key or ref.key in seen:
             continue
-        seen.add(key)
-        yield display, key
+        seen.add(ref.key)
+        yield ref.name.strip(), ref.key
@@ -311,7 +311,7 @@ class PertinencePillar(BasePillar):
         if not context.user_subtopics or not content.topics:
             return 0.0, []
 
-        user_subtopics = {s.lower().strip() for s in context.user_subtopics}
+        user_subtopics = context.user_subtopics_normalized
 
         matched_topics: list[tuple[str, float]] = []
         seen_topics: set[str] = set()
@@ -343,7 +343,7 @@ class PertinencePillar(BasePillar):
                 boosted_topics.append(topic)
 
         # Precision bonus: theme + subtopic both match
-        user_interests_lower = {s.lower().strip() for s in context.user_interests}
+        user_interests_lower = context.user_interests_normalized
         has_theme_match = False
         if hasattr(content, "theme") and content.theme:
             has_theme_match = content.theme.lower().strip() in user_interests_lower
@@ -110,6 +110,31 @@ class ScoringContext:
         # Diagnostics pour explicabilité
         self.reasons: dict[UUID, dict[str, Any]] = {}
 
+        # Formes normalisées (minuscules/strip) calculées une fois par contexte
+        # au lieu d'une fois par article. Clé = nom d'attribut, valeur =
+        # (objet source, forme normalisée) : une réaffectation de l'attribut
+        # (fréquente dans les tests) invalide l'entrée par identité.
+        self._normalized_cache: dict[str, tuple[Any, frozenset[str]]] = {}
+
+    @property
+    def user_interests_normalized(self) -> frozenset[str]:
+        """`user_interests` en minuscules/strippé (lu par le pilier Pertinence)."""
+        return self._normalized("user_interests")
+
+    @property
+    def user_subtopics_normalized(self) -> frozenset[str]:
+        """`user_subtopics` en minuscules/strippé (lu par le pilier Pertinence)."""
+        return self._normalized("user_subtopics")
+
+    def _normalized(self, attr: str) -> frozenset[str]:
+        raw = getattr(self, attr)
+        cached = self._normalized_cache.get(attr)
+        if cached is not None and cached[0] is raw:
+            return cached[1]
+        value = frozenset(s.lower().strip() for s in raw)
+        self._normalized_cache[attr] = (raw, value)
+        return value
+
     def add_reason(self, content_id: UUID, layer: str, score: float, details: str):
         if content_id not in self.reasons:
             self.reasons[content_id] = []
@@ -210,15 +235,64 @@ class PillarScoringEngine:
         self, content: Content, context: ScoringContext
     ) -> PillarScoreResult:
         """Compute pillar-based score for a content item."""
+        return self._score_one(content, context)
+
+    def compute_scores_batch(
+        self, contents: list[Content], context: ScoringContext
+    ) -> list[PillarScoreResult]:
+        """Score un pool de candidats en une passe (même ordre que `contents`).
+
+        Chemin chaud de `get_feed` (~500 candidats × ~10 sections au cold
+        open) : les scores sont **identiques** à `compute_score` (parité
+        testée), mais deux coûts par article disparaissent :
+
+        - le pilier Source ne dépend que de la source et du contexte → calculé
+          une fois par `source_id` distinct du pool (~50) au lieu de 500 fois ;
+        - les `contributions` (dicts d'explicabilité) ne sont pas construites :
+          les résultats portent une liste vide. L'appelant rejoue
+          `compute_score` sur le seul top-N renvoyé pour hydrater
+          `recommendation_reason`.
+        """
+        source_memo: dict[Any, float] = {}
+        return [
+            self._score_one(
+                content, context, source_memo=source_memo, with_contributions=False
+            )
+            for content in contents
+        ]
+
+    def _score_one(
+        self,
+        content: Content,
+        context: ScoringContext,
+        source_memo: dict[Any, float] | None = None,
+        with_contributions: bool = True,
+    ) -> PillarScoreResult:
+        """Score un article ; `source_memo` mémoïse le pilier Source par source.
+
+        Une exception du pilier Source est mémoïsée comme un 0.0 (même repli
+        que le chemin unitaire) pour ne pas relogger l'erreur 500 fois.
+        """
         pillar_scores: dict[str, float] = {}
         all_contributions: list[dict[str, Any]] = []
 
         # Score each pillar
         for pillar in self.pillars:
+            if (
+                source_memo is not None
+                and pillar.name == "source"
+                and content.source_id in source_memo
+            ):
+                pillar_scores[pillar.name] = source_memo[content.source_id]
+                continue
             try:
                 result = pillar.score(content, context)
                 pillar_scores[pillar.name] = result.normalized_score
+                if source_memo is not None and pillar.name == "source":
+                    source_memo[content.source_id] = result.normalized_score
 
+                if not with_contributions:
+                    continue
                 for contrib in result.contributions:
                     all_contributions.append(
                         {
@@ -232,6 +306,8 @@ class PillarScoringEngine:
             except Exception as e:
                 logger.error("pillar_scoring_error", pillar=pillar.name, error=str(e))
                 pillar_scores[pillar.name] = 0.0
+                if source_memo is not None and pillar.name == "source":
+                    source_memo[content.source_id] = 0.0
 
         # Weighted combination
         base_score = sum(
@@ -244,7 +320,7 @@ class PillarScoringEngine:
             penalty_score, penalty_contribs = self.penalty_pass.compute(
                 content, context
             )
-            for contrib in penalty_contribs:
+            for contrib in penalty_contribs if with_contributions else ():
                 all_contributions.append(
                     {
                         "pillar": self.penalty_pass.name,
@@ -2,8 +2,10 @@ import asyncio
 import datetime
 import hashlib
 import re
+import sys
 import time
 import unicodedata
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import Any
 from uuid import UUID
@@ -11,13 +13,22 @@ from uuid import UUID
 import structlog
 from sqlalchemy import case, desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import defer, selectinload
 
 from app.database import SessionMaker, safe_async_session
 from app.models.content import Content, UserContentStatus
 from app.models.enums import ContentStatus, ContentType, FeedFilterMode, InterestState
 from app.models.source import Source, UserSource
 from app.models.user import UserProfile, UserSubtopic
+from app.services.candidate_pool_cache import (
+    CANDIDATE_POOL_CACHE,
+    SNAPSHOT_MAX_ROWS,
+    CandidatePoolSnapshot,
+    detached_copy,
+    filter_section_pool,
+)
+from app.services.carousel_aggregates import CAROUSEL_AGGREGATES
+from app.services.feed_cursor import FEED_CURSORS
 from app.services.recommendation.carousel_catalog import (
     MIN_ITEMS_BY_CODE,
     PHASE_B_ORDER,
@@ -29,6 +40,13 @@ from app.services.recommendation.carousel_selection_service import (
     build_phase_b,
     pick_essentiel_type,
 )
+from app.services.user_context_cache import (
+    USER_CONTEXT_CACHE,
+    CompiledUserContext,
+    freeze_mapping,
+    intern_slugs,
+    next_version,
+)
 from app.utils.time import today_paris
 
 logger = structlog.get_logger()
@@ -153,6 +171,84 @@ async def _load_entity_affinity_safe(session, user_id: UUID) -> dict[str, float]
         return {}
 
 
+def _compile_user_context(
+    user_id: UUID,
+    profile,
+    sources_rows,
+    subtopics_rows,
+    personalization,
+    muted_entities: set[str],
+    entity_affinity: dict[str, float],
+    source_affinity_scores: dict[UUID, float],
+    custom_topics: list,
+) -> CompiledUserContext:
+    """Compile les lectures de la phase 1 en snapshot immuable partageable.
+
+    Normalise une fois (slugs internés, mutes en minuscules) ce que
+    `get_feed` recalculait à chaque requête.
+    """
+    followed, custom, subscribed = set(), set(), set()
+    multipliers: dict[UUID, float] = {}
+    for row in sources_rows:
+        followed.add(row.source_id)
+        multipliers[row.source_id] = row.priority_multiplier
+        if row.is_custom:
+            custom.add(row.source_id)
+        if row.has_subscription:
+            subscribed.add(row.source_id)
+
+    subtopic_weights = {
+        sys.intern(row.topic_slug): row.weight for row in subtopics_rows
+    }
+
+    interest_weights: dict[str, float] = {}
+    interest_states: dict[str, InterestState] = {}
+    prefs: dict[str, Any] = {}
+    if profile:
+        for i in profile.interests:
+            slug = sys.intern(i.interest_slug)
+            interest_weights[slug] = i.weight
+            # Story 22.1: state déclaré par l'utilisateur (hidden / favorite, etc.)
+            interest_states[slug] = i.state
+        for p in profile.preferences:
+            prefs[p.preference_key] = p.preference_value
+
+    pz = personalization
+    return CompiledUserContext(
+        user_id=user_id,
+        version=next_version(),
+        user_profile=profile,
+        user_interests=intern_slugs(interest_weights),
+        user_interest_weights=freeze_mapping(interest_weights),
+        user_interest_states=freeze_mapping(interest_states),
+        user_prefs=freeze_mapping(prefs),
+        followed_source_ids=frozenset(followed),
+        custom_source_ids=frozenset(custom),
+        subscribed_source_ids=frozenset(subscribed),
+        user_subtopics=intern_slugs(subtopic_weights),
+        user_subtopic_weights=freeze_mapping(subtopic_weights),
+        muted_sources=frozenset(pz.muted_sources or ()) if pz else frozenset(),
+        muted_themes=intern_slugs(t.lower() for t in (pz.muted_themes or ()))
+        if pz
+        else frozenset(),
+        muted_topics=intern_slugs(t.lower() for t in (pz.muted_topics or ()))
+        if pz
+        else frozenset(),
+        muted_content_types=intern_slugs(
+            t.lower() for t in (pz.muted_content_types or ())
+        )
+        if pz
+        else frozenset(),
+        muted_entities=tuple(muted_entities),
+        hide_paid_content=pz.hide_paid_content if pz else None,
+        hide_non_fr_sources=pz.hide_non_fr_sources if pz else None,
+        entity_affinity=freeze_mapping(entity_affinity),
+        source_priority_multipliers=freeze_mapping(multipliers),
+        source_affinity_scores=freeze_mapping(source_affinity_scores),
+        user_custom_topics=tuple(custom_topics),
+    )
+
+
 from app.schemas.content import RecommendationReason, ScoreContribution
 
 
@@ -209,6 +305,10 @@ from app.services.recommendation.filter_presets import (
     calculate_user_bias,
     get_opposing_biases,
 )
+from app.services.recommendation.helpers.entities import (
+    entity_keys,
+    iter_entities,
+)
 from app.services.recommendation.layers import (
     ArticleTopicLayer,
     BehavioralLayer,
@@ -249,6 +349,14 @@ class RecommendationService:
             dict
         ] = []  # Populated by topic regroupement (Phase 2)
         self.total_candidates: int = 0  # Total candidate pool size (pre-filtering)
+        # Version du snapshot `CompiledUserContext` utilisé par get_feed().
+        self.context_version: int | None = None
+        # Jeton du classement de la page 1 (vues paginées par slice), rendu au
+        # client dans `PaginationMeta.next_cursor` — cf. feed_cursor.py.
+        self.next_cursor: str | None = None
+        # False pour le refresh SWR en arrière-plan : garde le curseur déjà
+        # servi avec la page stale au lieu d'en émettre un nouveau.
+        self.rotate_cursor: bool = True
         # Section source : True quand aucun article récent (≤72h) n'existe et que
         # le feed a dû reculer jusqu'à 30 j (repli « Pas d'article récent. »).
         self.source_no_recent_source: bool = False
@@ -292,6 +400,7 @@ class RecommendationService:
         include_unfollowed: bool = False,
         personalized: bool = False,
         followed_only: bool = False,
+        cursor: str | None = None,
     ) -> list[Content]:
         """
         Génère un feed personnalisé pour l'utilisateur.
@@ -301,6 +410,12 @@ class RecommendationService:
         2. Scorer via ScoringEngine (Core + Prefs + Behavioral).
         3. Appliquer la pénalité de fatigue de source (Diversité).
         4. Trier et paginer.
+
+        La page 1 d'une vue paginée par slice (modes scorés, vues filtrées
+        chronologiques) publie son classement complet dans `self.next_cursor`.
+        Avec `cursor` et `offset > 0`, la page est hydratée depuis ce
+        classement sans rejouer le pipeline ; un curseur invalide ou inconnu
+        retombe sur le calcul complet.
         """
         # 1. Fetch user context in parallel using 2 sessions
         # Round 4 fix (docs/bugs/bug-infinite-load-requests.md — burst
@@ -320,9 +435,41 @@ class RecommendationService:
         from app.database import safe_async_session
         from app.models.daily_digest import DailyDigest
         from app.models.user_personalization import UserPersonalization
+        from app.models.user_topic_profile import UserTopicProfile
 
         t0 = time.monotonic()
 
+        # Tous les paramètres de la vue sauf l'offset : un curseur n'est relu
+        # que pour la vue exacte qui l'a émis.
+        view_signature = (
+            limit,
+            content_type,
+            mode,
+            saved_only,
+            theme,
+            topic,
+            has_note,
+            source_id,
+            entity,
+            keyword,
+            serein,
+            include_unfollowed,
+            personalized,
+            followed_only,
+        )
+        if cursor and offset > 0:
+            page = await self._page_from_cursor(
+                user_id, cursor, view_signature, offset=offset, limit=limit
+            )
+            if page is not None:
+                logger.info(
+                    "feed_total",
+                    duration_ms=round((time.monotonic() - t0) * 1000),
+                    items=len(page),
+                    mode="cursor",
+                )
+                return page
+
         profile_stmt = (
             select(UserProfile)
             .options(
@@ -331,7 +478,10 @@ class RecommendationService:
             .where(UserProfile.user_id == user_id)
         )
         sources_stmt = select(
-            UserSource.source_id, UserSource.is_custom, UserSource.has_subscription
+            UserSource.source_id,
+            UserSource.is_custom,
+            UserSource.has_subscription,
+            UserSource.priority_multiplier,
         ).where(
             UserSource.user_id == user_id,
             UserSource.state.in_(FOLLOWED_SOURCE_STATES),
@@ -340,6 +490,9 @@ class RecommendationService:
         personalization_stmt = select(UserPersonalization).where(
             UserPersonalization.user_id == user_id
         )
+        custom_topics_stmt = select(UserTopicProfile).where(
+            UserTopicProfile.user_id == user_id
+        )
         # `uq_daily_digest_user_date_serene` garantit 1 ligne par
         # (user, date, is_serene) : sans le prédicat `is_serene`, un compte qui
         # a les deux digests du jour (normal + serein) en récupérait un au
@@ -358,7 +511,7 @@ class RecommendationService:
             # ensuite idle pendant les longs `await` (batches parallèles,
             # scoring) jusqu'à ce que Postgres la tue
             # (idle_in_transaction_session_timeout=10s) → IdleInTransaction
-            # → /api/feed 500. On exécute désormais ces 3 lectures dans une
+            # → /api/feed 500. On exécute désormais ces lectures dans une
             # short session capée 8s/5s, comme _batch_personalization : la
             # connexion n'est tenue que le temps du gather puis rendue au pool,
             # et `self.session` n'ouvre plus sa tx ici.
@@ -377,62 +530,82 @@ class RecommendationService:
                 statement_timeout_ms=8_000, idle_in_tx_timeout_ms=5_000
             ) as s:
                 pz = await s.scalar(personalization_stmt)
-                digest = await s.scalar(digest_stmt)
                 # Epic 13: Load muted entities (defensive — tolère schema drift)
                 muted_entities = await _load_muted_entities_safe(s, user_id)
                 # PR2: Load learned entity affinity (defensive — tolère drift)
                 entity_affinity = await _load_entity_affinity_safe(s, user_id)
-                return pz, digest, muted_entities, entity_affinity
-
-        # gather() préserve le parallélisme : _user_context_short et
-        # _batch_personalization ouvrent chacune leur propre short session
-        # (sessions distinctes), aucun risque de "concurrent operations on
-        # same session". Tradeoff PYTHON-37 : 2 connexions courtes
-        # concurrentes pendant la fenêtre du gather, toutes deux rendues au
-        # pool ensuite (vs. self.session qui gardait sa tx ouverte tout le
-        # pipeline). La pression pool résiduelle est traitée séparément.
-        (
-            (user_profile, followed_sources_rows, subtopics_rows),
-            (personalization, digest_row, muted_entities, entity_affinity),
-        ) = await asyncio.gather(
-            _user_context_short(),
-            _batch_personalization(),
+                affinity_rows = (
+                    await s.execute(self._source_affinity_stmt(user_id))
+                ).all()
+                custom_topics = list((await s.scalars(custom_topics_stmt)).all())
+                return (
+                    pz,
+                    muted_entities,
+                    entity_affinity,
+                    self._normalize_affinity(affinity_rows),
+                    custom_topics,
+                )
+
+        async def _build_user_context() -> CompiledUserContext:
+            # gather() préserve le parallélisme : _user_context_short et
+            # _batch_personalization ouvrent chacune leur propre short session
+            # (sessions distinctes), aucun risque de "concurrent operations on
+            # same session". Tradeoff PYTHON-37 : 2 connexions courtes
+            # concurrentes pendant la fenêtre du gather, toutes deux rendues au
+            # pool ensuite (vs. self.session qui gardait sa tx ouverte tout le
+            # pipeline). La pression pool résiduelle est traitée séparément.
+            (
+                (profile, sources_rows, subtopics_rows),
+                (pz, muted_ents, ent_affinity, src_affinity, custom_topics),
+            ) = await asyncio.gather(
+                _user_context_short(),
+                _batch_personalization(),
+            )
+            return _compile_user_context(
+                user_id,
+                profile,
+                sources_rows,
+                subtopics_rows,
+                pz,
+                muted_ents,
+                ent_affinity,
+                src_affinity,
+                custom_topics,
+            )
+
+        async def _load_digest_short():
+            async with safe_async_session(
+                statement_timeout_ms=8_000, idle_in_tx_timeout_ms=5_000
+            ) as s:
+                return await s.scalar(digest_stmt)
+
+        # Snapshot partagé par les ~10 sections parallèles du cold open
+        # (single-flight, invalidé par les écritures via FEED_CACHE.invalidate).
+        # Le digest du jour (régénérable dans la journée) reste lu à chaque
+        # requête, mais en parallèle du build : pas d'aller-retour en série
+        # derrière un miss.
+        compiled, digest_row = await asyncio.gather(
+            USER_CONTEXT_CACHE.get_or_build(user_id, _build_user_context),
+            _load_digest_short(),
         )
+        self.context_version = compiled.version
 
         t1 = time.monotonic()
         logger.info("feed_phase1_context", duration_ms=round((t1 - t0) * 1000))
 
-        # Process results
-        followed_source_ids = set()
-        custom_source_ids = set()
-        subscribed_source_ids = set()
-        for row in followed_sources_rows:
-            followed_source_ids.add(row.source_id)
-            if row.is_custom:
-                custom_source_ids.add(row.source_id)
-            if row.has_subscription:
-                subscribed_source_ids.add(row.source_id)
-
-        user_subtopics = set()
-        user_subtopic_weights: dict[str, float] = {}
-        for row in subtopics_rows:
-            user_subtopics.add(row.topic_slug)
-            user_subtopic_weights[row.topic_slug] = row.weight
-
-        user_interests = set()
-        user_interest_weights = {}
-        user_interest_states: dict[str, InterestState] = {}
-        user_prefs = {}
-
-        if user_profile:
-            for i in user_profile.interests:
-                user_interests.add(i.interest_slug)
-                user_interest_weights[i.interest_slug] = i.weight
-                # Story 22.1: state déclaré par l'utilisateur (hidden / favorite, etc.)
-                user_interest_states[i.interest_slug] = i.state
-
-            for p in user_profile.preferences:
-                user_prefs[p.preference_key] = p.preference_value
+        # Copies locales mutables : le snapshot est partagé entre requêtes.
+        user_profile = compiled.user_profile
+        followed_source_ids = set(compiled.followed_source_ids)
+        custom_source_ids = set(compiled.custom_source_ids)
+        subscribed_source_ids = set(compiled.subscribed_source_ids)
+        user_subtopics = set(compiled.user_subtopics)
+        user_subtopic_weights = dict(compiled.user_subtopic_weights)
+        user_interests = set(compiled.user_interests)
+        user_interest_weights = dict(compiled.user_interest_weights)
+        user_interest_states = dict(compiled.user_interest_states)
+        user_prefs = dict(compiled.user_prefs)
+        muted_entities = set(compiled.muted_entities)
+        entity_affinity = dict(compiled.entity_affinity)
 
         if saved_only:
             # Fetch saved items directly
@@ -514,43 +687,27 @@ class RecommendationService:
         except Exception as e:
             logger.warning("feed_digest_exclusion_failed", error=str(e))
 
-        # Story 4.7: Personalization filters
-        muted_sources = (
-            set(personalization.muted_sources)
-            if personalization and personalization.muted_sources
-            else set()
-        )
-        muted_themes = (
-            {t.lower() for t in personalization.muted_themes}
-            if personalization and personalization.muted_themes
-            else set()
-        )
-        muted_topics = (
-            {t.lower() for t in personalization.muted_topics}
-            if personalization and personalization.muted_topics
-            else set()
-        )
-        muted_content_types = (
-            {t.lower() for t in personalization.muted_content_types}
-            if personalization and personalization.muted_content_types
-            else set()
-        )
+        # Story 4.7: Personalization filters (déjà normalisés dans le snapshot)
+        muted_sources = set(compiled.muted_sources)
+        muted_themes = set(compiled.muted_themes)
+        muted_topics = set(compiled.muted_topics)
+        muted_content_types = set(compiled.muted_content_types)
 
         # Paywall filter preference
         # Disable paywall filter when browsing a specific source (exploration mode)
         hide_paid_content = True  # Default: hide paid articles
         if source_id:
             hide_paid_content = False
-        elif personalization and personalization.hide_paid_content is not None:
-            hide_paid_content = personalization.hide_paid_content
+        elif compiled.hide_paid_content is not None:
+            hide_paid_content = compiled.hide_paid_content
 
         # Language filter preference (hide non-FR sources non-suivies).
         # Désactivé quand on browse explicitement une source (exploration).
         hide_non_fr_sources = True
         if source_id:
             hide_non_fr_sources = False
-        elif personalization and personalization.hide_non_fr_sources is not None:
-            hide_non_fr_sources = personalization.hide_non_fr_sources
+        elif compiled.hide_non_fr_sources is not None:
+            hide_non_fr_sources = compiled.hide_non_fr_sources
 
         # Convert source_id string to UUID if provided
         source_uuid = UUID(source_id) if source_id else None
@@ -605,53 +762,32 @@ class RecommendationService:
             # Onglets Flâner : restreindre le bloc principal aux sources suivies
             # (tri chronologique conservé, contrairement à personalized).
             followed_only=followed_only,
+            # Sections de la Tournée : découpe du pool partagé (1 requête/user).
+            shared_pool=True,
         )
         self.total_candidates = len(candidates)
 
         # Entity filter: post-filter candidates by entity name in content.entities[]
         if entity:
-            import json as _json
-
             entity_norm = _normalize_entity_name(entity)
 
             def _matches_entity(c: Content) -> bool:
-                if not c.entities:
-                    return False
-                for raw in c.entities:
-                    try:
-                        e = _json.loads(raw)
-                        if (
-                            isinstance(e, dict)
-                            and _normalize_entity_name(e.get("name", "")) == entity_norm
-                        ):
-                            return True
-                    except (ValueError, TypeError):
-                        continue
-                return False
+                return any(
+                    ref.is_json and _normalize_entity_name(ref.name) == entity_norm
+                    for ref in iter_entities(c.entities)
+                )
 
             candidates = [c for c in candidates if _matches_entity(c)]
 
         # Epic 13: Filter out articles containing muted entities (post-SQL)
         if muted_entities:
-            import json as _json_mute
-
-            muted_lower = {e.lower() for e in muted_entities}
+            # Même clé canonique que `entity_keys` ; nom vide ignoré.
+            muted_keys = {key for e in muted_entities if (key := e.strip().lower())}
 
             def _has_muted_entity(c: Content) -> bool:
-                if not c.entities:
-                    return False
-                for raw in c.entities:
-                    try:
-                        e = _json_mute.loads(raw)
-                        if (
-                            isinstance(e, dict)
-                            and e.get("name", "").lower() in muted_lower
-                        ):
-                            return True
-                    except (ValueError, TypeError):
-                        if isinstance(raw, str) and raw.lower() in muted_lower:
-                            return True
-                return False
+                return bool(muted_keys) and not muted_keys.isdisjoint(
+                    entity_keys(c.entities)
+                )
 
             before_count = len(candidates)
             candidates = [c for c in candidates if not _has_muted_entity(c)]
@@ -669,6 +805,10 @@ class RecommendationService:
             topic=topic,
             source_uuid=source_uuid,
         )
+        # Même règle que `_get_candidates` : prédicat d'exclusion relâché.
+        explicit_filter = any(
+            f is not None for f in (source_uuid, theme, topic, entity, keyword)
+        )
 
         # Explicit filter (exploration chip) OR RECENT mode : skip scoring,
         # return pure chronological order. Candidates are already sorted by
@@ -688,22 +828,22 @@ class RecommendationService:
         if (
             source_uuid or theme or topic or entity or mode == FeedFilterMode.RECENT
         ) and not personalized_theme_mode:
+            if offset == 0:
+                self.next_cursor = FEED_CURSORS.issue(
+                    user_id,
+                    view_signature,
+                    [c.id for c in candidates],
+                    context_version=self.context_version,
+                    followed_source_ids=followed_source_ids,
+                    explicit_filter=explicit_filter,
+                    rotate=self.rotate_cursor,
+                )
             paginated = candidates[offset : offset + limit]
             await self._hydrate_user_status(paginated, user_id, followed_source_ids)
             return paginated
 
-        # Load source priority multipliers (needed for both chrono and scoring paths)
-        source_weight_rows = (
-            await self.session.execute(
-                select(UserSource.source_id, UserSource.priority_multiplier).where(
-                    UserSource.user_id == user_id,
-                    UserSource.state.in_(FOLLOWED_SOURCE_STATES),
-                )
-            )
-        ).all()
-        source_priority_multipliers = {
-            row.source_id: row.priority_multiplier for row in source_weight_rows
-        }
+        # Source priority multipliers (needed for both chrono and scoring paths)
+        source_priority_multipliers = dict(compiled.source_priority_multipliers)
 
         # Epic 12: Chronological diversified mode (new default)
         # mode=None means no chip selected → chronological diversified.
@@ -720,17 +860,9 @@ class RecommendationService:
                 mode="chronological",
             )
 
-            # Story 12.8: load custom topics BEFORE diversification so we can
+            # Story 12.8: custom topics BEFORE diversification so we can
             # build an InterestContext (halve quotas of sources with zero match).
-            from app.models.user_topic_profile import UserTopicProfile
-
-            custom_topics_stmt = select(UserTopicProfile).where(
-                UserTopicProfile.user_id == user_id
-            )
-            async with safe_async_session(
-                statement_timeout_ms=8_000, idle_in_tx_timeout_ms=5_000
-            ) as s:
-                user_custom_topics = list((await s.scalars(custom_topics_stmt)).all())
+            user_custom_topics = list(compiled.user_custom_topics)
             self.user_custom_topics = user_custom_topics
 
             ct_slugs: set[str] = set()
@@ -846,22 +978,11 @@ class RecommendationService:
         scored_candidates = []
         now = datetime.datetime.now(datetime.UTC)
 
-        # Phase 3: Parallel scoring context queries (2 batched sessions)
-        from app.models.user_topic_profile import UserTopicProfile
-
-        source_affinity_stmt = self._source_affinity_stmt(user_id)
+        # Phase 3: impressions des candidats (source affinity + custom topics
+        # viennent du snapshot compilé en phase 1).
         impression_ids = [c.id for c in candidates]
-        custom_topics_stmt = select(UserTopicProfile).where(
-            UserTopicProfile.user_id == user_id
-        )
-
-        async def _batch_scoring_context():
-            async with safe_async_session(
-                statement_timeout_ms=8_000, idle_in_tx_timeout_ms=5_000
-            ) as s:
-                affinity_rows = (await s.execute(source_affinity_stmt)).all()
-                custom_rows = (await s.scalars(custom_topics_stmt)).all()
-                return self._normalize_affinity(affinity_rows), list(custom_rows)
+        source_affinity_scores = dict(compiled.source_affinity_scores)
+        user_custom_topics = list(compiled.user_custom_topics)
 
         async def _batch_impressions():
             if not impression_ids:
@@ -886,7 +1007,7 @@ class RecommendationService:
 
         # Hardening résiduel PYTHON-37 (non activé pour l'instant) : `self.session`
         # a ouvert sa tx au phase 2 (`_get_candidates`) et la garde idle pendant
-        # ce gather où seules les short sessions font des I/O. Si Postgres tue à
+        # cette lecture où seule la short session fait des I/O. Si Postgres tue à
         # nouveau cette tx (idle_in_transaction_session_timeout=10s) sur une
         # nouvelle ligne après le fix _user_context_short, insérer ici :
         #     await self.session.rollback()
@@ -894,13 +1015,7 @@ class RecommendationService:
         # (libère la tx idle puis re-pose les SET LOCAL sur la prochaine tx).
         # Laissé en commentaire tant que PYTHON-37 ne réapparaît pas — un
         # rollback() systématique a un coût et n'est pas justifié sans signal.
-        (
-            (source_affinity_scores, user_custom_topics),
-            impression_data,
-        ) = await asyncio.gather(
-            _batch_scoring_context(),
-            _batch_impressions(),
-        )
+        impression_data = await _batch_impressions()
         self.user_custom_topics = user_custom_topics  # Expose for caller reuse
 
         t4 = time.monotonic()
@@ -939,11 +1054,19 @@ class RecommendationService:
         # Store pillar results for reason hydration (v2 only)
         pillar_results: dict = {}  # {content_id: PillarScoreResult}
 
+        # v2 : une seule passe batch (pilier Source mémoïsé par source, pas de
+        # contributions) ; les raisons sont hydratées en 5.5 sur le seul top-N.
+        if use_pillars:
+            for content, pillar_result in zip(
+                candidates,
+                self.pillar_engine.compute_scores_batch(candidates, context),
+                strict=True,
+            ):
+                pillar_results[content.id] = pillar_result
+
         for content in candidates:
             if use_pillars:
-                pillar_result = self.pillar_engine.compute_score(content, context)
-                score = pillar_result.final_score
-                pillar_results[content.id] = pillar_result
+                score = pillar_results[content.id].final_score
             else:
                 score = self.scoring_engine.compute_score(content, context)
             # Serein mode: boost humorous/satirical sources x1.3
@@ -1032,43 +1155,108 @@ class RecommendationService:
             # decay neutralisé en 4b (évite les murs de même source SANS
             # pénalité de score). Pagination stable (slice déterministe).
             ordered = self._apply_source_interleaving(ordered)
+        if offset == 0:
+            # Le classement entier (bruit Gumbel compris) : les pages suivantes
+            # en sont des slices stables au lieu de re-tirer un classement.
+            self.next_cursor = FEED_CURSORS.issue(
+                user_id,
+                view_signature,
+                [c.id for c in ordered],
+                context_version=self.context_version,
+                followed_source_ids=followed_source_ids,
+                explicit_filter=explicit_filter,
+                scoring_context=context,
+                personalized_theme_mode=personalized_theme_mode,
+                rotate=self.rotate_cursor,
+            )
         result = ordered[offset : offset + limit]
 
         # 5.5 Hydrate Recommendation Reason (Transparency)
-        if use_pillars:
+        self._hydrate_reasons(result, context, personalized_theme_mode)
+
+        # 6. Hydrate with User Status (is_saved, etc)
+        await self._hydrate_user_status(result, user_id, followed_source_ids)
+
+        t_end = time.monotonic()
+        logger.info(
+            "feed_total", duration_ms=round((t_end - t0) * 1000), items=len(result)
+        )
+        return result
+
+    def _hydrate_reasons(
+        self,
+        result: list[Content],
+        context: ScoringContext,
+        personalized_theme_mode: bool,
+    ) -> None:
+        """Recommendation reasons of the served page (transparency)."""
+        if ScoringWeights.SCORING_VERSION == "pillars_v1":
             # v2: Use reason_builder with pillar results
             from app.services.recommendation.reason_builder import (
                 build_recommendation_reason,
             )
 
             for content in result:
-                pr = pillar_results.get(content.id)
-                if pr:
-                    content.recommendation_reason = build_recommendation_reason(pr)
-                    if (
-                        ScoringWeights.FEED_RANDOMIZATION_TEMPERATURE > 0
-                        and not personalized_theme_mode
-                    ):
-                        content.recommendation_reason.breakdown.append(
-                            ScoreContribution(
-                                label="Hasard pour diversifier",
-                                points=0,
-                                is_positive=True,
-                                pillar="diversite",
-                            )
+                # Le batch n'a pas construit les contributions : on rejoue
+                # le chemin unitaire (scores identiques) pour ce top-N.
+                pr = self.pillar_engine.compute_score(content, context)
+                content.recommendation_reason = build_recommendation_reason(pr)
+                if (
+                    ScoringWeights.FEED_RANDOMIZATION_TEMPERATURE > 0
+                    and not personalized_theme_mode
+                ):
+                    content.recommendation_reason.breakdown.append(
+                        ScoreContribution(
+                            label="Hasard pour diversifier",
+                            points=0,
+                            is_positive=True,
+                            pillar="diversite",
                         )
+                    )
         else:
             # v1: Legacy reason hydration from context.reasons
             self._hydrate_legacy_reasons(result, context)
 
-        # 6. Hydrate with User Status (is_saved, etc)
-        await self._hydrate_user_status(result, user_id, followed_source_ids)
-
-        t_end = time.monotonic()
-        logger.info(
-            "feed_total", duration_ms=round((t_end - t0) * 1000), items=len(result)
+    async def _page_from_cursor(
+        self,
+        user_id: UUID,
+        token: str,
+        view_signature: tuple,
+        *,
+        offset: int,
+        limit: int,
+    ) -> list[Content] | None:
+        """Page `offset` d'un classement publié par la page 1, ou None si le
+        curseur ne résout plus (→ pipeline complet).
+
+        Une requête indexée par clé primaire, avec le prédicat d'exclusion de
+        `_get_candidates` : un article masqué (ou vu, hors vues filtrées)
+        depuis la page 1 sort de la page au lieu d'être re-servi."""
+        ranked = FEED_CURSORS.resolve(token, user_id, view_signature)
+        if ranked is None:
+            return None
+        self.next_cursor = token
+        self.context_version = ranked.context_version
+        self.total_candidates = len(ranked.content_ids)
+        page_ids = ranked.content_ids[offset : offset + limit]
+        if not page_ids:
+            return []
+        excluded = self._excluded_status_exists(
+            user_id, explicit_filter=ranked.explicit_filter
         )
-        return result
+        stmt = (
+            select(Content)
+            .options(selectinload(Content.source), defer(Content.html_content))
+            .where(Content.id.in_(page_ids), ~excluded)
+        )
+        rows = {c.id: c for c in await self.session.scalars(stmt)}
+        page = [rows[cid] for cid in page_ids if cid in rows]
+        if ranked.scoring_context is not None:
+            self._hydrate_reasons(
+                page, ranked.scoring_context, ranked.personalized_theme_mode
+            )
+        await self._hydrate_user_status(page, user_id, set(ranked.followed_source_ids))
+        return page
 
     async def _hydrate_user_status(
         self,
@@ -1265,8 +1453,6 @@ class RecommendationService:
         Groups articles sharing the same named entity (from content.entities JSON).
         Returns: (filtered_articles, entity_overflow_info, assigned_ids, ctas_used)
         """
-        import json as _json
-
         min_group = ScoringWeights.MIN_FOR_ENTITY_GROUPING
 
         # Step 1: Build entity → articles index
@@ -1275,17 +1461,10 @@ class RecommendationService:
             if not article.entities:
                 continue
             seen_entities: set[str] = set()
-            for raw in article.entities:
-                try:
-                    obj = _json.loads(raw)
-                    name = obj.get("name", "").strip()
-                    if name:
-                        key = name.lower()
-                        if key not in seen_entities:
-                            seen_entities.add(key)
-                            entity_to_articles.setdefault(key, []).append(article)
-                except (ValueError, TypeError):
-                    continue
+            for ref in iter_entities(article.entities):
+                if ref.is_json and ref.key and ref.key not in seen_entities:
+                    seen_entities.add(ref.key)
+                    entity_to_articles.setdefault(ref.key, []).append(article)
 
         # Step 2: Filter entities with enough articles
         viable = {k: v for k, v in entity_to_articles.items() if len(v) >= min_group}
@@ -1328,14 +1507,10 @@ class RecommendationService:
 
             # Display label: use original casing from first article's entity
             display_name = entity_key.title()
-            for raw in representative.entities:
-                try:
-                    obj = _json.loads(raw)
-                    if obj.get("name", "").lower() == entity_key:
-                        display_name = obj["name"]
-                        break
-                except (ValueError, TypeError):
-                    continue
+            for ref in iter_entities(representative.entities):
+                if ref.is_json and ref.name.lower() == entity_key:
+                    display_name = ref.name
+                    break
 
             if len(sources_list) == 1:
                 display_label = f"{display_name} \u2014 {len(to_hide)} articles de {sources_list[0]['source_name']}"
@@ -2003,20 +2178,18 @@ class RecommendationService:
 
                 ids_to_hide_kw.update(a.id for a in to_hide)
                 # Collect unique sources from all articles in the group
-                seen_src: set[str] = set()
+                per_source = Counter(a.source_id for a in arts)
+                seen_src: set[UUID] = set()
                 sources_list: list[dict] = []
                 for a in arts:
-                    sid = str(a.source_id)
-                    if sid not in seen_src and a.source:
-                        seen_src.add(sid)
+                    if a.source_id not in seen_src and a.source:
+                        seen_src.add(a.source_id)
                         sources_list.append(
                             {
                                 "source_id": a.source_id,
                                 "source_name": a.source.name,
                                 "source_logo_url": a.source.logo_url,
-                                "article_count": sum(
-                                    1 for x in arts if str(x.source_id) == sid
-                                ),
+                                "article_count": per_source[a.source_id],
                             }
                         )
                 # Sort: sources with logos first
@@ -2306,6 +2479,43 @@ class RecommendationService:
                 label=label, score_total=score_total, breakdown=breakdown
             )
 
+    @staticmethod
+    def _excluded_status_exists(user_id: UUID, *, explicit_filter: bool):
+        """``EXISTS`` d'un ``UserContentStatus`` qui exclut le contenu du feed.
+
+        Partagé par ``_get_candidates`` et les pages servies par curseur (qui
+        re-vérifient l'exclusion des ids classés en page 1)."""
+        from sqlalchemy import exists, or_
+
+        if explicit_filter:
+            # Relaxed: only exclude explicitly hidden articles
+            return exists().where(
+                UserContentStatus.content_id == Content.id,
+                UserContentStatus.user_id == user_id,
+                UserContentStatus.is_hidden,
+            )
+        # Default feed: exclude hidden, saved, seen, consumed, et les
+        # articles récemment impressionés (pull-to-refresh) ou marqués
+        # comme "déjà vus". Traduit en SQL la sémantique de
+        # ImpressionLayer (<1h = "invisible après refresh") qui est
+        # sinon ignorée par le tri chronologique.
+        impression_cutoff = datetime.datetime.now(datetime.UTC) - datetime.timedelta(
+            hours=ScoringWeights.IMPRESSION_HIDE_WINDOW_HOURS
+        )
+        return exists().where(
+            UserContentStatus.content_id == Content.id,
+            UserContentStatus.user_id == user_id,
+            or_(
+                UserContentStatus.is_hidden,
+                UserContentStatus.is_saved,
+                UserContentStatus.status.in_(
+                    [ContentStatus.SEEN, ContentStatus.CONSUMED]
+                ),
+                UserContentStatus.last_impressed_at > impression_cutoff,
+                UserContentStatus.manually_impressed.is_(True),
+            ),
+        )
+
     async def _get_candidates(
         self,
         user_id: UUID,
@@ -2333,8 +2543,14 @@ class RecommendationService:
         personalized: bool = False,
         user_subtopics: set[str] | None = None,
         followed_only: bool = False,
+        shared_pool: bool = False,
     ) -> list[Content]:
-        """Récupère les N contenus les plus récents que l'utilisateur n'a pas encore vus/consommés et qui ne sont pas masqués."""
+        """Récupère les N contenus les plus récents que l'utilisateur n'a pas encore vus/consommés et qui ne sont pas masqués.
+
+        ``shared_pool=True`` (passé par ``get_feed``) autorise les sections
+        thème/topic de la Tournée à se découper dans le snapshot partagé
+        ``CANDIDATE_POOL_CACHE`` au lieu d'émettre chacune leur requête.
+        """
         from sqlalchemy import and_, or_
 
         # Sanitize inputs to prevent SQL Tri-state logic issues with "NOT IN (NULL, ...)"
@@ -2354,7 +2570,7 @@ class RecommendationService:
         # When user explicitly filters by source or theme, only exclude hidden
         # articles — they want to browse ALL content for that source/theme.
         # Otherwise, exclude hidden + saved + seen + consumed (default feed).
-        from sqlalchemy import exists
+        # Cf. `_excluded_status_exists`.
 
         # Tournée du jour : sections curées par thème/topic/source restreintes
         # (source suivie) + fenêtre adaptative 24→48→72h + boost user_subtopics.
@@ -2376,35 +2592,9 @@ class RecommendationService:
             or keyword is not None
         )
 
-        if explicit_filter:
-            # Relaxed: only exclude explicitly hidden articles
-            exists_stmt = exists().where(
-                UserContentStatus.content_id == Content.id,
-                UserContentStatus.user_id == user_id,
-                UserContentStatus.is_hidden,
-            )
-        else:
-            # Default feed: exclude hidden, saved, seen, consumed, et les
-            # articles récemment impressionés (pull-to-refresh) ou marqués
-            # comme "déjà vus". Traduit en SQL la sémantique de
-            # ImpressionLayer (<1h = "invisible après refresh") qui est
-            # sinon ignorée par le tri chronologique.
-            impression_cutoff = datetime.datetime.now(
-                datetime.UTC
-            ) - datetime.timedelta(hours=ScoringWeights.IMPRESSION_HIDE_WINDOW_HOURS)
-            exists_stmt = exists().where(
-                UserContentStatus.content_id == Content.id,
-                UserContentStatus.user_id == user_id,
-                or_(
-                    UserContentStatus.is_hidden,
-                    UserContentStatus.is_saved,
-                    UserContentStatus.status.in_(
-                        [ContentStatus.SEEN, ContentStatus.CONSUMED]
-                    ),
-                    UserContentStatus.last_impressed_at > impression_cutoff,
-                    UserContentStatus.manually_impressed.is_(True),
-                ),
-            )
+        exists_stmt = self._excluded_status_exists(
+            user_id, explicit_filter=explicit_filter
+        )
 
         query = (
             select(Content)
@@ -2572,6 +2762,21 @@ class RecommendationService:
 
                 query = query.where(Source.bias_stance.in_(target_bias))
 
+        # Pool commun aux sections thème/topic de la Tournée : tous les filtres
+        # partagés sont posés, seul le prédicat thème/topic reste à appliquer.
+        shared_query = query
+        use_shared_pool = (
+            shared_pool
+            and personalized_theme_mode
+            and _use_two_phase
+            and CANDIDATE_POOL_CACHE.enabled
+            and not serein
+            and mode is None
+            and content_type is None
+            and entity is None
+            and keyword is None
+        )
+
         # Apply theme filter (Story 2 - Feed par thème, skip when source filter active)
         if theme and not source_id:
             query = apply_theme_focus_filter(query, theme)
@@ -2670,13 +2875,66 @@ class RecommendationService:
             # est insuffisant. Chaque palier conserve la borne SQL afin qu'une
             # section large ne charge jamais tous ses candidats sur 72 h.
             now_window = datetime.datetime.now(datetime.UTC)
+            snapshot = None
+            volumes = (
+                CAROUSEL_AGGREGATES.source_volumes(
+                    ScoringWeights.THEMATIC_WINDOW_TIERS_HOURS[-1] // 24
+                )
+                if use_shared_pool
+                else None
+            )
+            if volumes is not None:
+                # Borne haute sans exclusions utilisateur : au-delà du plafond,
+                # le snapshot serait tronqué → inutile de payer la requête large.
+                # Agrégats en retard d'un refresh : un sous-compte finit en
+                # snapshot `complete=False`, donc au chemin SQL par section.
+                pool_upper_bound = sum(
+                    volumes.get(source_id, 0) for source_id in followed_source_ids
+                )
+                use_shared_pool = pool_upper_bound <= SNAPSHOT_MAX_ROWS
+            if use_shared_pool:
+                snapshot = await self._shared_candidate_pool(
+                    user_id,
+                    shared_query,
+                    followed_source_ids=followed_source_ids,
+                    signature=(
+                        frozenset(digest_content_ids or ()),
+                        frozenset(followed_source_ids),
+                        frozenset(subscribed_source_ids or ()),
+                        frozenset(muted_sources or ()),
+                        frozenset(muted_themes or ()),
+                        frozenset(muted_topics or ()),
+                        frozenset(muted_content_types or ()),
+                        hide_paid_content,
+                        hide_non_fr_sources,
+                    ),
+                )
+                if not snapshot.complete:
+                    # Pool tronqué ou en timeout : la découpe en mémoire
+                    # divergerait du SQL → chemin par section inchangé.
+                    snapshot = None
             for tier_hours in ScoringWeights.THEMATIC_WINDOW_TIERS_HOURS:
                 since = now_window - datetime.timedelta(hours=tier_hours)
-                candidates_list = await _fetch_candidates(
-                    query.where(Content.published_at >= since)
-                )
+                if snapshot is not None:
+                    candidates_list = filter_section_pool(
+                        snapshot.rows,
+                        since=since,
+                        theme=theme,
+                        topic=topic,
+                        user_subtopics=user_subtopics,
+                        limit=limit_candidates,
+                    )
+                else:
+                    candidates_list = await _fetch_candidates(
+                        query.where(Content.published_at >= since)
+                    )
                 if len(candidates_list) >= ScoringWeights.THEMATIC_MIN_POOL_SIZE:
                     break
+            if snapshot is not None:
+                # Les lignes du snapshot sont partagées par les sections
+                # concurrentes : raisons et statut utilisateur s'écrivent sur
+                # des copies propres à cette requête.
+                candidates_list = [detached_copy(c) for c in candidates_list]
             # `tier_hours` reste le premier palier qui atteint le seuil, ou 72 h.
             logger.info(
                 "feed_thematic_adaptive_window",
@@ -2684,6 +2942,7 @@ class RecommendationService:
                 window_hours=tier_hours,
                 candidates=len(candidates_list),
                 threshold=ScoringWeights.THEMATIC_MIN_POOL_SIZE,
+                shared_pool=snapshot is not None,
             )
 
             # Repli « pas d'article récent » pour les sections **source** : si la
@@ -2776,6 +3035,74 @@ class RecommendationService:
 
         return candidates_list
 
+    async def _shared_candidate_pool(
+        self,
+        user_id: UUID,
+        shared_query,
+        *,
+        followed_source_ids: set[UUID],
+        signature: tuple,
+    ) -> CandidatePoolSnapshot:
+        """Snapshot des candidats suivis sur 72 h, partagé par les sections.
+
+        Une seule requête par utilisateur (single-flight) pour toute la rafale
+        de sections ; lue sur une short session → lignes détachées, réutilisables
+        par les requêtes concurrentes. Même borne de temps que la requête
+        two-phase : en timeout, snapshot vide ``complete=False`` (mis en cache,
+        pour que les sections suivantes ne ré-essaient pas la requête large).
+        """
+
+        async def _build() -> CandidatePoolSnapshot:
+            fetched_at = datetime.datetime.now(datetime.UTC)
+            since = fetched_at - datetime.timedelta(
+                hours=ScoringWeights.THEMATIC_WINDOW_TIERS_HOURS[-1]
+            )
+            stmt = (
+                shared_query.where(
+                    Source.id.in_(list(followed_source_ids)),
+                    Content.published_at >= since,
+                )
+                .options(defer(Content.html_content))
+                .order_by(Content.published_at.desc())
+                .limit(SNAPSHOT_MAX_ROWS + 1)
+            )
+            try:
+                async with self._session_maker(
+                    statement_timeout_ms=8_000, idle_in_tx_timeout_ms=5_000
+                ) as s:
+                    rows = (
+                        await asyncio.wait_for(
+                            s.scalars(stmt), timeout=_FEED_TWO_PHASE_TIMEOUT_S
+                        )
+                    ).all()
+            except TimeoutError:
+                logger.warning(
+                    "feed_candidate_pool_timeout",
+                    user_id=str(user_id),
+                    followed_source_count=len(followed_source_ids),
+                )
+                return CandidatePoolSnapshot(
+                    signature=signature, rows=(), fetched_at=fetched_at, complete=False
+                )
+            logger.info(
+                "feed_candidate_pool_built",
+                user_id=str(user_id),
+                rows=min(len(rows), SNAPSHOT_MAX_ROWS),
+                truncated=len(rows) > SNAPSHOT_MAX_ROWS,
+                duration_ms=round(
+                    (datetime.datetime.now(datetime.UTC) - fetched_at).total_seconds()
+                    * 1000
+                ),
+            )
+            return CandidatePoolSnapshot(
+                signature=signature,
+                rows=tuple(rows[:SNAPSHOT_MAX_ROWS]),
+                fetched_at=fetched_at,
+                complete=len(rows) <= SNAPSHOT_MAX_ROWS,
+            )
+
+        return await CANDIDATE_POOL_CACHE.get_or_build(user_id, signature, _build)
+
     def _source_affinity_stmt(self, user_id: UUID):
         """Build the source affinity query statement (reusable for parallel execution)."""
         return (
@@ -2908,20 +3235,19 @@ class RecommendationService:
             others = articles[1:]
 
             # Collect unique sources from all articles in the cluster
-            seen_src: set[str] = set()
+            # (comptes par source en une passe, pas un `sum` par source).
+            per_source = Counter(a.source_id for a in articles)
+            seen_src: set[UUID] = set()
             sources_list: list[dict] = []
             for a in articles:
-                sid = str(a.source_id)
-                if sid not in seen_src and a.source:
-                    seen_src.add(sid)
+                if a.source_id not in seen_src and a.source:
+                    seen_src.add(a.source_id)
                     sources_list.append(
                         {
                             "source_id": a.source_id,
                             "source_name": a.source.name,
                             "source_logo_url": a.source.logo_url,
-                            "article_count": sum(
-                                1 for x in articles if str(x.source_id) == sid
-                            ),
+                            "article_count": per_source[a.source_id],
                         }
                     )
             # Sort: sources with logos first
@@ -1,5 +1,7 @@
 import asyncio
 import re
+from collections.abc import Awaitable, Coroutine
+from typing import Any
 from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
 
 import feedparser
@@ -9,10 +11,12 @@ from bs4 import BeautifulSoup
 from pydantic import BaseModel
 
 from app.config import get_settings
+from app.services.feed_detection_cache import FEED_DETECTION_CACHE
 from app.services.http_fetch import (
     fetch_with_impersonation,
     is_antibot_response,
 )
+from app.services.outbound_http import OUTBOUND_HTTP
 from app.services.wordpress_feed import (
     fetch_wp_posts,
     fetch_wp_site_info,
@@ -153,17 +157,61 @@ class DetectedFeed(BaseModel):
     entries: list[dict] = []
 
 
+class FeedNotFoundError(ValueError):
+    """Detection ran to completion: no usable feed, or the site blocks bots.
+
+    The only detection failure replayed by ``FEED_DETECTION_CACHE``.
+    """
+
+
+class FeedFetchError(ValueError):
+    """The page could not be fetched (timeout, connection or HTTP error).
+
+    Transient by nature: never cached, the next detection retries the site.
+    """
+
+
+async def _first_by_priority(
+    strategies: list[tuple[str, Coroutine[Any, Any, DetectedFeed | None]]],
+) -> DetectedFeed | None:
+    """Race detection strategies, keep the first feed in list order.
+
+    All strategies start at once; results are read in priority order, so a
+    later strategy's feed only counts once every earlier one came back empty
+    (an exception propagates at its rank the same way). As soon as the
+    winner is known the remaining strategies are cancelled.
+    """
+    tasks = [asyncio.create_task(coro, name=name) for name, coro in strategies]
+    try:
+        for task in tasks:
+            feed = await task
+            if feed is not None:
+                return feed
+        return None
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        # Drain cancelled tasks so their exceptions don't leak.
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _signal_when_done[T](done: asyncio.Event, coro: Awaitable[T]) -> T:
+    """Await ``coro`` and set ``done`` however it ends."""
+    try:
+        return await coro
+    finally:
+        done.set()
+
+
 class RSSParser:
     """Service to parse and detect RSS feeds."""
 
     def __init__(self):
-        self.client = httpx.AsyncClient(
-            timeout=7.0,
-            follow_redirects=False,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-                "Accept-Language": "en-US,en;q=0.9",
-            },
+        # Own cookie jar, shared "detect" connection pool: closing this
+        # client leaves the pooled connections open for the next parser.
+        self.client = OUTBOUND_HTTP.session(
+            "detect",
             cookies={"CONSENT": "YES+cb.20210328-17-p0.en+FX+430"},
         )
 
@@ -662,37 +710,41 @@ class RSSParser:
         3. Direct feedparser parse.
         4. HTML <link rel="alternate"> auto-discovery.
         4b. HTML <a href> deep scan for feed-like links.
-        4c. Feed index page follow (recurse into /rss, /flux, … HTML lists).
         5. Expanded suffix fallback with Content-Type validation.
+        5b. WordPress reinforcement (curl-cffi /feed/, REST synthetic feed).
+        6. Feed index page follow (recurse into /rss, /flux, … HTML lists).
+
+        Independent stages race (0/0b/1-2, then 4-6 once the page is in
+        hand) and the first feed in pipeline order wins, cancelling the
+        others. Results — feeds and ``FeedNotFoundError`` — are cached per
+        URL in ``FEED_DETECTION_CACHE``, shared with smart source search;
+        ``FeedFetchError`` (site unreachable) is not.
         """
         url = normalize_input_url(url)
         logger.info("Detecting feed", url=url)
         validate_url_for_fetch(url)
+        return await FEED_DETECTION_CACHE.get_or_detect(
+            url, lambda: self._detect_uncached(url)
+        )
+
+    async def _detect_uncached(self, url: str) -> DetectedFeed:
         loop = asyncio.get_event_loop()
         detection_log: list[str] = []
+        strategies: list[tuple[str, Coroutine[Any, Any, DetectedFeed | None]]] = []
 
         # ── Step 0: Domain override ───────────────────────────────
         override_feed = self._lookup_domain_override(url)
         if override_feed:
             logger.info("Domain override matched", url=url, feed_url=override_feed)
             detection_log.append(f"override={override_feed}")
-            try:
-                resp = await self._safe_get(override_feed)
-                if resp.status_code == 200:
-                    feed_data = await loop.run_in_executor(
-                        None, feedparser.parse, resp.text
-                    )
-                    if len(feed_data.entries) > 0:
-                        return await self._format_response(override_feed, feed_data)
-                detection_log.append("override_feed=no_entries")
-            except Exception as e:
-                detection_log.append(f"override_error={e}")
-                logger.warning(
-                    "Domain override feed failed, continuing detection",
-                    url=url,
-                    feed_url=override_feed,
-                    error=str(e),
+            strategies.append(
+                (
+                    "override",
+                    self._try_known_feed(
+                        "override", override_feed, loop, detection_log
+                    ),
                 )
+            )
 
         # ── Step 0b: Platform-specific URL transforms ──────────────
         transformed_url = self._try_platform_transform(url)
@@ -703,108 +755,159 @@ class RSSParser:
                 feed_url=transformed_url,
             )
             detection_log.append(f"platform_transform={transformed_url}")
-            try:
-                resp = await self._safe_get(transformed_url)
-                if resp.status_code == 200:
-                    feed_data = await loop.run_in_executor(
-                        None, feedparser.parse, resp.text
-                    )
-                    if len(feed_data.entries) > 0:
-                        return await self._format_response(transformed_url, feed_data)
-                detection_log.append("platform_transform_feed=no_entries")
-            except Exception as e:
-                detection_log.append(f"platform_transform_error={e}")
-                logger.warning(
-                    "Platform transform feed failed, continuing detection",
-                    error=str(e),
+            strategies.append(
+                (
+                    "platform_transform",
+                    self._try_known_feed(
+                        "platform_transform", transformed_url, loop, detection_log
+                    ),
+                )
+            )
+
+        # ── Steps 1-6: platform handler, else the page itself ─────
+        # Raced with the known feed URLs above: when they come back empty
+        # the page fetch is already done instead of only starting.
+        landing = self._detect_platform(url, loop)
+        if landing is None:
+            landing = self._detect_from_page(url, loop, detection_log)
+        strategies.append(("landing", landing))
+
+        feed = await _first_by_priority(strategies)
+        if feed is not None:
+            return feed
+
+        # ── Failure: detailed diagnostic ──────────────────────────
+        log_str = "; ".join(detection_log)
+        raise FeedNotFoundError(f"No RSS feed found. Tried: {log_str}")
+
+    async def _try_known_feed(
+        self,
+        stage: str,
+        feed_url: str,
+        loop: asyncio.AbstractEventLoop,
+        detection_log: list[str],
+    ) -> DetectedFeed | None:
+        """Steps 0/0b: fetch a feed URL we already believe in."""
+        try:
+            resp = await self._safe_get(feed_url)
+            if resp.status_code == 200:
+                feed_data = await loop.run_in_executor(
+                    None, feedparser.parse, resp.text
                 )
+                if len(feed_data.entries) > 0:
+                    return await self._format_response(feed_url, feed_data)
+            detection_log.append(f"{stage}_feed=no_entries")
+        except Exception as e:
+            detection_log.append(f"{stage}_error={e}")
+            logger.warning(
+                "Known feed URL failed, continuing detection",
+                stage=stage,
+                url=feed_url,
+                error=str(e),
+            )
+        return None
 
-        # ── SPECIAL: Reddit URL detection ─────────────────────────
+    def _detect_platform(
+        self, url: str, loop: asyncio.AbstractEventLoop
+    ) -> Coroutine[Any, Any, DetectedFeed] | None:
+        """Step 1: dedicated handler for Reddit / YouTube URLs, else None."""
         reddit_match = re.match(
             r"https?://(?:www\.|old\.)?reddit\.com/r/([\w]+)/?", url
         )
         logger.info("Reddit pattern check", url=url, matched=bool(reddit_match))
         if reddit_match:
-            subreddit = reddit_match.group(1)
-            rss_url = f"https://www.reddit.com/r/{subreddit}/.rss"
-            logger.info("Reddit URL detected", subreddit=subreddit, rss_url=rss_url)
-            try:
-                feed_resp = await self._safe_get(rss_url)
-                feed_resp.raise_for_status()
-                reddit_feed = await loop.run_in_executor(
-                    None, feedparser.parse, feed_resp.text
-                )
-                if len(reddit_feed.entries) > 0:
-                    return await self._format_response(rss_url, reddit_feed)
-                logger.warning("Reddit RSS feed empty", subreddit=subreddit)
-            except httpx.HTTPStatusError as e:
-                logger.warning(
-                    "Reddit RSS fetch HTTP error",
-                    subreddit=subreddit,
-                    status=e.response.status_code,
-                    error=str(e),
-                )
-            except Exception as e:
-                logger.warning(
-                    "Reddit RSS fetch failed", subreddit=subreddit, error=str(e)
-                )
-            raise ValueError(
-                f"Could not fetch RSS feed for r/{subreddit}. The subreddit may not exist."
+            return self._detect_reddit(reddit_match.group(1), loop)
+        if "youtube.com/feeds/videos.xml" in url:
+            return self._detect_youtube_feed(url, loop)
+        if "youtube.com" in url or "youtu.be" in url:
+            return self._detect_youtube(url, loop)
+        return None
+
+    async def _detect_reddit(
+        self, subreddit: str, loop: asyncio.AbstractEventLoop
+    ) -> DetectedFeed:
+        rss_url = f"https://www.reddit.com/r/{subreddit}/.rss"
+        logger.info("Reddit URL detected", subreddit=subreddit, rss_url=rss_url)
+        try:
+            feed_resp = await self._safe_get(rss_url)
+            feed_resp.raise_for_status()
+            reddit_feed = await loop.run_in_executor(
+                None, feedparser.parse, feed_resp.text
+            )
+            if len(reddit_feed.entries) > 0:
+                return await self._format_response(rss_url, reddit_feed)
+            logger.warning("Reddit RSS feed empty", subreddit=subreddit)
+        except httpx.HTTPStatusError as e:
+            logger.warning(
+                "Reddit RSS fetch HTTP error",
+                subreddit=subreddit,
+                status=e.response.status_code,
+                error=str(e),
+            )
+        except Exception as e:
+            logger.warning("Reddit RSS fetch failed", subreddit=subreddit, error=str(e))
+        raise ValueError(
+            f"Could not fetch RSS feed for r/{subreddit}. The subreddit may not exist."
+        )
+
+    async def _detect_youtube_feed(
+        self, url: str, loop: asyncio.AbstractEventLoop
+    ) -> DetectedFeed:
+        """YouTube feed URL (already resolved): parse it directly."""
+        logger.info("YouTube feed URL detected, parsing directly", url=url)
+        try:
+            feed_resp = await self._safe_get(url)
+            feed_resp.raise_for_status()
+            yt_feed = await loop.run_in_executor(None, feedparser.parse, feed_resp.text)
+            if len(yt_feed.entries) > 0:
+                return await self._format_response(url, yt_feed)
+        except Exception as e:
+            logger.warning(
+                "Failed to parse YouTube feed URL",
+                url=url,
+                error=str(e),
             )
+        raise ValueError("YouTube feed is empty or invalid.")
 
-        # ── SPECIAL: YouTube feed URL (already resolved) ─────────
-        if "youtube.com/feeds/videos.xml" in url:
-            logger.info("YouTube feed URL detected, parsing directly", url=url)
+    async def _detect_youtube(
+        self, url: str, loop: asyncio.AbstractEventLoop
+    ) -> DetectedFeed:
+        logger.info("YouTube URL detected, resolving channel_id", url=url)
+        channel_id = await self._resolve_youtube_channel_id(url)
+
+        if channel_id:
+            rss_url = (
+                f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
+            )
+            logger.info(
+                "Resolved YouTube channel",
+                channel_id=channel_id,
+                rss_url=rss_url,
+            )
             try:
-                feed_resp = await self._safe_get(url)
+                feed_resp = await self._safe_get(rss_url)
                 feed_resp.raise_for_status()
                 yt_feed = await loop.run_in_executor(
                     None, feedparser.parse, feed_resp.text
                 )
                 if len(yt_feed.entries) > 0:
-                    return await self._format_response(url, yt_feed)
+                    return await self._format_response(rss_url, yt_feed)
             except Exception as e:
                 logger.warning(
-                    "Failed to parse YouTube feed URL",
-                    url=url,
+                    "Failed to parse YouTube feed",
+                    rss_url=rss_url,
                     error=str(e),
                 )
-            raise ValueError("YouTube feed is empty or invalid.")
-
-        # ── SPECIAL: YouTube URL detection ────────────────────────
-        if "youtube.com" in url or "youtu.be" in url:
-            logger.info("YouTube URL detected, resolving channel_id", url=url)
-            channel_id = await self._resolve_youtube_channel_id(url)
 
-            if channel_id:
-                rss_url = (
-                    f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
-                )
-                logger.info(
-                    "Resolved YouTube channel",
-                    channel_id=channel_id,
-                    rss_url=rss_url,
-                )
-                try:
-                    feed_resp = await self._safe_get(rss_url)
-                    feed_resp.raise_for_status()
-                    yt_feed = await loop.run_in_executor(
-                        None, feedparser.parse, feed_resp.text
-                    )
-                    if len(yt_feed.entries) > 0:
-                        return await self._format_response(rss_url, yt_feed)
-                except Exception as e:
-                    logger.warning(
-                        "Failed to parse YouTube feed",
-                        rss_url=rss_url,
-                        error=str(e),
-                    )
+        logger.warning("Failed to resolve YouTube channel_id", url=url)
+        raise ValueError("Could not resolve YouTube channel. Please check the URL.")
 
-            logger.warning("Failed to resolve YouTube channel_id", url=url)
-            raise ValueError("Could not resolve YouTube channel. Please check the URL.")
+    async def _fetch_page(self, url: str, detection_log: list[str]) -> str:
+        """Step 2: page content (httpx → curl-cffi fallback).
 
-        # ── Stage 1: Fetch URL (httpx → curl-cffi fallback) ────────
-        content = None
+        Raises ``FeedNotFoundError`` when the site blocks automated access and
+        ``FeedFetchError`` when the page cannot be fetched at all.
+        """
         try:
             response = await self._safe_get(url)
             logger.info("Fetched URL", url=url, status_code=response.status_code)
@@ -814,18 +917,16 @@ class RSSParser:
                 detection_log.append(f"httpx={response.status_code}/antibot")
                 impersonated = await self._fetch_with_impersonation(url)
                 if impersonated:
-                    content = impersonated
                     detection_log.append("curl_cffi=success")
-                else:
-                    detection_log.append("curl_cffi=failed")
-                    raise ValueError(
-                        f"Site blocked automated access (HTTP {response.status_code}). "
-                        "Try pasting the RSS feed URL directly if you know it."
-                    )
-            else:
-                response.raise_for_status()
-                content = response.text
-                detection_log.append(f"httpx={response.status_code}")
+                    return impersonated
+                detection_log.append("curl_cffi=failed")
+                raise FeedNotFoundError(
+                    f"Site blocked automated access (HTTP {response.status_code}). "
+                    "Try pasting the RSS feed URL directly if you know it."
+                )
+            response.raise_for_status()
+            detection_log.append(f"httpx={response.status_code}")
+            return response.text
         except ValueError:
             raise
         except Exception as e:
@@ -833,13 +934,21 @@ class RSSParser:
             detection_log.append(f"httpx_error={e}")
             impersonated = await self._fetch_with_impersonation(url)
             if impersonated:
-                content = impersonated
                 detection_log.append("curl_cffi=success")
-            else:
-                detection_log.append("curl_cffi=failed")
-                raise ValueError(f"Could not access URL: {str(e)}")
+                return impersonated
+            detection_log.append("curl_cffi=failed")
+            raise FeedFetchError(f"Could not access URL: {str(e)}") from e
+
+    async def _detect_from_page(
+        self,
+        url: str,
+        loop: asyncio.AbstractEventLoop,
+        detection_log: list[str],
+    ) -> DetectedFeed | None:
+        """Steps 2-6 for a regular web page."""
+        content = await self._fetch_page(url, detection_log)
 
-        # ── Stage 2: Direct feedparser parse ──────────────────────
+        # ── Stage 3: Direct feedparser parse ──────────────────────
         feed_data = await loop.run_in_executor(None, feedparser.parse, content)
 
         if not feed_data.bozo and len(feed_data.entries) > 0:
@@ -854,8 +963,59 @@ class RSSParser:
             f"direct_parse=fail(bozo={feed_data.bozo},entries={len(feed_data.entries)})"
         )
 
-        # ── Stage 3: HTML <link rel="alternate"> auto-discovery ───
+        # ── Stages 4-6 race, in pipeline order ────────────────────
+        # The page is reachable and not a feed: every remaining stage only
+        # needs it (or nothing), so they run side by side and the first
+        # feed in pipeline order wins. Index pages wait for the <a> scan
+        # (their candidates) and for the suffix probes, which already
+        # cover the blind index paths appended to a root URL.
         soup = BeautifulSoup(content, "html.parser")
+        html_index_candidates: list[str] = []
+        links_done = asyncio.Event()
+        suffix_done = asyncio.Event()
+
+        async def _index_pages() -> DetectedFeed | None:
+            await links_done.wait()
+            await suffix_done.wait()
+            return await self._try_index_pages(
+                url, html_index_candidates, loop, detection_log
+            )
+
+        return await _first_by_priority(
+            [
+                (
+                    "page_links",
+                    _signal_when_done(
+                        links_done,
+                        self._try_page_links(
+                            url, soup, html_index_candidates, loop, detection_log
+                        ),
+                    ),
+                ),
+                (
+                    "suffix",
+                    _signal_when_done(
+                        suffix_done, self._try_suffixes(url, loop, detection_log)
+                    ),
+                ),
+                ("wordpress", self._try_wordpress(url, soup, loop, detection_log)),
+                ("index_pages", _index_pages()),
+            ]
+        )
+
+    async def _try_page_links(
+        self,
+        url: str,
+        soup: BeautifulSoup,
+        html_index_candidates: list[str],
+        loop: asyncio.AbstractEventLoop,
+        detection_log: list[str],
+    ) -> DetectedFeed | None:
+        """Stages 4/4b: feeds linked from the page (<link>, then <a>).
+
+        HTML pages among the <a> candidates are appended to
+        ``html_index_candidates`` for Stage 6."""
+        # ── Stage 4: HTML <link rel="alternate"> auto-discovery ───
         rss_links = soup.find_all("link", rel="alternate")
 
         found_url = None
@@ -898,7 +1058,7 @@ class RSSParser:
         else:
             detection_log.append("link_alternate=none")
 
-        # ── Stage 3b: HTML <a href> deep scan for feed links ──────
+        # ── Stage 4b: HTML <a href> deep scan for feed links ──────
         candidate_urls: list[str] = []
         seen: set[str] = set()
 
@@ -920,39 +1080,48 @@ class RSSParser:
                 seen.add(href)
                 candidate_urls.append(href)
 
-        html_index_candidates: list[str] = []
-        if candidate_urls:
-            detection_log.append(f"a_tag_scan={len(candidate_urls)}_candidates")
-            for candidate in candidate_urls[:5]:
-                try:
-                    cand_resp = await self._safe_get(candidate)
-                    if cand_resp.status_code != 200:
-                        continue
-                    if self._is_feed_content_type(cand_resp):
-                        cand_feed = await loop.run_in_executor(
-                            None, feedparser.parse, cand_resp.text
-                        )
-                        if len(cand_feed.entries) > 0:
-                            logger.info("Found feed via <a> tag scan", url=candidate)
-                            return await self._format_response(candidate, cand_feed)
-                    elif "html" in cand_resp.headers.get("content-type", "").lower():
-                        # Candidate is an HTML *index page* (common on French
-                        # mainstream sites : /rss, /rss/, /flux-rss, …).
-                        # Defer recursion to Stage 3c below so we dedupe with
-                        # the blind-tried index paths.
-                        html_index_candidates.append(candidate)
-                except Exception:
-                    continue
-        else:
+        if not candidate_urls:
             detection_log.append("a_tag_scan=0_candidates")
+            return None
+
+        detection_log.append(f"a_tag_scan={len(candidate_urls)}_candidates")
+        for candidate in candidate_urls[:5]:
+            try:
+                cand_resp = await self._safe_get(candidate)
+                if cand_resp.status_code != 200:
+                    continue
+                if self._is_feed_content_type(cand_resp):
+                    cand_feed = await loop.run_in_executor(
+                        None, feedparser.parse, cand_resp.text
+                    )
+                    if len(cand_feed.entries) > 0:
+                        logger.info("Found feed via <a> tag scan", url=candidate)
+                        return await self._format_response(candidate, cand_feed)
+                elif "html" in cand_resp.headers.get("content-type", "").lower():
+                    # Candidate is an HTML *index page* (common on French
+                    # mainstream sites : /rss, /rss/, /flux-rss, …).
+                    # Defer recursion to Stage 6 so we dedupe with the
+                    # blind-tried index paths.
+                    html_index_candidates.append(candidate)
+            except Exception:
+                continue
+        return None
 
-        # ── Stage 4: Expanded suffix fallback + Content-Type check
-        # Runs BEFORE index-page follow so that "/rss" appended to the
-        # *current* URL (e.g. radiofrance.fr/franceculture + /rss =
-        # /franceculture/rss, a direct XML feed) is tried before the
-        # <a href="/rss"> link on the page — which urljoins to the
-        # *root* (radiofrance.fr/rss, a global HTML index listing all
-        # stations, from which we'd pick the wrong feed).
+    async def _try_suffixes(
+        self,
+        url: str,
+        loop: asyncio.AbstractEventLoop,
+        detection_log: list[str],
+    ) -> DetectedFeed | None:
+        """Stage 5: expanded suffix fallback + Content-Type check.
+
+        Ranks BEFORE index-page follow so that "/rss" appended to the
+        *current* URL (e.g. radiofrance.fr/franceculture + /rss =
+        /franceculture/rss, a direct XML feed) wins over the
+        <a href="/rss"> link on the page — which urljoins to the *root*
+        (radiofrance.fr/rss, a global HTML index listing all stations,
+        from which we'd pick the wrong feed).
+        """
         common_suffixes = [
             "/feed",  # WordPress
             "/?feed=rss2",  # WordPress with flat permalinks (no pretty URLs)
@@ -1023,40 +1192,58 @@ class RSSParser:
         detection_log.append(
             f"suffix_fallback=tried_{suffix_tried['n']}_of_{len(common_suffixes)}"
         )
+        return None
+
+    async def _try_wordpress(
+        self,
+        url: str,
+        soup: BeautifulSoup,
+        loop: asyncio.AbstractEventLoop,
+        detection_log: list[str],
+    ) -> DetectedFeed | None:
+        """Stage 5b: WordPress reinforcement (Story 12.2).
 
-        # ── Stage 4b/4c: WordPress reinforcement (Story 12.2) ─────
-        # All cheap probes have failed. WordPress is a large share of the FR
-        # long tail, so it's worth two targeted rungs before giving up:
-        #   4b — resolve the canonical /feed/ via curl-cffi (a REAL feed), and
-        #   4c — if /feed/ is truly gone, expose the open REST API as a
-        #        synthetic internal feed (no migration, SyncService unchanged).
+        WordPress is a large share of the FR long tail, so it's worth two
+        targeted rungs when the cheap probes fail:
+          - resolve the canonical /feed/ via curl-cffi (a REAL feed), and
+          - if /feed/ is truly gone, expose the open REST API as a
+            synthetic internal feed (no migration, SyncService unchanged).
+        """
         root = self._host_root(url)
-        if root and await self._detect_wordpress(root, soup):
-            detection_log.append("wordpress=detected")
-            wp_feed = await self._try_wordpress_feed(root, loop)
-            if wp_feed is not None:
-                detection_log.append(f"wp_feed={wp_feed.feed_url}")
-                return wp_feed
-            wp_rest = await self._try_wordpress_rest(root)
-            if wp_rest is not None:
-                detection_log.append(f"wp_rest={wp_rest.feed_url}")
-                return wp_rest
-            detection_log.append("wordpress=no_feed")
-
-        # ── Stage 5: Feed index page follow (Pattern A) ───────────
-        # Last resort: some sites (Les Echos, L'Express) require
-        # fetching an HTML "RSS directory" page (/rss/, /flux-rss/)
-        # and scanning it for the real feed URLs. Includes a
-        # curl-cffi fallback for anti-bot-protected directories.
+        if not root or not await self._detect_wordpress(root, soup):
+            return None
+        detection_log.append("wordpress=detected")
+        wp_feed = await self._try_wordpress_feed(root, loop)
+        if wp_feed is not None:
+            detection_log.append(f"wp_feed={wp_feed.feed_url}")
+            return wp_feed
+        wp_rest = await self._try_wordpress_rest(root)
+        if wp_rest is not None:
+            detection_log.append(f"wp_rest={wp_rest.feed_url}")
+            return wp_rest
+        detection_log.append("wordpress=no_feed")
+        return None
+
+    async def _try_index_pages(
+        self,
+        url: str,
+        html_index_candidates: list[str],
+        loop: asyncio.AbstractEventLoop,
+        detection_log: list[str],
+    ) -> DetectedFeed | None:
+        """Stage 6: feed index page follow (Pattern A).
+
+        Last resort: some sites (Les Echos, L'Express) require fetching an
+        HTML "RSS directory" page (/rss/, /flux-rss/) and scanning it for
+        the real feed URLs. Includes a curl-cffi fallback for
+        anti-bot-protected directories.
+        """
         index_feed = await self._try_feed_index_pages(url, html_index_candidates, loop)
         if index_feed is not None:
             detection_log.append(f"index_page={index_feed.feed_url}")
             return index_feed
         detection_log.append("index_page=none")
-
-        # ── Failure: detailed diagnostic ──────────────────────────
-        log_str = "; ".join(detection_log)
-        raise ValueError(f"No RSS feed found. Tried: {log_str}")
+        return None
 
     # ─── Response Formatting ──────────────────────────────────────
 
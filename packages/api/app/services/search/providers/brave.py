@@ -4,6 +4,7 @@ import httpx
 import structlog
 
 from app.config import get_settings
+from app.services.outbound_http import OUTBOUND_HTTP
 
 logger = structlog.get_logger()
 
@@ -33,31 +34,30 @@ class BraveSearchProvider:
             return []
 
         try:
-            async with httpx.AsyncClient(timeout=2.0) as client:
-                resp = await client.get(
-                    BRAVE_SEARCH_URL,
-                    params={
-                        # Send the bare query — appending "RSS feed site blog"
-                        # systematically pulled in SEO listicles ("Top 60 best
-                        # political RSS feeds…") instead of real sources.
-                        "q": query,
-                        "count": str(count),
-                        "safesearch": "moderate",
-                        "result_filter": "web",
-                        # Bias the index toward French content. Without this,
-                        # "politis" ranks Politis Cyprus above Politis.fr.
-                        "country": "fr",
-                        "search_lang": "fr",
-                        "ui_lang": "fr-FR",
-                    },
-                    headers={
-                        "Accept": "application/json",
-                        "Accept-Encoding": "gzip",
-                        "X-Subscription-Token": self._api_key,
-                    },
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await OUTBOUND_HTTP.client("search").get(
+                BRAVE_SEARCH_URL,
+                params={
+                    # Send the bare query — appending "RSS feed site blog"
+                    # systematically pulled in SEO listicles ("Top 60 best
+                    # political RSS feeds…") instead of real sources.
+                    "q": query,
+                    "count": str(count),
+                    "safesearch": "moderate",
+                    "result_filter": "web",
+                    # Bias the index toward French content. Without this,
+                    # "politis" ranks Politis Cyprus above Politis.fr.
+                    "country": "fr",
+                    "search_lang": "fr",
+                    "ui_lang": "fr-FR",
+                },
+                headers={
+                    "Accept": "application/json",
+                    "Accept-Encoding": "gzip",
+                    "X-Subscription-Token": self._api_key,
+                },
+            )
+            resp.raise_for_status()
+            data = resp.json()
 
             results = []
             for item in data.get("web", {}).get("results", []):
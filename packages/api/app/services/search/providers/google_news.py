@@ -3,9 +3,10 @@
 from urllib.parse import quote, urlparse
 
 import feedparser
-import httpx
 import structlog
 
+from app.services.outbound_http import OUTBOUND_HTTP, timeout_budget
+
 logger = structlog.get_logger()
 
 USER_AGENT = (
@@ -31,21 +32,20 @@ class GoogleNewsProvider:
         )
 
         try:
-            async with httpx.AsyncClient(
-                timeout=2.0,
+            resp = await OUTBOUND_HTTP.client("news").get(
+                url,
                 headers={"User-Agent": USER_AGENT},
-                follow_redirects=True,
-            ) as client:
-                resp = await client.get(url)
-                if resp.status_code != 200:
-                    logger.warning(
-                        "google_news.http_error",
-                        query=query,
-                        status=resp.status_code,
-                    )
-                    return []
+                timeout=timeout_budget(2.0),
+            )
+            if resp.status_code != 200:
+                logger.warning(
+                    "google_news.http_error",
+                    query=query,
+                    status=resp.status_code,
+                )
+                return []
 
-                feed = feedparser.parse(resp.content)
+            feed = feedparser.parse(resp.content)
 
             seen_domains: set[str] = set()
             base_urls: list[str] = []
@@ -3,6 +3,8 @@
 import httpx
 import structlog
 
+from app.services.outbound_http import OUTBOUND_HTTP
+
 logger = structlog.get_logger()
 
 REDDIT_SEARCH_URL = "https://www.reddit.com/search.json"
@@ -18,22 +20,19 @@ class RedditSearchProvider:
         Returns [] on error (graceful degradation).
         """
         try:
-            async with httpx.AsyncClient(
-                timeout=2.0,
+            resp = await OUTBOUND_HTTP.client("search").get(
+                REDDIT_SEARCH_URL,
+                params={
+                    "q": query,
+                    "type": "sr",
+                    "limit": str(limit),
+                },
                 headers={
                     "User-Agent": "Facteur/1.0 (RSS reader; +https://facteur.app)",
                 },
-            ) as client:
-                resp = await client.get(
-                    REDDIT_SEARCH_URL,
-                    params={
-                        "q": query,
-                        "type": "sr",
-                        "limit": str(limit),
-                    },
-                )
-                resp.raise_for_status()
-                data = resp.json()
+            )
+            resp.raise_for_status()
+            data = resp.json()
 
             results = []
             for child in data.get("data", {}).get("children", []):
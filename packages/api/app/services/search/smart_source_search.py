@@ -19,9 +19,11 @@ from app.models.host_feed_resolution import HostFeedResolution
 from app.models.source import Source
 from app.models.source_search_log import SourceSearchLog
 from app.models.user import UserInterest
+from app.services.feed_detection_cache import FEED_DETECTION_CACHE
 from app.services.observability.cost_budget import is_over_cap, monthly_call_count
 from app.services.observability.usage_recorder import track_api_call
 from app.services.rss_parser import (
+    DetectedFeed,
     RSSParser,
     normalize_input_url,
     scheme_host_root,
@@ -942,13 +944,20 @@ class SmartSourceSearchService:
         return host
 
     async def _cached_detect_feed(self, url: str) -> dict | None:
-        """Try the host_feed_resolutions cache before doing real detection.
-
-        Stores both positive (feed found) and negative (no feed) results so
-        Brave/GNews don't repeat the ~4s detection budget on every request
-        for the same publisher. All cache I/O is best-effort: on any error
-        we fall through to direct detection.
+        """Try the detection caches before doing real detection.
+
+        The in-process ``FEED_DETECTION_CACHE`` (shared with every
+        ``RSSParser.detect`` call, e.g. adding the source right after the
+        search) comes first, then the durable host_feed_resolutions table.
+        The table stores both positive (feed found) and negative (no feed)
+        results so Brave/GNews don't repeat the ~4s detection budget on every
+        request for the same publisher. All cache I/O is best-effort: on any
+        error we fall through to direct detection.
         """
+        found, detected = FEED_DETECTION_CACHE.lookup(url)
+        if found:
+            return self._feed_meta(detected) if detected is not None else None
+
         key = self._cache_key(url)
         if not key:
             return await self._try_detect_feed(url)
@@ -1024,6 +1033,24 @@ class SmartSourceSearchService:
         except Exception as exc:
             logger.debug("host_feed_cache.upsert_failed", host=key, error=str(exc))
 
+    @staticmethod
+    def _feed_meta(detected: DetectedFeed) -> dict:
+        """Enrichment dict of a detected feed (search result fields)."""
+        return {
+            "feed_url": detected.feed_url,
+            "name": detected.title,
+            "type": detected.feed_type,
+            "favicon_url": detected.logo_url,
+            "description": detected.description,
+            "recent_items": [
+                {
+                    "title": e["title"],
+                    "published_at": e.get("published_at", ""),
+                }
+                for e in detected.entries[:3]
+            ],
+        }
+
     async def _try_detect_feed(self, url: str) -> dict | None:
         """Try RSS feed detection on a URL. Returns enrichment dict or None.
 
@@ -1034,20 +1061,7 @@ class SmartSourceSearchService:
             detected = await asyncio.wait_for(
                 self.rss_parser.detect(url), timeout=FEED_DETECT_TIMEOUT_S
             )
-            return {
-                "feed_url": detected.feed_url,
-                "name": detected.title,
-                "type": detected.feed_type,
-                "favicon_url": detected.logo_url,
-                "description": detected.description,
-                "recent_items": [
-                    {
-                        "title": e["title"],
-                        "published_at": e.get("published_at", ""),
-                    }
-                    for e in detected.entries[:3]
-                ],
-            }
+            return self._feed_meta(detected)
         except TimeoutError:
             logger.debug("smart_search.feed_detect_timeout", url=url)
             return None
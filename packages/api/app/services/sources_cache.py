@@ -17,6 +17,21 @@ Invalidation
 Every mutation that affects the catalog visible to a user MUST call
 :py:meth:`SourcesCache.invalidate`. Stale-but-correct is acceptable for
 passive reads (≤ 30 s blink); inconsistent-after-write is not.
+
+Stale-while-revalidate
+----------------------
+Opt-in via ``SOURCES_CACHE_STALE_SECONDS`` (default 0 = off), same contract
+as the feed cache: past the TTL the entry stays servable that many more
+seconds through :py:meth:`SourcesCache.get_or_stale`, while
+:py:meth:`SourcesCache.refresh_in_background` recomputes it on the shared
+``BACKGROUND_REFRESHER`` (global concurrency cap). Per-user generations
+drop a refresh that raced an invalidation.
+
+Memory
+------
+Entries sit in a ``BoundedLRU`` under ``SOURCES_CACHE_MAX_BYTES`` (default
+16 MiB, ``0`` = unbounded), sized at ~1 KiB per ``SourceResponse``; locks and
+generations are bounded too (cf. :mod:`app.services.bounded_cache`).
 """
 
 from __future__ import annotations
@@ -25,10 +40,18 @@ import asyncio
 import logging
 import os
 import time
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from uuid import UUID
 
 from app.schemas.source import SourceCatalogResponse
+from app.services.bounded_cache import (
+    BoundedLRU,
+    GenerationCounters,
+    LockRegistry,
+    max_bytes_from_env,
+)
+from app.services.cache_refresh import BACKGROUND_REFRESHER
 
 logger = logging.getLogger(__name__)
 
@@ -43,10 +66,35 @@ def _ttl_from_env() -> float:
         return 30.0
 
 
+def _stale_seconds_from_env() -> float:
+    """Stale-while-revalidate window beyond the TTL. ``0`` (default) = off."""
+    raw = os.environ.get("SOURCES_CACHE_STALE_SECONDS", "0")
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        logger.warning("sources_cache_invalid_stale raw=%s, defaulting to 0s", raw)
+        return 0.0
+
+
+# Estimation par source (modèle pydantic + chaînes) : pas de sérialisation
+# au `put` juste pour mesurer.
+_SOURCE_BYTES = 1024
+
+
+def _max_bytes_from_env() -> int:
+    """``SOURCES_CACHE_MAX_BYTES`` — ``0`` disables the bound."""
+    return max_bytes_from_env("SOURCES_CACHE_MAX_BYTES", 16 * 1024 * 1024)
+
+
 @dataclass
 class _Entry:
     expires_at: float
     payload: SourceCatalogResponse
+    fresh_until: float = 0.0
+
+
+def _entry_bytes(entry: _Entry) -> int:
+    return _SOURCE_BYTES * (len(entry.payload.curated) + len(entry.payload.custom))
 
 
 class SourcesCache:
@@ -55,12 +103,27 @@ class SourcesCache:
     See ``feed_cache.FeedPageCache`` for the rationale on locks and TTL.
     """
 
-    def __init__(self, ttl_seconds: float | None = None) -> None:
+    def __init__(
+        self,
+        ttl_seconds: float | None = None,
+        stale_seconds: float | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
         self._ttl = ttl_seconds if ttl_seconds is not None else _ttl_from_env()
-        self._entries: dict[UUID, _Entry] = {}
-        self._locks: dict[UUID, asyncio.Lock] = {}
+        self._stale = (
+            stale_seconds if stale_seconds is not None else _stale_seconds_from_env()
+        )
+        self._entries: BoundedLRU[UUID, _Entry] = BoundedLRU(
+            max_bytes=max_bytes if max_bytes is not None else _max_bytes_from_env(),
+            sizeof=_entry_bytes,
+        )
+        self._locks: LockRegistry[UUID, asyncio.Lock] = LockRegistry(
+            lambda _: asyncio.Lock()
+        )
+        self._generations: GenerationCounters[UUID] = GenerationCounters()
         self._hits = 0
         self._misses = 0
+        self._stale_hits = 0
         self._invalidations = 0
 
     @property
@@ -72,32 +135,78 @@ class SourcesCache:
         return self._ttl > 0
 
     def lock(self, user_id: UUID) -> asyncio.Lock:
-        lock = self._locks.get(user_id)
-        if lock is None:
-            lock = asyncio.Lock()
-            self._locks[user_id] = lock
-        return lock
+        return self._locks.get(user_id)
 
     def get(self, user_id: UUID) -> SourceCatalogResponse | None:
+        payload, is_stale = self.get_or_stale(user_id)
+        return None if is_stale else payload
+
+    def get_or_stale(self, user_id: UUID) -> tuple[SourceCatalogResponse | None, bool]:
+        """``(payload, is_stale)`` — a stale payload only in the
+        stale-while-revalidate window, never when the mode is off."""
         if not self.enabled:
-            return None
+            return None, False
         entry = self._entries.get(user_id)
-        if entry is None or entry.expires_at < time.monotonic():
+        now = time.monotonic()
+        if entry is None or entry.expires_at < now:
+            if entry is not None:
+                self._entries.pop(user_id)
             self._misses += 1
-            return None
+            return None, False
+        if entry.fresh_until < now:
+            self._stale_hits += 1
+            return entry.payload, True
         self._hits += 1
-        return entry.payload
-
-    def put(self, user_id: UUID, payload: SourceCatalogResponse) -> None:
+        return entry.payload, False
+
+    def generation(self, user_id: UUID) -> int:
+        """Invalidation counter of ``user_id`` — capture before computing,
+        hand back to :py:meth:`put` (cf. ``FeedPageCache.generation``)."""
+        return self._generations.get(user_id)
+
+    def put(
+        self,
+        user_id: UUID,
+        payload: SourceCatalogResponse,
+        *,
+        generation: int | None = None,
+    ) -> None:
         if not self.enabled:
             return
-        self._entries[user_id] = _Entry(
-            expires_at=time.monotonic() + self._ttl,
-            payload=payload,
+        if generation is not None and generation != self.generation(user_id):
+            return
+        now = time.monotonic()
+        self._entries.put(
+            user_id,
+            _Entry(
+                expires_at=now + self._ttl + self._stale,
+                payload=payload,
+                fresh_until=now + self._ttl,
+            ),
         )
 
+    def refresh_in_background(
+        self,
+        user_id: UUID,
+        compute: Callable[[], Awaitable[SourceCatalogResponse]],
+    ) -> bool:
+        """Recompute a stale entry off the request path (shared cap, one
+        refresh per user, generation-guarded ``put``)."""
+
+        async def _refresh() -> None:
+            async with self.lock(user_id):
+                entry = self._entries.peek(user_id)
+                if entry is not None and entry.fresh_until >= time.monotonic():
+                    return
+                generation = self.generation(user_id)
+                self.put(user_id, await compute(), generation=generation)
+
+        return BACKGROUND_REFRESHER.schedule(("sources", user_id), _refresh)
+
     def invalidate(self, user_id: UUID) -> None:
-        if self._entries.pop(user_id, None) is not None:
+        # Bumpé même sans entrée : un compute en vol ne doit pas la recréer.
+        self._generations.bump(user_id)
+        if self._entries.pop(user_id) is not None:
             self._invalidations += 1
 
     def stats(self) -> dict[str, int | float]:
@@ -105,17 +214,23 @@ class SourcesCache:
         return {
             "hits": self._hits,
             "misses": self._misses,
+            "stale_hits": self._stale_hits,
             "invalidations": self._invalidations,
             "size": len(self._entries),
             "hit_rate": (self._hits / total) if total else 0.0,
             "ttl_seconds": self._ttl,
+            "stale_seconds": self._stale,
+            **{k: v for k, v in self._entries.stats().items() if k != "entries"},
+            **self._locks.stats(),
         }
 
     def clear(self) -> None:
         self._entries.clear()
         self._locks.clear()
+        self._generations.clear()
         self._hits = 0
         self._misses = 0
+        self._stale_hits = 0
         self._invalidations = 0
 
 
@@ -0,0 +1,124 @@
+"""Planification adaptative du sync RSS — un `next_sync_at` par source.
+
+Le sync fetchait toutes les sources au même intervalle fixe, par rafale de
+30 minutes : une agence qui publie 100 articles/jour et un blog mensuel
+coûtaient autant. Ici chaque source reçoit sa prochaine échéance, calculée à
+partir de :
+
+- sa **cadence de parution** observée (`alert_cadence.cadence_per_week`, même
+  fenêtre 30 j clampée sur l'âge réel que le devis de bruit des alertes) : on
+  repasse ~2 fois par intervalle moyen entre deux articles ;
+- son **audience** (utilisateurs qui la suivent) : une source suivie est
+  rafraîchie plus souvent qu'une source de veille que personne ne lit ;
+- ses **échecs consécutifs** de sync (`Source.sync_failure_count`) : backoff
+  exponentiel, plafonné à `MAX_BACKOFF`.
+
+L'intervalle est borné par `rss_sync_min_interval_minutes` /
+`rss_sync_max_interval_minutes` et décalé d'un jitter stable par source (±10 %)
+pour lisser la charge. Les sources dues forment la file de priorité : index
+sur `next_sync_at`, vidée en continu par `SyncService.sync_due_sources`.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.content import Content
+from app.models.enums import InterestState
+from app.models.source import UserSource
+from app.services.alert_cadence import FREQUENCY_WINDOW_DAYS, cadence_per_week
+
+FOLLOWED_SOURCE_STATES = (InterestState.FOLLOWED, InterestState.FAVORITE)
+
+#: Passages par intervalle moyen entre deux parutions.
+SAMPLES_PER_ARTICLE = 2
+#: Plafond du backoff sur échecs (au-delà de l'intervalle max).
+MAX_BACKOFF = timedelta(hours=24)
+#: Amplitude du jitter stable par source.
+JITTER_RATIO = 0.1
+
+
+@dataclass(frozen=True)
+class SourceSyncStats:
+    """Entrées de la cadence d'une source (cf. `source_frequency_stats`)."""
+
+    articles_30d: int = 0
+    oldest_content_at: datetime | None = None
+    followers: int = 0
+
+
+def next_sync_delay(
+    stats: SourceSyncStats,
+    *,
+    source_id: UUID,
+    failures: int,
+    now: datetime,
+    min_interval: timedelta,
+    max_interval: timedelta,
+) -> timedelta:
+    """Délai avant le prochain sync de la source."""
+    per_day = cadence_per_week(stats.articles_30d, stats.oldest_content_at, now) / 7
+    if per_day <= 0:
+        interval = max_interval
+    else:
+        interval = timedelta(days=1) / (per_day * SAMPLES_PER_ARTICLE)
+    # 1 abonné → ×0,67 ; 7 → ×0,4 ; 63 → ×0,25.
+    interval /= 1 + 0.5 * math.log2(1 + stats.followers)
+    interval = min(max(interval, min_interval), max_interval)
+    if failures > 0:
+        interval = min(interval * 2 ** min(failures, 16), MAX_BACKOFF)
+    # Jitter stable (dérivé de l'id) : pas de re-synchronisation des échéances.
+    jitter = ((source_id.int % 201) - 100) / 100 * JITTER_RATIO
+    return interval * (1 + jitter)
+
+
+async def load_sync_stats(
+    session: AsyncSession, source_ids: list[UUID], *, now: datetime
+) -> dict[UUID, SourceSyncStats]:
+    """`SourceSyncStats` d'un lot de sources en deux allers-retours.
+
+    Version groupée de `source_alert_producer.source_frequency_stats` (même
+    `COUNT(*) FILTER` + `MIN`), plus le nombre d'abonnés.
+    """
+    if not source_ids:
+        return {}
+    window_start = now - timedelta(days=FREQUENCY_WINDOW_DAYS)
+    frequency = (
+        await session.execute(
+            select(
+                Content.source_id,
+                func.count().filter(Content.published_at >= window_start),
+                func.min(Content.published_at),
+            )
+            .where(Content.source_id.in_(source_ids))
+            .group_by(Content.source_id)
+        )
+    ).all()
+    followers = dict(
+        (
+            await session.execute(
+                select(UserSource.source_id, func.count())
+                .where(
+                    UserSource.source_id.in_(source_ids),
+                    UserSource.state.in_(FOLLOWED_SOURCE_STATES),
+                )
+                .group_by(UserSource.source_id)
+            )
+        ).all()
+    )
+    stats = {
+        sid: SourceSyncStats(followers=followers.get(sid, 0)) for sid in source_ids
+    }
+    for source_id, articles_30d, oldest_content_at in frequency:
+        stats[source_id] = SourceSyncStats(
+            articles_30d=articles_30d,
+            oldest_content_at=oldest_content_at,
+            followers=followers.get(source_id, 0),
+        )
+    return stats
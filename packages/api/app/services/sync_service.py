@@ -1,43 +1,153 @@
 import asyncio
 import copy
 import datetime
-import html
-import re
+import hashlib
+from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from uuid import UUID, uuid4
 
-import certifi
 import feedparser
 import httpx
 import structlog
-from sqlalchemy import select, update
+from sqlalchemy import and_, insert, or_, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
 from app.models.content import Content
-from app.models.enums import ContentType, SourceType
+from app.models.enums import ContentType
 from app.models.source import Source, UserSource
 from app.models.veille import VeilleSource
+from app.services.article_head_fetcher import ArticleHeadFetcher
 from app.services.content_quality import compute_content_quality
+from app.services.feed_entry_parser import (
+    EntrySource,
+    analyze_feed,
+    detect_paywalls,
+    extract_youtube_video_id,
+    is_valid_thumbnail,
+    optimize_thumbnail_url,
+    parse_duration,
+    parse_entry,
+)
+from app.services.feed_ingest_pool import FEED_INGEST_POOL
+from app.services.feed_stream import FeedTruncator
 from app.services.http_fetch import fetch_with_impersonation, is_antibot_response
 from app.services.ml.language_filter import detect_language
+from app.services.outbound_http import OUTBOUND_HTTP
 from app.services.paywall_detector import detect_paywall
+from app.services.sync_scheduler import load_sync_stats, next_sync_delay
 
 logger = structlog.get_logger()
 
 
+@dataclass(frozen=True)
+class FeedFetch:
+    """Résultat d'un fetch de flux (conditionnel ou non)."""
+
+    # None ⇔ 304 Not Modified : rien à parser.
+    text: str | None
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def not_modified(self) -> bool:
+        return self.text is None
+
+    @property
+    def body_hash(self) -> str | None:
+        if self.text is None:
+            return None
+        return hashlib.sha256(self.text.encode("utf-8", "replace")).hexdigest()
+
+
+# Entrées traitées par passage (les plus récentes en tête de flux).
+MAX_FEED_ENTRIES = 50
+# Gros flux lus en flux : lot d'entrées dont on vérifie qu'elles sont déjà
+# connues (toutes connues → le reste du flux l'est aussi, on arrête).
+KNOWN_PROBE_BATCH = 10
+
+# Un contenu connu mais encore gratuit et plus jeune que cette fenêtre repasse
+# par le HEAD article + `detect_paywall` : le seed à l'ajout d'une source saute
+# ce HEAD et compte sur le sync de fond qui suit pour l'upgrade false→true.
+PAYWALL_RECHECK_WINDOW = datetime.timedelta(hours=1)
+
+# Colonnes lues/écrites par le backfill d'un contenu déjà connu.
+_BACKFILL_COLUMNS = (
+    "thumbnail_url",
+    "description",
+    "html_content",
+    "audio_url",
+    "is_paid",
+    "content_quality",
+)
+
+
+def _backfill_changes(current: dict, data: dict) -> dict:
+    """Règles de backfill d'un contenu existant : colonnes à réécrire.
+
+    `current` porte les `_BACKFILL_COLUMNS` de la ligne ; partagé par
+    `_save_content` (ORM) et `_save_contents` (UPDATE groupé).
+    """
+    changes: dict = {}
+    # Backfill thumbnail / description if missing
+    if not current["thumbnail_url"] and data.get("thumbnail_url"):
+        changes["thumbnail_url"] = data["thumbnail_url"]
+    if not current["description"] and data.get("description"):
+        changes["description"] = data["description"]
+
+    # Story 5.2: Backfill html_content and audio_url if missing
+    if not current["html_content"] and data.get("html_content"):
+        changes["html_content"] = data["html_content"]
+        changes["content_quality"] = data.get("content_quality")
+    if not current["audio_url"] and data.get("audio_url"):
+        changes["audio_url"] = data["audio_url"]
+
+    # Paywall: upgrade false→true only (never downgrade paid→free)
+    if data.get("is_paid") and not current["is_paid"]:
+        changes["is_paid"] = True
+
+    # Compute current quality if not set
+    merged = {**current, **changes}
+    if not merged["content_quality"]:
+        changes["content_quality"] = compute_content_quality(
+            merged["html_content"] or merged["description"]
+        )
+    return changes
+
+
+def _paywall_pending(row: dict, since: datetime.datetime) -> bool:
+    """Contenu connu dont le paywall reste à confirmer (cf. fenêtre)."""
+    created_at = row.get("created_at")
+    return not row["is_paid"] and created_at is not None and created_at >= since
+
+
 class SyncService:
     def __init__(self, session: AsyncSession, session_maker=None):
         self.session = session
         self.session_maker = session_maker
-        self.client = httpx.AsyncClient(
-            timeout=30.0,
-            follow_redirects=True,
-            verify=certifi.where(),
-            headers={
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            },
+        # Client dédié sur le pool partagé « feeds » (keep-alive, HTTP/2,
+        # cache DNS) : le fermer ne ferme pas les connexions du pool.
+        self.client = OUTBOUND_HTTP.session("feeds")
+        # HEAD article du paywall : partagé par les copies `copy.copy`, donc
+        # par toutes les sources d'un même passage.
+        settings = get_settings()
+        self.head_fetcher = ArticleHeadFetcher(
+            self.client,
+            concurrency=settings.rss_sync_head_concurrency,
+            per_host=settings.rss_sync_head_per_host,
+            host_interval_seconds=settings.rss_sync_head_host_interval_ms / 1000,
         )
+        # Compteurs du GET conditionnel, partagés par les copies `copy.copy`
+        # de `sync_all_sources` (même dict).
+        self.feed_stats = {
+            "fetched": 0,
+            "not_modified": 0,
+            "unchanged_body": 0,
+            "known_skipped": 0,
+            "streamed": 0,
+        }
 
     async def close(self):
         await self.client.aclose()
@@ -64,10 +174,9 @@ class SyncService:
                 await session.rollback()
                 raise
 
-    async def sync_all_sources(self):
-        """Synchronise toutes les sources actives avec une limite de concomitance."""
-        logger.info("Starting sync of all sources")
-
+    @staticmethod
+    def _syncable_clause():
+        """Sources à synchroniser : curées, custom d'un utilisateur ou de veille."""
         # Sync curated sources + user custom sources only (not indexed candidates)
         custom_source_ids = (
             select(UserSource.source_id)
@@ -78,13 +187,19 @@ class SyncService:
         # Sources niche référencées par une veille : is_curated=False et absentes
         # de user_sources → autrement jamais synchronisées (plan veille V0, Pb 1).
         veille_source_ids = select(VeilleSource.source_id).distinct().scalar_subquery()
+        return and_(
+            Source.is_active,
+            (Source.is_curated)
+            | (Source.id.in_(custom_source_ids))
+            | (Source.id.in_(veille_source_ids)),
+        )
+
+    async def sync_all_sources(self):
+        """Synchronise toutes les sources actives avec une limite de concomitance."""
+        logger.info("Starting sync of all sources")
+
         result = await self.session.execute(
-            select(Source).where(
-                Source.is_active,
-                (Source.is_curated)
-                | (Source.id.in_(custom_source_ids))
-                | (Source.id.in_(veille_source_ids)),
-            )
+            select(Source).where(self._syncable_clause())
         )
         sources = result.scalars().all()
 
@@ -92,8 +207,125 @@ class SyncService:
 
         results = {"success": 0, "failed": 0, "total_new": 0}
 
-        # Concurrency control
-        semaphore = asyncio.Semaphore(5)  # 5 sources à la fois max
+        sync_results = await self._sync_sources(sources)
+
+        for res in sync_results:
+            if isinstance(res, Exception):
+                logger.error("Source sync task failed", error=str(res))
+                results["failed"] += 1
+            elif isinstance(res, int):
+                results["success"] += 1
+                results["total_new"] += res
+
+        results["unchanged"] = (
+            self.feed_stats["not_modified"] + self.feed_stats["unchanged_body"]
+        )
+        logger.info(
+            "Sync completed",
+            results=results,
+            feed_stats=self.feed_stats,
+            head_fetch=self.head_fetcher.stats(),
+        )
+        return results
+
+    async def sync_due_sources(self, limit: int | None = None) -> dict:
+        """Synchronise les sources dont `next_sync_at` est échu, puis les replanifie.
+
+        File de priorité = index `next_sync_at` (NULL d'abord, puis les plus en
+        retard). Le lot est *réclamé* (`FOR UPDATE SKIP LOCKED` + bail de
+        `rss_sync_interval_minutes`) avant tout fetch : deux ticks ou deux
+        process ne traitent jamais la même source, et une source dont le run
+        meurt redevient due à l'expiration du bail.
+        """
+        settings = get_settings()
+        now = datetime.datetime.now(datetime.UTC)
+        async with self._short_session() as session:
+            claimed = list(
+                (
+                    await session.scalars(
+                        select(Source)
+                        .where(
+                            self._syncable_clause(),
+                            or_(
+                                Source.next_sync_at.is_(None),
+                                Source.next_sync_at <= now,
+                            ),
+                        )
+                        .order_by(Source.next_sync_at.asc().nulls_first())
+                        .limit(limit or settings.rss_sync_batch_size)
+                        .with_for_update(skip_locked=True, of=Source)
+                    )
+                ).all()
+            )
+            lease_until = now + datetime.timedelta(
+                minutes=settings.rss_sync_interval_minutes
+            )
+            for source in claimed:
+                source.next_sync_at = lease_until
+            await session.flush()
+            failures = {s.id: s.sync_failure_count or 0 for s in claimed}
+            for source in claimed:
+                session.expunge(source)
+
+        results = {"success": 0, "failed": 0, "total_new": 0, "due": len(claimed)}
+        if not claimed:
+            return results
+
+        sync_results = await self._sync_sources(claimed)
+
+        now = datetime.datetime.now(datetime.UTC)
+        min_interval = datetime.timedelta(
+            minutes=settings.rss_sync_min_interval_minutes
+        )
+        max_interval = datetime.timedelta(
+            minutes=settings.rss_sync_max_interval_minutes
+        )
+        async with self._short_session() as session:
+            stats = await load_sync_stats(session, list(failures), now=now)
+            schedule = []
+            for source, res in zip(claimed, sync_results, strict=True):
+                if isinstance(res, Exception):
+                    logger.error(
+                        "Source sync task failed", source=source.name, error=str(res)
+                    )
+                    results["failed"] += 1
+                    failure_count = failures[source.id] + 1
+                else:
+                    results["success"] += 1
+                    results["total_new"] += res
+                    failure_count = 0
+                delay = next_sync_delay(
+                    stats[source.id],
+                    source_id=source.id,
+                    failures=failure_count,
+                    now=now,
+                    min_interval=min_interval,
+                    max_interval=max_interval,
+                )
+                schedule.append(
+                    {
+                        "id": source.id,
+                        "next_sync_at": now + delay,
+                        "sync_failure_count": failure_count,
+                    }
+                )
+            await session.execute(update(Source), schedule)
+
+        results["unchanged"] = (
+            self.feed_stats["not_modified"] + self.feed_stats["unchanged_body"]
+        )
+        logger.info(
+            "Due sync completed",
+            results=results,
+            feed_stats=self.feed_stats,
+            head_fetch=self.head_fetcher.stats(),
+        )
+        return results
+
+    async def _sync_sources(self, sources) -> list[int | BaseException]:
+        """`process_source` sur chaque source, `rss_sync_concurrency` à la fois.
+        Résultats dans l'ordre des sources, exceptions comprises."""
+        semaphore = asyncio.Semaphore(get_settings().rss_sync_concurrency)
 
         async def sync_with_semaphore(source: Source):
             async with semaphore:
@@ -119,26 +351,16 @@ class SyncService:
         tasks = [sync_with_semaphore(s) for s in sources]
 
         # Exécution et collecte des résultats
-        sync_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        for res in sync_results:
-            if isinstance(res, Exception):
-                logger.error("Source sync task failed", error=str(res))
-                results["failed"] += 1
-            elif isinstance(res, int):
-                results["success"] += 1
-                results["total_new"] += res
-
-        logger.info("Sync completed", results=results)
-        return results
+        return await asyncio.gather(*tasks, return_exceptions=True)
 
     async def process_source(self, source: Source) -> int:
         """Synchronise une source spécifique.
 
         Refactor P2 (cf. docs/bugs/bug-infinite-load-requests.md) : la session
         SQLAlchemy n'est PLUS tenue ouverte pendant la boucle de 50 entries. Les
-        I/O externes (httpx, feedparser) s'exécutent hors session ;
-        chaque INSERT/UPDATE ouvre une session courte via `_short_session()`.
+        I/O externes (httpx, feedparser) s'exécutent hors session ; les
+        entrées sont ensuite écrites d'un bloc par `_save_contents`, dans une
+        session courte (`_short_session()`).
         Avant ce fix, `self.session` restait checked-out pendant 4 à 20 minutes
         par source × 5 sources en parallèle → fuite massive du pool DB.
         """
@@ -152,70 +374,135 @@ class SyncService:
         source_name = source.name
         source_url = source.feed_url
         source_paywall_config = getattr(source, "paywall_config", None)
+        source_etag = getattr(source, "feed_etag", None)
+        source_last_modified = getattr(source, "feed_last_modified", None)
+        source_body_hash = getattr(source, "feed_body_hash", None)
 
         try:
-            # 1. Fetch feed content (HORS session DB), avec repli anti-bot.
-            content = await self._fetch_feed_content(source_url)
+            # 1. Fetch feed content (HORS session DB), conditionnel, avec repli
+            # anti-bot.
+            fetch = await self._fetch_feed(
+                source_url,
+                etag=source_etag,
+                last_modified=source_last_modified,
+                known_guids=self._known_guid_set,
+            )
 
-            # 2. Parse feed (HORS session DB ; offloaded to thread pool, CPU-bound)
-            loop = asyncio.get_event_loop()
-            feed = await loop.run_in_executor(None, feedparser.parse, content)
+            # 1b. Flux inchangé (304 ou même corps) : ni parsing, ni travail
+            # par entrée.
+            unchanged = fetch.not_modified or (
+                source_body_hash is not None and fetch.body_hash == source_body_hash
+            )
+            if unchanged:
+                self.feed_stats[
+                    "not_modified" if fetch.not_modified else "unchanged_body"
+                ] += 1
+                logger.info(
+                    "feed_unchanged",
+                    source=source_name,
+                    not_modified=fetch.not_modified,
+                )
+                await self._record_feed_fetch(source_id, fetch, unchanged=True)
+                return 0
+            self.feed_stats["fetched"] += 1
+
+            # 2. Parse feed + entries (HORS session DB ; CPU-bound, dans un
+            # processus de `FEED_INGEST_POOL`, hors de l'event loop).
+            parsed_feed = await FEED_INGEST_POOL.run(
+                analyze_feed, fetch.text, EntrySource.of(source), MAX_FEED_ENTRIES
+            )
 
-            if feed.bozo:
+            if parsed_feed.bozo_error:
                 logger.warning(
                     "Feed parsing warning",
                     source=source_name,
-                    error=feed.bozo_exception,
+                    error=parsed_feed.bozo_error,
                 )
 
-            if not feed.entries:
+            if not parsed_feed.total:
                 logger.warning("No entries found in feed", source=source_name)
                 # On met quand même à jour last_synced_at pour ne pas re-tenter
                 # immédiatement.
-                await self._update_source_last_synced(source_id)
+                await self._record_feed_fetch(source_id, fetch, unchanged=False)
                 return 0
 
-            new_contents_count = 0
-
-            # 3. Process entries — chaque itération ouvre des sessions COURTES.
-            for entry in feed.entries[:50]:
-                content_data = self._parse_entry(entry, source)
-                if not content_data:
+            # 3. UN SELECT des guids déjà connus.
+            parsed = parsed_feed.entries
+            known = await self._load_known_contents(
+                [content_data["guid"] for content_data in parsed]
+            )
+            recheck_since = datetime.datetime.now(datetime.UTC) - PAYWALL_RECHECK_WINDOW
+
+            # 3a. Entrées à vérifier (nouvelles ou paywall à confirmer) ; les
+            # autres ne passent au lot que s'il reste une colonne à backfiller.
+            batch: list[dict] = []
+            to_check: list[dict] = []
+            for content_data in parsed:
+                row = known.get(content_data["guid"])
+                if row is not None and not _paywall_pending(row, recheck_since):
+                    # Déjà connu : ni HEAD article ni détection paywall.
+                    self.feed_stats["known_skipped"] += 1
+                    if _backfill_changes(row, content_data):
+                        batch.append(content_data)
                     continue
-
-                # 3a. HTML head fetch (HORS session DB) — paywall detection
-                html_head = None
-                if content_data.get("content_type") == ContentType.ARTICLE:
-                    html_head = await self._fetch_html_head(content_data.get("url", ""))
-
-                # 3b. Paywall detection (pure CPU, HORS session DB)
-                content_data["is_paid"] = detect_paywall(
-                    title=content_data.get("title", ""),
-                    description=content_data.get("description"),
-                    url=content_data.get("url", ""),
-                    html_content=content_data.get("html_content"),
-                    source_id=str(source_id),
-                    paywall_config=source_paywall_config,
-                    html_head=html_head,
+                to_check.append(content_data)
+                batch.append(content_data)
+
+            # 3b. HTML head fetch (HORS session DB), concurrents : le débit
+            # est borné par `head_fetcher` (global + par hôte).
+            articles = [
+                content_data
+                for content_data in to_check
+                if content_data.get("content_type") == ContentType.ARTICLE
+            ]
+            heads = await asyncio.gather(
+                *(
+                    self._fetch_html_head(content_data.get("url", ""))
+                    for content_data in articles
                 )
+            )
+            html_heads = {
+                id(content_data): head
+                for content_data, head in zip(articles, heads, strict=True)
+            }
 
-                # 3c. Upsert atomique (session COURTE).
-                try:
-                    is_new = await self._save_content(content_data)
-                except SQLAlchemyError as save_err:
-                    logger.warning(
-                        "Failed to save content",
-                        source=source_name,
-                        guid=content_data.get("guid"),
-                        error=str(save_err),
-                    )
-                    continue
+            # 3c. Paywall detection (CPU, dans le pool)
+            if to_check:
+                verdicts = await FEED_INGEST_POOL.run(
+                    detect_paywalls,
+                    [
+                        {
+                            "title": content_data.get("title", ""),
+                            "description": content_data.get("description"),
+                            "url": content_data.get("url", ""),
+                            "html_content": content_data.get("html_content"),
+                            "source_id": str(source_id),
+                            "paywall_config": source_paywall_config,
+                            "html_head": html_heads.get(id(content_data)),
+                        }
+                        for content_data in to_check
+                    ],
+                )
+                for content_data, is_paid in zip(to_check, verdicts, strict=True):
+                    content_data["is_paid"] = is_paid
 
-                if is_new:
-                    new_contents_count += 1
+            # 3d. Upsert groupé (UNE session COURTE) ; en cas d'échec, repli
+            # entrée par entrée pour qu'une ligne fautive n'emporte pas le lot.
+            try:
+                new_contents_count = await self._save_contents(batch, known=known)
+            except SQLAlchemyError as batch_err:
+                logger.warning(
+                    "Bulk save failed, falling back to per-entry saves",
+                    source=source_name,
+                    entries=len(batch),
+                    error=str(batch_err),
+                )
+                new_contents_count = await self._save_each(batch, source_name)
 
-            # 4. Update source.last_synced_at en session COURTE.
-            await self._update_source_last_synced(source_id)
+            # 4. last_synced_at + validateurs en session COURTE — seulement
+            # une fois toutes les entrées traitées : une erreur en cours de
+            # boucle ne doit pas faire sauter ce corps au prochain cycle.
+            await self._record_feed_fetch(source_id, fetch, unchanged=False)
 
             return new_contents_count
 
@@ -223,6 +510,25 @@ class SyncService:
             logger.error("Error processing source", source=source_name, error=str(e))
             raise e
 
+    async def _save_each(self, batch: list[dict], source_name: str) -> int:
+        """`_save_content` entrée par entrée (session COURTE chacune)."""
+        new_contents_count = 0
+        for content_data in batch:
+            try:
+                is_new = await self._save_content(content_data)
+            except SQLAlchemyError as save_err:
+                logger.warning(
+                    "Failed to save content",
+                    source=source_name,
+                    guid=content_data.get("guid"),
+                    error=str(save_err),
+                )
+                continue
+
+            if is_new:
+                new_contents_count += 1
+        return new_contents_count
+
     async def seed_recent_content(self, source: Source, *, max_items: int = 10) -> int:
         """Insert a bounded slice of the freshest entries synchronously.
 
@@ -264,330 +570,143 @@ class SyncService:
 
     def _parse_entry(self, entry, source: Source) -> dict | None:
         """Extrait les données pertinentes selon le type de source."""
-        try:
-            # Common fields
-            title = entry.get("title", "No Title")
-            link = entry.get("link", "")
-            guid = entry.get("id", link)  # Fallback to link if no ID
-
-            if not link:
-                return None
-
-            # Date handling
-            published_at = datetime.datetime.utcnow()
-            if hasattr(entry, "published_parsed") and entry.published_parsed:
-                published_at = datetime.datetime(*entry.published_parsed[:6])
-            elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
-                published_at = datetime.datetime(*entry.updated_parsed[:6])
-
-            # Base content data
-            content_data = {
-                "source_id": source.id,
-                "source_name": source.name,
-                "title": title,
-                "url": link,
-                "guid": guid,
-                "published_at": published_at,
-                "content_type": ContentType.ARTICLE,  # Default
-                "description": None,
-                "thumbnail_url": None,
-                "duration_seconds": None,
-                "html_content": None,  # Story 5.2: In-App Reading
-                "audio_url": None,  # Story 5.2: In-App Reading
-            }
-
-            # Type specific parsing
-            if source.type == SourceType.YOUTUBE:
-                content_data["content_type"] = ContentType.YOUTUBE
-
-                # YouTube specific details
-                if "media_group" in entry:
-                    group = entry.media_group
-                    if "media_thumbnail" in group:
-                        # Taken the largest thumbnail usually usually the first one or we can verify
-                        thumbnails = group.media_thumbnail
-                        if isinstance(thumbnails, list) and thumbnails:
-                            content_data["thumbnail_url"] = thumbnails[0]["url"]
-                    if "media_description" in group:
-                        content_data["description"] = html.unescape(
-                            group.media_description
-                        )
-
-                if not content_data["description"] and "summary" in entry:
-                    content_data["description"] = html.unescape(entry.summary)
-
-                # HD Thumbnail: extract video ID and use maxresdefault
-                video_id = self._extract_youtube_video_id(link)
-                if video_id:
-                    content_data["thumbnail_url"] = (
-                        f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
-                    )
-                elif content_data["thumbnail_url"]:
-                    content_data["thumbnail_url"] = self._optimize_thumbnail_url(
-                        content_data["thumbnail_url"]
-                    )
-
-                # Description -> html_content for in-app reading
-                if content_data["description"]:
-                    desc = content_data["description"]
-                    html_lines = html.escape(desc).replace("\n", "<br>")
-                    content_data["html_content"] = f"<p>{html_lines}</p>"
-                    content_data["content_quality"] = (
-                        "full" if len(desc) > 500 else "partial"
-                    )
-
-            elif source.type == SourceType.PODCAST:
-                content_data["content_type"] = ContentType.PODCAST
-
-                # Podcast duration
-                if "itunes_duration" in entry:
-                    duration_str = entry.itunes_duration
-                    content_data["duration_seconds"] = self._parse_duration(
-                        duration_str
-                    )
-
-                # Story 5.2: Extract audio URL from enclosure
-                if "enclosures" in entry:
-                    for enclosure in entry.enclosures:
-                        if enclosure.get("type", "").startswith("audio"):
-                            content_data["audio_url"] = enclosure.get(
-                                "href"
-                            ) or enclosure.get("url")
-                            break
-
-                # Thumbnail extraction
-                if "image" in entry and "href" in entry.image:
-                    content_data["thumbnail_url"] = entry.image.href
-                elif "itunes_image" in entry and "href" in entry.itunes_image:
-                    content_data["thumbnail_url"] = entry.itunes_image.href
-
-                description = entry.get("summary", "")
-                content_data["description"] = (
-                    html.unescape(description) if description else ""
-                )
-
-                if content_data["thumbnail_url"]:
-                    content_data["thumbnail_url"] = self._optimize_thumbnail_url(
-                        content_data["thumbnail_url"]
-                    )
-
-            else:  # ARTICLE
-                content_data["content_type"] = ContentType.ARTICLE
-                # Try to find an image in standard enclosures
-                if "media_content" in entry:
-                    for media in entry.media_content:
-                        if media.get("medium") == "image" and "url" in media:
-                            content_data["thumbnail_url"] = media["url"]
-                            break
-
-                # Fallback to enclosures
-                if not content_data["thumbnail_url"] and "enclosures" in entry:
-                    for enclosure in entry.enclosures:
-                        if enclosure.get("type", "").startswith("image/"):
-                            content_data["thumbnail_url"] = enclosure.get("href")
-                            break
-
-                description = entry.get("summary", "")
-                content_data["description"] = (
-                    html.unescape(description) if description else ""
-                )
-
-                # Fallback: Try to find image in description/content using regex
-                if not content_data["thumbnail_url"]:
-                    html_content = ""
-                    if "content" in entry:
-                        # Atom/RSS content usually in list of dicts
-                        for c in entry.content:
-                            html_content += c.get("value", "")
+        return parse_entry(entry, source)
 
-                    if not html_content:
-                        html_content = content_data["description"] or ""
-
-                    # Unescape HTML (fixes Socialter and others)
-                    html_content = html.unescape(html_content)
-
-                    # Broad regex for img src
-                    # Loop through all matches to find a valid one
-                    img_matches = re.finditer(
-                        r'<img[^>]+src=["\'](http[^"\']+)["\']', html_content
-                    )
-                    for match in img_matches:
-                        url = match.group(1)
-                        if self._is_valid_thumbnail(url):
-                            content_data["thumbnail_url"] = url
-                            break
-
-                if content_data["thumbnail_url"]:
-                    content_data["thumbnail_url"] = self._optimize_thumbnail_url(
-                        content_data["thumbnail_url"]
-                    )
-
-                # Story 5.2: Extract content:encoded for in-app reading
-                if "content" in entry:
-                    for c in entry.content:
-                        content_type = c.get("type", "")
-                        if (
-                            content_type in ("text/html", "html")
-                            or "html" in content_type
-                        ):
-                            content_data["html_content"] = c.get("value")
-                            break
-                    # Fallback to first content if no HTML found
-                    if not content_data["html_content"] and entry.content:
-                        content_data["html_content"] = entry.content[0].get("value")
-
-            quality_source = content_data.get("html_content") or content_data.get(
-                "description"
-            )
-            content_data["content_quality"] = content_data.get(
-                "content_quality"
-            ) or compute_content_quality(quality_source)
-            return content_data
-
-        except Exception as e:
-            logger.warning(
-                "Error parsing entry",
-                entry_title=entry.get("title", "Unknown"),
-                error=str(e),
-            )
-            return None
-
-    @staticmethod
-    def _extract_youtube_video_id(url: str) -> str | None:
-        """Extract video ID from a YouTube URL.
-
-        Supports patterns like:
-        - https://www.youtube.com/watch?v=VIDEO_ID
-        - https://img.youtube.com/vi/VIDEO_ID/...
-        - https://youtu.be/VIDEO_ID
-        """
-        if not url:
-            return None
-        # watch?v=VIDEO_ID
-        match = re.search(r"[?&]v=([\w-]+)", url)
-        if match:
-            return match.group(1)
-        # /vi/VIDEO_ID or /embed/VIDEO_ID
-        match = re.search(r"/(?:vi|embed)/([\w-]+)", url)
-        if match:
-            return match.group(1)
-        # youtu.be/VIDEO_ID
-        match = re.search(r"youtu\.be/([\w-]+)", url)
-        if match:
-            return match.group(1)
-        return None
-
-    def _optimize_thumbnail_url(self, url: str) -> str:
-        """Tente d'obtenir une version haute résolution de l'image."""
-        if not url:
-            return url
-
-        # 1. Courrier International: /644/ -> /original/ or /1200/
-        if "focus.courrierinternational.com" in url:
-            # Pattern: .../644/0/60/0/...
-            url = url.replace("/644/", "/1200/")
-
-        # 2. WordPress resizing: thumb-150x150.jpg -> thumb.jpg
-        # Pattern match for -WxH before extension
-        wordpress_pattern = re.compile(r"-\d+x\d+(\.[a-z]{3,4})$", re.IGNORECASE)
-        url = wordpress_pattern.sub(r"\1", url)
-
-        return url
-
-    def _is_valid_thumbnail(self, url: str) -> bool:
-        """Vérifie si une URL d'image est pertinente comme thumbnail."""
-        if not url:
-            return False
-
-        url_lower = url.lower()
-
-        # 1. Exclure les emojis Wordpress et autres trackers connus
-        if "s.w.org/images/core/emoji" in url_lower:
-            return False
-        if "doubleclick.net" in url_lower:
-            return False
-        if "googlesyndication" in url_lower:
-            return False
-
-        # 2. Exclure par mots-clés dans le nom de fichier
-        # On essaie de ne pas être trop agressif sur le domaine, mais sur le path
-        bad_keywords = [
-            "logo",
-            "icon",
-            "button",
-            "pixel",
-            "tracker",
-            "avatar",
-            "smiley",
-            "emoji",
-            "facebook",
-            "twitter",
-            "linkedin",
-            "share",
-            "counter",
-            "count.gif",
-            "ad.",
-            "doubleclick",
-        ]
-
-        # Check if any bad keyword is in the URL filename part roughly
-        # Clean query params?
-        base_url = url_lower.split("?")[0]
-        return not any(keyword in base_url for keyword in bad_keywords)
+    _extract_youtube_video_id = staticmethod(extract_youtube_video_id)
+    _optimize_thumbnail_url = staticmethod(optimize_thumbnail_url)
+    _is_valid_thumbnail = staticmethod(is_valid_thumbnail)
+    _parse_duration = staticmethod(parse_duration)
 
     async def _fetch_feed_content(self, source_url: str) -> str:
-        """Fetch a feed body, retrying via curl-cffi on an anti-bot response.
+        """Fetch a feed body in full (no validators), anti-bot aware."""
+        return (await self._fetch_feed(source_url)).text
+
+    async def _fetch_feed(
+        self,
+        source_url: str,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        known_guids: Callable[[list[str]], Awaitable[set[str]]] | None = None,
+    ) -> FeedFetch:
+        """Fetch a feed, conditionally when validators are known, retrying via
+        curl-cffi on an anti-bot response.
 
         Story 12.2 (T3) — le seul changement du hot-path sync. Un flux
         découvert derrière un mur anti-bot à l'add (``detect()`` utilise déjà
         curl-cffi) mourrait sinon au refresh, car cette voie chaude fetch en
         httpx nu. Le repli est **scopé** : uniquement sur 403 / marqueurs
         anti-bot, jamais sur le chemin nominal.
+
+        ``etag`` / ``last_modified`` partent en ``If-None-Match`` /
+        ``If-Modified-Since`` ; un 304 rend ``FeedFetch(text=None)`` avec les
+        validateurs connus. Le repli curl-cffi n'en renvoie aucun.
+
+        Un gros flux n'est lu que jusqu'au préfixe utile (`_read_feed_body`) ;
+        `known_guids` y permet l'arrêt sur entrées déjà connues.
         """
-        response = await self.client.get(source_url)
-        if is_antibot_response(response.status_code, response.text):
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        async with self.client.stream(
+            "GET", source_url, headers=headers or None
+        ) as response:
+            if response.status_code == 304:
+                return FeedFetch(
+                    text=None,
+                    etag=response.headers.get("etag") or etag,
+                    last_modified=response.headers.get("last-modified")
+                    or last_modified,
+                )
+            if response.status_code == 200:
+                text = await self._read_feed_body(
+                    response, source_url=source_url, known_guids=known_guids
+                )
+            else:
+                await response.aread()
+                text = response.text
+        if is_antibot_response(response.status_code, text):
             logger.info("sync_antibot_detected_retry_curl_cffi", source_url=source_url)
             impersonated = await fetch_with_impersonation(source_url)
             if impersonated is not None:
-                return impersonated
+                return FeedFetch(text=impersonated)
         response.raise_for_status()
-        return response.text
+        return FeedFetch(
+            text=text,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
+
+    async def _read_feed_body(
+        self,
+        response: httpx.Response,
+        *,
+        source_url: str,
+        known_guids: Callable[[list[str]], Awaitable[set[str]]] | None = None,
+    ) -> str:
+        """Corps d'un flux en 200, lu au fil de l'eau.
+
+        Jusqu'à `rss_sync_stream_threshold_bytes`, le corps complet (décodé
+        comme `response.text`). Au-delà, seul le préfixe utile via
+        `FeedTruncator` : `MAX_FEED_ENTRIES` entrées, `rss_sync_feed_max_bytes`
+        octets lus, ou arrêt dès qu'un lot de `KNOWN_PROBE_BATCH` entrées est
+        entièrement connu (`known_guids`). Un corps dont aucune entrée ne
+        sort (pas du RSS/Atom) est relu en entier, comme avant.
+        """
+        settings = get_settings()
+        chunks = response.aiter_bytes()
+        # Corps brut gardé tant qu'aucune entrée n'est sortie (repli).
+        raw = bytearray()
+        truncator: FeedTruncator | None = None
+        async for chunk in chunks:
+            if truncator is None or not truncator.entry_count:
+                raw += chunk
+            if truncator is None:
+                if len(raw) <= settings.rss_sync_stream_threshold_bytes:
+                    continue
+                truncator = FeedTruncator(
+                    max_entries=MAX_FEED_ENTRIES,
+                    max_bytes=settings.rss_sync_feed_max_bytes,
+                )
+                chunk = bytes(raw)
+            if truncator.feed(chunk):
+                break
+            if (
+                known_guids is not None
+                and truncator.unprobed_count >= KNOWN_PROBE_BATCH
+            ):
+                guids = truncator.take_unprobed_guids()
+                if set(guids) <= await known_guids(guids):
+                    truncator.stop("known")
+                    break
+
+        encoding = response.encoding or "utf-8"
+        if truncator is None:
+            return raw.decode(encoding, errors="replace")
+        document = truncator.document()
+        if document is None:
+            async for chunk in chunks:
+                raw += chunk
+            return raw.decode(encoding, errors="replace")
+        self.feed_stats["streamed"] += 1
+        logger.info(
+            "feed_streamed",
+            source_url=source_url,
+            reason=truncator.stop_reason,
+            bytes_read=truncator.bytes_read,
+            entries=truncator.entry_count,
+        )
+        return document
 
     async def _fetch_html_head(self, url: str) -> str | None:
-        """Fetch first ~50KB of an article page for paywall detection.
+        """Fetch the start of an article page for paywall detection.
 
-        Uses Range header to avoid downloading the full page.
-        Returns HTML head content or None on any error.
+        Goes through the shared `ArticleHeadFetcher` (global and per-host
+        limits, `Range` + early abort). Returns None on any error.
         """
-        if not url:
-            return None
-        try:
-            response = await self.client.get(
-                url,
-                headers={"Range": "bytes=0-50000"},
-                timeout=5.0,
-            )
-            # Accept both 200 (full) and 206 (partial) responses
-            if response.status_code in (200, 206):
-                return response.text[:50000]
-        except Exception:
-            pass  # Fail silently — scoring fallback will handle detection
-        return None
-
-    def _parse_duration(self, duration_str: str) -> int | None:
-        """Convertit une durée itunes (HH:MM:SS ou MM:SS ou secondes) en entier."""
-        try:
-            if ":" in duration_str:
-                parts = duration_str.split(":")
-                if len(parts) == 3:
-                    return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-                elif len(parts) == 2:
-                    return int(parts[0]) * 60 + int(parts[1])
-            else:
-                return int(duration_str)
-        except (ValueError, IndexError):
-            return None
-        return None
+        return await self.head_fetcher.fetch(url)
 
     async def _save_content(self, data: dict) -> bool:
         """Upsert the content row in a short database session."""
@@ -601,57 +720,13 @@ class SyncService:
             existing = result.scalars().first()
 
             if existing:
-                # Backfill thumbnail if missing
-                if not existing.thumbnail_url and data.get("thumbnail_url"):
-                    existing.thumbnail_url = data["thumbnail_url"]
-
-                # Also update description if missing
-                if not existing.description and data.get("description"):
-                    existing.description = data["description"]
-
-                # Story 5.2: Backfill html_content and audio_url if missing
-                if not existing.html_content and data.get("html_content"):
-                    existing.html_content = data["html_content"]
-                    existing.content_quality = data.get("content_quality")
-                if not existing.audio_url and data.get("audio_url"):
-                    existing.audio_url = data["audio_url"]
-
-                # Paywall: upgrade false→true only (never downgrade paid→free)
-                if data.get("is_paid") and not existing.is_paid:
-                    existing.is_paid = True
-
-                # Compute current quality if not set
-                if not existing.content_quality:
-                    quality_source = existing.html_content or existing.description
-                    existing.content_quality = compute_content_quality(quality_source)
-
+                current = {col: getattr(existing, col) for col in _BACKFILL_COLUMNS}
+                for col, value in _backfill_changes(current, data).items():
+                    setattr(existing, col, value)
                 await session.flush()
                 return False
 
-            content_quality = data.get("content_quality") or compute_content_quality(
-                data.get("html_content") or data.get("description")
-            )
-
-            # Create new content
-            new_content = Content(
-                id=uuid4(),
-                source_id=data["source_id"],
-                title=data["title"][:500],
-                url=data["url"],
-                guid=data["guid"][:500],
-                published_at=data["published_at"],
-                content_type=data["content_type"],
-                description=data["description"],
-                thumbnail_url=data["thumbnail_url"],
-                duration_seconds=data["duration_seconds"],
-                html_content=data.get("html_content"),
-                audio_url=data.get("audio_url"),
-                content_quality=content_quality,
-                is_paid=data.get("is_paid", False),
-                language=detect_language(data["title"], data.get("source_name")),
-                created_at=datetime.datetime.utcnow(),
-            )
-
+            new_content = Content(**self._new_content_values(data))
             session.add(new_content)
             await session.flush()
 
@@ -662,13 +737,153 @@ class SyncService:
 
             return True
 
-    async def _update_source_last_synced(self, source_id: UUID) -> None:
-        """Met à jour `sources.last_synced_at` en session COURTE."""
+    async def _known_guid_set(self, guids: list[str]) -> set[str]:
+        return set(await self._load_known_contents(guids))
+
+    async def _load_known_contents(self, guids: list[str]) -> dict[str, dict]:
+        """Contenus déjà stockés pour ces guids (session COURTE)."""
+        if not guids:
+            return {}
+        async with self._short_session() as session:
+            return await self._select_known_contents(session, guids)
+
+    @staticmethod
+    async def _select_known_contents(
+        session: AsyncSession, guids: list[str]
+    ) -> dict[str, dict]:
+        """guid → colonnes de backfill (+ `id`, `created_at`) des contenus
+        connus. Comme `.first()` : une seule ligne par guid, même en doublon."""
+        rows = await session.execute(
+            select(
+                Content.id,
+                Content.guid,
+                Content.created_at,
+                *(getattr(Content, col) for col in _BACKFILL_COLUMNS),
+            ).where(Content.guid.in_(set(guids)))
+        )
+        known: dict[str, dict] = {}
+        for row in rows.mappings():
+            known.setdefault(row["guid"], dict(row))
+        return known
+
+    async def _save_contents(
+        self, batch: list[dict], *, known: dict[str, dict] | None = None
+    ) -> int:
+        """`_save_content` groupé pour les entrées d'un flux ; renvoie le
+        nombre de contenus créés.
+
+        Mêmes règles, entrée par entrée et dans l'ordre du flux, mais en une
+        session COURTE et quatre allers-retours au plus au lieu de ~3 par
+        entrée : un SELECT des guids connus, un UPDATE groupé (par clé
+        primaire) des backfills, un INSERT multi-lignes des nouveaux contenus
+        et un enqueue groupé de classification.
+
+        `known` (cf. `_load_known_contents`) évite de relire les guids quand
+        `process_source` les a déjà chargés pour son préfiltre ; il est
+        complété au fil du lot.
+
+        Pas d'`INSERT ... ON CONFLICT (guid)` : `contents.guid` n'a qu'un
+        index non unique (des doublons historiques peuvent exister), le
+        backfill reste donc calculé par `_backfill_changes`.
+        """
+        if not batch:
+            return 0
+
+        async with self._short_session() as session:
+            if known is None:
+                known = await self._select_known_contents(
+                    session, [data["guid"] for data in batch]
+                )
+
+            updates: dict[UUID, dict] = {}
+            inserts: list[dict] = []
+            priorities: dict[UUID, int] = {}
+            for data in batch:
+                current = known.get(data["guid"])
+                if current is None:
+                    values = self._new_content_values(data)
+                    inserts.append(values)
+                    priorities[values["id"]] = self._compute_classification_priority(
+                        data
+                    )
+                    # Une entrée suivante au même guid backfille cette ligne,
+                    # comme si elle avait déjà été insérée.
+                    current = {col: values[col] for col in _BACKFILL_COLUMNS}
+                    current.update(id=values["id"], guid=values["guid"], new=values)
+                    known[values["guid"]] = current
+                    continue
+                changes = _backfill_changes(current, data)
+                if not changes:
+                    continue
+                current.update(changes)
+                if "new" in current:
+                    current["new"].update(changes)
+                else:
+                    updates.setdefault(current["id"], {"id": current["id"]}).update(
+                        changes
+                    )
+
+            # UPDATE groupé : un executemany par jeu de colonnes modifiées.
+            by_columns: dict[tuple[str, ...], list[dict]] = {}
+            for params in updates.values():
+                by_columns.setdefault(tuple(sorted(params)), []).append(params)
+            for params_list in by_columns.values():
+                await session.execute(update(Content), params_list)
+
+            if inserts:
+                await session.execute(insert(Content), inserts)
+                # US-2 : classification queue (same SHORT session for atomicity)
+                await self._enqueue_many_for_classification_in_session(
+                    session, priorities
+                )
+
+        return len(inserts)
+
+    def _new_content_values(self, data: dict) -> dict:
+        """Colonnes d'un nouveau contenu issu d'une entrée de flux."""
+        content_quality = data.get("content_quality") or compute_content_quality(
+            data.get("html_content") or data.get("description")
+        )
+        return {
+            "id": uuid4(),
+            "source_id": data["source_id"],
+            "title": data["title"][:500],
+            "url": data["url"],
+            "guid": data["guid"][:500],
+            "published_at": data["published_at"],
+            "content_type": data["content_type"],
+            "description": data["description"],
+            "thumbnail_url": data["thumbnail_url"],
+            "duration_seconds": data["duration_seconds"],
+            "html_content": data.get("html_content"),
+            "audio_url": data.get("audio_url"),
+            "content_quality": content_quality,
+            "is_paid": data.get("is_paid", False),
+            "language": detect_language(data["title"], data.get("source_name")),
+            "created_at": datetime.datetime.utcnow(),
+        }
+
+    async def _record_feed_fetch(
+        self, source_id: UUID, fetch: FeedFetch, *, unchanged: bool
+    ) -> None:
+        """`last_synced_at`, validateurs et compteurs du flux en session COURTE.
+
+        Un corps inchangé garde le hash déjà stocké ; un corps traité remplace
+        les validateurs (un serveur qui n'en renvoie plus les efface).
+        """
+        values: dict = {
+            "last_synced_at": datetime.datetime.utcnow(),
+            "feed_etag": fetch.etag,
+            "feed_last_modified": fetch.last_modified,
+            "feed_fetch_count": Source.feed_fetch_count + 1,
+        }
+        if unchanged:
+            values["feed_unchanged_count"] = Source.feed_unchanged_count + 1
+        else:
+            values["feed_body_hash"] = fetch.body_hash
         async with self._short_session() as session:
             await session.execute(
-                update(Source)
-                .where(Source.id == source_id)
-                .values(last_synced_at=datetime.datetime.utcnow())
+                update(Source).where(Source.id == source_id).values(**values)
             )
 
     @staticmethod
@@ -698,3 +913,14 @@ class SyncService:
 
         queue_service = ClassificationQueueService(session)
         await queue_service.enqueue(content_id, priority=priority)
+
+    async def _enqueue_many_for_classification_in_session(
+        self, session: AsyncSession, priorities: dict[UUID, int]
+    ) -> None:
+        """Add contents to classification queue inside the given session."""
+        from app.services.classification_queue_service import (
+            ClassificationQueueService,
+        )
+
+        queue_service = ClassificationQueueService(session)
+        await queue_service.enqueue_many(priorities)
@@ -0,0 +1,272 @@
+"""Per-user cache of the compiled scoring inputs of ``/api/feed/``.
+
+Cousin of :mod:`app.services.feed_cache` — caches the *inputs* of the
+ranking rather than its output.
+
+Background
+----------
+Every ``get_feed`` call rebuilt the user's scoring state from 6+ queries
+(profile + interests + preferences, ``UserSource``, ``UserSubtopic``,
+``UserPersonalization``, muted entities, entity affinity, source weights,
+source affinity, custom topics). The cold-open fan-out of ~10
+``personalized=true`` Tournée sections rebuilt the exact same state ten
+times, each build holding pool connections. ``FEED_CACHE`` does not help
+there: each section is its own variant, and all of them miss together.
+
+Design
+------
+- :class:`CompiledUserContext` is an immutable snapshot: frozensets,
+  read-only mappings, interned slugs. Callers copy what they need to mutate;
+  nothing writes back into the snapshot, so one instance is safely shared
+  by concurrent requests.
+- **Single-flight** via :meth:`UserContextCache.get_or_build` — concurrent
+  section requests of one user wait on one build instead of running N.
+- **Invalidation** piggybacks on ``FEED_CACHE.invalidate(user_id)``, which
+  every ranking-relevant write already calls (listener registered at import
+  time). Content-scoped invalidations are not forwarded: they never touch
+  these inputs. Under ``FEED_CACHE_BACKEND=shared``, invalidations served
+  by another worker are picked up by ``FEED_CACHE.sync_invalidations``
+  before each read. A short TTL (``USER_CONTEXT_CACHE_TTL_SECONDS``, default
+  60 s, ``0`` disables) bounds the staleness of what is learned outside the
+  write endpoints (entity/source affinity).
+- **Versioned** — each build gets a process-wide increasing ``version``, so
+  downstream consumers can tell whether two rankings used the same inputs.
+- **Bounded memory** — entries sit in a ``BoundedLRU`` under
+  ``USER_CONTEXT_CACHE_MAX_BYTES`` (default 16 MiB, ``0`` = unbounded),
+  sized from their collection lengths; locks and generations are bounded
+  too (cf. :mod:`app.services.bounded_cache`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import os
+import sys
+import time
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+from typing import Any
+from uuid import UUID
+
+from app.services.bounded_cache import (
+    BoundedLRU,
+    GenerationCounters,
+    LockRegistry,
+    max_bytes_from_env,
+)
+from app.services.feed_cache import FEED_CACHE
+
+logger = logging.getLogger(__name__)
+
+_VERSION_COUNTER = itertools.count(1)
+
+
+def _ttl_from_env() -> float:
+    """Read TTL from env. ``USER_CONTEXT_CACHE_TTL_SECONDS=0`` disables the cache."""
+    raw = os.environ.get("USER_CONTEXT_CACHE_TTL_SECONDS", "60")
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        logger.warning("user_context_cache_invalid_ttl raw=%s, defaulting to 60s", raw)
+        return 60.0
+
+
+def _max_bytes_from_env() -> int:
+    """``USER_CONTEXT_CACHE_MAX_BYTES`` — ``0`` disables the bound."""
+    return max_bytes_from_env("USER_CONTEXT_CACHE_MAX_BYTES", 16 * 1024 * 1024)
+
+
+def intern_slugs(slugs: Iterable[str | None]) -> frozenset[str]:
+    """Frozenset of interned, non-empty slugs (shared across users' snapshots)."""
+    return frozenset(sys.intern(s) for s in slugs if s)
+
+
+def freeze_mapping(values: Mapping[Any, Any]) -> Mapping[Any, Any]:
+    """Read-only view over a private copy of ``values``."""
+    return MappingProxyType(dict(values))
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledUserContext:
+    """Immutable snapshot of one user's ranking inputs.
+
+    ``user_profile`` and ``user_custom_topics`` are detached ORM rows (their
+    collections are eagerly loaded) — read-only by contract.
+    """
+
+    user_id: UUID
+    version: int
+    user_profile: Any
+    user_interests: frozenset[str]
+    user_interest_weights: Mapping[str, float]
+    user_interest_states: Mapping[str, Any]
+    user_prefs: Mapping[str, Any]
+    followed_source_ids: frozenset[UUID]
+    custom_source_ids: frozenset[UUID]
+    subscribed_source_ids: frozenset[UUID]
+    user_subtopics: frozenset[str]
+    user_subtopic_weights: Mapping[str, float]
+    muted_sources: frozenset[UUID]
+    muted_themes: frozenset[str]
+    muted_topics: frozenset[str]
+    muted_content_types: frozenset[str]
+    muted_entities: tuple[str, ...]
+    hide_paid_content: bool | None
+    hide_non_fr_sources: bool | None
+    entity_affinity: Mapping[str, float]
+    source_priority_multipliers: Mapping[UUID, float]
+    source_affinity_scores: Mapping[UUID, float]
+    user_custom_topics: tuple[Any, ...]
+
+
+def next_version() -> int:
+    """Process-wide increasing version stamped on each build."""
+    return next(_VERSION_COUNTER)
+
+
+@dataclass
+class _Entry:
+    expires_at: float
+    payload: CompiledUserContext
+
+
+# Estimations grossières : un élément de collection (clé + valeur boxées) et
+# les lignes ORM détachées (profil, custom topics) avec leur état SQLAlchemy.
+_ITEM_BYTES = 96
+_ORM_ROW_BYTES = 2048
+
+
+def _entry_bytes(entry: _Entry) -> int:
+    ctx = entry.payload
+    items = sum(
+        len(value)
+        for value in (getattr(ctx, f.name) for f in fields(ctx))
+        if isinstance(value, (frozenset, tuple, Mapping))
+    )
+    return items * _ITEM_BYTES + (1 + len(ctx.user_custom_topics)) * _ORM_ROW_BYTES
+
+
+class UserContextCache:
+    """Per-user TTL cache with single-flight builds.
+
+    See ``feed_cache.FeedPageCache`` for the rationale on locks and TTL.
+    """
+
+    def __init__(
+        self, ttl_seconds: float | None = None, max_bytes: int | None = None
+    ) -> None:
+        self._ttl = ttl_seconds if ttl_seconds is not None else _ttl_from_env()
+        self._entries: BoundedLRU[UUID, _Entry] = BoundedLRU(
+            max_bytes=max_bytes if max_bytes is not None else _max_bytes_from_env(),
+            sizeof=_entry_bytes,
+        )
+        self._locks: LockRegistry[UUID, asyncio.Lock] = LockRegistry(
+            lambda _: asyncio.Lock()
+        )
+        # Per-user invalidation counter: a build that started before an
+        # `invalidate` must not be stored (same guarantee as FEED_CACHE).
+        self._generations: GenerationCounters[UUID] = GenerationCounters()
+        self._hits = 0
+        self._misses = 0
+        self._builds = 0
+        self._invalidations = 0
+
+    @property
+    def ttl_seconds(self) -> float:
+        return self._ttl
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    def lock(self, user_id: UUID) -> asyncio.Lock:
+        return self._locks.get(user_id)
+
+    def get(self, user_id: UUID) -> CompiledUserContext | None:
+        if not self.enabled:
+            return None
+        entry = self._entries.get(user_id)
+        if entry is None or entry.expires_at < time.monotonic():
+            if entry is not None:
+                self._entries.pop(user_id)
+            self._misses += 1
+            return None
+        self._hits += 1
+        return entry.payload
+
+    def put(
+        self,
+        user_id: UUID,
+        payload: CompiledUserContext,
+        *,
+        generation: int | None = None,
+    ) -> None:
+        if not self.enabled:
+            return
+        if generation is not None and generation != self._generations.get(user_id):
+            return
+        self._entries.put(
+            user_id, _Entry(expires_at=time.monotonic() + self._ttl, payload=payload)
+        )
+
+    async def get_or_build(
+        self,
+        user_id: UUID,
+        build: Callable[[], Awaitable[CompiledUserContext]],
+    ) -> CompiledUserContext:
+        """Return the cached snapshot, or run ``build()`` once for all waiters."""
+        FEED_CACHE.sync_invalidations(user_id)
+        if not self.enabled:
+            self._builds += 1
+            return await build()
+        hit = self.get(user_id)
+        if hit is not None:
+            return hit
+        async with self.lock(user_id):
+            # Un autre waiter a pu construire pendant qu'on attendait le lock ;
+            # on relit sans recompter un miss.
+            entry = self._entries.peek(user_id)
+            if entry is not None and entry.expires_at >= time.monotonic():
+                return entry.payload
+            generation = self._generations.get(user_id)
+            payload = await build()
+            self._builds += 1
+            self.put(user_id, payload, generation=generation)
+            return payload
+
+    def invalidate(self, user_id: UUID) -> None:
+        self._generations.bump(user_id)
+        if self._entries.pop(user_id) is not None:
+            self._invalidations += 1
+
+    def stats(self) -> dict[str, int | float]:
+        total = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "builds": self._builds,
+            "invalidations": self._invalidations,
+            "size": len(self._entries),
+            "hit_rate": (self._hits / total) if total else 0.0,
+            "ttl_seconds": self._ttl,
+            **{k: v for k, v in self._entries.stats().items() if k != "entries"},
+            **self._locks.stats(),
+        }
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._locks.clear()
+        self._generations.clear()
+        self._hits = 0
+        self._misses = 0
+        self._builds = 0
+        self._invalidations = 0
+
+
+USER_CONTEXT_CACHE = UserContextCache()
+"""Module-level singleton — import as ``from app.services.user_context_cache import USER_CONTEXT_CACHE``."""
+
+FEED_CACHE.add_invalidate_listener(USER_CONTEXT_CACHE.invalidate)
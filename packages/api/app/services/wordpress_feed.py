@@ -26,12 +26,11 @@ from email.utils import format_datetime
 from urllib.parse import urlparse
 from xml.sax.saxutils import escape
 
-import certifi
-import httpx
 import structlog
 
 from app.config import get_settings
 from app.services.http_fetch import fetch_with_impersonation, is_antibot_response
+from app.services.outbound_http import OUTBOUND_HTTP
 from app.utils.url_safety import validate_url_for_fetch
 
 logger = structlog.get_logger()
@@ -85,29 +84,23 @@ async def _safe_get_json(url: str) -> object | None:
     """
     validated = validate_url_for_fetch(url)
     try:
-        async with httpx.AsyncClient(
+        resp = await OUTBOUND_HTTP.client("feeds").get(
+            validated,
             timeout=8.0,
-            follow_redirects=True,
-            verify=certifi.where(),
-            headers={
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "application/json",
-            },
-        ) as client:
-            resp = await client.get(validated)
-            if resp.status_code == 200:
+            headers={"Accept": "application/json"},
+        )
+        if resp.status_code == 200:
+            try:
+                return resp.json()
+            except (json.JSONDecodeError, ValueError):
+                return None
+        if is_antibot_response(resp.status_code, resp.text):
+            impersonated = await fetch_with_impersonation(validated)
+            if impersonated:
                 try:
-                    return resp.json()
+                    return json.loads(impersonated)
                 except (json.JSONDecodeError, ValueError):
                     return None
-            if is_antibot_response(resp.status_code, resp.text):
-                impersonated = await fetch_with_impersonation(validated)
-                if impersonated:
-                    try:
-                        return json.loads(impersonated)
-                    except (json.JSONDecodeError, ValueError):
-                        return None
     except ValueError:
         raise
     except Exception as exc:  # network/timeout — degrade gracefully
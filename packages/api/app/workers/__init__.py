@@ -1,11 +1,12 @@
 """Workers background."""
 
-from app.workers.rss_sync import sync_all_sources, sync_source
+from app.workers.rss_sync import sync_all_sources, sync_due_sources, sync_source
 from app.workers.scheduler import start_scheduler, stop_scheduler
 
 __all__ = [
     "start_scheduler",
     "stop_scheduler",
     "sync_all_sources",
+    "sync_due_sources",
     "sync_source",
 ]
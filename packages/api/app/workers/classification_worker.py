@@ -6,6 +6,8 @@ Batch-5 with enriched prompt for accurate classification.
 
 import asyncio
 import contextlib
+import time
+from collections import deque
 from datetime import datetime
 
 from sqlalchemy import select
@@ -16,8 +18,10 @@ from app.config import get_settings
 from app.models.classification_queue import ClassificationQueue
 from app.models.content import Content
 from app.models.source import Source
+from app.services.carousel_aggregates import CAROUSEL_AGGREGATES
 from app.services.classification_queue_service import ClassificationQueueService
 from app.services.ml.classification_service import get_classification_service
+from app.services.ml.fused_classification import get_fused_classifier
 from app.services.ml.good_news_classifier import get_good_news_classifier
 from app.services.ml.language_filter import is_french_source, looks_english
 
@@ -31,6 +35,90 @@ settings = get_settings()
 _MAX_RAPID_RESTARTS = 5
 _RESTART_WINDOW_S = 60.0
 
+_PIPELINE_STAGES = ("dequeue", "classify", "write")
+
+
+class _StageStats:
+    """Latences récentes d'un étage du pipeline (fenêtre glissante)."""
+
+    def __init__(self, window: int = 200) -> None:
+        self._samples_ms: deque[float] = deque(maxlen=window)
+        self.count = 0
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self._samples_ms.append(seconds * 1000)
+
+    def snapshot(self) -> dict:
+        ordered = sorted(self._samples_ms)
+        if not ordered:
+            return {
+                "count": self.count,
+                "last_ms": None,
+                "p50_ms": None,
+                "p95_ms": None,
+            }
+        return {
+            "count": self.count,
+            "last_ms": round(self._samples_ms[-1], 1),
+            "p50_ms": round(ordered[len(ordered) // 2], 1),
+            "p95_ms": round(
+                ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 1
+            ),
+        }
+
+
+def _completion(rec: dict, result: dict | None) -> tuple[list, list, dict] | None:
+    """`(topics, entities, flags)` à écrire pour un record, ou None quand il
+    doit repartir en file (`mark_failed`, topics vides avant 2 retries)."""
+    import structlog
+
+    if not rec["has_content"]:
+        return [], [], {}
+
+    # Get topics, serene, is_ad and entities from batch result
+    result = result or {}
+    topics = result.get("topics", [])
+
+    # If still no topics after individual retry, let the retry
+    # mechanism handle it (mark_failed will requeue up to 3 times)
+    if not topics:
+        if rec["retry_count"] < 2:
+            return None
+        # After max retries, mark completed with empty topics
+        structlog.get_logger().warning(
+            "classification_worker.exhausted_retries",
+            content_id=str(rec["content_id"]),
+            title=rec["title"][:80],
+        )
+
+    return (
+        topics,
+        result.get("entities", []),
+        {
+            "is_serene": result.get("serene"),
+            "is_good_news": result.get("good_news"),
+            "is_ad": result.get("is_ad"),
+        },
+    )
+
+
+def _good_news_candidates(
+    batch_items: list[dict], all_results: list[dict]
+) -> list[int]:
+    """Index des survivants serene + source FR + titre non anglais, seuls
+    évalués par la passe good-news."""
+    indices: list[int] = []
+    for idx, (bi, result) in enumerate(zip(batch_items, all_results, strict=False)):
+        if result.get("serene") is not True:
+            continue
+        if not is_french_source(bi.get("source_name", "")):
+            continue
+        if looks_english(bi.get("title", "")):
+            continue
+        indices.append(idx)
+    return indices
+
 
 class ClassificationWorker:
     """Worker qui traite la file d'attente de classification via Mistral API.
@@ -40,6 +128,11 @@ class ClassificationWorker:
     `min_batch_size` articles en attente (ou que le plus vieux pending atteigne
     `max_wait_s`) avant de traiter un lot de `batch_size`. Priorité, retry,
     reset des items bloqués et sessions DB courtes sont préservés.
+
+    Pipeline : la run-loop fait tourner `lanes` lots en parallèle entre un
+    étage de dequeue et un étage d'écriture groupée (cf. `_run_loop`), pour
+    que le débit suive la concurrence Mistral autorisée plutôt que la latence
+    d'un aller-retour.
     """
 
     def __init__(
@@ -48,6 +141,7 @@ class ClassificationWorker:
         interval: int | None = None,
         min_batch_size: int | None = None,
         max_wait_s: int | None = None,
+        lanes: int | None = None,
     ):
         """Initialize the worker.
 
@@ -58,6 +152,8 @@ class ClassificationWorker:
                 (gate d'accumulation ; def. settings).
             max_wait_s: Plafond d'attente — si le plus vieux pending dépasse cet
                 âge, on traite même sous le seuil (anti-famine ; def. settings).
+            lanes: Nombre de lots classés en parallèle par la run-loop
+                (def. settings).
 
         Les arguments None retombent sur la config (rollback env-only).
         """
@@ -78,6 +174,7 @@ class ClassificationWorker:
         self.max_wait_s = _or_setting(
             max_wait_s, settings.classification_worker_max_wait_s
         )
+        self.lanes = max(1, _or_setting(lanes, settings.classification_worker_lanes))
         self.running = False
         self._task: asyncio.Task | None = None
 
@@ -102,8 +199,16 @@ class ClassificationWorker:
 
         self._classifier = None
         self._good_news_classifier = None
+        self._fused_classifier = None
         self._loop_count = 0
 
+        # Pipeline : files bornées (re)créées à chaque démarrage du run-loop,
+        # latences par étage exposées sur /api/health/classification.
+        self._classify_queue: asyncio.Queue | None = None
+        self._write_queue: asyncio.Queue | None = None
+        self._busy_lanes = 0
+        self._stage_stats = {name: _StageStats() for name in _PIPELINE_STAGES}
+
         # Superviseur : fenêtre glissante de comptage des redémarrages.
         self._restart_count = 0
         self._restart_window_start = 0.0
@@ -120,6 +225,12 @@ class ClassificationWorker:
             self._good_news_classifier = get_good_news_classifier()
         return self._good_news_classifier
 
+    def _get_fused_classifier(self):
+        """Lazy load fused classifier (CLASSIFICATION_FUSED_ENABLED)."""
+        if self._fused_classifier is None:
+            self._fused_classifier = get_fused_classifier()
+        return self._fused_classifier
+
     async def start(self):
         """Start the worker in the background."""
         if self.running:
@@ -258,8 +369,47 @@ class ClassificationWorker:
         await self.engine.dispose()
 
     async def _run_loop(self):
-        """Main processing loop."""
+        """Main processing loop : pipeline dequeue → voies LLM → écriture.
+
+        Trois étages reliés par des files bornées, pour qu'un lot attende
+        Mistral pendant que le suivant est dequeué et que le précédent
+        s'écrit :
+
+        - **dequeue** (1 task) : gate d'accumulation + `dequeue_batch`, pousse
+          le lot dans `_classify_queue` (bloque quand toutes les voies sont
+          prises : contre-pression, pas de lots `processing` qui s'empilent) ;
+        - **voies LLM** (`lanes` tasks) : `_classify_records`, hors session ;
+          le débit Mistral réel reste borné par les limiteurs partagés ;
+        - **écriture** (1 task) : vide `_write_queue` et écrit tout ce qui
+          attend en une transaction (`_write_back_bulk`).
+
+        Chaque étage attrape ses `Exception` (log, lot suivant) ; une
+        `BaseException` fait sortir le loop entier → superviseur.
+        """
+        self._classify_queue = asyncio.Queue(maxsize=self.lanes)
+        self._write_queue = asyncio.Queue(maxsize=self.lanes)
+        stages = [
+            asyncio.create_task(self._dequeue_stage()),
+            *(asyncio.create_task(self._lane()) for _ in range(self.lanes)),
+            asyncio.create_task(self._write_stage()),
+        ]
+        try:
+            done, _ = await asyncio.wait(stages, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                task.result()
+        finally:
+            for task in stages:
+                task.cancel()
+            await asyncio.gather(*stages, return_exceptions=True)
+
+    async def _dequeue_stage(self):
+        """Étage 1 : alimente les voies tant que la file a du travail."""
+        import structlog
+
+        logger = structlog.get_logger()
+
         while self.running:
+            records: list[dict] = []
             try:
                 # Every ~5 minutes, reset items stuck in "processing" too long
                 self._loop_count += 1
@@ -269,15 +419,77 @@ class ClassificationWorker:
                 # Gate d'accumulation : ne traiter un lot que si la file est
                 # assez remplie OU si le plus vieux pending a trop attendu.
                 if await self._should_process():
-                    await self._process_batch()
+                    started = time.perf_counter()
+                    records = await self._dequeue_records()
+                    self._stage_stats["dequeue"].record(time.perf_counter() - started)
             except Exception as e:
-                import structlog
-
-                logger = structlog.get_logger()
-                logger.error("classification_worker_error", error=str(e))
+                logger.error(
+                    "classification_worker_error", stage="dequeue", error=str(e)
+                )
 
+            if records:
+                # Pas de sleep : on enchaîne tant que les voies absorbent.
+                await self._classify_queue.put(records)
+                continue
             await asyncio.sleep(self.interval)
 
+    async def _lane(self):
+        """Étage 2 : une voie LLM, un lot à la fois."""
+        import structlog
+
+        logger = structlog.get_logger()
+
+        while True:
+            records = await self._classify_queue.get()
+            self._busy_lanes += 1
+            started = time.perf_counter()
+            try:
+                result_by_record = await self._classify_records(records)
+            except Exception as e:
+                # Sans résultat, chaque article repart en file via mark_failed
+                # (retry borné) plutôt que de rester bloqué en `processing`.
+                logger.error(
+                    "classification_worker_error", stage="classify", error=str(e)
+                )
+                result_by_record = {}
+            finally:
+                self._busy_lanes -= 1
+                self._stage_stats["classify"].record(time.perf_counter() - started)
+            await self._write_queue.put((records, result_by_record))
+
+    async def _write_stage(self):
+        """Étage 3 : écrit d'un coup tous les lots classés en attente."""
+        import structlog
+
+        logger = structlog.get_logger()
+
+        while True:
+            groups = [await self._write_queue.get()]
+            while not self._write_queue.empty():
+                groups.append(self._write_queue.get_nowait())
+            started = time.perf_counter()
+            try:
+                await self._write_back_bulk(groups)
+            except Exception as e:
+                logger.error("classification_worker_error", stage="write", error=str(e))
+            self._stage_stats["write"].record(time.perf_counter() - started)
+
+    def pipeline_stats(self) -> dict:
+        """Profondeur des files et latences par étage (health classification)."""
+
+        def depth(queue: asyncio.Queue | None) -> int:
+            return queue.qsize() if queue is not None else 0
+
+        return {
+            "lanes": self.lanes,
+            "busy_lanes": self._busy_lanes,
+            "classify_queue": depth(self._classify_queue),
+            "write_queue": depth(self._write_queue),
+            "stages": {
+                name: stats.snapshot() for name, stats in self._stage_stats.items()
+            },
+        }
+
     async def _should_process(self) -> bool:
         """Décide si un lot doit être traité maintenant (gate d'accumulation).
 
@@ -318,9 +530,9 @@ class ClassificationWorker:
         """Process one batch of pending items using batch API call.
 
         Renvoie le nombre d'items dequeués sur ce lot (0 si la file était vide).
-        La run-loop ignore la valeur ; elle sert au pilotage manuel via
-        `drive_once()` (endpoint admin force-drive) pour observer un batch à la
-        demande post-deploy.
+        La run-loop enchaîne les mêmes phases en pipeline (`_run_loop`) ; ce
+        chemin séquentiel sert au pilotage manuel via `drive_once()` (endpoint
+        admin force-drive) pour observer un batch à la demande post-deploy.
 
         3 phases pour ne jamais tenir une transaction DB pendant les appels
         Mistral (90-180 s au pire) : le timeout serveur
@@ -328,18 +540,27 @@ class ClassificationWorker:
         (cause racine des IdleInTransactionSessionTimeout Sentry et des kills
         du zombie_session_sweeper).
         """
+        records = await self._dequeue_records()
+        if not records:
+            return 0
+        result_by_record = await self._classify_records(records)
+        await self._write_back(records, result_by_record)
+        await self._refresh_read_models()
+        return len(records)
+
+    async def _dequeue_records(self) -> list[dict]:
+        """Phase 1 — session courte : dequeue + snapshot des données du batch."""
         import structlog
 
         logger = structlog.get_logger()
 
-        # Phase 1 — session courte : dequeue + snapshot des données du batch.
         async with self.session_maker() as session:
             service = ClassificationQueueService(session)
 
             items = await service.dequeue_batch(batch_size=self.batch_size)
 
             if not items:
-                return 0
+                return []
 
             logger.info("classification_worker.processing_batch", count=len(items))
 
@@ -380,7 +601,14 @@ class ClassificationWorker:
                         "source_name": source.name if source else "",
                     }
                 )
+        return records
+
+    async def _classify_records(self, records: list[dict]) -> dict[int, dict]:
+        """Phase 2 — hors session : appels Mistral, résultats par index de record.
 
+        Les index absents = articles sans contenu/titre, traités par le
+        fallback de l'écriture.
+        """
         # Build batch for API call. record_for_batch[k] = records index of the
         # k-ème batch item → permet de remapper all_results[k] sur son record
         # en phase 3 sans curseur séparé.
@@ -398,89 +626,14 @@ class ClassificationWorker:
                 )
                 record_for_batch.append(i)
 
-        # Phase 2 — hors session : appels Mistral.
         classifier = self._get_classifier()
         all_results: list[dict] = []
 
         if classifier and classifier.is_ready() and batch_items:
-            # Step 1: Classify (topics + serene only)
-            all_results = await classifier.classify_batch_async(batch_items)
-
-            # Retry individually for each article that got empty topics
-            empty_indices = [
-                idx for idx, r in enumerate(all_results) if not r.get("topics")
-            ]
-            if empty_indices:
-                logger.info(
-                    "classification_worker.individual_retry",
-                    total=len(batch_items),
-                    empty=len(empty_indices),
-                )
-                for idx in empty_indices:
-                    bi = batch_items[idx]
-                    result = await classifier.classify_async(
-                        title=bi["title"],
-                        description=bi.get("description", ""),
-                        source_name=bi.get("source_name", ""),
-                    )
-                    if result.get("topics"):
-                        all_results[idx] = result
-
-            # Step 2: Extract entities (separate API call)
-            try:
-                all_entities = await classifier.extract_entities_batch_async(
-                    batch_items
-                )
-                for idx, entities in enumerate(all_entities):
-                    if idx < len(all_results):
-                        all_results[idx]["entities"] = entities
-            except Exception as e:
-                logger.warning(
-                    "classification_worker.entity_extraction_failed",
-                    error=str(e),
-                )
-
-            # Step 3: Good-news pass (mistral-large) on serene+FR survivors
-            # Initialize good_news=None for all; only mutated for evaluated items
-            for r in all_results:
-                r["good_news"] = None
-
-            good_news_indices: list[int] = []
-            good_news_items: list[dict] = []
-            for idx, (bi, result) in enumerate(
-                zip(batch_items, all_results, strict=False)
-            ):
-                if result.get("serene") is not True:
-                    continue
-                source_name = bi.get("source_name", "")
-                title = bi.get("title", "")
-                if not is_french_source(source_name):
-                    continue
-                if looks_english(title):
-                    continue
-                good_news_indices.append(idx)
-                good_news_items.append(bi)
-
-            if good_news_items:
-                gn_classifier = self._get_good_news_classifier()
-                if gn_classifier and gn_classifier.is_ready():
-                    try:
-                        gn_results = await gn_classifier.classify_batch_async(
-                            good_news_items
-                        )
-                        for offset, idx in enumerate(good_news_indices):
-                            if offset < len(gn_results):
-                                all_results[idx]["good_news"] = gn_results[offset]
-                        logger.info(
-                            "classification_worker.good_news_pass",
-                            evaluated=len(good_news_items),
-                            positives=sum(1 for v in gn_results if v is True),
-                        )
-                    except Exception as e:
-                        logger.warning(
-                            "classification_worker.good_news_pass_failed",
-                            error=str(e),
-                        )
+            if settings.classification_fused_enabled:
+                all_results = await self._classify_fused(batch_items)
+            else:
+                all_results = await self._classify_separately(batch_items)
         else:
             all_results = [
                 {
@@ -493,69 +646,248 @@ class ClassificationWorker:
                 for _ in batch_items
             ]
 
-        # Remap les résultats LLM sur leur record d'origine (indices manquants
-        # = articles sans contenu/titre, traités par le fallback ci-dessous).
-        result_by_record: dict[int, dict] = {
+        # Remap les résultats LLM sur leur record d'origine.
+        return {
             rec_idx: all_results[k]
             for k, rec_idx in enumerate(record_for_batch)
             if k < len(all_results)
         }
 
-        # Phase 3 — session courte : écrire les résultats.
+    async def _classify_separately(self, batch_items: list[dict]) -> list[dict]:
+        """Mode séparé : un appel Mistral par famille de champs."""
+        import structlog
+
+        logger = structlog.get_logger()
+        classifier = self._get_classifier()
+
+        # Step 1: Classify (topics + serene only)
+        all_results = await classifier.classify_batch_async(batch_items)
+        await self._retry_empty_topics(batch_items, all_results)
+
+        # Step 2: Extract entities (separate API call)
+        try:
+            all_entities = await classifier.extract_entities_batch_async(batch_items)
+            for idx, entities in enumerate(all_entities):
+                if idx < len(all_results):
+                    all_results[idx]["entities"] = entities
+        except Exception as e:
+            logger.warning(
+                "classification_worker.entity_extraction_failed",
+                error=str(e),
+            )
+
+        # Step 3: Good-news pass (mistral-large) on serene+FR survivors
+        # Initialize good_news=None for all; only mutated for evaluated items
+        for r in all_results:
+            r["good_news"] = None
+        await self._good_news_pass(
+            batch_items,
+            all_results,
+            _good_news_candidates(batch_items, all_results),
+        )
+        return all_results
+
+    async def _classify_fused(self, batch_items: list[dict]) -> list[dict]:
+        """Mode fusionné : un appel pour tous les champs, fallback par champ.
+
+        Un champ absent ou invalide pour un article (validateur strict de
+        `FusedClassifier`) est redemandé à l'appel séparé, pour ces seuls
+        articles : topics/serene/is_ad → `classify_batch_async`, entités →
+        `extract_entities_batch_async`, good_news → `GoodNewsClassifier`. Le
+        good_news fusionné n'est gardé que sur les survivants serene + FR,
+        comme la passe 2.
+        """
+        import structlog
+
+        logger = structlog.get_logger()
+        classifier = self._get_classifier()
+
+        fused = await self._get_fused_classifier().classify_batch_async(batch_items)
+        all_results = [
+            {
+                "topics": f["topics"] or [],
+                "serene": f["serene"],
+                "is_ad": f["is_ad"],
+                "entities": f["entities"] or [],
+                "good_news": None,
+            }
+            for f in fused
+        ]
+
+        redo_classification = [
+            idx
+            for idx, f in enumerate(fused)
+            if f["topics"] is None or f["serene"] is None or f["is_ad"] is None
+        ]
+        if redo_classification:
+            retried = await classifier.classify_batch_async(
+                [batch_items[idx] for idx in redo_classification]
+            )
+            for idx, result in zip(redo_classification, retried, strict=False):
+                for key in ("topics", "serene", "is_ad"):
+                    if fused[idx][key] is None:
+                        all_results[idx][key] = result.get(key)
+                all_results[idx]["topics"] = all_results[idx]["topics"] or []
+        await self._retry_empty_topics(batch_items, all_results)
+
+        redo_entities = [idx for idx, f in enumerate(fused) if f["entities"] is None]
+        if redo_entities:
+            try:
+                extracted = await classifier.extract_entities_batch_async(
+                    [batch_items[idx] for idx in redo_entities]
+                )
+                for idx, entities in zip(redo_entities, extracted, strict=False):
+                    all_results[idx]["entities"] = entities
+            except Exception as e:
+                logger.warning(
+                    "classification_worker.entity_extraction_failed",
+                    error=str(e),
+                )
+
+        candidates = _good_news_candidates(batch_items, all_results)
+        for idx in candidates:
+            all_results[idx]["good_news"] = fused[idx]["good_news"]
+        redo_good_news = [idx for idx in candidates if fused[idx]["good_news"] is None]
+        await self._good_news_pass(batch_items, all_results, redo_good_news)
+
+        logger.info(
+            "classification_worker.fused_batch",
+            count=len(batch_items),
+            fallback_classification=len(redo_classification),
+            fallback_entities=len(redo_entities),
+            fallback_good_news=len(redo_good_news),
+        )
+        return all_results
+
+    async def _retry_empty_topics(
+        self, batch_items: list[dict], all_results: list[dict]
+    ) -> None:
+        """Retry individually for each article that got empty topics."""
+        import structlog
+
+        logger = structlog.get_logger()
+        classifier = self._get_classifier()
+
+        empty_indices = [
+            idx for idx, r in enumerate(all_results) if not r.get("topics")
+        ]
+        if not empty_indices:
+            return
+        logger.info(
+            "classification_worker.individual_retry",
+            total=len(batch_items),
+            empty=len(empty_indices),
+        )
+        for idx in empty_indices:
+            bi = batch_items[idx]
+            result = await classifier.classify_async(
+                title=bi["title"],
+                description=bi.get("description", ""),
+                source_name=bi.get("source_name", ""),
+            )
+            if result.get("topics"):
+                all_results[idx].update(result)
+
+    async def _good_news_pass(
+        self, batch_items: list[dict], all_results: list[dict], indices: list[int]
+    ) -> None:
+        """Passe good-news (mistral-large) sur `indices` ; les autres inchangés."""
+        import structlog
+
+        logger = structlog.get_logger()
+
+        if not indices:
+            return
+        gn_classifier = self._get_good_news_classifier()
+        if not (gn_classifier and gn_classifier.is_ready()):
+            return
+        good_news_items = [batch_items[idx] for idx in indices]
+        try:
+            gn_results = await gn_classifier.classify_batch_async(good_news_items)
+            for offset, idx in enumerate(indices):
+                if offset < len(gn_results):
+                    all_results[idx]["good_news"] = gn_results[offset]
+            logger.info(
+                "classification_worker.good_news_pass",
+                evaluated=len(good_news_items),
+                positives=sum(1 for v in gn_results if v is True),
+            )
+        except Exception as e:
+            logger.warning(
+                "classification_worker.good_news_pass_failed",
+                error=str(e),
+            )
+
+    async def _write_back(
+        self, records: list[dict], result_by_record: dict[int, dict]
+    ) -> None:
+        """Phase 3 — session courte : écrire les résultats, un commit par record."""
         async with self.session_maker() as session:
             service = ClassificationQueueService(session)
 
             for i, rec in enumerate(records):
                 try:
-                    if not rec["has_content"]:
-                        await service.mark_completed_with_entities(
-                            rec["queue_id"], [], []
+                    completion = _completion(rec, result_by_record.get(i))
+                    if completion is None:
+                        await service.mark_failed(
+                            rec["queue_id"], "empty_classification"
                         )
                         continue
+                    topics, entities, flags = completion
+                    await service.mark_completed_with_entities(
+                        rec["queue_id"], topics, entities, **flags
+                    )
+                except Exception as e:
+                    await service.mark_failed(rec["queue_id"], str(e)[:500])
 
-                    # Get topics, serene, is_ad and entities from batch result
-                    result = result_by_record.get(i)
-                    if result is not None:
-                        topics = result.get("topics", [])
-                        is_serene = result.get("serene")
-                        is_good_news = result.get("good_news")
-                        is_ad = result.get("is_ad")
-                        entities = result.get("entities", [])
-                    else:
-                        topics = []
-                        is_serene = None
-                        is_good_news = None
-                        is_ad = None
-                        entities = []
-
-                    # If still no topics after individual retry, let the retry
-                    # mechanism handle it (mark_failed will requeue up to 3 times)
-                    if not topics:
-                        if rec["retry_count"] < 2:
-                            await service.mark_failed(
-                                rec["queue_id"], "empty_classification"
-                            )
-                            continue
-                        # After max retries, mark completed with empty topics
-                        logger.warning(
-                            "classification_worker.exhausted_retries",
-                            content_id=str(rec["content_id"]),
-                            title=rec["title"][:80],
-                        )
+    async def _write_back_bulk(
+        self, groups: list[tuple[list[dict], dict[int, dict]]]
+    ) -> None:
+        """Phase 3 du pipeline : tous les lots en attente en une transaction.
 
+        Un seul commit au lieu d'un par article. Si la transaction échoue, elle
+        est annulée en bloc et chaque lot repasse par `_write_back` (un commit
+        par record, l'article fautif isolé en `mark_failed`).
+        """
+        import structlog
+
+        logger = structlog.get_logger()
+
+        pairs = [
+            (rec, result_by_record.get(i))
+            for records, result_by_record in groups
+            for i, rec in enumerate(records)
+        ]
+        try:
+            async with self.session_maker() as session:
+                service = ClassificationQueueService(session)
+                for rec, result in pairs:
+                    completion = _completion(rec, result)
+                    if completion is None:
+                        await service.mark_failed(
+                            rec["queue_id"], "empty_classification", commit=False
+                        )
+                        continue
+                    topics, entities, flags = completion
                     await service.mark_completed_with_entities(
-                        rec["queue_id"],
-                        topics,
-                        entities,
-                        is_serene=is_serene,
-                        is_good_news=is_good_news,
-                        is_ad=is_ad,
+                        rec["queue_id"], topics, entities, **flags, commit=False
                     )
+                await session.commit()
+        except Exception as e:
+            logger.warning(
+                "classification_worker.bulk_write_failed",
+                records=len(pairs),
+                error=str(e),
+            )
+            for records, result_by_record in groups:
+                await self._write_back(records, result_by_record)
 
-                except Exception as e:
-                    await service.mark_failed(rec["queue_id"], str(e)[:500])
+        await self._refresh_read_models()
 
-        return len(items)
+    async def _refresh_read_models(self) -> None:
+        # Agrégats des carrousels (volumes, top communauté) : throttlés, la
+        # boucle tourne toutes les quelques secondes.
+        await CAROUSEL_AGGREGATES.refresh()
 
     async def drive_once(self) -> int:
         """Traite un lot à la demande, hors run-loop, et renvoie le nb dequeué.
@@ -3,6 +3,7 @@
 import structlog
 
 from app.database import safe_async_session
+from app.services.carousel_aggregates import CAROUSEL_AGGREGATES
 from app.services.sync_service import SyncService
 
 logger = structlog.get_logger()
@@ -19,7 +20,7 @@ async def sync_all_sources() -> dict:
     async with safe_async_session() as session:
         service = SyncService(session, session_maker=safe_async_session)
         try:
-            return await service.sync_all_sources()
+            results = await service.sync_all_sources()
         finally:
             # Libère la connexion Supavisor même si SyncService a entamé une
             # tx implicite sur la session outer (sinon → idle in transaction).
@@ -29,6 +30,35 @@ async def sync_all_sources() -> dict:
                 logger.warning("rss_sync outer rollback failed", exc_info=True)
             await service.close()
 
+    # Hors de la session outer : les agrégats ouvrent leur propre short
+    # session (fail-soft, ne fait jamais échouer le job de sync).
+    await CAROUSEL_AGGREGATES.refresh(force=True)
+    return results
+
+
+async def sync_due_sources() -> dict:
+    """Tick de la planification adaptative : sources dont l'échéance est passée.
+
+    Returns:
+        Dictionnaire de résultats {success, failed, total_new, due, unchanged}
+    """
+    async with safe_async_session() as session:
+        service = SyncService(session, session_maker=safe_async_session)
+        try:
+            results = await service.sync_due_sources()
+        finally:
+            try:
+                await session.rollback()
+            except Exception:
+                logger.warning("rss_sync outer rollback failed", exc_info=True)
+            await service.close()
+
+    if results["due"]:
+        # Tick toutes les minutes : les agrégats restent throttlés (pas de
+        # `force`).
+        await CAROUSEL_AGGREGATES.refresh()
+    return results
+
 
 async def seed_source(source_id: str, *, max_items: int = 10) -> int:
     """Sème synchroniquement une tranche bornée de contenus pour une source.
@@ -31,7 +31,7 @@ from app.services.push_alert_dispatcher import (
 )
 from app.services.push_dispatcher import dispatch_daily_essentiel_pushes
 from app.services.recommendation.scoring_config import ScoringWeights
-from app.workers.rss_sync import sync_all_sources
+from app.workers.rss_sync import sync_all_sources, sync_due_sources
 from app.workers.storage_cleanup import cleanup_old_articles
 
 logger = structlog.get_logger()
@@ -502,15 +502,28 @@ def start_scheduler() -> None:
     # Job de synchronisation RSS (Intervalle).
     # max_instances=1 + coalesce=True : voir la discipline de sérialisation
     # documentée dans la docstring de start_scheduler (appliquée à tous les jobs).
-    scheduler.add_job(
-        sync_all_sources,
-        trigger=IntervalTrigger(minutes=settings.rss_sync_interval_minutes),
-        id="rss_sync",
-        name="RSS Feed Synchronization",
-        replace_existing=True,
-        coalesce=True,
-        max_instances=1,
-    )
+    # Régime adaptatif : tick court qui vide la file des sources échues
+    # (`sync_scheduler`) au lieu d'une rafale sur toutes les sources.
+    if settings.rss_sync_adaptive:
+        scheduler.add_job(
+            sync_due_sources,
+            trigger=IntervalTrigger(seconds=settings.rss_sync_tick_seconds),
+            id="rss_sync",
+            name="RSS Feed Synchronization (adaptive)",
+            replace_existing=True,
+            coalesce=True,
+            max_instances=1,
+        )
+    else:
+        scheduler.add_job(
+            sync_all_sources,
+            trigger=IntervalTrigger(minutes=settings.rss_sync_interval_minutes),
+            id="rss_sync",
+            name="RSS Feed Synchronization",
+            replace_existing=True,
+            coalesce=True,
+            max_instances=1,
+        )
 
     # Job Digest Quotidien (07h30 Paris — voir DIGEST_CRON_HOUR_PARIS pour le
     # rationale : à 06h les Unes du matin ne sont pas encore publiées).
@@ -826,6 +839,7 @@ def start_scheduler() -> None:
             "classification_queue_health_check",
         ],
         rss_interval_minutes=settings.rss_sync_interval_minutes,
+        rss_adaptive=settings.rss_sync_adaptive,
         digest_cron="07:30 Europe/Paris",
         watchdog_cron="08:15 Europe/Paris",
         cleanup_cron="03:00 Europe/Paris",
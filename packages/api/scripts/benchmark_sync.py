@@ -0,0 +1,625 @@
+"""Banc de mesure du sync RSS — débit d'ingestion sur corpus enregistré.
+
+Rejoue le **vrai** `SyncService.sync_all_sources()` contre un Postgres local,
+sur un corpus figé de corps de flux et de débuts de pages article, servi par
+une doublure HTTP à latence réglable. C'est l'instrument des optimisations
+d'ingestion : un changement du hot-path sync se justifie par un avant/après
+mesuré ici, pas par une intuition.
+
+### Ce qui est mesuré, par passage
+
+- **sources/s** et **entrées/s** (nouveaux contenus) sur le temps mur de
+  `sync_all_sources` ;
+- **allers-retours DB par entrée** : chaque requête SQL et chaque commit du
+  moteur partagé (`app.database.engine`), `SET LOCAL` compris ;
+- **p50 / p95 de latence par source** (`process_source`, fetch + parsing +
+  HEAD article + écriture) ;
+- **pic de RSS** du process, et celui des workers de `FEED_INGEST_POOL`.
+
+Le premier passage ingère tout (base vide) ; les suivants (`--passes`)
+mesurent le régime établi : corps inchangés, entrées déjà connues.
+
+### La doublure HTTP
+
+Les pools sortants partagés (`OUTBOUND_HTTP`) sont reconstruits sur un
+`transport_factory` qui répond depuis le corpus : les sources gardent leurs
+vrais hôtes, donc les plafonds par hôte, le keep-alive simulé et le HEAD
+paywall se comportent comme en prod, sans réseau. Chaque réponse attend
+`--latency-ms` (± `--jitter-ms`) et sort par blocs, comme un vrai corps.
+`--scale N` duplique chaque source N fois sous des hôtes `rN.<hôte>` avec des
+guids préfixés, pour mesurer sous charge sans enregistrer plus de flux.
+
+### Le corpus
+
+`tests/fixtures/sync_corpus/manifest.yaml` liste les sources (RSS presse,
+Atom, YouTube, podcast, WordPress) ; `--record` capture leurs flux et les
+débuts de leurs pages article dans `feeds/` et `heads/`, non versionnés. Sans
+capture, le banc tourne sur le corpus jouet de `tests/scripts/fixtures/`.
+
+### La base
+
+Le banc écrit : il exige un Postgres **local** (`DATABASE_URL`, schéma à
+jour) et refuse de tourner si d'autres sources y sont synchronisables — le
+sync les toucherait aussi. Les sources du banc (préfixe `[bench]`) et leurs
+contenus sont supprimés à la fin, sauf `--keep`.
+
+Usage :
+    cd packages/api
+    PYTHONPATH=. python scripts/benchmark_sync.py --record
+    PYTHONPATH=. python scripts/benchmark_sync.py
+    PYTHONPATH=. python scripts/benchmark_sync.py --latency-ms 80 --jitter-ms 40 --scale 10
+    PYTHONPATH=. python scripts/benchmark_sync.py --passes 3 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import resource
+import statistics
+import sys
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+import yaml
+
+from app.models.enums import SourceType
+from app.services.outbound_http import OutboundHTTP, PooledTransport, Purpose
+
+ROOT = Path(__file__).resolve().parent.parent
+CORPUS_DIR = ROOT / "tests/fixtures/sync_corpus"
+TOY_CORPUS_DIR = ROOT / "tests/scripts/fixtures/sync_corpus_toy"
+BENCH_PREFIX = "[bench] "
+CHUNK_BYTES = 16 * 1024
+
+KIND_CONTENT_TYPES = {
+    "rss": "application/rss+xml; charset=utf-8",
+    "atom": "application/atom+xml; charset=utf-8",
+    "youtube": "application/atom+xml; charset=utf-8",
+    "podcast": "application/rss+xml; charset=utf-8",
+    "wordpress": "application/rss+xml; charset=UTF-8",
+}
+
+_REPLICA_HOST = re.compile(r"^r\d+\.")
+_GUID_OPEN = re.compile(rb"(<(?:guid|id)\b[^>]*>(?:<!\[CDATA\[)?)")
+
+
+@dataclass
+class CorpusSource:
+    """Une source du corpus, avec ses charges utiles enregistrées."""
+
+    slug: str
+    name: str
+    kind: str
+    type: SourceType
+    site_url: str
+    feed_url: str
+    body: bytes
+    heads: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def content_type(self) -> str:
+        return KIND_CONTENT_TYPES[self.kind]
+
+
+def load_manifest(corpus_dir: Path) -> dict[str, Any]:
+    return yaml.safe_load((corpus_dir / "manifest.yaml").read_text())
+
+
+def load_corpus(corpus_dir: Path) -> tuple[list[CorpusSource], list[str]]:
+    """Sources dont le flux a été enregistré, et slugs sans capture."""
+    manifest = load_manifest(corpus_dir)
+    report_path = corpus_dir / "record_report.json"
+    recorded = json.loads(report_path.read_text()) if report_path.exists() else {}
+    sources: list[CorpusSource] = []
+    missing: list[str] = []
+    for spec in manifest["sources"]:
+        slug = spec["slug"]
+        feed_path = corpus_dir / "feeds" / f"{slug}.xml"
+        if not feed_path.exists():
+            missing.append(slug)
+            continue
+        heads_path = corpus_dir / "heads" / f"{slug}.json"
+        sources.append(
+            CorpusSource(
+                slug=slug,
+                name=spec["name"],
+                kind=spec["kind"],
+                type=SourceType(spec["type"]),
+                site_url=spec["site_url"],
+                feed_url=recorded.get(slug, {}).get("feed_url")
+                or spec["feed_candidates"][0],
+                body=feed_path.read_bytes(),
+                heads=json.loads(heads_path.read_text()) if heads_path.exists() else {},
+            )
+        )
+    return sources, missing
+
+
+# ─── Doublure HTTP ────────────────────────────────────────────────────
+
+
+def replica_url(url: str, replica: int) -> str:
+    """`url` sous l'hôte `r<replica>.<hôte>` (la réplique 0 est l'original)."""
+    if replica == 0:
+        return url
+    parts = urlsplit(url)
+    return parts._replace(netloc=f"r{replica}.{parts.netloc}").geturl()
+
+
+def original_url(url: str) -> tuple[str, int]:
+    """Inverse de `replica_url` : URL enregistrée et numéro de réplique."""
+    parts = urlsplit(url)
+    match = _REPLICA_HOST.match(parts.netloc)
+    if match is None:
+        return url, 0
+    netloc = parts.netloc[match.end() :]
+    return parts._replace(netloc=netloc).geturl(), int(match.group()[1:-1])
+
+
+def replica_body(source: CorpusSource, replica: int) -> bytes:
+    """Corps de flux d'une réplique : liens sous son hôte, guids préfixés
+    (`contents.guid` dédoublonne tout le catalogue, toutes sources)."""
+    if replica == 0:
+        return source.body
+    body = _GUID_OPEN.sub(rb"\1" + f"r{replica}-".encode(), source.body)
+    for url in {source.site_url, source.feed_url, *source.heads}:
+        netloc = urlsplit(url).netloc.encode()
+        body = body.replace(b"//" + netloc, b"//" + f"r{replica}.".encode() + netloc)
+    return body
+
+
+class _ChunkedBody(httpx.AsyncByteStream):
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for start in range(0, len(self._body), CHUNK_BYTES):
+            yield self._body[start : start + CHUNK_BYTES]
+            await asyncio.sleep(0)
+
+
+class ReplayStandIn:
+    """Serveur HTTP de remplacement : flux et pages du corpus, latence réglable."""
+
+    def __init__(
+        self,
+        sources: list[CorpusSource],
+        *,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        self._feeds = {s.feed_url: s for s in sources}
+        self._heads = {url: html for s in sources for url, html in s.heads.items()}
+        self._latency = latency_ms / 1000
+        self._jitter = jitter_ms / 1000
+        self._random = random.Random(seed)
+        self.stats = {"requests": 0, "feeds": 0, "heads": 0, "not_found": 0, "bytes": 0}
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.stats["requests"] += 1
+        delay = self._latency + self._random.uniform(-self._jitter, self._jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        url, replica = original_url(str(request.url))
+        source = self._feeds.get(url)
+        if source is not None:
+            self.stats["feeds"] += 1
+            body = replica_body(source, replica)
+            content_type = source.content_type
+        elif url in self._heads:
+            self.stats["heads"] += 1
+            body = self._heads[url].encode()
+            content_type = "text/html; charset=utf-8"
+        else:
+            self.stats["not_found"] += 1
+            return httpx.Response(404, content=b"not in corpus")
+        self.stats["bytes"] += len(body)
+        return httpx.Response(
+            200,
+            headers={"content-type": content_type, "content-length": str(len(body))},
+            stream=_ChunkedBody(body),
+        )
+
+    def transport_factory(self, purpose: Purpose) -> PooledTransport:
+        return PooledTransport(
+            httpx.MockTransport(self.handle), per_host=purpose.per_host
+        )
+
+    def outbound(self) -> OutboundHTTP:
+        return OutboundHTTP(transport_factory=self.transport_factory)
+
+
+# ─── Mesures ──────────────────────────────────────────────────────────
+
+
+@dataclass
+class PassReport:
+    """Mesures d'un passage de `sync_all_sources`."""
+
+    sources: int
+    seconds: float
+    new_entries: int
+    failed: int
+    unchanged: int
+    db_round_trips: int
+    latencies_ms: list[float]
+    http: dict[str, int]
+
+    @property
+    def sources_per_s(self) -> float:
+        return self.sources / self.seconds if self.seconds else 0.0
+
+    @property
+    def entries_per_s(self) -> float:
+        return self.new_entries / self.seconds if self.seconds else 0.0
+
+    @property
+    def round_trips_per_entry(self) -> float | None:
+        return self.db_round_trips / self.new_entries if self.new_entries else None
+
+    def latency_ms(self, pct: int) -> float:
+        return percentile(self.latencies_ms, pct)
+
+    def as_dict(self) -> dict[str, Any]:
+        out = asdict(self)
+        del out["latencies_ms"]
+        out.update(
+            sources_per_s=round(self.sources_per_s, 2),
+            entries_per_s=round(self.entries_per_s, 2),
+            round_trips_per_entry=(
+                round(self.round_trips_per_entry, 2)
+                if self.round_trips_per_entry is not None
+                else None
+            ),
+            p50_source_ms=round(self.latency_ms(50), 1),
+            p95_source_ms=round(self.latency_ms(95), 1),
+            seconds=round(self.seconds, 3),
+        )
+        return out
+
+
+def percentile(values: list[float], pct: int) -> float:
+    """Percentile inclusif (0 sur liste vide) — assez pour une poignée de sources."""
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[pct - 1]
+
+
+def peak_rss_mb() -> dict[str, float]:
+    """Pic de RSS (Mo) du process et des workers terminés (Linux : ko)."""
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return {
+        "self": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale, 1),
+        "ingest_workers": round(
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale, 1
+        ),
+    }
+
+
+@contextmanager
+def count_round_trips(engine) -> Iterator[list[int]]:
+    """Compte requêtes et commits du moteur pendant le bloc (`counter[0]`)."""
+    from sqlalchemy import event
+
+    counter = [0]
+
+    def _bump(*_args, **_kwargs) -> None:
+        counter[0] += 1
+
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _bump)
+    event.listen(sync_engine, "commit", _bump)
+    try:
+        yield counter
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", _bump)
+        event.remove(sync_engine, "commit", _bump)
+
+
+# ─── Base locale ──────────────────────────────────────────────────────
+
+
+def _assert_local_database(database_url: str) -> None:
+    host = urlsplit(database_url).hostname or ""
+    if host not in {"localhost", "127.0.0.1", "::1"}:
+        raise SystemExit(
+            f"Base {host or '?'} refusée : le banc écrit des sources et des "
+            "contenus, il ne tourne que sur un Postgres local."
+        )
+
+
+async def _prepare_database(rows: list[dict[str, Any]]) -> None:
+    """Sources du banc fraîches ; refuse une base avec d'autres sources actives."""
+    from sqlalchemy import delete, func, select
+
+    from app.database import safe_async_session
+    from app.models.source import Source
+    from app.services.sync_service import SyncService
+
+    async with safe_async_session() as session:
+        await session.execute(
+            delete(Source).where(Source.name.startswith(BENCH_PREFIX))
+        )
+        others = await session.scalar(
+            select(func.count())
+            .select_from(Source)
+            .where(SyncService._syncable_clause())
+        )
+        if others:
+            await session.rollback()
+            raise SystemExit(
+                f"{others} source(s) synchronisable(s) hors banc dans cette base : "
+                "sync_all_sources les toucherait. Utiliser une base dédiée."
+            )
+        session.add_all(Source(**row) for row in rows)
+        await session.commit()
+
+
+async def _cleanup_database() -> None:
+    from sqlalchemy import delete
+
+    from app.database import safe_async_session
+    from app.models.source import Source
+
+    async with safe_async_session() as session:
+        # ON DELETE CASCADE : contenus et file de classification suivent.
+        await session.execute(
+            delete(Source).where(Source.name.startswith(BENCH_PREFIX))
+        )
+        await session.commit()
+
+
+def source_rows(sources: list[CorpusSource], scale: int) -> list[dict[str, Any]]:
+    """Lignes `sources` du banc, `scale` répliques par source du corpus."""
+    return [
+        {
+            "name": f"{BENCH_PREFIX}{source.name}"
+            + (f" #{replica}" if replica else ""),
+            "url": replica_url(source.site_url, replica),
+            "feed_url": replica_url(source.feed_url, replica),
+            "type": source.type,
+            "theme": "bench",
+            "is_curated": True,
+            "is_active": True,
+        }
+        for replica in range(scale)
+        for source in sources
+    ]
+
+
+async def run_pass(stand_in: ReplayStandIn) -> PassReport:
+    """Un `sync_all_sources` complet, comme le job planifié."""
+    from app.database import engine, safe_async_session
+    from app.services.sync_service import SyncService
+
+    latencies: list[float] = []
+
+    class _TimedSyncService(SyncService):
+        # `copy.copy` par source garde la classe et la même liste.
+        async def process_source(self, source):
+            started = time.perf_counter()
+            try:
+                return await super().process_source(source)
+            finally:
+                latencies.append((time.perf_counter() - started) * 1000)
+
+    http_before = dict(stand_in.stats)
+    async with safe_async_session() as session:
+        service = _TimedSyncService(session, session_maker=safe_async_session)
+        try:
+            with count_round_trips(engine) as round_trips:
+                started = time.perf_counter()
+                results = await service.sync_all_sources()
+                seconds = time.perf_counter() - started
+        finally:
+            await session.rollback()
+            await service.close()
+
+    return PassReport(
+        sources=results["success"] + results["failed"],
+        seconds=seconds,
+        new_entries=results["total_new"],
+        failed=results["failed"],
+        unchanged=results.get("unchanged", 0),
+        db_round_trips=round_trips[0],
+        latencies_ms=latencies,
+        http={k: v - http_before[k] for k, v in stand_in.stats.items()},
+    )
+
+
+async def benchmark(
+    sources: list[CorpusSource],
+    *,
+    scale: int,
+    passes: int,
+    latency_ms: float,
+    jitter_ms: float,
+    keep: bool,
+) -> dict[str, Any]:
+    from app.config import get_settings
+    from app.services import sync_service
+    from app.services.feed_ingest_pool import FEED_INGEST_POOL
+
+    _assert_local_database(get_settings().database_url)
+    stand_in = ReplayStandIn(sources, latency_ms=latency_ms, jitter_ms=jitter_ms)
+    # `SyncService` prend son client sur `sync_service.OUTBOUND_HTTP` à la
+    # construction : la doublure remplace ce seul point d'entrée.
+    real_outbound = sync_service.OUTBOUND_HTTP
+    sync_service.OUTBOUND_HTTP = stand_in.outbound()
+    await _prepare_database(source_rows(sources, scale))
+    try:
+        reports = [await run_pass(stand_in) for _ in range(passes)]
+    finally:
+        await sync_service.OUTBOUND_HTTP.aclose()
+        sync_service.OUTBOUND_HTTP = real_outbound
+        FEED_INGEST_POOL.shutdown()
+        if not keep:
+            await _cleanup_database()
+
+    return {
+        "corpus": sorted({s.slug for s in sources}),
+        "scale": scale,
+        "latency_ms": latency_ms,
+        "jitter_ms": jitter_ms,
+        "passes": [r.as_dict() for r in reports],
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+# ─── Enregistrement du corpus ─────────────────────────────────────────
+
+
+async def record_corpus(corpus_dir: Path) -> dict[str, dict[str, Any]]:
+    """Capture flux et débuts de pages article des sources du manifeste."""
+    import feedparser
+
+    from app.services.article_head_fetcher import HEAD_MAX_CHARS
+    from app.services.outbound_http import OUTBOUND_HTTP
+
+    manifest = load_manifest(corpus_dir)
+    max_heads = manifest.get("max_heads_per_source", 20)
+    (corpus_dir / "feeds").mkdir(exist_ok=True)
+    (corpus_dir / "heads").mkdir(exist_ok=True)
+    client = OUTBOUND_HTTP.client("feeds")
+    report: dict[str, dict[str, Any]] = {}
+
+    for spec in manifest["sources"]:
+        slug = spec["slug"]
+        entry: dict[str, Any] = {"errors": []}
+        for candidate in spec["feed_candidates"]:
+            try:
+                response = await client.get(candidate)
+                response.raise_for_status()
+            except httpx.HTTPError as exc:
+                entry["errors"].append(f"{candidate}: {exc}")
+                continue
+            parsed = feedparser.parse(response.content)
+            if not parsed.entries:
+                entry["errors"].append(f"{candidate}: no entries")
+                continue
+            (corpus_dir / "feeds" / f"{slug}.xml").write_bytes(response.content)
+            entry.update(feed_url=candidate, entries=len(parsed.entries))
+            break
+        else:
+            report[slug] = entry
+            print(f"  ✗ {slug}: aucune candidate valide")
+            continue
+
+        heads: dict[str, str] = {}
+        for item in parsed.entries[:max_heads]:
+            link = item.get("link")
+            if not link or spec["kind"] in {"youtube", "podcast"}:
+                continue
+            try:
+                page = await client.get(
+                    link, headers={"Range": f"bytes=0-{HEAD_MAX_CHARS}"}
+                )
+            except httpx.HTTPError:
+                continue
+            if page.status_code in (200, 206):
+                heads[link] = page.text[:HEAD_MAX_CHARS]
+        (corpus_dir / "heads" / f"{slug}.json").write_text(
+            json.dumps(heads, ensure_ascii=False, indent=1)
+        )
+        entry["heads"] = len(heads)
+        report[slug] = entry
+        print(f"  ✓ {slug}: {entry['entries']} entrées, {len(heads)} pages")
+
+    await OUTBOUND_HTTP.aclose()
+    (corpus_dir / "record_report.json").write_text(
+        json.dumps(report, ensure_ascii=False, indent=2)
+    )
+    return report
+
+
+# ─── Rendu ────────────────────────────────────────────────────────────
+
+
+def render(result: dict[str, Any]) -> str:
+    lines = [
+        f"Corpus : {len(result['corpus'])} sources × {result['scale']} "
+        f"(latence {result['latency_ms']:g} ± {result['jitter_ms']:g} ms)",
+        "",
+        f"{'passage':>8} {'sources/s':>10} {'entrées/s':>10} {'nouv.':>7} "
+        f"{'AR DB/entrée':>13} {'p50 ms':>8} {'p95 ms':>8} {'échecs':>7}",
+    ]
+    for index, p in enumerate(result["passes"], start=1):
+        per_entry = p["round_trips_per_entry"]
+        lines.append(
+            f"{index:>8} {p['sources_per_s']:>10.2f} {p['entries_per_s']:>10.2f} "
+            f"{p['new_entries']:>7} "
+            f"{(f'{per_entry:.2f}' if per_entry is not None else '—'):>13} "
+            f"{p['p50_source_ms']:>8.1f} {p['p95_source_ms']:>8.1f} {p['failed']:>7}"
+        )
+    rss = result["peak_rss_mb"]
+    lines += [
+        "",
+        f"Pic RSS : {rss['self']} Mo (process), {rss['ingest_workers']} Mo (workers)",
+    ]
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--corpus", type=Path, default=None, help="dossier du corpus")
+    parser.add_argument(
+        "--record", action="store_true", help="capture le corpus du manifeste"
+    )
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument(
+        "--scale", type=int, default=1, help="répliques de chaque source"
+    )
+    parser.add_argument("--passes", type=int, default=2)
+    parser.add_argument(
+        "--keep", action="store_true", help="garde sources et contenus du banc"
+    )
+    parser.add_argument("--json", action="store_true", help="sortie JSON")
+    args = parser.parse_args()
+
+    if args.record:
+        report = asyncio.run(record_corpus(args.corpus or CORPUS_DIR))
+        return 0 if all("feed_url" in e for e in report.values()) else 1
+
+    corpus_dir = args.corpus or CORPUS_DIR
+    sources, missing = load_corpus(corpus_dir)
+    if not sources and args.corpus is None:
+        print(f"Corpus non enregistré ({CORPUS_DIR}) : corpus jouet.", file=sys.stderr)
+        sources, missing = load_corpus(TOY_CORPUS_DIR)
+    if missing:
+        print(f"Sans capture, ignorées : {', '.join(missing)}", file=sys.stderr)
+    if not sources:
+        print("Aucune source enregistrée.", file=sys.stderr)
+        return 1
+
+    result = asyncio.run(
+        benchmark(
+            sources,
+            scale=max(1, args.scale),
+            passes=max(1, args.passes),
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            keep=args.keep,
+        )
+    )
+    print(json.dumps(result, indent=2) if args.json else render(result))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -21,6 +21,10 @@ codes 200 **et** 206, troncature à 50 000 caractères. Toute divergence ici
 rendrait la baseline non représentative : c'est le seul endroit du corpus où
 une approximation se paie en mesure fausse.
 
+Depuis `ArticleHeadFetcher`, la prod arrête de lire dès que
+`head_is_complete` (`</head>` + un bloc JSON-LD) : le corpus garde les 50 000
+caractères, dont la lecture de prod est un préfixe.
+
 Le fetch du flux réplique `_fetch_feed_content`, repli anti-bot compris.
 
 ### Append-only sur les labels
@@ -0,0 +1,437 @@
+"""Compare le mode de classification séparé (3 appels Mistral par lot) au mode
+fusionné (1 appel, `CLASSIFICATION_FUSED_ENABLED`) sur les mêmes articles.
+
+Les deux modes passent par le code du worker (`_classify_separately` /
+`_classify_fused`, fallbacks compris) et par les vrais appels Mistral — il
+faut donc `MISTRAL_API_KEY`. Produit un rapport markdown combinant :
+- Coût : appels, tokens prompt / completion par mode (interceptés sur
+  `record_api_call`, rien n'est écrit dans `api_usage_events`).
+- Latence mur par lot (p50 / p95) — celle d'une voie du worker.
+- Accord fusionné ↔ séparé : topic principal, Jaccard topics, κ sur
+  serene / is_ad / good_news, F1 entités (nom normalisé + type).
+- Champs invalides dans la réponse fusionnée (= fallbacks déclenchés).
+- Section qualitative : articles où les deux modes divergent.
+
+Gate d'activation : à lancer sur un corpus représentatif avant de passer le
+flag à true ; le mode séparé sert de référence (pas de gold humain).
+
+Usage :
+    cd packages/api && python scripts/compare_classification_modes.py \\
+        --from-db 200 \\
+        --out ../../.context/classification-fused-vs-separate.md
+
+    # Ou sur un corpus figé (JSON : [{"title", "description", "source_name"}])
+    cd packages/api && python scripts/compare_classification_modes.py \\
+        --input ../../.context/classification-corpus.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from scripts.compare_annotations import cohen_kappa  # noqa: E402
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+CONTEXT_DIR = REPO_ROOT / ".context"
+
+MODES = ("separate", "fused")
+FLAG_FIELDS = ("serene", "is_ad", "good_news")
+
+
+# ---------------------------------------------------------------------------
+# Corpus
+# ---------------------------------------------------------------------------
+
+
+def load_items(path: Path) -> list[dict]:
+    """Charge un corpus JSON (liste d'articles, ou `{"items": [...]}`)."""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if isinstance(data, dict):
+        data = data.get("items", [])
+    return [
+        {
+            "title": item.get("title") or "",
+            "description": item.get("description") or "",
+            "source_name": item.get("source_name") or "",
+        }
+        for item in data
+        if item.get("title")
+    ]
+
+
+async def load_items_from_db(limit: int) -> list[dict]:
+    """Les `limit` derniers contenus publiés, avec le nom de leur source."""
+    from sqlalchemy import select
+
+    from app.database import safe_async_session
+    from app.models.content import Content
+    from app.models.source import Source
+
+    async with safe_async_session() as session:
+        rows = await session.execute(
+            select(Content.title, Content.description, Source.name)
+            .join(Source, Source.id == Content.source_id)
+            .where(Content.title.is_not(None))
+            .order_by(Content.published_at.desc())
+            .limit(limit)
+        )
+        return [
+            {
+                "title": title,
+                "description": description or "",
+                "source_name": source_name or "",
+            }
+            for title, description, source_name in rows
+        ]
+
+
+# ---------------------------------------------------------------------------
+# Runs
+# ---------------------------------------------------------------------------
+
+
+class UsageCollector:
+    """Remplace `record_api_call` : agrège les appels en mémoire par mode."""
+
+    def __init__(self) -> None:
+        self.mode = MODES[0]
+        self.calls: dict[str, list[dict]] = {mode: [] for mode in MODES}
+
+    async def __call__(self, provider: str, call_site: str, **kwargs) -> None:
+        self.calls[self.mode].append({"call_site": call_site, **kwargs})
+
+    def summary(self, mode: str) -> dict:
+        calls = self.calls[mode]
+        by_site: dict[str, int] = {}
+        for call in calls:
+            by_site[call["call_site"]] = by_site.get(call["call_site"], 0) + 1
+        return {
+            "calls": len(calls),
+            "errors": sum(1 for c in calls if c.get("status") != "ok"),
+            "prompt_tokens": sum(c.get("prompt_tokens") or 0 for c in calls),
+            "completion_tokens": sum(c.get("completion_tokens") or 0 for c in calls),
+            "cached_prompt_tokens": sum(
+                c.get("cached_prompt_tokens") or 0 for c in calls
+            ),
+            "by_call_site": by_site,
+        }
+
+
+async def run_modes(items: list[dict], batch_size: int | None) -> dict:
+    """Classe chaque lot dans les deux modes ; résultats, latences, usage."""
+    from unittest.mock import patch
+
+    from app.workers.classification_worker import ClassificationWorker
+
+    worker = ClassificationWorker(batch_size=batch_size, lanes=1)
+    batch_size = worker.batch_size
+    fused_classifier = worker._get_fused_classifier()
+    raw_fused: list[dict] = []
+    classify_fused_batch = fused_classifier.classify_batch_async
+
+    async def capture_fused(batch: list[dict], top_k: int = 3) -> list[dict]:
+        result = await classify_fused_batch(batch, top_k)
+        raw_fused.extend(result)
+        return result
+
+    collector = UsageCollector()
+    results: dict[str, list[dict]] = {mode: [] for mode in MODES}
+    latencies: dict[str, list[float]] = {mode: [] for mode in MODES}
+    batches = [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
+
+    with (
+        patch("app.services.observability.usage_recorder.record_api_call", collector),
+        patch.object(fused_classifier, "classify_batch_async", capture_fused),
+    ):
+        for n, batch in enumerate(batches, start=1):
+            for mode in MODES:
+                collector.mode = mode
+                run = (
+                    worker._classify_fused
+                    if mode == "fused"
+                    else worker._classify_separately
+                )
+                started = time.perf_counter()
+                results[mode].extend(await run(batch))
+                latencies[mode].append((time.perf_counter() - started) * 1000)
+            print(f"  lot {n}/{len(batches)} ✓", file=sys.stderr)
+
+    await worker.engine.dispose()
+    return {
+        "batch_size": batch_size,
+        "results": results,
+        "latencies": latencies,
+        "usage": {mode: collector.summary(mode) for mode in MODES},
+        "invalid_fields": count_invalid_fields(raw_fused),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+
+def count_invalid_fields(raw_fused: list[dict]) -> dict[str, int]:
+    """Champs None dans la réponse fusionnée brute, par champ."""
+    fields = ("topics", "serene", "is_ad", "entities", "good_news")
+    return {f: sum(1 for r in raw_fused if r.get(f) is None) for f in fields}
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def jaccard(left: list[str], right: list[str]) -> float:
+    a, b = set(left), set(right)
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def _entity_keys(entities: list[dict] | None) -> set[tuple[str, str]]:
+    return {
+        ((e.get("name") or "").strip().casefold(), e.get("type") or "")
+        for e in entities or []
+    }
+
+
+def entity_f1(reference: list[dict] | None, candidate: list[dict] | None) -> float:
+    """F1 sur les entités (nom normalisé + type) ; 1.0 si toutes deux vides."""
+    ref, cand = _entity_keys(reference), _entity_keys(candidate)
+    if not ref and not cand:
+        return 1.0
+    tp = len(ref & cand)
+    if tp == 0:
+        return 0.0
+    precision, recall = tp / len(cand), tp / len(ref)
+    return 2 * precision * recall / (precision + recall)
+
+
+def agreement(separate: list[dict], fused: list[dict]) -> dict:
+    """Accord du mode fusionné sur le mode séparé (référence)."""
+    pairs = list(zip(separate, fused, strict=False))
+    if not pairs:
+        return {}
+    primary = [
+        (s.get("topics") or [None])[0] == (f.get("topics") or [None])[0]
+        for s, f in pairs
+    ]
+    out = {
+        "n": len(pairs),
+        "primary_topic": sum(primary) / len(pairs),
+        "topics_jaccard": statistics.mean(
+            jaccard(s.get("topics") or [], f.get("topics") or []) for s, f in pairs
+        ),
+        "entities_f1": statistics.mean(
+            entity_f1(s.get("entities"), f.get("entities")) for s, f in pairs
+        ),
+    }
+    for field in FLAG_FIELDS:
+        out[f"{field}_kappa"] = cohen_kappa(
+            [(str(s.get(field)), str(f.get(field))) for s, f in pairs]
+        )
+        out[f"{field}_match"] = sum(
+            1 for s, f in pairs if s.get(field) == f.get(field)
+        ) / len(pairs)
+    return out
+
+
+def disagreements(
+    items: list[dict], separate: list[dict], fused: list[dict], n: int
+) -> list[tuple[dict, dict, dict, list[str]]]:
+    """Articles où les modes divergent, les plus de champs en désaccord d'abord."""
+    ranked: list[tuple[int, int, list[str]]] = []
+    for idx, (s, f) in enumerate(zip(separate, fused, strict=False)):
+        fields = []
+        if (s.get("topics") or [None])[0] != (f.get("topics") or [None])[0]:
+            fields.append("topics")
+        fields.extend(field for field in FLAG_FIELDS if s.get(field) != f.get(field))
+        if entity_f1(s.get("entities"), f.get("entities")) < 1.0:
+            fields.append("entities")
+        if fields:
+            ranked.append((-len(fields), idx, fields))
+    ranked.sort()
+    return [
+        (items[idx], separate[idx], fused[idx], fields) for _, idx, fields in ranked[:n]
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Markdown rendering
+# ---------------------------------------------------------------------------
+
+
+def _format_result(result: dict) -> str:
+    entities = ", ".join(
+        f"{e.get('name')}/{e.get('type')}" for e in result.get("entities") or []
+    )
+    return (
+        f"topics={result.get('topics') or []} · serene={result.get('serene')} · "
+        f"is_ad={result.get('is_ad')} · good_news={result.get('good_news')} · "
+        f"entités=[{entities}]"
+    )
+
+
+def render_report(items: list[dict], run: dict, samples: int) -> str:
+    today = datetime.now(UTC).date().isoformat()
+    usage, latencies = run["usage"], run["latencies"]
+    separate, fused = run["results"]["separate"], run["results"]["fused"]
+    metrics = agreement(separate, fused)
+
+    out: list[str] = [
+        f"# Classification fusionnée ↔ séparée ({today})",
+        "",
+        f"- Articles : {len(items)} (lots de {run['batch_size']}, "
+        f"{len(latencies['separate'])} lots)",
+        "- Référence : mode séparé (production actuelle), pas de gold humain.",
+        "",
+        "## Coût et latence",
+        "",
+        "| Mode | Appels | Erreurs | Tokens prompt | dont cache | "
+        "Tokens completion | p50 lot (ms) | p95 lot (ms) |",
+        "|---|---:|---:|---:|---:|---:|---:|---:|",
+    ]
+    for mode in MODES:
+        u = usage[mode]
+        out.append(
+            f"| {mode} | {u['calls']} | {u['errors']} | {u['prompt_tokens']} | "
+            f"{u['cached_prompt_tokens']} | {u['completion_tokens']} | "
+            f"{percentile(latencies[mode], 0.5):.0f} | "
+            f"{percentile(latencies[mode], 0.95):.0f} |"
+        )
+    out.extend(["", "Appels par call site :", ""])
+    for mode in MODES:
+        sites = ", ".join(
+            f"`{site}` × {count}"
+            for site, count in sorted(usage[mode]["by_call_site"].items())
+        )
+        out.append(f"- {mode} : {sites or '_(aucun)_'}")
+
+    out.extend(
+        [
+            "",
+            "## Accord fusionné ↔ séparé",
+            "",
+            "| Métrique | Valeur |",
+            "|---|---:|",
+        ]
+    )
+    if metrics:
+        out.append(f"| Topic principal identique | {metrics['primary_topic']:.3f} |")
+        out.append(f"| Jaccard topics | {metrics['topics_jaccard']:.3f} |")
+        for field in FLAG_FIELDS:
+            out.append(
+                f"| {field} : accord / κ | {metrics[f'{field}_match']:.3f} / "
+                f"{metrics[f'{field}_kappa']:.3f} |"
+            )
+        out.append(f"| F1 entités | {metrics['entities_f1']:.3f} |")
+
+    out.extend(
+        [
+            "",
+            "## Champs invalides dans la réponse fusionnée (→ fallback)",
+            "",
+            "| Champ | Articles |",
+            "|---|---:|",
+        ]
+    )
+    for field, count in run["invalid_fields"].items():
+        out.append(f"| {field} | {count} |")
+
+    out.extend(
+        [
+            "",
+            "## Échantillon qualitatif",
+            "",
+            "Articles triés par nombre de champs en désaccord décroissant.",
+            "",
+        ]
+    )
+    for item, s, f, fields in disagreements(items, separate, fused, samples):
+        out.append(f"### {item['title']}")
+        out.append("")
+        out.append(
+            f"_Source : {item['source_name'] or '?'} · désaccord : {', '.join(fields)}_"
+        )
+        out.append("")
+        out.append(f"- **séparé** : {_format_result(s)}")
+        out.append(f"- **fusionné** : {_format_result(f)}")
+        out.append("")
+
+    return "\n".join(out)
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
+        "--input",
+        help="Corpus JSON : liste de {title, description, source_name}.",
+    )
+    source.add_argument(
+        "--from-db",
+        type=int,
+        metavar="N",
+        help="Classe les N derniers contenus publiés en base.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Taille des lots (défaut : CLASSIFICATION_WORKER_BATCH_SIZE).",
+    )
+    parser.add_argument(
+        "--out",
+        default=None,
+        help="Chemin du rapport markdown (défaut : .context/classification-fused-vs-separate-<date>.md)",
+    )
+    parser.add_argument(
+        "--samples",
+        type=int,
+        default=15,
+        help="Nombre d'articles montrés en section qualitative.",
+    )
+    args = parser.parse_args()
+
+    if args.input:
+        items = load_items(Path(args.input))
+    else:
+        items = asyncio.run(load_items_from_db(args.from_db))
+    if not items:
+        print("❌ Corpus vide.", file=sys.stderr)
+        sys.exit(2)
+
+    run = asyncio.run(run_modes(items, args.batch_size))
+    report = render_report(items, run, args.samples)
+
+    today = datetime.now(UTC).date().isoformat()
+    out_path = (
+        Path(args.out)
+        if args.out
+        else CONTEXT_DIR / f"classification-fused-vs-separate-{today}.md"
+    )
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(report, encoding="utf-8")
+    print(f"✓ Rapport : {out_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -21,7 +21,7 @@ et le harnais est construit pour rendre ce verdict mécanique.
 ### Reconstitution des entrées
 
 Les arguments passés à `detect_paywall()` sont reconstruits **comme
-`_parse_entry` le fait** pour un article (`sync_service.py`, branche ARTICLE) :
+`parse_entry` le fait** pour un article (`feed_entry_parser.py`, branche ARTICLE) :
 `description` = `html.unescape(entry.summary)`, `html_content` =
 `content:encoded`. Le `html_head` vient du fichier capturé par
 `build_paywall_corpus.py`.
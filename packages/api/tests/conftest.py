@@ -15,7 +15,12 @@ from app.config import get_settings
 from app.database import Base
 from app.models.enums import SourceType
 from app.models.source import Source
+from app.services.cache_refresh import BACKGROUND_REFRESHER
+from app.services.candidate_pool_cache import CANDIDATE_POOL_CACHE
 from app.services.feed_cache import FEED_CACHE
+from app.services.feed_detection_cache import FEED_DETECTION_CACHE
+from app.services.feed_ingest_pool import FEED_INGEST_POOL
+from app.services.user_context_cache import USER_CONTEXT_CACHE
 
 settings = get_settings()
 
@@ -46,21 +51,31 @@ def _reset_feed_cache():
     # same UUID (heisenbugs). Clearing before AND after also guards
     # against test-ordering flakes. `clear()` also resets the invalidation
     # generations — a counter left high by one test would silently drop the
-    # next test's `put()`.
+    # next test's `put()`. Same for the per-user scoring-input snapshot, the
+    # shared candidate pool, the stale-while-revalidate refresher and the
+    # feed detection outcomes (tests reuse the same hosts with other mocks).
     FEED_CACHE.clear()
     FEED_CACHE.reset_stats()
+    USER_CONTEXT_CACHE.clear()
+    CANDIDATE_POOL_CACHE.clear()
+    BACKGROUND_REFRESHER.clear()
+    FEED_DETECTION_CACHE.clear()
     yield
     FEED_CACHE.clear()
     FEED_CACHE.reset_stats()
+    USER_CONTEXT_CACHE.clear()
+    CANDIDATE_POOL_CACHE.clear()
+    BACKGROUND_REFRESHER.clear()
+    FEED_DETECTION_CACHE.clear()
 
 
 @pytest.fixture
 def feed_cache_payload():
     """Build a cached-feed payload mentioning the given content ids.
 
-    `FeedPageCache.invalidate_content` matches by scanning the serialized
-    payload for `str(content_id)`, so the shape of this string *is* the
-    contract under test — hence one definition shared by the unit tests
+    `FeedPageCache.invalidate_content` matches through a reverse index of the
+    `str(UUID)` occurrences of the serialized payload, so the shape of this
+    string *is* the contract under test — hence one definition shared by the unit tests
     (`tests/services/test_feed_cache.py`) and the endpoint tests
     (`tests/routers/test_feed_cache_invalidation_sites.py`) rather than a
     copy in each. The real serialization is pinned separately by
@@ -132,6 +147,19 @@ def _reset_mistral_rate_limiter():
     _reset_large_limiter()
 
 
+@pytest.fixture(autouse=True)
+def _inline_feed_ingest_pool(monkeypatch):
+    # FEED_INGEST_POOL is a module-level singleton whose queue semaphore binds
+    # to the running event loop, and whose spawned workers would re-import
+    # the whole app. Unit tests run it inline (thread executor, monkeypatches
+    # apply); the process pool itself is exercised in
+    # tests/services/test_feed_ingest_pool.py.
+    monkeypatch.setattr(FEED_INGEST_POOL, "_workers", 0)
+    FEED_INGEST_POOL.shutdown()
+    yield
+    FEED_INGEST_POOL.shutdown()
+
+
 @pytest.fixture(scope="session")
 def create_tables():
     """Create all database tables from model definitions (once per session).
@@ -0,0 +1,136 @@
+"""Tests unitaires pour `fused_classification` (validateur strict + payload).
+
+Pas d'appel réseau : on stubbe `ClassificationService._call_mistral` pour
+vérifier le parsing champ par champ et la forme du payload.
+"""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.ml.fused_classification import (
+    FUSED_CACHE_KEY,
+    FUSED_FIELDS,
+    FUSED_SYSTEM_PROMPT,
+    FusedClassifier,
+    _build_user_prompt,
+    parse_fused_response,
+)
+
+_VALID = {
+    "topics": ["health", "science"],
+    "serene": True,
+    "entities": [{"name": "Institut Pasteur", "type": "ORG"}],
+    "is_ad": False,
+    "good_news": True,
+}
+
+
+class TestParseFusedResponse:
+    def test_valid_item(self) -> None:
+        result = parse_fused_response(json.dumps([_VALID]), expected_count=1)
+        assert result[0]["topics"] == ["health", "science"]
+        assert result[0]["serene"] is True
+        assert result[0]["is_ad"] is False
+        assert result[0]["good_news"] is True
+        assert result[0]["entities"][0]["name"] == "Institut Pasteur"
+
+    def test_invalid_fields_are_none_individually(self) -> None:
+        item = {
+            "topics": ["not-a-slug"],
+            "serene": "maybe",
+            "entities": "Macron",
+            "is_ad": False,
+        }
+        result = parse_fused_response(json.dumps([item]), expected_count=1)
+        assert result[0] == {
+            "topics": None,
+            "serene": None,
+            "is_ad": False,
+            "entities": None,
+            "good_news": None,
+        }
+
+    def test_empty_entities_list_is_valid(self) -> None:
+        raw = json.dumps([{**_VALID, "entities": []}])
+        assert parse_fused_response(raw, expected_count=1)[0]["entities"] == []
+
+    def test_topics_capped_at_top_k(self) -> None:
+        raw = json.dumps([{**_VALID, "topics": ["health", "science", "ai", "tech"]}])
+        assert parse_fused_response(raw, expected_count=1, top_k=2)[0]["topics"] == [
+            "health",
+            "science",
+        ]
+
+    def test_invalid_json_all_none(self) -> None:
+        result = parse_fused_response("not json", expected_count=2)
+        assert result == [dict.fromkeys(FUSED_FIELDS)] * 2
+
+    def test_object_instead_of_array_all_none(self) -> None:
+        result = parse_fused_response(json.dumps(_VALID), expected_count=1)
+        assert result == [dict.fromkeys(FUSED_FIELDS)]
+
+    def test_padding_when_short(self) -> None:
+        result = parse_fused_response(json.dumps([_VALID]), expected_count=3)
+        assert result[0]["serene"] is True
+        assert result[1:] == [dict.fromkeys(FUSED_FIELDS)] * 2
+
+
+class TestPrompts:
+    def test_system_prompt_composes_both_passes(self) -> None:
+        # Taxonomie de la passe 1, règles good-news de la passe 2, un seul FORMAT.
+        assert "health" in FUSED_SYSTEM_PROMPT
+        assert "RÈGLE D'OR" in FUSED_SYSTEM_PROMPT
+        assert FUSED_SYSTEM_PROMPT.count("## FORMAT") == 1
+        assert '"good_news": true/false' in FUSED_SYSTEM_PROMPT
+
+    def test_user_prompt(self) -> None:
+        prompt = _build_user_prompt(
+            [
+                {"title": "Article un", "description": "x" * 1000},
+                {"title": "Article deux", "source_name": "Reporterre"},
+            ]
+        )
+        assert "[1]\nArticle un" in prompt
+        assert "[2] [Source: Reporterre]" in prompt
+        assert "exactement 2 éléments" in prompt
+        assert "x" * 250 not in prompt
+
+
+class TestFusedClassifierBatch:
+    @pytest.mark.asyncio
+    async def test_unready_returns_all_none(self) -> None:
+        service = MagicMock(is_ready=MagicMock(return_value=False))
+        classifier = FusedClassifier(service=service, model="mistral-small-latest")
+        result = await classifier.classify_batch_async([{"title": "a"}])
+        assert result == [dict.fromkeys(FUSED_FIELDS)]
+
+    @pytest.mark.asyncio
+    async def test_single_call_payload(self) -> None:
+        service = MagicMock(is_ready=MagicMock(return_value=True))
+        service._call_mistral = AsyncMock(
+            return_value={"choices": [{"message": {"content": json.dumps([_VALID])}}]}
+        )
+        classifier = FusedClassifier(service=service, model="mistral-small-latest")
+
+        result = await classifier.classify_batch_async([{"title": "A"}])
+
+        assert result[0]["good_news"] is True
+        service._call_mistral.assert_awaited_once()
+        payload = service._call_mistral.await_args.args[0]
+        assert payload["model"] == "mistral-small-latest"
+        assert payload["prompt_cache_key"] == FUSED_CACHE_KEY
+        assert payload["temperature"] == 0.0
+        kwargs = service._call_mistral.await_args.kwargs
+        assert kwargs["call_site"] == "classification_fused"
+
+    @pytest.mark.asyncio
+    async def test_failed_call_returns_all_none(self) -> None:
+        service = MagicMock(is_ready=MagicMock(return_value=True))
+        service._call_mistral = AsyncMock(return_value=None)
+        classifier = FusedClassifier(service=service, model="mistral-small-latest")
+        result = await classifier.classify_batch_async([{"title": "A"}, {"title": "B"}])
+        assert result == [dict.fromkeys(FUSED_FIELDS)] * 2
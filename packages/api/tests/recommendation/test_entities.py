@@ -0,0 +1,52 @@
+"""Tests unitaires du décodage partagé de `Content.entities` (pas de DB).
+
+Couvre les trois formes stockées (objet JSON, nom en clair legacy, JSON non
+objet), la mémoïsation par chaîne brute et les clés canoniques.
+"""
+
+import json
+
+from app.services.recommendation.helpers.entities import (
+    decode_entity,
+    entity_keys,
+    iter_entity_names,
+)
+
+
+def _ent(name, etype="PERSON"):
+    return json.dumps({"name": name, "type": etype})
+
+
+def test_decode_json_object():
+    ref = decode_entity(_ent(" Emmanuel Macron "))
+    assert ref.is_json is True
+    assert ref.name == " Emmanuel Macron "
+    assert ref.key == "emmanuel macron"
+    assert ref.type == "PERSON"
+
+
+def test_decode_plain_and_non_object():
+    plain = decode_entity("Macron:PERSON")
+    assert plain.is_json is False
+    assert plain.name == "Macron:PERSON"
+    assert decode_entity("[1, 2]") is None
+
+
+def test_decode_is_memoized_per_raw_string():
+    raw = _ent("OpenAI", "ORG")
+    assert decode_entity(raw) is decode_entity(raw)
+
+
+def test_keys_are_canonical_and_skip_empty_names():
+    a = entity_keys([_ent("OpenAI", "ORG")])
+    b = entity_keys([_ent("openai ", "ORG"), "OpenAI"])
+    assert a == b == {"openai"}
+    assert entity_keys(["", _ent("", "ORG")]) == frozenset()
+
+
+def test_iter_entity_names_keeps_live_casing_and_dedupes():
+    entities = [_ent("OpenAI", "ORG"), _ent("openai", "ORG"), "Mistral", "[]", ""]
+    assert list(iter_entity_names(entities)) == [
+        ("OpenAI", "openai"),
+        ("Mistral", "mistral"),
+    ]
@@ -0,0 +1,148 @@
+"""Parité `PillarScoringEngine.compute_scores_batch` ↔ `compute_score`.
+
+Le batch est le chemin chaud de `get_feed` : il doit rendre exactement les
+mêmes scores que le chemin unitaire, seules les contributions sont différées.
+"""
+
+import json
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from app.models.enums import ReliabilityScore
+from app.services.recommendation.scoring_engine import (
+    PillarScoringEngine,
+    ScoringContext,
+)
+
+NOW = datetime(2026, 5, 4, 12, 0, tzinfo=UTC)
+
+
+def _source(theme, reliability=ReliabilityScore.MEDIUM, curated=False):
+    return SimpleNamespace(
+        id=uuid4(),
+        theme=theme,
+        secondary_themes=["science"],
+        reliability_score=reliability,
+        is_curated=curated,
+        tone=None,
+    )
+
+
+def _content(source, idx):
+    return SimpleNamespace(
+        id=uuid4(),
+        title=f"Article {idx} sur l'intelligence artificielle",
+        description="",
+        theme=["tech", "politics", None][idx % 3],
+        topics=[["ai", "tech"], ["elections"], []][idx % 3],
+        entities=[json.dumps({"name": "OpenAI", "type": "ORG"})] if idx % 2 else None,
+        source=source,
+        source_id=source.id,
+        published_at=NOW - timedelta(hours=idx * 5),
+        content_type="article",
+        duration_seconds=None,
+        thumbnail_url="https://x/img.jpg" if idx % 2 else None,
+        content_quality=["full", "partial", None][idx % 3],
+        cluster_id=None,
+    )
+
+
+def _pool():
+    sources = [
+        _source("tech", ReliabilityScore.HIGH, curated=True),
+        _source("politics", ReliabilityScore.LOW),
+        _source("culture"),
+    ]
+    return sources, [_content(sources[i % 3], i) for i in range(30)]
+
+
+def _context(sources, contents):
+    custom_topic = SimpleNamespace(
+        topic_name="IA",
+        slug_parent="ai",
+        keywords=["intelligence artificielle"],
+        priority_multiplier=1.0,
+        entity_type=None,
+        canonical_name=None,
+    )
+    return ScoringContext(
+        user_profile=MagicMock(id=uuid4()),
+        user_interests={"tech", "science"},
+        user_interest_weights={"tech": 1.8},
+        followed_source_ids={sources[0].id},
+        user_prefs={"content_recency": "recent"},
+        now=NOW,
+        user_subtopics={"ai"},
+        user_subtopic_weights={"ai": 2.0},
+        user_entity_affinity={"openai": 1.6},
+        muted_sources={sources[2].id},
+        muted_topics={"elections"},
+        source_affinity_scores={sources[1].id: 0.4},
+        source_priority_multipliers={sources[0].id: 2.0},
+        impression_data={contents[0].id: (NOW - timedelta(hours=3), False)},
+        user_custom_topics=[custom_topic],
+    )
+
+
+def test_batch_scores_match_per_item_scores():
+    sources, contents = _pool()
+    context = _context(sources, contents)
+    engine = PillarScoringEngine()
+
+    batch = engine.compute_scores_batch(contents, context)
+
+    assert len(batch) == len(contents)
+    for content, result in zip(contents, batch, strict=True):
+        expected = engine.compute_score(content, context)
+        assert result.final_score == expected.final_score
+        assert result.pillar_scores == expected.pillar_scores
+
+
+def test_batch_defers_contributions():
+    sources, contents = _pool()
+    context = _context(sources, contents)
+    engine = PillarScoringEngine()
+
+    batch = engine.compute_scores_batch(contents, context)
+
+    assert all(result.contributions == [] for result in batch)
+    assert engine.compute_score(contents[0], context).contributions
+
+
+def test_batch_scores_source_pillar_once_per_source():
+    sources, contents = _pool()
+    context = _context(sources, contents)
+    engine = PillarScoringEngine()
+    source_pillar = next(p for p in engine.pillars if p.name == "source")
+    calls = []
+    original = source_pillar.score
+
+    def _counting_score(content, ctx):
+        calls.append(content.source_id)
+        return original(content, ctx)
+
+    source_pillar.score = _counting_score
+
+    engine.compute_scores_batch(contents, context)
+
+    assert len(calls) == len(sources)
+
+
+def test_batch_keeps_zero_fallback_on_pillar_error():
+    sources, contents = _pool()
+    context = _context(sources, contents)
+    engine = PillarScoringEngine()
+    fraicheur = next(p for p in engine.pillars if p.name == "fraicheur")
+
+    def _boom(content, ctx):
+        raise ValueError("boom")
+
+    fraicheur.score = _boom
+
+    batch = engine.compute_scores_batch(contents, context)
+
+    for content, result in zip(contents, batch, strict=True):
+        assert result.pillar_scores["fraicheur"] == 0.0
+        assert result.final_score == engine.compute_score(content, context).final_score
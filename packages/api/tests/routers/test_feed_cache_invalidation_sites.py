@@ -15,7 +15,6 @@ change; the tests below pin both halves of the rule:
   over-optimisation.
 """
 
-import json
 from datetime import UTC, datetime, timedelta
 from uuid import UUID, uuid4
 
@@ -31,6 +30,7 @@ from app.models.enums import ContentType, SourceType
 from app.models.source import Source
 from app.models.user import UserProfile
 from app.services.feed_cache import FEED_CACHE
+from app.services.feed_serialization import serialize_feed_response
 
 BASE_DT = datetime(2026, 6, 1, 12, 0, tzinfo=UTC)
 
@@ -170,19 +170,6 @@ async def test_unsave_purges_only_matching_sections(
     _assert_targeted(user_id)
 
 
-@pytest.mark.asyncio
-async def test_unhide_purges_only_matching_sections(
-    auth_client, article, user_id, seed_cache
-):
-    await auth_client.post(f"/api/contents/{article.id}/hide")
-    seed_cache(user_id, article.id)
-
-    resp = await auth_client.delete(f"/api/contents/{article.id}/hide")
-
-    assert resp.status_code == 200, resp.text
-    _assert_targeted(user_id)
-
-
 @pytest.mark.asyncio
 async def test_note_delete_purges_only_matching_sections(
     auth_client, article, user_id, seed_cache
@@ -249,6 +236,19 @@ async def test_hide_stays_full(auth_client, article, user_id, seed_cache):
     _assert_full(user_id)
 
 
+@pytest.mark.asyncio
+async def test_unhide_purges_everything(auth_client, article, user_id, seed_cache):
+    """The article re-enters the user's shared candidate pool, which only a
+    full invalidation drops — a targeted one left it excluded until TTL."""
+    await auth_client.post(f"/api/contents/{article.id}/hide")
+    seed_cache(user_id, article.id)
+
+    resp = await auth_client.delete(f"/api/contents/{article.id}/hide")
+
+    assert resp.status_code == 200, resp.text
+    _assert_full(user_id)
+
+
 @pytest_asyncio.fixture
 async def article_feedback_table(db_session):
     """`article_feedback` is Alembic-only — it is not registered in
@@ -367,6 +367,6 @@ def test_cached_payload_item_ids_match_str_uuid(feed_response_factory):
     response = feed_response_factory(content_ids=[content_id])
 
     # Exactly the serialization `get_personalized_feed` caches.
-    payload = json.dumps(response.model_dump(mode="json")).encode("utf-8")
+    payload = serialize_feed_response(response)
 
     assert str(content_id).encode() in payload
@@ -1,47 +1,58 @@
 """Tests for the web image proxy endpoint."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import patch
 
 import httpx
 import pytest
 from httpx import ASGITransport, AsyncClient
 
 from app.main import app
+from app.routers.images import _thumbnail_width
+from app.services.image_proxy_cache import ImageProxyCache
 
 
-def _mock_response(status_code: int, content: bytes, content_type: str) -> MagicMock:
-    resp = MagicMock()
-    resp.status_code = status_code
-    resp.content = content
-    resp.headers = {"content-type": content_type}
-    return resp
-
-
-def _patched_client(get_return=None, get_side_effect=None):
-    """Patches httpx.AsyncClient inside the router module."""
-    mock_client_instance = MagicMock()
-    mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-    mock_client_instance.__aexit__ = AsyncMock(return_value=False)
-    if get_side_effect is not None:
-        mock_client_instance.get = AsyncMock(side_effect=get_side_effect)
-    else:
-        mock_client_instance.get = AsyncMock(return_value=get_return)
-    return patch(
-        "app.routers.images.httpx.AsyncClient",
-        return_value=mock_client_instance,
-    )
+@pytest.fixture
+def upstream(tmp_path):
+    """Fresh disk cache, upstream served by the last appended handler.
+
+    Yields ``(handlers, calls)``: append a ``request -> httpx.Response``
+    handler; ``calls`` records every upstream request.
+    """
+    handlers: list = []
+    calls: list[httpx.Request] = []
+
+    def dispatch(request):
+        calls.append(request)
+        return handlers[-1](request)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(dispatch))
+    cache = ImageProxyCache(directory=str(tmp_path), max_bytes=1024 * 1024)
+    with (
+        patch("app.routers.images.IMAGE_PROXY_CACHE", cache),
+        patch(
+            "app.services.image_proxy_cache.OUTBOUND_HTTP.client",
+            return_value=client,
+        ),
+    ):
+        yield handlers, calls
+
+
+async def _get(url: str, **params):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        return await ac.get("/api/images/proxy", params={"url": url, **params})
 
 
 @pytest.mark.asyncio
-async def test_proxy_happy_path_returns_image_with_cors_and_cache():
+async def test_proxy_happy_path_returns_image_with_cors_and_cache(upstream):
+    handlers, _calls = upstream
     fake_png = b"\x89PNG\r\n\x1a\n" + b"\x00" * 32
-    with _patched_client(get_return=_mock_response(200, fake_png, "image/png")):
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as ac:
-            resp = await ac.get(
-                "/api/images/proxy",
-                params={"url": "https://cdn.example.com/a.png"},
-            )
+    handlers.append(
+        lambda _r: httpx.Response(
+            200, content=fake_png, headers={"content-type": "image/png"}
+        )
+    )
+    resp = await _get("https://cdn.example.com/a.png")
     assert resp.status_code == 200
     assert resp.headers["content-type"].startswith("image/png")
     assert resp.headers["access-control-allow-origin"] == "*"
@@ -50,46 +61,62 @@ async def test_proxy_happy_path_returns_image_with_cors_and_cache():
 
 
 @pytest.mark.asyncio
-async def test_proxy_rejects_non_https_scheme():
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        resp = await ac.get(
-            "/api/images/proxy", params={"url": "http://insecure.example/a.png"}
+async def test_proxy_serves_repeat_requests_from_disk(upstream):
+    handlers, calls = upstream
+    handlers.append(
+        lambda _r: httpx.Response(
+            200, content=b"jpeg-bytes", headers={"content-type": "image/jpeg"}
         )
+    )
+    first = await _get("https://cdn.example.com/a.jpg")
+    second = await _get("https://cdn.example.com/a.jpg")
+    assert first.content == second.content == b"jpeg-bytes"
+    assert second.headers["content-length"] == str(len(b"jpeg-bytes"))
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_proxy_rejects_non_https_scheme():
+    resp = await _get("http://insecure.example/a.png")
     assert resp.status_code == 400
 
 
 @pytest.mark.asyncio
-async def test_proxy_returns_404_when_upstream_unreachable():
-    with _patched_client(get_side_effect=httpx.ConnectError("boom")):
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as ac:
-            resp = await ac.get(
-                "/api/images/proxy",
-                params={"url": "https://cdn.example.com/a.png"},
-            )
+async def test_proxy_returns_404_when_upstream_unreachable(upstream):
+    handlers, _calls = upstream
+
+    def unreachable(request):
+        raise httpx.ConnectError("boom", request=request)
+
+    handlers.append(unreachable)
+    resp = await _get("https://cdn.example.com/a.png")
     assert resp.status_code == 404
 
 
 @pytest.mark.asyncio
-async def test_proxy_returns_415_when_content_type_not_image():
-    with _patched_client(get_return=_mock_response(200, b"<html></html>", "text/html")):
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as ac:
-            resp = await ac.get(
-                "/api/images/proxy",
-                params={"url": "https://cdn.example.com/page"},
-            )
+async def test_proxy_returns_415_when_content_type_not_image(upstream):
+    handlers, _calls = upstream
+    handlers.append(
+        lambda _r: httpx.Response(
+            200, content=b"<html></html>", headers={"content-type": "text/html"}
+        )
+    )
+    resp = await _get("https://cdn.example.com/page")
     assert resp.status_code == 415
 
 
 @pytest.mark.asyncio
-async def test_proxy_returns_404_when_upstream_not_200():
-    with _patched_client(get_return=_mock_response(404, b"", "image/png")):
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as ac:
-            resp = await ac.get(
-                "/api/images/proxy",
-                params={"url": "https://cdn.example.com/missing.png"},
-            )
+async def test_proxy_returns_404_when_upstream_not_200(upstream):
+    handlers, _calls = upstream
+    handlers.append(
+        lambda _r: httpx.Response(404, headers={"content-type": "image/png"})
+    )
+    resp = await _get("https://cdn.example.com/missing.png")
     assert resp.status_code == 404
+
+
+def test_proxy_width_is_rounded_up_to_a_thumbnail_width():
+    assert _thumbnail_width(None) is None
+    assert _thumbnail_width(100) == 160
+    assert _thumbnail_width(320) == 320
+    assert _thumbnail_width(2000) is None
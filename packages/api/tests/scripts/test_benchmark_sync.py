@@ -0,0 +1,127 @@
+"""Tests hermétiques pour `scripts/benchmark_sync.py`.
+
+Ni DB ni réseau : le corpus jouet (`fixtures/sync_corpus_toy/`) passe par la
+doublure HTTP et par le vrai `analyze_feed`. Couvre le chargement du corpus,
+les répliques `--scale` (hôtes et guids distincts, sinon `contents.guid`
+dédoublonnerait tout le banc), la doublure derrière les pools partagés, et
+le rendu. Le passage `sync_all_sources` lui-même exige un Postgres local.
+"""
+
+import uuid
+from pathlib import Path
+
+import pytest
+
+from app.models.enums import SourceType
+from app.services.feed_entry_parser import EntrySource, analyze_feed
+from scripts.benchmark_sync import (
+    PassReport,
+    ReplayStandIn,
+    load_corpus,
+    original_url,
+    percentile,
+    render,
+    replica_url,
+    source_rows,
+)
+
+TOY = Path(__file__).parent / "fixtures" / "sync_corpus_toy"
+
+
+@pytest.fixture(scope="module")
+def toy():
+    sources, missing = load_corpus(TOY)
+    assert missing == []
+    return sources
+
+
+def test_toy_corpus_covers_every_feed_variant(toy):
+    assert {s.kind for s in toy} == {"rss", "atom", "youtube", "podcast", "wordpress"}
+    rss = next(s for s in toy if s.slug == "toy-rss")
+    assert rss.feed_url == "https://news.toy.test/rss.xml"
+    assert len(rss.heads) == 2
+
+
+def test_replica_urls_round_trip():
+    url = "https://www.youtube.com/feeds/videos.xml?channel_id=UCtoy"
+    assert replica_url(url, 0) == url
+    assert replica_url(url, 3) == (
+        "https://r3.www.youtube.com/feeds/videos.xml?channel_id=UCtoy"
+    )
+    assert original_url(replica_url(url, 3)) == (url, 3)
+
+
+@pytest.mark.asyncio
+async def test_stand_in_serves_distinct_replicas_through_shared_pools(toy):
+    stand_in = ReplayStandIn(toy, latency_ms=1)
+    outbound = stand_in.outbound()
+    client = outbound.client("feeds")
+    by_slug = {s.slug: s for s in toy}
+
+    guids: dict[int, list[str]] = {}
+    for replica in (0, 1):
+        for slug in ("toy-rss", "toy-youtube"):
+            source = by_slug[slug]
+            resp = await client.get(replica_url(source.feed_url, replica))
+            assert resp.headers["content-type"] == source.content_type
+            parsed = analyze_feed(
+                resp.text,
+                EntrySource(id=uuid.uuid4(), name=source.name, type=source.type),
+                50,
+            )
+            guids.setdefault(replica, []).extend(e["guid"] for e in parsed.entries)
+
+    assert guids[0] and len(guids[0]) == len(guids[1])
+    assert not set(guids[0]) & set(guids[1])
+    head = await client.get("https://r1.news.toy.test/articles/premier")
+    assert "NewsArticle" in head.text
+    assert (await client.get("https://news.toy.test/nope")).status_code == 404
+    assert stand_in.stats == {
+        "requests": 6,
+        "feeds": 4,
+        "heads": 1,
+        "not_found": 1,
+        "bytes": stand_in.stats["bytes"],
+    }
+    assert outbound.stats()["feeds"]["requests"] == 6
+    await outbound.aclose()
+
+
+def test_source_rows_scale_sources_under_replica_hosts(toy):
+    rows = source_rows(toy, scale=2)
+    assert len(rows) == 2 * len(toy)
+    assert len({r["feed_url"] for r in rows}) == len(rows)
+    assert all(r["name"].startswith("[bench] ") for r in rows)
+    youtube = [r for r in rows if r["type"] == SourceType.YOUTUBE]
+    assert youtube[1]["feed_url"].startswith("https://r1.www.youtube.com/")
+
+
+def test_pass_report_metrics_and_render():
+    report = PassReport(
+        sources=4,
+        seconds=2.0,
+        new_entries=10,
+        failed=1,
+        unchanged=0,
+        db_round_trips=25,
+        latencies_ms=[100.0, 200.0, 300.0, 400.0],
+        http={"requests": 14},
+    )
+    out = report.as_dict()
+    assert out["sources_per_s"] == 2.0
+    assert out["entries_per_s"] == 5.0
+    assert out["round_trips_per_entry"] == 2.5
+    assert out["p95_source_ms"] == pytest.approx(385.0)
+    assert percentile([], 95) == 0.0
+
+    text = render(
+        {
+            "corpus": ["toy-rss"],
+            "scale": 1,
+            "latency_ms": 50.0,
+            "jitter_ms": 0.0,
+            "passes": [out],
+            "peak_rss_mb": {"self": 120.0, "ingest_workers": 80.0},
+        }
+    )
+    assert "2.50" in text and "Pic RSS" in text
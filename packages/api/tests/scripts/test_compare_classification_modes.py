@@ -0,0 +1,112 @@
+"""Tests hermétiques pour `scripts/compare_classification_modes.py`."""
+
+from __future__ import annotations
+
+import pytest
+
+from scripts.compare_classification_modes import (
+    UsageCollector,
+    agreement,
+    disagreements,
+    entity_f1,
+    jaccard,
+    render_report,
+)
+
+_SEPARATE = [
+    {
+        "topics": ["health", "science"],
+        "serene": True,
+        "is_ad": False,
+        "good_news": True,
+        "entities": [{"name": "Institut Pasteur", "type": "ORG"}],
+    },
+    {
+        "topics": ["economy"],
+        "serene": False,
+        "is_ad": False,
+        "good_news": None,
+        "entities": [],
+    },
+]
+_FUSED = [
+    {
+        "topics": ["health"],
+        "serene": True,
+        "is_ad": False,
+        "good_news": True,
+        "entities": [{"name": "institut pasteur", "type": "ORG"}],
+    },
+    {
+        "topics": ["politics"],
+        "serene": True,
+        "is_ad": False,
+        "good_news": False,
+        "entities": [{"name": "Bercy", "type": "ORG"}],
+    },
+]
+_ITEMS = [
+    {"title": "Un nouveau vaccin", "source_name": "Le Monde"},
+    {"title": "Le budget adopté", "source_name": "Les Échos"},
+]
+
+
+def test_jaccard_and_entity_f1():
+    assert jaccard(["health", "science"], ["health"]) == 0.5
+    assert jaccard([], []) == 1.0
+    assert entity_f1([], []) == 1.0
+    # Nom normalisé (casse) + type.
+    assert entity_f1(_SEPARATE[0]["entities"], _FUSED[0]["entities"]) == 1.0
+    assert entity_f1([], _FUSED[1]["entities"]) == 0.0
+
+
+def test_agreement_uses_separate_mode_as_reference():
+    metrics = agreement(_SEPARATE, _FUSED)
+    assert metrics["n"] == 2
+    assert metrics["primary_topic"] == 0.5
+    assert metrics["topics_jaccard"] == pytest.approx(0.25)
+    assert metrics["serene_match"] == 0.5
+    assert metrics["is_ad_match"] == 1.0
+    assert metrics["entities_f1"] == 0.5
+
+
+def test_disagreements_ranked_by_diverging_fields():
+    ranked = disagreements(_ITEMS, _SEPARATE, _FUSED, n=5)
+    assert len(ranked) == 1
+    item, _, _, fields = ranked[0]
+    assert item["title"] == "Le budget adopté"
+    assert fields == ["topics", "serene", "good_news", "entities"]
+
+
+@pytest.mark.asyncio
+async def test_usage_collector_aggregates_per_mode():
+    collector = UsageCollector()
+    await collector("mistral", "classification_pass1", status="ok", prompt_tokens=10)
+    collector.mode = "fused"
+    await collector(
+        "mistral", "classification_fused", status="error", completion_tokens=3
+    )
+
+    assert collector.summary("separate")["prompt_tokens"] == 10
+    fused = collector.summary("fused")
+    assert fused["errors"] == 1
+    assert fused["completion_tokens"] == 3
+    assert fused["by_call_site"] == {"classification_fused": 1}
+
+
+def test_render_report_sections():
+    run = {
+        "batch_size": 5,
+        "results": {"separate": _SEPARATE, "fused": _FUSED},
+        "latencies": {"separate": [900.0, 1100.0], "fused": [400.0, 500.0]},
+        "usage": {
+            mode: UsageCollector().summary(mode) for mode in ("separate", "fused")
+        },
+        "invalid_fields": {"topics": 0, "entities": 1},
+    }
+    report = render_report(_ITEMS, run, samples=5)
+    assert "## Coût et latence" in report
+    assert "## Accord fusionné ↔ séparé" in report
+    assert "| entities | 1 |" in report
+    assert "### Le budget adopté" in report
+    assert "### Un nouveau vaccin" not in report
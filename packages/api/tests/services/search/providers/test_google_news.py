@@ -24,7 +24,7 @@ def _build_rss(items: list[dict]) -> bytes:
         )
     return (
         '<?xml version="1.0"?><rss version="2.0"><channel>'
-        f'<title>q</title><link>https://news.google.com/</link>{"".join(body)}'
+        f"<title>q</title><link>https://news.google.com/</link>{''.join(body)}"
         "</channel></rss>"
     ).encode()
 
@@ -48,8 +48,8 @@ async def test_extracts_publisher_from_source_href():
         status_code = 200
         content = rss
 
-    with patch("app.services.search.providers.google_news.httpx.AsyncClient") as cli:
-        cli.return_value.__aenter__.return_value.get = AsyncMock(return_value=_Resp())
+    with patch("app.services.search.providers.google_news.OUTBOUND_HTTP.client") as cli:
+        cli.return_value.get = AsyncMock(return_value=_Resp())
         urls = await GoogleNewsProvider().search("politis")
 
     assert urls == ["https://www.politis.fr", "https://www.lemonde.fr"]
@@ -68,8 +68,8 @@ async def test_falls_back_to_link_when_source_missing():
         status_code = 200
         content = body
 
-    with patch("app.services.search.providers.google_news.httpx.AsyncClient") as cli:
-        cli.return_value.__aenter__.return_value.get = AsyncMock(return_value=_Resp())
+    with patch("app.services.search.providers.google_news.OUTBOUND_HTTP.client") as cli:
+        cli.return_value.get = AsyncMock(return_value=_Resp())
         urls = await GoogleNewsProvider().search("lemonde")
 
     assert urls == ["https://www.lemonde.fr"]
@@ -94,8 +94,8 @@ async def test_skips_google_redirects_with_no_source():
         status_code = 200
         content = rss
 
-    with patch("app.services.search.providers.google_news.httpx.AsyncClient") as cli:
-        cli.return_value.__aenter__.return_value.get = AsyncMock(return_value=_Resp())
+    with patch("app.services.search.providers.google_news.OUTBOUND_HTTP.client") as cli:
+        cli.return_value.get = AsyncMock(return_value=_Resp())
         urls = await GoogleNewsProvider().search("anything")
 
     assert urls == []
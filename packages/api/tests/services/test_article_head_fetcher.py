@@ -0,0 +1,144 @@
+"""Tests for the shared article-head fetcher of the RSS sync."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.article_head_fetcher import HEAD_MAX_CHARS, ArticleHeadFetcher
+
+_HEAD = (
+    "<html><head><title>A</title>"
+    '<script type="application/ld+json">{"isAccessibleForFree": false}</script>'
+    "</head>"
+)
+
+
+class _Chunks(httpx.AsyncByteStream):
+    """Corps servi morceau par morceau ; note ce qui a été consommé."""
+
+    def __init__(self, chunks: list[str], consumed: list[str]) -> None:
+        self._chunks = chunks
+        self._consumed = consumed
+
+    async def __aiter__(self):
+        for chunk in self._chunks:
+            self._consumed.append(chunk)
+            yield chunk.encode()
+
+
+def _fetcher(handler, **limits) -> ArticleHeadFetcher:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    options = {"concurrency": 8, "per_host": 2, "host_interval_seconds": 0.0}
+    options.update(limits)
+    return ArticleHeadFetcher(client, **options)
+
+
+@pytest.mark.asyncio
+async def test_stream_stops_once_head_and_json_ld_arrived():
+    consumed: list[str] = []
+    ranges: list[str] = []
+
+    def handler(request):
+        ranges.append(request.headers["range"])
+        body = [_HEAD, "<body>" + "x" * 20_000, "y" * 20_000]
+        return httpx.Response(206, stream=_Chunks(body, consumed))
+
+    fetcher = _fetcher(handler)
+    head = await fetcher.fetch("https://media.ex/a")
+
+    assert head == _HEAD
+    assert consumed == [_HEAD]  # le body n'a jamais été lu
+    assert ranges == [f"bytes=0-{HEAD_MAX_CHARS}"]
+    assert fetcher.stats()["early_aborts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_head_without_json_ld_reads_up_to_the_cap():
+    consumed: list[str] = []
+
+    def handler(request):
+        body = ["<head></head>", "z" * 30_000, "z" * 30_000, "never"]
+        return httpx.Response(200, stream=_Chunks(body, consumed))
+
+    head = await _fetcher(handler).fetch("https://media.ex/b")
+
+    assert len(head) == HEAD_MAX_CHARS
+    assert "never" not in consumed
+
+
+@pytest.mark.asyncio
+async def test_reading_goes_on_until_an_access_signal_is_seen():
+    """JSON-LD du head sans `isAccessibleForFree` : le signal est plus loin
+    (JSON-LD du body), la lecture continue jusqu'à lui."""
+    consumed: list[str] = []
+    head = (
+        '<head><script type="application/ld+json">{"@type": "WebSite"}</script></head>'
+    )
+    body_ld = (
+        '<body><script type="application/ld+json">'
+        '{"@type": "NewsArticle", "isAccessibleForFree": false}</script>'
+    )
+
+    def handler(request):
+        body = [head, "x" * 10_000, body_ld, "never"]
+        return httpx.Response(206, stream=_Chunks(body, consumed))
+
+    fetcher = _fetcher(handler)
+    text = await fetcher.fetch("https://media.ex/c")
+
+    assert text.endswith(body_ld)
+    assert "never" not in consumed
+    assert fetcher.stats()["early_aborts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_and_unexpected_statuses_give_none():
+    def handler(request):
+        if request.url.path == "/boom":
+            raise httpx.ConnectError("down")
+        return httpx.Response(403, text="blocked")
+
+    fetcher = _fetcher(handler)
+    assert await fetcher.fetch("https://media.ex/boom") is None
+    assert await fetcher.fetch("https://media.ex/forbidden") is None
+    assert await fetcher.fetch("") is None
+    assert fetcher.stats()["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_per_host_connections_are_capped_but_hosts_run_in_parallel():
+    active: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    async def handler(request):
+        host = request.url.host
+        active[host] = active.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), active[host])
+        await asyncio.sleep(0.01)
+        active[host] -= 1
+        return httpx.Response(200, text=_HEAD)
+
+    fetcher = _fetcher(handler, per_host=2)
+    urls = [f"https://{host}/{i}" for host in ("a.ex", "b.ex") for i in range(6)]
+    heads = await asyncio.gather(*(fetcher.fetch(url) for url in urls))
+
+    assert heads == [_HEAD] * 12
+    assert peak == {"a.ex": 2, "b.ex": 2}
+
+
+@pytest.mark.asyncio
+async def test_requests_to_one_host_are_spaced():
+    starts: list[float] = []
+    loop = asyncio.get_running_loop()
+
+    def handler(request):
+        starts.append(loop.time())
+        return httpx.Response(200, text=_HEAD)
+
+    fetcher = _fetcher(handler, per_host=3, host_interval_seconds=0.05)
+    await asyncio.gather(*(fetcher.fetch(f"https://a.ex/{i}") for i in range(3)))
+
+    gaps = [b - a for a, b in zip(starts, starts[1:], strict=False)]
+    assert all(gap >= 0.04 for gap in gaps)
+    assert fetcher.stats()["throttled"] == 2
@@ -0,0 +1,106 @@
+"""Tests for the bounded-memory primitives shared by the in-process caches."""
+
+from __future__ import annotations
+
+import asyncio
+
+from app.services.bounded_cache import (
+    ENTRY_OVERHEAD_BYTES,
+    BoundedLRU,
+    GenerationCounters,
+    LockRegistry,
+)
+
+
+def _lru(max_bytes: int, evicted: list | None = None) -> BoundedLRU[str, bytes]:
+    return BoundedLRU(
+        max_bytes=max_bytes,
+        sizeof=len,
+        on_evict=(lambda k, _: evicted.append(k)) if evicted is not None else None,
+    )
+
+
+def test_lru_evicts_least_recently_used_over_budget() -> None:
+    evicted: list[str] = []
+    lru = _lru(3 * (100 + ENTRY_OVERHEAD_BYTES), evicted)
+    lru.put("a", b"x" * 100)
+    lru.put("b", b"x" * 100)
+    lru.put("c", b"x" * 100)
+    assert lru.get("a") is not None  # "b" devient le moins récent
+
+    lru.put("d", b"x" * 100)
+
+    assert evicted == ["b"]
+    assert "b" not in lru
+    assert lru.stats()["evictions"] == 1
+    assert lru.bytes <= lru.max_bytes
+
+
+def test_lru_is_size_aware_and_keeps_oversized_last_write() -> None:
+    lru = _lru(1000)
+    lru.put("a", b"x" * 100)
+    lru.put("b", b"x" * 100)
+
+    lru.put("big", b"x" * 5000)
+
+    assert list(lru) == ["big"]
+    assert lru.stats()["evictions"] == 2
+
+
+def test_lru_overwrite_and_pop_keep_byte_count_exact() -> None:
+    lru = _lru(0)
+    lru.put("a", b"x" * 100)
+    lru.put("a", b"x" * 10)
+    assert lru.bytes == 10 + ENTRY_OVERHEAD_BYTES
+    assert lru.pop("a") == b"x" * 10
+    assert lru.bytes == 0
+    assert lru.pop("a") is None
+
+
+def test_peek_does_not_touch_lru_order() -> None:
+    evicted: list[str] = []
+    lru = _lru(2 * (1 + ENTRY_OVERHEAD_BYTES), evicted)
+    lru.put("a", b"x")
+    lru.put("b", b"x")
+    lru.peek("a")
+    lru.put("c", b"x")
+    assert evicted == ["a"]
+
+
+async def test_lock_registry_reclaims_only_idle_locks() -> None:
+    registry: LockRegistry[int, asyncio.Lock] = LockRegistry(
+        lambda _: asyncio.Lock(), sweep_above=4
+    )
+    held = registry.get(0)
+    await held.acquire()
+    contended = registry.get(1)
+    await contended.acquire()
+    waiter = asyncio.create_task(contended.acquire())
+    await asyncio.sleep(0)
+    for key in range(2, 4):
+        registry.get(key)
+
+    registry.get(99)  # déclenche le sweep : 2 et 3 sont idle
+
+    assert len(registry) == 3
+    assert registry.get(0) is held
+    assert registry.get(1) is contended
+    assert registry.stats()["locks_reclaimed"] == 2
+    contended.release()
+    await waiter
+    contended.release()
+    held.release()
+
+
+def test_generation_counters_never_go_backwards_after_eviction() -> None:
+    counters: GenerationCounters[str] = GenerationCounters(max_keys=2)
+    captured = counters.get("a")
+    counters.bump("a")
+    counters.bump("a")
+    counters.bump("b")
+    counters.bump("c")  # évince "a" (valeur 2)
+
+    assert len(counters) == 2
+    assert counters.get("a") == 2
+    assert counters.get("a") != captured
+    assert counters.get("never-seen") == 2
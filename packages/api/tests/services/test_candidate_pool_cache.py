@@ -0,0 +1,169 @@
+"""Tests for CandidatePoolCache (shared candidate pool of the Tournée sections)."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.models.content import Content
+from app.models.source import Source
+from app.services.candidate_pool_cache import (
+    CandidatePoolCache,
+    CandidatePoolSnapshot,
+    detached_copy,
+    filter_section_pool,
+)
+from app.services.feed_cache import FeedPageCache
+
+NOW = datetime(2026, 5, 4, 12, 0, tzinfo=UTC)
+
+
+def _row(hours_ago, theme=None, source_theme="tech", topics=None):
+    return SimpleNamespace(
+        id=uuid4(),
+        published_at=NOW - timedelta(hours=hours_ago),
+        theme=theme,
+        topics=topics,
+        source=SimpleNamespace(theme=source_theme),
+    )
+
+
+def _snapshot(signature="sig", complete=True) -> CandidatePoolSnapshot:
+    return CandidatePoolSnapshot(
+        signature=signature, rows=(), fetched_at=NOW, complete=complete
+    )
+
+
+@pytest.fixture
+def cache() -> CandidatePoolCache:
+    return CandidatePoolCache(ttl_seconds=30.0)
+
+
+def test_filter_matches_theme_focus_predicate() -> None:
+    own = _row(1, theme="tech", source_theme="culture")
+    inherited = _row(2, theme=None, source_theme="tech")
+    other = _row(3, theme="culture", source_theme="tech")
+    rows = [own, inherited, other]
+
+    got = filter_section_pool(
+        rows,
+        since=NOW - timedelta(hours=24),
+        theme="tech",
+        topic=None,
+        user_subtopics=None,
+        limit=500,
+    )
+
+    assert got == [own, inherited]
+
+
+def test_filter_applies_window_topic_and_limit() -> None:
+    rows = [_row(h, topics=["ai"]) for h in (1, 2, 3)] + [_row(30, topics=["ai"])]
+
+    got = filter_section_pool(
+        rows,
+        since=NOW - timedelta(hours=24),
+        theme=None,
+        topic="ai",
+        user_subtopics=None,
+        limit=2,
+    )
+
+    assert got == rows[:2]
+
+
+def test_filter_orders_like_postgres_overlap_desc() -> None:
+    """`topics && subtopics DESC` : NULL d'abord, puis overlap, puis le reste,
+    chronologique à l'intérieur de chaque rang."""
+    miss = _row(1, topics=["sport"])
+    hit_recent = _row(2, topics=["ai"])
+    null_topics = _row(3, topics=None)
+    hit_old = _row(4, topics=["ai", "cloud"])
+
+    got = filter_section_pool(
+        [miss, hit_recent, null_topics, hit_old],
+        since=NOW - timedelta(hours=24),
+        theme=None,
+        topic=None,
+        user_subtopics={"ai"},
+        limit=500,
+    )
+
+    assert got == [null_topics, hit_recent, hit_old, miss]
+
+
+async def test_concurrent_sections_share_one_build(cache: CandidatePoolCache) -> None:
+    user = uuid4()
+    builds = 0
+
+    async def build() -> CandidatePoolSnapshot:
+        nonlocal builds
+        builds += 1
+        await asyncio.sleep(0.01)
+        return _snapshot()
+
+    results = await asyncio.gather(
+        *(cache.get_or_build(user, "sig", build) for _ in range(10))
+    )
+
+    assert builds == 1
+    assert len({id(r) for r in results}) == 1
+    stats = cache.stats()
+    assert stats["hits"] == 9
+    assert stats["reuse_per_build"] == 10.0
+
+
+async def test_signature_change_rebuilds(cache: CandidatePoolCache) -> None:
+    user = uuid4()
+    await cache.get_or_build(user, "a", lambda: asyncio.sleep(0, _snapshot("a")))
+    second = await cache.get_or_build(
+        user, "b", lambda: asyncio.sleep(0, _snapshot("b"))
+    )
+
+    assert second.signature == "b"
+    assert cache.stats()["builds"] == 2
+
+
+async def test_incomplete_snapshot_is_counted(cache: CandidatePoolCache) -> None:
+    await cache.get_or_build(
+        uuid4(), "sig", lambda: asyncio.sleep(0, _snapshot(complete=False))
+    )
+
+    assert cache.stats()["incomplete"] == 1
+
+
+async def test_feed_cache_invalidate_drops_snapshot(cache: CandidatePoolCache) -> None:
+    feed_cache = FeedPageCache(ttl_seconds=30.0)
+    feed_cache.add_invalidate_listener(cache.invalidate)
+    user = uuid4()
+    await cache.get_or_build(user, "sig", lambda: asyncio.sleep(0, _snapshot()))
+
+    feed_cache.invalidate(user)
+
+    assert cache.stats()["size"] == 0
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_detached_copy_isolates_request_scoped_fields() -> None:
+    source = Source(id=uuid4(), name="Le Monde", theme="tech")
+    row = Content(
+        id=uuid4(), title="Titre", source_id=source.id, published_at=NOW, topics=["ai"]
+    )
+    row.source = source
+    make_transient_to_detached(row)
+
+    mine, theirs = detached_copy(row), detached_copy(row)
+    mine.recommendation_reason = "source suivie"
+    mine.is_saved = True
+
+    assert inspect(mine).detached
+    assert (mine.id, mine.title, mine.topics) == (row.id, "Titre", ["ai"])
+    assert mine.source is source
+    assert not hasattr(theirs, "recommendation_reason")
+    assert not hasattr(row, "is_saved")
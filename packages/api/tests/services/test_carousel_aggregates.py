@@ -0,0 +1,156 @@
+"""Tests for CarouselAggregates (process-wide Phase B carousel aggregates)."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from dataclasses import replace
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.services.carousel_aggregates import (
+    COMMUNITY_TOP_N,
+    VOLUME_WINDOWS_DAYS,
+    CarouselAggregates,
+)
+from app.services.recommendation.scoring_config import ScoringWeights
+
+
+def _volume(source_id, d7: int, d30: int, d3: int = 0) -> SimpleNamespace:
+    return SimpleNamespace(source_id=source_id, d3=d3, d7=d7, d30=d30)
+
+
+def _pick(score: float, count: int = 1) -> SimpleNamespace:
+    return SimpleNamespace(id=uuid4(), score=score, sunflower_count=count)
+
+
+def _session_maker(batches: list[list]):
+    """Fake `safe_async_session` : chaque `execute` sert le lot suivant."""
+
+    @asynccontextmanager
+    async def _maker(**_kwargs):
+        session = MagicMock()
+
+        async def _execute(_stmt):
+            batch = batches.pop(0)
+            if isinstance(batch, Exception):
+                raise batch
+            result = MagicMock()
+            result.all.return_value = batch
+            return result
+
+        session.execute = _execute
+        yield session
+
+    return _maker
+
+
+@pytest.fixture
+def aggregates() -> CarouselAggregates:
+    return CarouselAggregates(max_age_seconds=600, min_interval_seconds=60)
+
+
+async def test_refresh_loads_volumes_and_community(
+    aggregates: CarouselAggregates,
+) -> None:
+    busy, quiet = uuid4(), uuid4()
+    top = [_pick(3.0, 4), _pick(1.5)]
+
+    assert aggregates.source_volumes(7) is None
+    with patch(
+        "app.services.carousel_aggregates.safe_async_session",
+        _session_maker([[_volume(busy, 12, 40, d3=5), _volume(quiet, 0, 2)], top]),
+    ):
+        assert await aggregates.refresh()
+
+    assert aggregates.source_volumes(3) == {busy: 5}
+    assert aggregates.source_volumes(7) == {busy: 12}
+    assert aggregates.source_volumes(30) == {busy: 40, quiet: 2}
+    picks = aggregates.community_top(5)
+    assert [p.id for p in picks] == [r.id for r in top]
+    assert picks[0].sunflower_count == 4
+
+
+async def test_refresh_is_throttled_unless_forced(
+    aggregates: CarouselAggregates,
+) -> None:
+    batches: list[list] = [[], [], [], []]
+    with patch(
+        "app.services.carousel_aggregates.safe_async_session",
+        _session_maker(batches),
+    ):
+        assert await aggregates.refresh()
+        assert not await aggregates.refresh()  # lot de classification suivant
+        assert await aggregates.refresh(force=True)  # fin de sync RSS
+
+    assert not batches
+    assert aggregates.stats()["throttled"] == 1
+
+
+async def test_community_top_applies_exclusions(
+    aggregates: CarouselAggregates,
+) -> None:
+    top = [_pick(3.0), _pick(2.0), _pick(1.0)]
+    with patch(
+        "app.services.carousel_aggregates.safe_async_session",
+        _session_maker([[], top]),
+    ):
+        await aggregates.refresh()
+
+    picks = aggregates.community_top(5, exclude_ids={top[0].id})
+    assert [p.id for p in picks] == [top[1].id, top[2].id]
+
+
+async def test_exhausted_truncated_top_falls_back_to_sql(
+    aggregates: CarouselAggregates,
+) -> None:
+    top = [_pick(float(COMMUNITY_TOP_N - i)) for i in range(COMMUNITY_TOP_N)]
+    with patch(
+        "app.services.carousel_aggregates.safe_async_session",
+        _session_maker([[], top]),
+    ):
+        await aggregates.refresh()
+
+    excluded = {p.id for p in top[:-2]}
+    # Le rang N+1 (hors snapshot) pourrait être éligible : pas de réponse.
+    assert aggregates.community_top(5, exclude_ids=excluded) is None
+    assert len(aggregates.community_top(2, exclude_ids=excluded)) == 2
+
+
+async def test_stale_or_disabled_snapshot_is_not_served() -> None:
+    aggregates = CarouselAggregates(max_age_seconds=600, min_interval_seconds=0)
+    with patch(
+        "app.services.carousel_aggregates.safe_async_session",
+        _session_maker([[], [_pick(1.0)]]),
+    ):
+        await aggregates.refresh()
+    snapshot = aggregates._snapshot
+    aggregates._snapshot = replace(snapshot, built_at=snapshot.built_at - 601)
+
+    assert aggregates.community_top(5) is None
+    assert aggregates.source_volumes(30) is None
+    assert not await CarouselAggregates(max_age_seconds=0).refresh()
+
+
+async def test_refresh_failure_keeps_previous_snapshot(
+    aggregates: CarouselAggregates,
+) -> None:
+    source = uuid4()
+    with patch(
+        "app.services.carousel_aggregates.safe_async_session",
+        _session_maker([[_volume(source, 3, 3)], [], RuntimeError("db down")]),
+    ):
+        await aggregates.refresh()
+        assert not await aggregates.refresh(force=True)
+
+    assert aggregates.source_volumes(7) == {source: 3}
+    assert aggregates.stats()["errors"] == 1
+
+
+def test_volume_windows_cover_the_tournee_pool_gate() -> None:
+    """La Tournée borne son pool partagé avec la fenêtre du dernier palier."""
+    widest = ScoringWeights.THEMATIC_WINDOW_TIERS_HOURS[-1]
+    assert widest % 24 == 0
+    assert widest // 24 in VOLUME_WINDOWS_DAYS
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+import gzip
 from uuid import uuid4
 
 import pytest
 
-from app.services.feed_cache import FeedPageCache
+from app.services.feed_cache import FeedPageCache, MemoryFeedCacheBackend
 
 
 @pytest.fixture
@@ -350,6 +351,53 @@ def test_invalidate_content_global_purges_every_user(
     assert cache.stats()["invalidations"] == 1
 
 
+def test_content_index_follows_overwrites(
+    cache: FeedPageCache, feed_cache_payload
+) -> None:
+    """Re-putting a key with a payload that no longer mentions the id must
+    de-index it: the index answers exactly what the payload says."""
+    user = uuid4()
+    dropped, kept = uuid4(), uuid4()
+    cache.put(user, feed_cache_payload(dropped), variant="p|theme=tech")
+    cache.put(user, feed_cache_payload(kept), variant="p|theme=tech")
+
+    cache.invalidate_content(user, dropped)
+
+    assert cache.get(user, variant="p|theme=tech") == feed_cache_payload(kept)
+    assert cache.stats()["invalidations"] == 0
+
+
+def test_content_index_covers_nested_ids(cache: FeedPageCache) -> None:
+    """An id nested in a carousel (not a top-level item) still evicts."""
+    user, nested = uuid4(), uuid4()
+    payload = f'{{"items": [], "carousels": [{{"items": [{{"id": "{nested}"}}]}}]}}'
+    cache.put(user, payload.encode())
+
+    cache.invalidate_content(user, nested)
+
+    assert cache.get(user) is None
+
+
+def test_purge_does_not_scan_payloads(
+    cache: FeedPageCache, feed_cache_payload, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Eviction goes through the reverse index: unrelated entries are never
+    read, so the cost no longer grows with the size of the cache."""
+    target = uuid4()
+    for _ in range(50):
+        cache.put(uuid4(), feed_cache_payload(uuid4()), variant="p|sr=1")
+    cache.put(uuid4(), feed_cache_payload(target), variant="p|sr=1")
+
+    def _no_scan(*_args, **_kwargs):
+        raise AssertionError("payload scanned")
+
+    monkeypatch.setattr("app.services.feed_cache._payload_ids", _no_scan)
+    cache.invalidate_content_global(target)
+
+    assert cache.stats()["invalidations"] == 1
+    assert cache.stats()["size"] == 50
+
+
 # --- Generations (write-during-compute) ------------------------------------
 
 
@@ -449,3 +497,139 @@ def test_invalidate_keeps_locks_alive(cache: FeedPageCache) -> None:
 def test_stats_exposes_uptime(cache: FeedPageCache) -> None:
     """Counters are cumulative — readers need a time base to take a delta."""
     assert cache.stats()["uptime_seconds"] >= 0.0
+
+
+# --- Stale-while-revalidate ------------------------------------------------
+
+
+def _swr_cache(monkeypatch: pytest.MonkeyPatch, now: list[float]) -> FeedPageCache:
+    monkeypatch.setattr("app.services.feed_cache.time.monotonic", lambda: now[0])
+    return FeedPageCache(ttl_seconds=10.0, stale_seconds=20.0)
+
+
+def test_stale_entry_served_only_through_get_or_stale(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    now = [1000.0]
+    cache = _swr_cache(monkeypatch, now)
+    user = uuid4()
+    cache.put(user, b"v1")
+
+    now[0] += 15.0
+    assert cache.get(user) is None
+    assert cache.get_or_stale(user) == (b"v1", True)
+    assert cache.stats()["stale_hits"] == 2
+
+    now[0] += 20.0
+    assert cache.get_or_stale(user) == (None, False)
+
+
+def test_swr_off_by_default_keeps_hard_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [1000.0]
+    monkeypatch.setattr("app.services.feed_cache.time.monotonic", lambda: now[0])
+    cache = FeedPageCache(ttl_seconds=10.0)
+    user = uuid4()
+    cache.put(user, b"v1")
+
+    now[0] += 11.0
+    assert cache.get_or_stale(user) == (None, False)
+
+
+async def test_background_refresh_replaces_stale_entry(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from app.services.cache_refresh import BACKGROUND_REFRESHER
+
+    now = [1000.0]
+    cache = _swr_cache(monkeypatch, now)
+    user = uuid4()
+    cache.put(user, b"v1")
+    now[0] += 15.0
+
+    async def compute() -> bytes:
+        return b"v2"
+
+    assert cache.refresh_in_background(user, None, compute)
+    assert not cache.refresh_in_background(user, None, compute)  # déjà en vol
+    await BACKGROUND_REFRESHER.drain()
+
+    assert cache.get(user) == b"v2"
+
+
+async def test_background_refresh_cannot_resurrect_invalidated_entry(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from app.services.cache_refresh import BACKGROUND_REFRESHER
+
+    now = [1000.0]
+    cache = _swr_cache(monkeypatch, now)
+    user = uuid4()
+    cache.put(user, b"v1")
+    now[0] += 15.0
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def compute() -> bytes:
+        started.set()
+        await release.wait()
+        return b"stale-ranking"
+
+    cache.refresh_in_background(user, None, compute)
+    await started.wait()
+    cache.invalidate(user)
+    release.set()
+    await BACKGROUND_REFRESHER.drain()
+
+    assert cache.get_or_stale(user) == (None, False)
+
+
+async def test_background_refresh_respects_global_cap() -> None:
+    from app.services.cache_refresh import BackgroundRefresher
+
+    refresher = BackgroundRefresher(max_concurrency=1)
+    release = asyncio.Event()
+
+    async def slow() -> None:
+        await release.wait()
+
+    assert refresher.schedule("a", slow)
+    assert not refresher.schedule("b", slow)
+    assert refresher.stats()["skipped_busy"] == 1
+    release.set()
+    await refresher.drain()
+    assert refresher.schedule("b", slow)
+    await refresher.drain()
+
+
+# --- Memory budget ----------------------------------------------------------
+
+
+def test_budget_eviction_unindexes_content() -> None:
+    """An entry evicted by the byte budget must leave the reverse index too,
+    or content-scoped purges keep a dangling reference."""
+    cache = FeedPageCache(ttl_seconds=30.0, backend=MemoryFeedCacheBackend(1024))
+    old, new = uuid4(), uuid4()
+    cid = uuid4()
+    cache.put(old, f'{{"id": "{cid}", "pad": "{"x" * 300}"}}'.encode())
+    cache.put(new, f'{{"pad": "{"x" * 300}"}}'.encode())
+
+    assert cache.get(old) is None
+    assert cache.stats()["evictions"] == 1
+    assert cache.backend._by_content == {}
+    assert cache.backend._by_user.keys() == {new}
+
+
+# --- Pre-compressed entries -------------------------------------------------
+
+
+def test_gzip_entries_keep_the_content_index(feed_cache_payload) -> None:
+    cache = FeedPageCache(ttl_seconds=30.0, compress=True)
+    user, cid = uuid4(), uuid4()
+    payload = feed_cache_payload(cid)
+
+    stored = cache.put(user, payload)
+
+    assert gzip.decompress(stored) == payload
+    assert cache.get(user) == stored
+    cache.invalidate_content(user, cid)
+    assert cache.get(user) is None
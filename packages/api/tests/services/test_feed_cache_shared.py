@@ -0,0 +1,217 @@
+"""Tests for the shared (cross-worker) FeedPageCache backend.
+
+Two `FeedPageCache` instances opening the same SQLite file stand in for two
+uvicorn workers of the same pod.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import time
+from uuid import uuid4
+
+import pytest
+
+from app.services.feed_cache import FeedPageCache, MemoryFeedCacheBackend
+from app.services.feed_cache_shared import SharedFeedCacheBackend
+
+
+@pytest.fixture
+def shared_path(tmp_path) -> str:
+    return str(tmp_path / "feed-cache.sqlite3")
+
+
+def _worker(path: str) -> FeedPageCache:
+    return FeedPageCache(
+        ttl_seconds=30.0,
+        personalized_ttl_seconds=60.0,
+        backend=SharedFeedCacheBackend(path),
+        lease_seconds=2.0,
+    )
+
+
+def test_entries_are_visible_across_workers(shared_path: str) -> None:
+    a, b = _worker(shared_path), _worker(shared_path)
+    user = uuid4()
+
+    a.put(user, b"default")
+    a.put(user, b"tech", variant="p|theme=tech")
+
+    assert b.get(user) == b"default"
+    assert b.get(user, variant="p|theme=tech") == b"tech"
+    assert b.stats()["backend"] == "shared"
+    assert b.stats()["size"] == 2
+
+
+def test_invalidation_reaches_other_worker_and_its_generation(
+    shared_path: str,
+) -> None:
+    """Un `put()` dont le compute a démarré sur le worker B avant une
+    invalidation servie par le worker A doit être droppé."""
+    a, b = _worker(shared_path), _worker(shared_path)
+    user = uuid4()
+    b.put(user, b"old")
+    captured = b.generation(user)
+
+    a.invalidate(user)
+
+    assert b.get(user) is None
+    b.put(user, b"resurrected", generation=captured)
+    assert a.get(user) is None
+
+
+def test_content_scoped_and_global_purge(shared_path: str) -> None:
+    a, b = _worker(shared_path), _worker(shared_path)
+    u1, u2 = uuid4(), uuid4()
+    cid = uuid4()
+    a.put(u1, f'{{"id": "{cid}"}}'.encode(), variant="p|theme=tech")
+    a.put(u1, b'{"id": "other"}', variant="p|theme=sport")
+    a.put(u2, f'{{"id": "{cid}"}}'.encode())
+
+    b.invalidate_content(u1, cid)
+    assert a.get(u1, variant="p|theme=tech") is None
+    assert a.get(u1, variant="p|theme=sport") is not None
+    assert a.get(u2) is not None
+
+    before = a.generation(uuid4())
+    b.invalidate_content_global(cid)
+    assert a.get(u2) is None
+    assert a.generation(uuid4()) != before
+
+
+def test_content_index_follows_overwrites(shared_path: str) -> None:
+    a, b = _worker(shared_path), _worker(shared_path)
+    user, dropped, kept = uuid4(), uuid4(), uuid4()
+    a.put(user, f'{{"id": "{dropped}"}}'.encode())
+    a.put(user, f'{{"id": "{kept}"}}'.encode())
+
+    b.invalidate_content(user, dropped)
+    assert a.get(user) is not None
+
+    b.invalidate_content(user, kept)
+    assert a.get(user) is None
+
+
+async def test_single_flight_spans_workers(shared_path: str) -> None:
+    a, b = _worker(shared_path), _worker(shared_path)
+    user = uuid4()
+    computes = 0
+
+    async def serve(cache: FeedPageCache) -> bytes:
+        nonlocal computes
+        async with cache.lock(user):
+            hit = cache.get(user)
+            if hit is not None:
+                return hit
+            computes += 1
+            await asyncio.sleep(0.1)
+            cache.put(user, b"computed")
+            return b"computed"
+
+    results = await asyncio.gather(serve(a), serve(b), serve(a), serve(b))
+
+    assert results == [b"computed"] * 4
+    assert computes == 1
+
+
+async def test_expired_lease_is_taken_over(shared_path: str) -> None:
+    """Un worker mort en plein compute ne bloque la clé que `lease_seconds`."""
+    backend = SharedFeedCacheBackend(shared_path)
+    user = uuid4()
+    assert backend.try_lease((user, None), ttl=0.05) is not None
+    assert backend.try_lease((user, None), ttl=0.05) is None
+
+    await asyncio.sleep(0.1)
+
+    token = backend.try_lease((user, None), ttl=0.05)
+    assert token is not None
+    backend.release_lease((user, None), token)
+    assert backend.try_lease((user, None), ttl=0.05) is not None
+
+
+async def test_cancelled_lease_wait_releases_the_local_lock(shared_path: str) -> None:
+    a, b = _worker(shared_path), _worker(shared_path)
+    user = uuid4()
+    holder = b.lock(user)
+    await holder.__aenter__()
+
+    waiter = asyncio.create_task(a.lock(user).__aenter__())
+    await asyncio.sleep(0.1)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    await holder.__aexit__(None, None, None)
+
+    assert not a.lock(user).locked()
+    async with asyncio.timeout(1.0), a.lock(user):
+        pass
+
+
+def test_busy_store_never_blocks_and_purges_still_land(shared_path: str) -> None:
+    """Une transaction d'écriture ouverte par un autre worker : aucune op
+    n'attend le verrou, et la purge refusée est rejouée dès qu'il tombe."""
+    a, b = _worker(shared_path), _worker(shared_path)
+    user = uuid4()
+    b.put(user, b"old")
+    other = sqlite3.connect(shared_path, isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+
+    started = time.monotonic()
+    a.put(user, b"dropped")
+    a.invalidate(user)
+    assert a.get(user) is None
+    assert a.generation(user) == (-1, -1)
+    assert time.monotonic() - started < 0.5
+    assert a.backend.pending == 1
+
+    other.execute("COMMIT")
+    other.close()
+    assert a.get(user) is None
+    assert a.backend.pending == 0
+    assert b.get(user) is None
+
+
+def test_backend_errors_degrade_to_no_cache(shared_path: str) -> None:
+    backend = SharedFeedCacheBackend(shared_path)
+    cache = _worker(shared_path)
+    cache._backend = backend
+    user = uuid4()
+    cache.put(user, b"x")
+    backend.close()
+    backend._path = "/nonexistent-dir/feed-cache.sqlite3"
+
+    assert cache.get(user) is None
+    cache.put(user, b"y", generation=cache.generation(user))
+    assert backend.generation(user) == (-1, -1)
+
+
+def test_unknown_backend_env_falls_back_to_memory(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("FEED_CACHE_BACKEND", "memcached")
+    cache = FeedPageCache(ttl_seconds=30.0)
+    assert isinstance(cache.backend, MemoryFeedCacheBackend)
+    assert isinstance(cache.lock(uuid4()), asyncio.Lock)
+
+
+def test_input_caches_of_other_workers_follow_invalidations(
+    shared_path: str,
+) -> None:
+    """Les listeners ne tournent que dans le worker de l'écriture : les
+    autres les rattrapent via `sync_invalidations` avant de lire."""
+    a, b = _worker(shared_path), _worker(shared_path)
+    user = uuid4()
+    dropped: list = []
+    b.add_invalidate_listener(dropped.append)
+    b.sync_invalidations(user)
+    dropped.clear()
+
+    a.invalidate_content(user, uuid4())
+    b.sync_invalidations(user)
+    assert dropped == []
+
+    a.invalidate(user)
+    b.sync_invalidations(user)
+    b.sync_invalidations(user)
+    assert dropped == [user]
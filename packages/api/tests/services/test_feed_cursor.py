@@ -0,0 +1,130 @@
+"""Tests for the ranked-id feed cursors (page 2+ without re-ranking)."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.models.content import Content
+from app.services.feed_cache import FEED_CACHE
+from app.services.feed_cursor import FEED_CURSORS, FeedCursorStore
+from app.services.recommendation_service import RecommendationService
+
+# `view_signature` de `get_feed(limit=3, theme="tech")`.
+_VIEW = (3, None, None, False, "tech", None, False, None, None, None) + (False,) * 4
+
+
+def _issue(store: FeedCursorStore, user, ids, view=_VIEW) -> str:
+    return store.issue(
+        user,
+        view,
+        ids,
+        context_version=7,
+        followed_source_ids={uuid4()},
+        explicit_filter=True,
+    )
+
+
+def test_cursor_resolves_only_for_its_user_view_and_token() -> None:
+    store = FeedCursorStore(ttl_seconds=60.0)
+    user, ids = uuid4(), [uuid4() for _ in range(3)]
+    token = _issue(store, user, ids)
+
+    cursor = store.resolve(token, user, _VIEW)
+    assert cursor is not None
+    assert cursor.content_ids == tuple(ids)
+    assert cursor.context_version == 7
+
+    assert store.resolve(token, uuid4(), _VIEW) is None
+    assert store.resolve(token, user, (*_VIEW[:-1], True)) is None
+    assert store.resolve("forged", user, _VIEW) is None
+
+
+def test_new_first_page_replaces_the_views_cursor() -> None:
+    store = FeedCursorStore(ttl_seconds=60.0)
+    user = uuid4()
+    old = _issue(store, user, [uuid4()])
+    new = _issue(store, user, [uuid4()])
+
+    assert store.resolve(old, user, _VIEW) is None
+    assert store.resolve(new, user, _VIEW) is not None
+    assert len(store._entries) == 1
+
+
+def test_background_refresh_keeps_the_served_cursor() -> None:
+    """SWR : la page stale servie porte le jeton courant, le refresh en
+    arrière-plan ne doit pas l'invalider."""
+    store = FeedCursorStore(ttl_seconds=60.0)
+    user, served_ids = uuid4(), [uuid4()]
+    served = _issue(store, user, served_ids)
+
+    kept = store.issue(
+        user,
+        _VIEW,
+        [uuid4()],
+        context_version=8,
+        followed_source_ids=set(),
+        explicit_filter=True,
+        rotate=False,
+    )
+
+    assert kept == served
+    cursor = store.resolve(served, user, _VIEW)
+    assert cursor is not None
+    assert cursor.content_ids == tuple(served_ids)
+
+    store.invalidate(user)
+    fresh = store.issue(
+        user,
+        _VIEW,
+        [uuid4()],
+        context_version=9,
+        followed_source_ids=set(),
+        explicit_filter=True,
+        rotate=False,
+    )
+    assert fresh not in (None, served)
+    assert store.resolve(fresh, user, _VIEW) is not None
+
+
+def test_ranking_writes_drop_cursors_through_feed_cache() -> None:
+    """Mute, follow, hide… call `FEED_CACHE.invalidate`: the next page must
+    be re-ranked, not sliced from the pre-write ordering."""
+    user = uuid4()
+    token = _issue(FEED_CURSORS, user, [uuid4()])
+
+    FEED_CACHE.invalidate(user)
+
+    assert FEED_CURSORS.resolve(token, user, _VIEW) is None
+
+
+def test_zero_ttl_disables_cursors() -> None:
+    store = FeedCursorStore(ttl_seconds=0.0)
+    assert _issue(store, uuid4(), [uuid4()]) is None
+
+
+@pytest.mark.asyncio
+async def test_page_from_cursor_keeps_rank_order_and_drops_excluded() -> None:
+    user = uuid4()
+    ids = [uuid4() for _ in range(5)]
+    token = _issue(FEED_CURSORS, user, ids)
+    hidden_since_page_one = ids[3]
+    rows = [Content(id=cid, source_id=uuid4()) for cid in (ids[4], ids[2])]
+
+    session = AsyncMock()
+    session.scalars.side_effect = [rows, []]
+    service = RecommendationService(session)
+
+    page = await service.get_feed(
+        user_id=user, limit=3, offset=2, theme="tech", cursor=token
+    )
+
+    assert [c.id for c in page] == [ids[2], ids[4]]
+    assert hidden_since_page_one not in {c.id for c in page}
+    assert service.next_cursor == token
+    assert service.total_candidates == 5
+    # Ni contexte utilisateur ni candidats : une requête par clé + les statuts.
+    session.scalar.assert_not_awaited()
+    assert session.scalars.await_count == 2
@@ -0,0 +1,124 @@
+"""Tests for the shared feed detection cache (positive/negative, single-flight)."""
+
+import asyncio
+
+import pytest
+
+from app.services.feed_detection_cache import FeedDetectionCache, detection_key
+from app.services.rss_parser import DetectedFeed, FeedFetchError, FeedNotFoundError
+from app.services.search.smart_source_search import SmartSourceSearchService
+
+
+def _feed(url: str = "https://blog.fr/feed/") -> DetectedFeed:
+    return DetectedFeed(
+        feed_url=url, title="Mon Blog", entries=[{"title": "P1", "link": "x"}]
+    )
+
+
+def test_detection_key_matches_host_root_and_keeps_paths():
+    assert detection_key("https://Blog.fr/") == "blog.fr"
+    assert detection_key("https://blog.fr") == "blog.fr"
+    assert detection_key("https://radiofrance.fr/franceculture/") == (
+        "radiofrance.fr/franceculture"
+    )
+    assert detection_key("https://blog.fr/?feed=rss2") == "blog.fr?feed=rss2"
+    assert detection_key("mediapart") is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_detections_share_one_run_and_get_copies():
+    cache = FeedDetectionCache(ttl_seconds=60, negative_ttl_seconds=60)
+    runs = 0
+
+    async def detect():
+        nonlocal runs
+        runs += 1
+        await asyncio.sleep(0.01)
+        return _feed()
+
+    results = await asyncio.gather(
+        *(cache.get_or_detect("https://blog.fr", detect) for _ in range(3))
+    )
+
+    assert runs == 1
+    assert [r.feed_url for r in results] == ["https://blog.fr/feed/"] * 3
+    results[0].entries.clear()
+    found, cached = cache.lookup("https://blog.fr/")
+    assert found and cached.entries == [{"title": "P1", "link": "x"}]
+    stats = cache.stats()
+    assert (stats["detections"], stats["hits"]) == (1, 3)
+
+
+@pytest.mark.asyncio
+async def test_no_feed_is_replayed_until_the_negative_ttl_expires():
+    cache = FeedDetectionCache(ttl_seconds=60, negative_ttl_seconds=0.05)
+    runs = 0
+
+    async def detect():
+        nonlocal runs
+        runs += 1
+        raise FeedNotFoundError("No RSS feed found. Tried: httpx=200")
+
+    for _ in range(2):
+        with pytest.raises(FeedNotFoundError, match="No RSS feed found"):
+            await cache.get_or_detect("https://nofeed.fr", detect)
+    assert runs == 1
+    assert cache.lookup("https://nofeed.fr") == (True, None)
+
+    await asyncio.sleep(0.06)
+    with pytest.raises(ValueError):
+        await cache.get_or_detect("https://nofeed.fr", detect)
+    assert runs == 2
+
+
+@pytest.mark.asyncio
+async def test_timeouts_are_not_cached():
+    cache = FeedDetectionCache(ttl_seconds=60, negative_ttl_seconds=60)
+
+    async def slow():
+        await asyncio.sleep(1)
+        return _feed()
+
+    with pytest.raises(TimeoutError):
+        await asyncio.wait_for(cache.get_or_detect("https://slow.fr", slow), 0.01)
+    assert cache.lookup("https://slow.fr") == (False, None)
+
+
+@pytest.mark.asyncio
+async def test_fetch_failures_are_not_cached():
+    cache = FeedDetectionCache(ttl_seconds=60, negative_ttl_seconds=60)
+    runs = 0
+
+    async def unreachable():
+        nonlocal runs
+        runs += 1
+        raise FeedFetchError("Could not access URL: ConnectTimeout")
+
+    for _ in range(2):
+        with pytest.raises(FeedFetchError):
+            await cache.get_or_detect("https://down.fr", unreachable)
+    assert runs == 2
+    assert cache.lookup("https://down.fr") == (False, None)
+
+
+@pytest.mark.asyncio
+async def test_smart_search_reads_the_shared_cache_before_its_table(monkeypatch):
+    cache = FeedDetectionCache(ttl_seconds=60, negative_ttl_seconds=60)
+    cache.put("https://blog.fr", _feed())
+    cache.put_negative("https://nofeed.fr", "No RSS feed found.")
+    monkeypatch.setattr(
+        "app.services.search.smart_source_search.FEED_DETECTION_CACHE", cache
+    )
+
+    def no_db():
+        raise AssertionError("host_feed_resolutions must not be queried")
+
+    monkeypatch.setattr(
+        "app.services.search.smart_source_search.safe_async_session", no_db
+    )
+    svc = SmartSourceSearchService.__new__(SmartSourceSearchService)
+
+    meta = await svc._cached_detect_feed("https://blog.fr")
+    assert meta["feed_url"] == "https://blog.fr/feed/"
+    assert meta["recent_items"] == [{"title": "P1", "published_at": ""}]
+    assert await svc._cached_detect_feed("https://nofeed.fr") is None
@@ -0,0 +1,107 @@
+"""Tests for the off-loop RSS ingestion stage (`FeedIngestPool`)."""
+
+import asyncio
+import os
+from concurrent.futures.process import BrokenProcessPool
+from uuid import uuid4
+
+import pytest
+
+from app.models.enums import ContentType, SourceType
+from app.services.feed_entry_parser import EntrySource, analyze_feed, detect_paywalls
+from app.services.feed_ingest_pool import FeedIngestPool
+
+_RSS = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Blog</title>
+<item><title>A</title><link>https://b.ex/a</link><guid>a</guid>
+<description>Réservé aux abonnés</description></item>
+<item><title>No link</title><guid isPermaLink="false">x</guid></item>
+<item><title>B</title><link>https://b.ex/b</link><guid>b</guid></item>
+</channel></rss>"""
+
+_SOURCE = EntrySource(id=uuid4(), name="Blog", type=SourceType.ARTICLE)
+
+
+def test_analyze_feed_returns_plain_entry_dicts():
+    parsed = analyze_feed(_RSS, _SOURCE, 50)
+
+    assert parsed.total == 3
+    assert parsed.bozo_error is None
+    assert [e["guid"] for e in parsed.entries] == ["a", "b"]
+    assert parsed.entries[0]["content_type"] == ContentType.ARTICLE
+    assert parsed.entries[0]["source_id"] == _SOURCE.id
+    assert parsed.entries[0]["content_quality"] == "none"
+    assert [e["guid"] for e in analyze_feed(_RSS, _SOURCE, 1).entries] == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_process_pool_runs_parse_and_paywall_off_loop():
+    pool = FeedIngestPool(workers=1, queue_size=2)
+    try:
+        parsed = await pool.run(analyze_feed, _RSS, _SOURCE, 50)
+        verdicts = await pool.run(
+            detect_paywalls,
+            [
+                {
+                    "title": e["title"],
+                    "description": e["description"],
+                    "url": e["url"],
+                    "html_content": None,
+                    "source_id": str(_SOURCE.id),
+                    "html_head": '<meta property="og:article:content_tier" '
+                    'content="locked">',
+                }
+                for e in parsed.entries
+            ],
+        )
+    finally:
+        pool.shutdown()
+
+    assert [e["guid"] for e in parsed.entries] == ["a", "b"]
+    assert verdicts == [True, True]
+    stats = pool.stats()
+    assert (stats["submitted"], stats["completed"], stats["failed"]) == (2, 2, 0)
+
+
+def _slow_identity(value):
+    import time
+
+    time.sleep(0.02)
+    return value
+
+
+@pytest.mark.asyncio
+async def test_queue_is_bounded_and_errors_are_counted():
+    pool = FeedIngestPool(workers=0, queue_size=2)
+
+    results = await asyncio.gather(*(pool.run(_slow_identity, i) for i in range(5)))
+    with pytest.raises(ZeroDivisionError):
+        await pool.run(divmod, 1, 0)
+
+    assert results == list(range(5))
+    stats = pool.stats()
+    assert stats["peak_waiting"] == 3  # 2 slots, 3 en file
+    assert stats["in_flight"] == 0
+    assert (stats["completed"], stats["failed"]) == (5, 1)
+
+
+@pytest.mark.asyncio
+async def test_broken_pool_fails_its_calls_and_is_replaced_once():
+    pool = FeedIngestPool(workers=1, queue_size=2)
+    try:
+        crashed = await asyncio.gather(
+            pool.run(os._exit, 1),
+            pool.run(os._exit, 2),
+            return_exceptions=True,
+        )
+        replacement = pool._executor
+        assert await pool.run(abs, -3) == 3
+    finally:
+        pool.shutdown()
+
+    # Jamais rejoué dans le processus de l'API : l'appel échoue.
+    assert all(isinstance(exc, BrokenProcessPool) for exc in crashed)
+    assert replacement is None
+    stats = pool.stats()
+    assert stats["broken"] == 1
+    assert (stats["completed"], stats["failed"]) == (1, 2)
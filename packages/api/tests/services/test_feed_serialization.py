@@ -0,0 +1,75 @@
+"""Tests for the one-pass, fragment-spliced feed serialization."""
+
+from __future__ import annotations
+
+import json
+from uuid import uuid4
+
+from app.schemas.content import RecommendationReason, ScoreContribution
+from app.schemas.feed import CarouselInfo
+from app.services.feed_serialization import (
+    ArticleFragmentCache,
+    serialize_feed_response,
+)
+
+
+def test_matches_model_dump(feed_response_factory) -> None:
+    response = feed_response_factory(items=3)
+    item = response.items[0]
+    item.entities = ["PERSON:Emmanuel Macron"]
+    item.title = "Élection : l'heure des résultats"
+    item.recommendation_reason = RecommendationReason(
+        label="Pour toi",
+        score_total=12.5,
+        breakdown=[ScoreContribution(label="Thème : Tech", points=70)],
+    )
+    response.carousels = [
+        CarouselInfo(
+            carousel_type="hot",
+            title="Actu chaude",
+            emoji="🔴",
+            position=2,
+            items=response.items[1:],
+            badges=[],
+        )
+    ]
+
+    assert json.loads(serialize_feed_response(response)) == response.model_dump(
+        mode="json"
+    )
+
+
+def test_empty_page_matches_model_dump(feed_response_factory) -> None:
+    response = feed_response_factory(items=0)
+    assert json.loads(serialize_feed_response(response)) == response.model_dump(
+        mode="json"
+    )
+
+
+def test_shared_fragment_is_reused_across_user_state(feed_response_factory) -> None:
+    """Two users see the same article with a different state: one fragment,
+    two correct items."""
+    cache = ArticleFragmentCache()
+    content_id = uuid4()
+    mine = feed_response_factory(content_ids=[content_id]).items[0]
+    theirs = mine.model_copy(update={"is_saved": True, "reading_progress": 40})
+
+    assert json.loads(cache.item_json(mine))["is_saved"] is False
+    decoded = json.loads(cache.item_json(theirs))
+
+    assert decoded["is_saved"] is True
+    assert decoded["reading_progress"] == 40
+    assert cache.stats()["hits"] == 1
+
+
+def test_changed_article_fields_miss_the_fragment(feed_response_factory) -> None:
+    """No `updated_at` on Content: the fragment is versioned by its values, so
+    a re-classification can never serve the old topics."""
+    cache = ArticleFragmentCache()
+    item = feed_response_factory(items=1).items[0]
+    cache.item_json(item)
+
+    reclassified = item.model_copy(update={"topics": ["ai"]})
+
+    assert json.loads(cache.item_json(reclassified))["topics"] == ["ai"]
+    assert cache.stats()["misses"] == 2
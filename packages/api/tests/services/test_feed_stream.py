@@ -0,0 +1,143 @@
+"""Tests for the incremental reading of large feeds (`feed_stream`)."""
+
+import feedparser
+import httpx
+import pytest
+
+from app.config import get_settings
+from app.services.feed_stream import FeedTruncator
+from app.services.sync_service import SyncService
+
+
+def _rss(count: int) -> bytes:
+    items = "".join(
+        f"<item><title>T{i}</title><link>https://b.ex/{i}</link>"
+        f'<guid isPermaLink="false">g{i}</guid>'
+        f"<content:encoded><![CDATA[<p>{'x' * 500}</p>]]></content:encoded>"
+        "<media:group><media:item>nested</media:item></media:group></item>"
+        for i in range(count)
+    )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?><rss version="2.0" '
+        'xmlns:content="http://purl.org/rss/1.0/modules/content/" '
+        'xmlns:media="http://search.yahoo.com/mrss/"><channel>'
+        f"<title>Blog é</title><link>https://b.ex</link>{items}</channel></rss>"
+    ).encode()
+
+
+def _atom(count: int) -> bytes:
+    entries = "".join(
+        f"<entry><title>T{i}</title><id>urn:e{i}</id>"
+        f'<link rel="alternate" href="https://b.ex/{i}"/>'
+        "<updated>2025-10-01T10:00:00Z</updated></entry>"
+        for i in range(count)
+    )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<feed xmlns="http://www.w3.org/2005/Atom"><title>Atom</title>'
+        f"{entries}</feed>"
+    ).encode()
+
+
+def _feed_in_chunks(truncator: FeedTruncator, body: bytes, size: int = 4096) -> int:
+    read = 0
+    for start in range(0, len(body), size):
+        read += 1
+        if truncator.feed(body[start : start + size]):
+            break
+    return read
+
+
+@pytest.mark.parametrize("body", [_rss(120), _atom(120)], ids=["rss", "atom"])
+def test_truncated_document_parses_like_the_full_feed_prefix(body):
+    truncator = FeedTruncator(max_entries=50, max_bytes=10**7)
+    _feed_in_chunks(truncator, body)
+
+    assert truncator.stop_reason == "entries"
+    assert truncator.bytes_read < len(body)
+    truncated = feedparser.parse(truncator.document())
+    full = feedparser.parse(body)
+    assert not truncated.bozo
+    assert truncated.feed.title == full.feed.title
+    assert [dict(e) for e in truncated.entries] == [dict(e) for e in full.entries[:50]]
+
+
+def test_byte_cap_keeps_complete_entries_only():
+    truncator = FeedTruncator(max_entries=50, max_bytes=5000)
+    _feed_in_chunks(truncator, _rss(120), size=1000)
+
+    assert truncator.stop_reason == "bytes"
+    ids = [e.id for e in feedparser.parse(truncator.document()).entries]
+    assert ids == [f"g{i}" for i in range(truncator.entry_count)]
+    assert 0 < truncator.entry_count < 50
+
+
+async def _serve_chunks(service, body: bytes, chunk_size: int = 2048) -> list[int]:
+    """Sert `body` morceau par morceau ; renvoie le compteur de morceaux lus."""
+    served = [0]
+
+    class _Stream(httpx.AsyncByteStream):
+        async def __aiter__(self):
+            for start in range(0, len(body), chunk_size):
+                served[0] += 1
+                yield body[start : start + chunk_size]
+
+    def handler(request):
+        return httpx.Response(
+            200, stream=_Stream(), headers={"content-type": "application/rss+xml"}
+        )
+
+    await service.client.aclose()
+    service.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return served
+
+
+@pytest.fixture
+def small_stream_threshold(monkeypatch):
+    monkeypatch.setattr(get_settings(), "rss_sync_stream_threshold_bytes", 4096)
+
+
+@pytest.mark.asyncio
+async def test_large_feed_is_read_only_up_to_the_entry_cap(small_stream_threshold):
+    service = SyncService(session=None)
+    body = _rss(400)
+    served = await _serve_chunks(service, body)
+
+    fetch = await service._fetch_feed("https://b.ex/feed")
+
+    assert served[0] < len(body) // 2048
+    assert len(feedparser.parse(fetch.text).entries) == 50
+    assert service.feed_stats["streamed"] == 1
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_large_feed_stops_at_known_entries(small_stream_threshold):
+    service = SyncService(session=None)
+    await _serve_chunks(service, _rss(400))
+    probes: list[list[str]] = []
+
+    async def known(guids):
+        probes.append(guids)
+        return set(guids) if guids[0] != "g0" else set()
+
+    fetch = await service._fetch_feed("https://b.ex/feed", known_guids=known)
+
+    entries = feedparser.parse(fetch.text).entries
+    # Premier lot nouveau, second déjà connu : arrêt, sans lire les 50.
+    assert len(probes) == 2
+    assert 20 <= len(entries) < 50
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_large_non_feed_body_is_read_in_full(small_stream_threshold):
+    service = SyncService(session=None)
+    body = b"<html><body>" + b"<p>challenge</p>" * 2000 + b"</body></html>"
+    await _serve_chunks(service, body)
+
+    fetch = await service._fetch_feed("https://b.ex/feed")
+
+    assert fetch.text == body.decode()
+    assert service.feed_stats["streamed"] == 0
+    await service.close()
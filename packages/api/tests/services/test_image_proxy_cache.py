@@ -0,0 +1,205 @@
+"""Tests for the image proxy disk cache (LRU, coalescing, thumbnails)."""
+
+import asyncio
+import io
+import os
+import threading
+
+import httpx
+import pytest
+
+from app.services import image_proxy_cache
+from app.services.image_proxy_cache import ImageProxyCache, ImageProxyError
+from app.services.outbound_http import OUTBOUND_HTTP
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Upstream images by URL path: ``{"/a.jpg": (b"...", "image/jpeg")}``."""
+    images: dict[str, tuple[bytes, str]] = {}
+    calls: list[str] = []
+    gate = asyncio.Event()
+    gate.set()
+
+    async def handler(request):
+        calls.append(request.url.path)
+        await gate.wait()
+        body, content_type = images[request.url.path]
+        return httpx.Response(200, content=body, headers={"content-type": content_type})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(OUTBOUND_HTTP, "client", lambda _purpose: client)
+    return images, calls, gate
+
+
+def _read(served) -> bytes:
+    return b"".join(served.chunks())
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_upstream_fetch(tmp_path, upstream):
+    images, calls, gate = upstream
+    images["/a.jpg"] = (b"jpeg" * 10, "image/jpeg")
+    cache = ImageProxyCache(directory=str(tmp_path), max_bytes=1024)
+
+    gate.clear()
+    tasks = [asyncio.create_task(cache.get("https://cdn.ex/a.jpg")) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    gate.set()
+    served = await asyncio.gather(*tasks)
+
+    assert [_read(s) for s in served] == [b"jpeg" * 10] * 3
+    assert calls == ["/a.jpg"]
+    stats = cache.stats()
+    assert stats["coalesced"] == 2
+    assert stats["downloads"] == 1
+    assert stats["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_lru_evicts_least_recently_served_entry(tmp_path, upstream):
+    images, calls, _gate = upstream
+    for name in ("a", "b", "c"):
+        images[f"/{name}.png"] = (name.encode() * 10, "image/png")
+    cache = ImageProxyCache(directory=str(tmp_path), max_bytes=25)
+
+    _read(await cache.get("https://cdn.ex/a.png"))
+    _read(await cache.get("https://cdn.ex/b.png"))
+    _read(await cache.get("https://cdn.ex/a.png"))  # hit: a devient récent
+    _read(await cache.get("https://cdn.ex/c.png"))  # évince b
+    _read(await cache.get("https://cdn.ex/a.png"))
+    _read(await cache.get("https://cdn.ex/b.png"))
+
+    assert calls == ["/a.png", "/b.png", "/c.png", "/b.png"]
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["bytes"] <= 25
+    assert stats["evictions"] == 2
+    files = [f for _r, _d, fs in os.walk(tmp_path) for f in fs]
+    assert len(files) == stats["entries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_index_is_rebuilt_from_disk_after_restart(tmp_path, upstream):
+    images, calls, _gate = upstream
+    images["/a.webp"] = (b"webp-bytes", "image/webp")
+    _read(await ImageProxyCache(directory=str(tmp_path)).get("https://cdn.ex/a.webp"))
+    stale = tmp_path / "tmpdead.tmp"
+    stale.write_bytes(b"partial")
+    os.utime(stale, (0, 0))
+
+    restarted = ImageProxyCache(directory=str(tmp_path))
+    served = await restarted.get("https://cdn.ex/a.webp")
+
+    assert _read(served) == b"webp-bytes"
+    assert served.content_type == "image/webp"
+    assert served.cached
+    assert calls == ["/a.webp"]
+    assert not stale.exists()
+
+
+@pytest.mark.asyncio
+async def test_oversized_image_is_rejected_and_not_kept(
+    tmp_path, upstream, monkeypatch
+):
+    images, _calls, _gate = upstream
+    images["/big.jpg"] = (b"x" * 100, "image/jpeg")
+    monkeypatch.setattr(image_proxy_cache, "MAX_BYTES", 50)
+    cache = ImageProxyCache(directory=str(tmp_path))
+
+    with pytest.raises(ImageProxyError) as excinfo:
+        await cache.get("https://cdn.ex/big.jpg")
+
+    assert excinfo.value.status_code == 413
+    assert [f for _r, _d, fs in os.walk(tmp_path) for f in fs] == []
+
+
+@pytest.mark.asyncio
+async def test_unresizable_thumbnail_links_to_the_original(tmp_path, upstream):
+    images, calls, _gate = upstream
+    images["/anim.gif"] = (b"GIF89a" + b"\x00" * 20, "image/gif")
+    cache = ImageProxyCache(directory=str(tmp_path))
+
+    first = await cache.get("https://cdn.ex/anim.gif", 320)
+    second = await cache.get("https://cdn.ex/anim.gif", 320)
+
+    assert _read(first) == _read(second) == images["/anim.gif"][0]
+    assert second.cached
+    assert calls == ["/anim.gif"]
+    assert cache.stats()["resized"] == 0
+
+
+@pytest.mark.asyncio
+async def test_thumbnail_is_downscaled_with_pillow(tmp_path, upstream):
+    pil = pytest.importorskip("PIL.Image")
+    original = io.BytesIO()
+    pil.new("RGB", (1200, 800), "red").save(original, format="JPEG")
+    images, _calls, _gate = upstream
+    images["/big.jpg"] = (original.getvalue(), "image/jpeg")
+    cache = ImageProxyCache(directory=str(tmp_path))
+
+    served = await cache.get("https://cdn.ex/big.jpg", 320)
+
+    with pil.open(io.BytesIO(_read(served))) as thumb:
+        assert thumb.size == (320, 213)
+    assert cache.stats()["resized"] == 1
+
+
+@pytest.mark.asyncio
+async def test_oversized_or_broken_image_serves_the_original(
+    tmp_path, upstream, monkeypatch
+):
+    pil = pytest.importorskip("PIL.Image")
+    original = io.BytesIO()
+    pil.new("RGB", (1200, 800), "red").save(original, format="PNG")
+    images, _calls, _gate = upstream
+    images["/huge.png"] = (original.getvalue(), "image/png")
+    images["/broken.jpg"] = (b"\xff\xd8\xff\xe0" + b"\x00" * 64, "image/jpeg")
+    monkeypatch.setattr(image_proxy_cache, "MAX_PIXELS", 1200 * 800 - 1)
+    cache = ImageProxyCache(directory=str(tmp_path))
+
+    huge = await cache.get("https://cdn.ex/huge.png", 320)
+    broken = await cache.get("https://cdn.ex/broken.jpg", 320)
+
+    assert _read(huge) == images["/huge.png"][0]
+    assert _read(broken) == images["/broken.jpg"][0]
+    stats = cache.stats()
+    assert stats["resized"] == 0
+    assert stats["errors"] == 0
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_streams_without_writing(tmp_path, upstream):
+    images, calls, _gate = upstream
+    images["/a.jpg"] = (b"jpeg-bytes", "image/jpeg")
+    cache = ImageProxyCache(directory=str(tmp_path / "cache"), max_bytes=0)
+
+    assert _read(await cache.get("https://cdn.ex/a.jpg")) == b"jpeg-bytes"
+    assert _read(await cache.get("https://cdn.ex/a.jpg")) == b"jpeg-bytes"
+
+    assert calls == ["/a.jpg", "/a.jpg"]
+    assert not (tmp_path / "cache").exists()
+
+
+@pytest.mark.asyncio
+async def test_warm_builds_the_index_in_a_worker_thread(tmp_path, upstream):
+    images, calls, _gate = upstream
+    images["/a.png"] = (b"png-bytes", "image/png")
+    _read(await ImageProxyCache(directory=str(tmp_path)).get("https://cdn.ex/a.png"))
+    restarted = ImageProxyCache(directory=str(tmp_path))
+    loop_thread = threading.get_ident()
+    scan_threads: list[int] = []
+    scan = restarted._scan
+
+    def tracked_scan():
+        scan_threads.append(threading.get_ident())
+        return scan()
+
+    restarted._scan = tracked_scan
+    await asyncio.gather(restarted.warm(), restarted.warm())
+
+    assert len(scan_threads) == 1
+    assert scan_threads[0] != loop_thread
+    assert restarted.stats()["entries"] == 1
+    assert (await restarted.get("https://cdn.ex/a.png")).cached
+    assert calls == ["/a.png"]
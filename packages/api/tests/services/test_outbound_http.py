@@ -0,0 +1,179 @@
+"""Tests for the shared outbound HTTP layer (per-purpose pools)."""
+
+import asyncio
+import socket
+
+import httpcore
+import httpx
+import pytest
+
+from app.services.outbound_http import (
+    PURPOSES,
+    CachingResolver,
+    OutboundHTTP,
+    PooledTransport,
+)
+
+
+def _pooled(handler, per_host: int = 2) -> PooledTransport:
+    return PooledTransport(httpx.MockTransport(handler), per_host=per_host)
+
+
+@pytest.mark.asyncio
+async def test_per_host_limit_caps_concurrent_requests():
+    release = asyncio.Event()
+    active: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    async def handler(request):
+        host = request.url.host
+        active[host] = active.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), active[host])
+        await release.wait()
+        active[host] -= 1
+        return httpx.Response(200, content=b"ok")
+
+    transport = _pooled(handler, per_host=2)
+    client = httpx.AsyncClient(transport=transport)
+    tasks = [
+        asyncio.create_task(client.get(f"https://{host}/{i}"))
+        for i in range(4)
+        for host in ("slow.ex", "other.ex")
+    ]
+    await asyncio.sleep(0.05)
+    # Chaque hôte a sa propre limite : l'un ne bloque pas l'autre.
+    assert active == {"slow.ex": 2, "other.ex": 2}
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert peak == {"slow.ex": 2, "other.ex": 2}
+    stats = transport.stats()
+    assert stats["requests"] == 8
+    assert stats["host_waits"] == 4
+    assert stats["in_flight"] == 0
+    assert transport._gates == {}
+
+
+class _Body(httpx.AsyncByteStream):
+    async def __aiter__(self):
+        yield b"x" * 10
+
+
+@pytest.mark.asyncio
+async def test_host_slot_is_held_until_the_streamed_body_is_closed():
+    transport = _pooled(lambda _request: httpx.Response(200, stream=_Body()))
+    client = httpx.AsyncClient(transport=transport)
+
+    async with client.stream("GET", "https://cdn.ex/a.png") as response:
+        assert transport.stats()["in_flight"] == 1
+        await response.aread()
+    assert transport.stats()["in_flight"] == 0
+    assert transport._gates == {}
+
+
+@pytest.mark.asyncio
+async def test_metrics_count_5xx_and_transport_errors_per_host():
+    def handler(request):
+        if request.url.path == "/down":
+            raise httpx.ConnectError("boom", request=request)
+        status = 503 if request.url.path == "/busy" else 200
+        return httpx.Response(status)
+
+    transport = _pooled(handler)
+    client = httpx.AsyncClient(transport=transport)
+    await client.get("https://a.ex/ok")
+    await client.get("https://a.ex/busy")
+    with pytest.raises(httpx.ConnectError):
+        await client.get("https://b.ex/down")
+
+    stats = transport.stats()
+    assert stats["requests"] == 3
+    assert stats["errors"] == 2
+    assert stats["hosts"]["a.ex"]["requests"] == 2
+    assert stats["hosts"]["a.ex"]["errors"] == 1
+    assert stats["hosts"]["b.ex"]["errors"] == 1
+    assert stats["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_sessions_share_the_purpose_transport_and_leave_it_open():
+    seen: list[httpx.Request] = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200)
+
+    created: list[str] = []
+
+    def factory(purpose):
+        created.append(purpose.name)
+        return _pooled(handler)
+
+    outbound = OutboundHTTP(transport_factory=factory)
+    session = outbound.session("detect", headers={"X-Probe": "1"})
+    await session.get("https://site.ex/")
+    await session.aclose()
+    # Fermer la session ne ferme pas le pool : le client partagé le réutilise.
+    await outbound.client("detect").get("https://site.ex/feed")
+
+    assert created == ["detect"]
+    assert seen[0].headers["user-agent"] == PURPOSES["detect"].headers["User-Agent"]
+    assert seen[0].headers["x-probe"] == "1"
+    assert "x-probe" not in seen[1].headers
+    assert outbound.stats()["detect"]["requests"] == 2
+    await outbound.aclose()
+
+
+class _FakeBackend(httpcore.AsyncNetworkBackend):
+    def __init__(self, refused: set[str]) -> None:
+        self.refused = refused
+        self.connects: list[str] = []
+
+    async def connect_tcp(self, host, port, timeout=None, **kwargs):
+        self.connects.append(host)
+        if host in self.refused:
+            raise httpcore.ConnectError(f"refused {host}")
+        return object()
+
+
+@pytest.mark.asyncio
+async def test_caching_resolver_reuses_addresses_and_falls_back(monkeypatch):
+    lookups: list[str] = []
+
+    def fake_getaddrinfo(host, port, *args, **kwargs):
+        lookups.append(host)
+        return [
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("192.0.2.1", port)),
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("192.0.2.2", port)),
+        ]
+
+    monkeypatch.setattr(socket, "getaddrinfo", fake_getaddrinfo)
+    backend = _FakeBackend(refused={"192.0.2.1"})
+    resolver = CachingResolver(backend)
+
+    await resolver.connect_tcp("media.ex", 443)
+    await resolver.connect_tcp("media.ex", 443)
+    await resolver.connect_tcp("203.0.113.9", 443)
+
+    assert lookups == ["media.ex"]
+    assert backend.connects == [
+        "192.0.2.1",
+        "192.0.2.2",
+        "192.0.2.1",
+        "192.0.2.2",
+        "203.0.113.9",
+    ]
+    assert resolver.stats() == {"hits": 1, "misses": 1, "errors": 0, "entries": 1}
+
+
+@pytest.mark.asyncio
+async def test_caching_resolver_maps_dns_failure_to_connect_error(monkeypatch):
+    def fake_getaddrinfo(*args, **kwargs):
+        raise socket.gaierror("Name or service not known")
+
+    monkeypatch.setattr(socket, "getaddrinfo", fake_getaddrinfo)
+    resolver = CachingResolver(_FakeBackend(refused=set()))
+
+    with pytest.raises(httpcore.ConnectError):
+        await resolver.connect_tcp("nowhere.ex", 443)
+    assert resolver.stats()["errors"] == 1
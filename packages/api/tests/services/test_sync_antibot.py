@@ -1,13 +1,15 @@
-"""Tests for the sync-side anti-bot fallback (T3) and buffer seed (T1d)."""
+"""Tests for the sync-side anti-bot fallback (T3), buffer seed (T1d) and
+conditional feed GET."""
 
 from unittest.mock import AsyncMock
 from uuid import uuid4
 
+import httpx
 import pytest
 
 from app.models.enums import SourceType
 from app.models.source import Source
-from app.services.sync_service import SyncService
+from app.services.sync_service import FeedFetch, SyncService
 
 _RSS = """<?xml version="1.0"?>
 <rss version="2.0"><channel><title>Blog</title>
@@ -16,20 +18,24 @@ _RSS = """<?xml version="1.0"?>
 </channel></rss>"""
 
 
-class _Resp:
-    def __init__(self, status_code, text):
-        self.status_code = status_code
-        self.text = text
+async def _serve(service, status_code, text, headers=None) -> list[httpx.Request]:
+    """Sert chaque requête du client du service par la même réponse ;
+    renvoie la liste des requêtes reçues."""
+    requests: list[httpx.Request] = []
 
-    def raise_for_status(self):
-        if self.status_code >= 400:
-            raise RuntimeError(f"HTTP {self.status_code}")
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(status_code, text=text, headers=headers)
+
+    await service.client.aclose()
+    service.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return requests
 
 
 @pytest.mark.asyncio
 async def test_fetch_feed_content_happy_path(monkeypatch):
     service = SyncService(session=None)
-    service.client.get = AsyncMock(return_value=_Resp(200, _RSS))
+    await _serve(service, 200, _RSS)
     impersonate = AsyncMock()
     monkeypatch.setattr(
         "app.services.sync_service.fetch_with_impersonation", impersonate
@@ -44,7 +50,7 @@ async def test_fetch_feed_content_happy_path(monkeypatch):
 @pytest.mark.asyncio
 async def test_fetch_feed_content_falls_back_to_curl_cffi_on_403(monkeypatch):
     service = SyncService(session=None)
-    service.client.get = AsyncMock(return_value=_Resp(403, "blocked"))
+    await _serve(service, 403, "blocked")
     monkeypatch.setattr(
         "app.services.sync_service.fetch_with_impersonation",
         AsyncMock(return_value=_RSS),
@@ -58,12 +64,12 @@ async def test_fetch_feed_content_falls_back_to_curl_cffi_on_403(monkeypatch):
 @pytest.mark.asyncio
 async def test_fetch_feed_content_raises_when_fallback_fails(monkeypatch):
     service = SyncService(session=None)
-    service.client.get = AsyncMock(return_value=_Resp(403, "blocked"))
+    await _serve(service, 403, "blocked")
     monkeypatch.setattr(
         "app.services.sync_service.fetch_with_impersonation",
         AsyncMock(return_value=None),
     )
-    with pytest.raises(RuntimeError):
+    with pytest.raises(httpx.HTTPStatusError):
         await service._fetch_feed_content("https://b.ex/feed")
     await service.close()
 
@@ -105,3 +111,84 @@ async def test_seed_recent_content_propagates_fetch_error(monkeypatch):
     with pytest.raises(RuntimeError):
         await service.seed_recent_content(source)
     await service.close()
+
+
+def _synced_source(**validators) -> Source:
+    return Source(
+        id=uuid4(),
+        name="Blog",
+        url="https://b.ex",
+        feed_url="https://b.ex/feed",
+        type=SourceType.ARTICLE,
+        **validators,
+    )
+
+
+@pytest.mark.asyncio
+async def test_fetch_feed_sends_validators_and_handles_304():
+    service = SyncService(session=None)
+    requests = await _serve(service, 304, "", {"etag": '"v2"'})
+
+    fetch = await service._fetch_feed(
+        "https://b.ex/feed", etag='"v1"', last_modified="Wed, 01 Oct 2025 10:00:00 GMT"
+    )
+
+    assert fetch.not_modified
+    assert fetch.etag == '"v2"'
+    assert fetch.last_modified == "Wed, 01 Oct 2025 10:00:00 GMT"
+    (request,) = requests
+    assert request.headers["If-None-Match"] == '"v1"'
+    assert request.headers["If-Modified-Since"] == "Wed, 01 Oct 2025 10:00:00 GMT"
+    await service.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [304, 200])
+async def test_unchanged_feed_short_circuits_before_parsing(monkeypatch, status):
+    """304, or a 200 whose body hashes like the last processed one: no parse,
+    no per-entry work, the unchanged counter moves."""
+    service = SyncService(session=None)
+    body = "" if status == 304 else _RSS
+    await _serve(service, status, body)
+    parse = AsyncMock()
+    monkeypatch.setattr("app.services.sync_service.FEED_INGEST_POOL.run", parse)
+    recorded = AsyncMock()
+    monkeypatch.setattr(service, "_record_feed_fetch", recorded)
+    saved = AsyncMock()
+    monkeypatch.setattr(service, "_save_content", saved)
+    source = _synced_source(
+        feed_etag='"v1"', feed_body_hash=FeedFetch(text=_RSS).body_hash
+    )
+
+    assert await service.process_source(source) == 0
+
+    parse.assert_not_awaited()
+    saved.assert_not_awaited()
+    assert recorded.await_args.kwargs == {"unchanged": True}
+    key = "not_modified" if status == 304 else "unchanged_body"
+    assert service.feed_stats[key] == 1
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_changed_feed_records_new_validators_after_entries(monkeypatch):
+    service = SyncService(session=None)
+    await _serve(service, 200, _RSS, {"etag": '"v2"', "last-modified": "lm"})
+    monkeypatch.setattr(service, "_fetch_html_head", AsyncMock(return_value=None))
+    monkeypatch.setattr(service, "_load_known_contents", AsyncMock(return_value={}))
+    saved = AsyncMock(return_value=2)
+    monkeypatch.setattr(service, "_save_contents", saved)
+    recorded = AsyncMock()
+    monkeypatch.setattr(service, "_record_feed_fetch", recorded)
+
+    new = await service.process_source(
+        _synced_source(feed_etag='"v1"', feed_body_hash="stale")
+    )
+
+    assert new == 2
+    assert [d["guid"] for d in saved.await_args.args[0]] == ["a", "b"]
+    fetch = recorded.await_args.args[1]
+    assert (fetch.etag, fetch.last_modified) == ('"v2"', "lm")
+    assert fetch.body_hash == FeedFetch(text=_RSS).body_hash
+    assert recorded.await_args.kwargs == {"unchanged": False}
+    await service.close()
@@ -0,0 +1,197 @@
+"""Tests for the batched feed-entry upsert (`SyncService._save_contents`) and
+the known-guid prefilter of `process_source`."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import httpx
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.models.enums import ContentType, SourceType
+from app.models.source import Source
+from app.services.sync_service import SyncService
+
+
+def _entry(guid: str, **overrides) -> dict:
+    data = {
+        "source_id": uuid4(),
+        "title": f"Title {guid}",
+        "url": f"https://b.ex/{guid}",
+        "guid": guid,
+        "published_at": datetime.utcnow() - timedelta(hours=1),
+        "content_type": ContentType.ARTICLE,
+        "description": None,
+        "thumbnail_url": None,
+        "duration_seconds": None,
+        "is_paid": False,
+    }
+    data.update(overrides)
+    return data
+
+
+def _known(guid: str, **columns) -> dict:
+    row = {
+        "id": uuid4(),
+        "guid": guid,
+        "created_at": None,
+        "thumbnail_url": None,
+        "description": None,
+        "html_content": None,
+        "audio_url": None,
+        "is_paid": False,
+        "content_quality": None,
+    }
+    row.update(columns)
+    return row
+
+
+def _service(known_rows: list[dict]) -> tuple[SyncService, list]:
+    """Service sur une session factice : le SELECT des guids sert
+    `known_rows`, les écritures sont enregistrées dans `calls`."""
+    calls: list = []
+    session = MagicMock()
+
+    async def _execute(stmt, params=None):
+        calls.append((stmt, params))
+        result = MagicMock()
+        result.mappings.return_value = known_rows
+        return result
+
+    session.execute = _execute
+    return SyncService(session), calls
+
+
+def _writes(calls: list) -> list[tuple[str, object]]:
+    return [(stmt.table.name, params) for stmt, params in calls[1:]]
+
+
+@pytest.mark.asyncio
+async def test_bulk_save_inserts_new_and_backfills_known_in_one_pass():
+    known = _known("old", thumbnail_url="kept.jpg", is_paid=True)
+    service, calls = _service([known])
+    enqueue = AsyncMock()
+    service._enqueue_many_for_classification_in_session = enqueue
+
+    created = await service._save_contents(
+        [
+            _entry("old", thumbnail_url="new.jpg", description="desc"),
+            _entry("fresh", description="hello"),
+        ]
+    )
+
+    assert created == 1
+    assert len(calls) == 3  # SELECT, UPDATE groupé, INSERT multi-lignes
+    (_, updated), (_, inserted) = _writes(calls)
+    # Backfill : seulement les colonnes vides, jamais de downgrade paywall.
+    assert updated == [
+        {"id": known["id"], "description": "desc", "content_quality": "none"}
+    ]
+    assert [row["guid"] for row in inserted] == ["fresh"]
+    priorities = enqueue.await_args.args[1]
+    assert priorities == {inserted[0]["id"]: 10}
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_bulk_save_backfills_duplicate_guid_on_pending_insert():
+    """Deux entrées au même guid : la seconde backfille la ligne créée par la
+    première, comme en sauvegarde entrée par entrée."""
+    service, calls = _service([])
+    service._enqueue_many_for_classification_in_session = AsyncMock()
+
+    created = await service._save_contents(
+        [_entry("dup"), _entry("dup", thumbnail_url="t.jpg", is_paid=True)]
+    )
+
+    assert created == 1
+    ((table, inserted),) = _writes(calls)
+    assert table == "contents"
+    assert len(inserted) == 1
+    assert inserted[0]["thumbnail_url"] == "t.jpg"
+    assert inserted[0]["is_paid"] is True
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_bulk_save_skips_writes_when_nothing_changes():
+    known = _known("old", description="desc", content_quality="partial")
+    service, calls = _service([known])
+
+    assert await service._save_contents([_entry("old", description="other")]) == 0
+    assert len(calls) == 1  # le SELECT seul
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_per_entry_fallback_isolates_failing_rows(monkeypatch):
+    service = SyncService(session=None)
+    monkeypatch.setattr(
+        service, "_save_contents", AsyncMock(side_effect=SQLAlchemyError("boom"))
+    )
+    save_one = AsyncMock(side_effect=[True, SQLAlchemyError("bad row"), False])
+    monkeypatch.setattr(service, "_save_content", save_one)
+
+    batch = [_entry("a"), _entry("b"), _entry("c")]
+    assert await service._save_each(batch, "Blog") == 1
+    assert save_one.await_count == 3
+    await service.close()
+
+
+_RSS = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Blog</title>
+<item><title>A</title><link>https://b.ex/a</link><guid>a</guid></item>
+<item><title>B</title><link>https://b.ex/b</link><guid>b</guid>
+<description>Nouveau résumé</description></item>
+<item><title>C</title><link>https://b.ex/c</link><guid>c</guid></item>
+<item><title>D</title><link>https://b.ex/d</link><guid>d</guid></item>
+</channel></rss>"""
+
+
+@pytest.mark.asyncio
+async def test_known_entries_skip_article_fetch_and_paywall(monkeypatch):
+    """a : connu et complet → ignoré ; b : connu avec un trou → backfill sans
+    HEAD ; c : connu, gratuit et tout juste semé → paywall re-vérifié ;
+    d : nouveau → chemin complet."""
+    now = datetime.now(UTC)
+    old = now - timedelta(days=2)
+    known = {
+        "a": _known("a", description="x", content_quality="partial", created_at=old),
+        "b": _known("b", content_quality="partial", created_at=old),
+        "c": _known("c", description="x", content_quality="partial", created_at=now),
+    }
+    service = SyncService(session=None)
+    await service.client.aclose()
+    service.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda _: httpx.Response(200, text=_RSS))
+    )
+    monkeypatch.setattr(service, "_load_known_contents", AsyncMock(return_value=known))
+    head = AsyncMock(return_value=None)
+    monkeypatch.setattr(service, "_fetch_html_head", head)
+    paywall = MagicMock(return_value=False)
+    monkeypatch.setattr("app.services.feed_entry_parser.detect_paywall", paywall)
+    saved = AsyncMock(return_value=1)
+    monkeypatch.setattr(service, "_save_contents", saved)
+    monkeypatch.setattr(service, "_record_feed_fetch", AsyncMock())
+
+    source = Source(
+        id=uuid4(),
+        name="Blog",
+        url="https://b.ex",
+        feed_url="https://b.ex/feed",
+        type=SourceType.ARTICLE,
+    )
+    assert await service.process_source(source) == 1
+
+    assert [c.args[0] for c in head.await_args_list] == [
+        "https://b.ex/c",
+        "https://b.ex/d",
+    ]
+    assert paywall.call_count == 2
+    batch = saved.await_args.args[0]
+    assert [d["guid"] for d in batch] == ["b", "c", "d"]
+    assert "is_paid" not in batch[0]  # pas d'upgrade paywall sans HEAD
+    assert saved.await_args.kwargs == {"known": known}
+    assert service.feed_stats["known_skipped"] == 2
+    await service.close()
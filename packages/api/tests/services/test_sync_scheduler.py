@@ -0,0 +1,62 @@
+"""Planification adaptative du sync RSS — délai par source (`next_sync_delay`)."""
+
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from app.services.sync_scheduler import (
+    MAX_BACKOFF,
+    SourceSyncStats,
+    next_sync_delay,
+)
+
+NOW = datetime(2026, 7, 26, 12, 0, tzinfo=UTC)
+MONTH = NOW - timedelta(days=60)
+# `int % 201 == 100` → jitter nul, pour des bornes exactes.
+NO_JITTER = UUID(int=100)
+MIN = timedelta(minutes=10)
+MAX = timedelta(hours=6)
+
+
+def _delay(articles_30d=0, followers=0, failures=0, oldest=MONTH, source_id=NO_JITTER):
+    return next_sync_delay(
+        SourceSyncStats(
+            articles_30d=articles_30d, oldest_content_at=oldest, followers=followers
+        ),
+        source_id=source_id,
+        failures=failures,
+        now=NOW,
+        min_interval=MIN,
+        max_interval=MAX,
+    )
+
+
+def test_wire_is_polled_at_the_floor_and_monthly_blog_at_the_ceiling():
+    assert _delay(articles_30d=3000) == MIN
+    assert _delay(articles_30d=1) == MAX
+    assert _delay(articles_30d=0, oldest=None) == MAX
+
+
+def test_cadence_sets_the_interval_between_the_bounds():
+    """8 articles par jour → un passage toutes les 1 h 30 (2 par parution)."""
+    assert _delay(articles_30d=240) == timedelta(hours=1, minutes=30)
+    # 1 par jour → 12 h, plafonné.
+    assert _delay(articles_30d=30) == MAX
+
+
+def test_followed_sources_are_refreshed_more_often():
+    assert _delay(articles_30d=240, followers=7) < _delay(articles_30d=240)
+
+
+def test_failures_back_off_exponentially_up_to_the_cap():
+    base = _delay(articles_30d=240)
+    assert _delay(articles_30d=240, failures=1) == base * 2
+    assert _delay(articles_30d=240, failures=2) == base * 4
+    assert _delay(articles_30d=240, failures=40) == MAX_BACKOFF
+
+
+def test_jitter_is_bounded_and_stable_per_source():
+    source = UUID("6f1c0d1e-2b9a-4c55-9d1f-0a3b4c5d6e7f")
+    delay = _delay(articles_30d=240, source_id=source)
+    assert delay == _delay(articles_30d=240, source_id=source)
+    base = _delay(articles_30d=240)
+    assert base * 0.9 <= delay <= base * 1.1
@@ -0,0 +1,162 @@
+"""Tests for UserContextCache (compiled scoring inputs of /api/feed/)."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.models.enums import InterestState
+from app.services.feed_cache import FeedPageCache
+from app.services.recommendation_service import _compile_user_context
+from app.services.user_context_cache import (
+    CompiledUserContext,
+    UserContextCache,
+)
+
+
+def _compiled(user_id=None) -> CompiledUserContext:
+    source_id = uuid4()
+    profile = SimpleNamespace(
+        interests=[
+            SimpleNamespace(
+                interest_slug="tech", weight=1.5, state=InterestState.FAVORITE
+            )
+        ],
+        preferences=[
+            SimpleNamespace(preference_key="content_recency", preference_value="recent")
+        ],
+    )
+    return _compile_user_context(
+        user_id or uuid4(),
+        profile,
+        [
+            SimpleNamespace(
+                source_id=source_id,
+                is_custom=True,
+                has_subscription=False,
+                priority_multiplier=2.0,
+            )
+        ],
+        [SimpleNamespace(topic_slug="ai", weight=1.2)],
+        SimpleNamespace(
+            muted_sources=[],
+            muted_themes=["Sport"],
+            muted_topics=None,
+            muted_content_types=["PODCAST"],
+            hide_paid_content=False,
+            hide_non_fr_sources=None,
+        ),
+        {"macron"},
+        {"openai": 1.4},
+        {source_id: 1.0},
+        [],
+    )
+
+
+@pytest.fixture
+def cache() -> UserContextCache:
+    return UserContextCache(ttl_seconds=60.0)
+
+
+def test_compiled_context_is_normalized_and_immutable() -> None:
+    compiled = _compiled()
+
+    assert compiled.user_interests == frozenset({"tech"})
+    assert compiled.user_subtopics == frozenset({"ai"})
+    assert compiled.muted_themes == frozenset({"sport"})
+    assert compiled.muted_topics == frozenset()
+    assert compiled.muted_content_types == frozenset({"podcast"})
+    assert compiled.user_interest_states["tech"] == InterestState.FAVORITE
+    assert compiled.user_prefs == {"content_recency": "recent"}
+    assert compiled.hide_paid_content is False
+    assert compiled.hide_non_fr_sources is None
+    assert set(compiled.source_priority_multipliers.values()) == {2.0}
+    assert compiled.custom_source_ids == compiled.followed_source_ids
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        compiled.version = 0  # type: ignore[misc]
+    with pytest.raises(TypeError):
+        compiled.user_interest_weights["tech"] = 9.0  # type: ignore[index]
+
+
+def test_versions_increase_per_build() -> None:
+    assert _compiled().version < _compiled().version
+
+
+async def test_concurrent_requests_share_one_build(cache: UserContextCache) -> None:
+    user = uuid4()
+    builds = 0
+
+    async def build() -> CompiledUserContext:
+        nonlocal builds
+        builds += 1
+        await asyncio.sleep(0.01)
+        return _compiled(user)
+
+    results = await asyncio.gather(
+        *(cache.get_or_build(user, build) for _ in range(10))
+    )
+
+    assert builds == 1
+    assert len({id(r) for r in results}) == 1
+    assert cache.stats()["builds"] == 1
+
+
+async def test_invalidate_forces_rebuild(cache: UserContextCache) -> None:
+    user = uuid4()
+    first = await cache.get_or_build(user, lambda: asyncio.sleep(0, _compiled(user)))
+    cache.invalidate(user)
+    second = await cache.get_or_build(user, lambda: asyncio.sleep(0, _compiled(user)))
+
+    assert second.version > first.version
+    assert cache.stats()["invalidations"] == 1
+
+
+async def test_build_racing_an_invalidate_is_not_stored(
+    cache: UserContextCache,
+) -> None:
+    user = uuid4()
+
+    async def build() -> CompiledUserContext:
+        cache.invalidate(user)  # write landing mid-build
+        return _compiled(user)
+
+    await cache.get_or_build(user, build)
+
+    assert cache.get(user) is None
+
+
+async def test_disabled_cache_always_builds() -> None:
+    cache = UserContextCache(ttl_seconds=0)
+    user = uuid4()
+    builds = 0
+
+    async def build() -> CompiledUserContext:
+        nonlocal builds
+        builds += 1
+        return _compiled(user)
+
+    await cache.get_or_build(user, build)
+    await cache.get_or_build(user, build)
+
+    assert builds == 2
+    assert cache.get(user) is None
+
+
+async def test_feed_cache_invalidate_notifies_listeners(
+    cache: UserContextCache,
+) -> None:
+    feed_cache = FeedPageCache(ttl_seconds=30.0)
+    feed_cache.add_invalidate_listener(cache.invalidate)
+    user = uuid4()
+    await cache.get_or_build(user, lambda: asyncio.sleep(0, _compiled(user)))
+
+    feed_cache.invalidate_content(user, uuid4())
+    assert cache.get(user) is not None
+
+    feed_cache.invalidate(user)
+    assert cache.get(user) is None
@@ -286,3 +286,25 @@ async def test_concurrent_misses_compute_once_and_touch_db_after_lock(
     assert all(response.json() == responses[0].json() for response in responses)
     assert compute_calls == 1
     assert db_access_while_locked == [True]
+
+
+@pytest.mark.asyncio
+async def test_compressed_cache_serves_stored_gzip_bytes(
+    feed_client, monkeypatch
+) -> None:
+    """`FEED_CACHE_GZIP`: miss and hit answer with the stored gzip bytes (the
+    middleware does not recompress), and clients without gzip get the JSON."""
+    from app.services.feed_cache import FEED_CACHE
+
+    monkeypatch.setattr(FEED_CACHE, "_compress", True)
+    url = "/api/feed/?personalized=true&theme=tech&limit=12"
+
+    miss = await feed_client.get(url, headers={"Accept-Encoding": "gzip"})
+    hit = await feed_client.get(url, headers={"Accept-Encoding": "gzip"})
+    plain = await feed_client.get(url, headers={"Accept-Encoding": "identity"})
+
+    assert miss.headers["content-encoding"] == "gzip"
+    assert hit.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in plain.headers
+    assert miss.json() == hit.json() == plain.json()
+    assert len(hit.json()["items"]) == 3
@@ -13,13 +13,15 @@ Cf. docs/maintenance/maintenance-cold-boot-essentiel-perf.md.
 """
 
 import os
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import patch
 
+import httpx
 import pytest
 from httpx import ASGITransport, AsyncClient
 from starlette.middleware.gzip import GZipMiddleware
 
 from app.main import app
+from app.services.image_proxy_cache import ImageProxyCache
 
 
 def test_gzip_middleware_is_installed() -> None:
@@ -74,7 +76,7 @@ async def test_large_response_is_compressed_over_the_wire() -> None:
 
 
 @pytest.mark.asyncio
-async def test_image_proxy_is_not_gzipped() -> None:
+async def test_image_proxy_is_not_gzipped(tmp_path) -> None:
     """Image bytes come back untouched even when the client accepts gzip.
 
     Starlette's GZipMiddleware compresses by content-*length*, not
@@ -86,16 +88,24 @@ async def test_image_proxy_is_not_gzipped() -> None:
     # real image data, which gzip likewise cannot shrink.
     fake_png = b"\x89PNG\r\n\x1a\n" + os.urandom(4096)
 
-    mock_client = MagicMock()
-    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client.__aexit__ = AsyncMock(return_value=False)
-    upstream = MagicMock()
-    upstream.status_code = 200
-    upstream.content = fake_png
-    upstream.headers = {"content-type": "image/png"}
-    mock_client.get = AsyncMock(return_value=upstream)
-
-    with patch("app.routers.images.httpx.AsyncClient", return_value=mock_client):
+    upstream = httpx.AsyncClient(
+        transport=httpx.MockTransport(
+            lambda _r: httpx.Response(
+                200, content=fake_png, headers={"content-type": "image/png"}
+            )
+        )
+    )
+
+    with (
+        patch(
+            "app.routers.images.IMAGE_PROXY_CACHE",
+            ImageProxyCache(directory=str(tmp_path)),
+        ),
+        patch(
+            "app.services.image_proxy_cache.OUTBOUND_HTTP.client",
+            return_value=upstream,
+        ),
+    ):
         transport = ASGITransport(app=app)
         async with AsyncClient(transport=transport, base_url="http://test") as ac:
             resp = await ac.get(
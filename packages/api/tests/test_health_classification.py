@@ -54,6 +54,7 @@ def _content(source_id) -> Content:
 def _worker(running: bool) -> MagicMock:
     worker = MagicMock()
     worker.running = running
+    worker.pipeline_stats.return_value = {"lanes": 3, "busy_lanes": 0}
     return worker
 
 
@@ -156,6 +157,7 @@ async def test_worker_running_returns_ok_with_last_completed(health_client):
     assert body["last_completed_at"] is not None
     assert body["last_completed_age_s"] is not None
     assert body["last_completed_age_s"] >= 60
+    assert body["pipeline"]["lanes"] == 3
 
 
 @pytest.mark.asyncio
@@ -1,3 +1,4 @@
+import asyncio
 import socket
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -696,3 +697,58 @@ async def test_discovered_private_candidate_is_not_fetched():
         with patch("feedparser.parse", return_value=BadFeed()):
             with pytest.raises(ValueError, match="No RSS feed found"):
                 await parser.detect("https://example.com")
+
+
+# ─── Stage race ──────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_declared_feed_wins_over_faster_suffix_probe_and_cancels_the_rest():
+    """Stages race, but <link rel="alternate"> still outranks a suffix hit."""
+    parser = RSSParser()
+
+    main_response = MagicMock()
+    main_response.text = (
+        '<html><head><link rel="alternate" type="application/rss+xml"'
+        ' href="/declared.xml" /></head></html>'
+    )
+    main_response.status_code = 200
+    main_response.headers = {"content-type": "text/html"}
+    main_response.raise_for_status = MagicMock()
+
+    feed_response = MagicMock()
+    feed_response.text = "<rss>valid</rss>"
+    feed_response.status_code = 200
+    feed_response.headers = {"content-type": "application/rss+xml"}
+    feed_response.raise_for_status = MagicMock()
+
+    cancelled: list[str] = []
+
+    async def mock_get(url, **kwargs):
+        if url == "https://race.example.com":
+            return main_response
+        if url.endswith("/declared.xml"):
+            await asyncio.sleep(0.05)
+            return feed_response
+        if url.endswith("/feed"):
+            return feed_response
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(url)
+            raise
+        return feed_response
+
+    with (
+        patch("httpx.AsyncClient.get", side_effect=mock_get),
+        patch(
+            "feedparser.parse",
+            side_effect=lambda c: MockFeed() if "valid" in c else BadFeed(),
+        ),
+    ):
+        result = await asyncio.wait_for(
+            parser.detect("https://race.example.com"), timeout=2
+        )
+
+    assert result.feed_url == "https://race.example.com/declared.xml"
+    assert cancelled  # wp-json / slow probes did not run to completion
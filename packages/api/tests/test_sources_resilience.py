@@ -170,6 +170,38 @@ class TestSourcesCache:
         assert stats["hit_rate"] == pytest.approx(2 / 3)
 
 
+    @pytest.mark.asyncio
+    async def test_stale_entry_refreshed_in_background(self):
+        from app.services.cache_refresh import BACKGROUND_REFRESHER
+
+        cache = SourcesCache(ttl_seconds=0.05, stale_seconds=30.0)
+        uid = uuid4()
+        old = SourceCatalogResponse(curated=[], custom=[])
+        new = SourceCatalogResponse(curated=[], custom=[])
+        cache.put(uid, old)
+        await asyncio.sleep(0.1)
+
+        assert cache.get(uid) is None
+        payload, is_stale = cache.get_or_stale(uid)
+        assert payload is old and is_stale
+
+        assert cache.refresh_in_background(uid, AsyncMock(return_value=new))
+        await BACKGROUND_REFRESHER.drain()
+        assert cache.get(uid) is new
+
+    def test_put_with_stale_generation_is_dropped(self):
+        cache = SourcesCache(ttl_seconds=30.0)
+        uid = uuid4()
+        generation = cache.generation(uid)
+
+        cache.invalidate(uid)
+        cache.put(
+            uid, SourceCatalogResponse(curated=[], custom=[]), generation=generation
+        )
+
+        assert cache.get(uid) is None
+
+
 # ─── get_sources router ────────────────────────────────────────────────
 
 
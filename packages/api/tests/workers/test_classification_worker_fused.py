@@ -0,0 +1,109 @@
+"""Tests du mode fusionné du ClassificationWorker (fallback champ par champ).
+
+Un seul appel `FusedClassifier` par lot ; un champ absent ou invalide pour un
+article est redemandé à l'appel séparé, pour ce seul article. Classifieurs
+remplacés par des doublures, pas d'appel réseau.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.workers.classification_worker import ClassificationWorker
+
+_ITEMS = [
+    {"title": "Une forêt replantée", "description": "", "source_name": "Le Monde"},
+    {"title": "Un nouveau vaccin", "description": "", "source_name": "Le Monde"},
+]
+
+
+def _worker(fused: list[dict]) -> ClassificationWorker:
+    with patch.object(ClassificationWorker, "__init__", lambda _self: None):
+        worker = ClassificationWorker()
+    worker._classifier = MagicMock(
+        is_ready=MagicMock(return_value=True),
+        classify_batch_async=AsyncMock(
+            return_value=[{"topics": ["health"], "serene": True, "is_ad": False}]
+        ),
+        classify_async=AsyncMock(),
+        extract_entities_batch_async=AsyncMock(
+            return_value=[[{"name": "Institut Pasteur", "type": "ORG"}]]
+        ),
+    )
+    worker._good_news_classifier = MagicMock(
+        is_ready=MagicMock(return_value=True),
+        classify_batch_async=AsyncMock(return_value=[True]),
+    )
+    worker._fused_classifier = MagicMock(
+        classify_batch_async=AsyncMock(return_value=fused)
+    )
+    return worker
+
+
+@pytest.mark.asyncio
+async def test_complete_fused_answer_makes_no_other_call():
+    fused = [
+        {
+            "topics": ["environment"],
+            "serene": True,
+            "is_ad": False,
+            "entities": [],
+            "good_news": True,
+        },
+        {
+            "topics": ["health"],
+            "serene": False,
+            "is_ad": False,
+            "entities": [],
+            "good_news": True,
+        },
+    ]
+    worker = _worker(fused)
+
+    results = await worker._classify_fused(_ITEMS)
+
+    assert results[0]["good_news"] is True
+    # Hors gate serene + FR : le good_news fusionné est ignoré.
+    assert results[1]["good_news"] is None
+    worker._classifier.classify_batch_async.assert_not_awaited()
+    worker._classifier.extract_entities_batch_async.assert_not_awaited()
+    worker._good_news_classifier.classify_batch_async.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_invalid_fields_fall_back_to_separate_calls_for_that_item_only():
+    fused = [
+        {
+            "topics": ["environment"],
+            "serene": True,
+            "is_ad": False,
+            "entities": [],
+            "good_news": True,
+        },
+        {
+            "topics": None,
+            "serene": None,
+            "is_ad": False,
+            "entities": None,
+            "good_news": None,
+        },
+    ]
+    worker = _worker(fused)
+
+    results = await worker._classify_fused(_ITEMS)
+
+    worker._classifier.classify_batch_async.assert_awaited_once_with([_ITEMS[1]])
+    worker._classifier.extract_entities_batch_async.assert_awaited_once_with(
+        [_ITEMS[1]]
+    )
+    worker._good_news_classifier.classify_batch_async.assert_awaited_once_with(
+        [_ITEMS[1]]
+    )
+    assert results[0]["topics"] == ["environment"]
+    assert results[1] == {
+        "topics": ["health"],
+        "serene": True,
+        "is_ad": False,
+        "entities": [{"name": "Institut Pasteur", "type": "ORG"}],
+        "good_news": True,
+    }
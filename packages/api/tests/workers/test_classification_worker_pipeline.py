@@ -0,0 +1,145 @@
+"""Tests du pipeline du ClassificationWorker (dequeue → voies LLM → écriture).
+
+La run-loop fait tourner `lanes` lots en parallèle entre un étage de dequeue
+et un étage d'écriture groupée : le débit suit la concurrence autorisée, pas
+la latence d'un aller-retour Mistral. Les étages sont remplacés par des
+doublures ; l'écriture groupée est testée sur une session factice.
+"""
+
+import asyncio
+import contextlib
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.workers.classification_worker import ClassificationWorker
+
+
+def _record(retry_count: int = 0) -> dict:
+    return {
+        "queue_id": uuid4(),
+        "content_id": uuid4(),
+        "retry_count": retry_count,
+        "has_content": True,
+        "title": "Titre",
+        "description": "",
+        "source_name": "Le Monde",
+    }
+
+
+@pytest.mark.asyncio
+async def test_lanes_classify_batches_concurrently_and_report_stats():
+    worker = ClassificationWorker(lanes=3, interval=0)
+    worker.running = True
+    pending = [[_record()] for _ in range(6)]
+    in_flight = peak = 0
+    written: list = []
+    all_written = asyncio.Event()
+
+    async def dequeue():
+        return pending.pop(0) if pending else []
+
+    async def classify(records):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return {0: {"topics": ["ai"]}}
+
+    async def write(groups):
+        written.extend(groups)
+        if len(written) == 6:
+            all_written.set()
+
+    worker._should_process = AsyncMock(side_effect=lambda: bool(pending))
+    worker._reset_stale_processing = AsyncMock()
+    worker._dequeue_records = dequeue
+    worker._classify_records = classify
+    worker._write_back_bulk = write
+
+    task = asyncio.create_task(worker._run_loop())
+    await asyncio.wait_for(all_written.wait(), timeout=2)
+    stats = worker.pipeline_stats()
+    worker.running = False
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+
+    # 3 lots en vol à la fois : 2 vagues, pas 6 allers-retours en série.
+    assert peak == 3
+    assert stats["lanes"] == 3
+    assert stats["stages"]["dequeue"]["count"] == 6
+    assert stats["stages"]["classify"]["count"] == 6
+    assert stats["stages"]["classify"]["p50_ms"] >= 40
+    await worker.engine.dispose()
+
+
+def _bulk_worker(session) -> ClassificationWorker:
+    with patch.object(ClassificationWorker, "__init__", lambda _self: None):
+        worker = ClassificationWorker()
+
+    @asynccontextmanager
+    async def maker():
+        yield session
+
+    worker.session_maker = maker
+    worker._refresh_read_models = AsyncMock()
+    return worker
+
+
+@pytest.mark.asyncio
+async def test_bulk_write_back_commits_all_waiting_batches_once():
+    session = MagicMock(commit=AsyncMock())
+    service = MagicMock(
+        mark_completed_with_entities=AsyncMock(), mark_failed=AsyncMock()
+    )
+    done, empty = _record(), _record()
+    worker = _bulk_worker(session)
+
+    with patch(
+        "app.workers.classification_worker.ClassificationQueueService",
+        return_value=service,
+    ):
+        await worker._write_back_bulk(
+            [([done], {0: {"topics": ["ai"], "serene": True}}), ([empty], {})]
+        )
+
+    session.commit.assert_awaited_once()
+    service.mark_completed_with_entities.assert_awaited_once_with(
+        done["queue_id"],
+        ["ai"],
+        [],
+        is_serene=True,
+        is_good_news=None,
+        is_ad=None,
+        commit=False,
+    )
+    service.mark_failed.assert_awaited_once_with(
+        empty["queue_id"], "empty_classification", commit=False
+    )
+    worker._refresh_read_models.assert_awaited_once_with()
+
+
+@pytest.mark.asyncio
+async def test_bulk_write_back_falls_back_to_per_record_commits():
+    session = MagicMock(commit=AsyncMock(side_effect=RuntimeError("deadlock")))
+    service = MagicMock(
+        mark_completed_with_entities=AsyncMock(), mark_failed=AsyncMock()
+    )
+    record = _record()
+    worker = _bulk_worker(session)
+
+    with patch(
+        "app.workers.classification_worker.ClassificationQueueService",
+        return_value=service,
+    ):
+        await worker._write_back_bulk([([record], {0: {"topics": ["ai"]}})])
+
+    # Tentative groupée puis réécriture unitaire (commit dans le service).
+    assert service.mark_completed_with_entities.await_count == 2
+    _, kwargs = service.mark_completed_with_entities.await_args
+    assert "commit" not in kwargs
+    worker._refresh_read_models.assert_awaited_once_with()
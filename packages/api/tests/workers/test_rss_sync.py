@@ -71,3 +71,28 @@ async def test_sync_source_releases_outer_session_on_not_found():
 
     assert ok is False
     assert session.rollback.await_count + session.commit.await_count >= 1
+
+
+@pytest.mark.asyncio
+async def test_sync_due_sources_releases_outer_session_and_skips_refresh_when_idle():
+    """Tick sans source échue : session outer libérée, pas de refresh des agrégats."""
+    maker, session = _make_session_cm()
+
+    with patch(
+        "app.workers.rss_sync.safe_async_session", maker
+    ), patch("app.workers.rss_sync.SyncService") as MockService, patch(
+        "app.workers.rss_sync.CAROUSEL_AGGREGATES"
+    ) as aggregates:
+        instance = MockService.return_value
+        instance.sync_due_sources = AsyncMock(
+            return_value={"success": 0, "failed": 0, "total_new": 0, "due": 0}
+        )
+        instance.close = AsyncMock()
+        aggregates.refresh = AsyncMock()
+
+        from app.workers.rss_sync import sync_due_sources
+
+        await sync_due_sources()
+
+    assert session.rollback.await_count + session.commit.await_count >= 1
+    aggregates.refresh.assert_not_awaited()